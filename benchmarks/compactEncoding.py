@@ -0,0 +1,71 @@
+"""
+Compact encoding benchmark.
+
+Report the size of the compact encoding of a datastore against the default
+encoding, per object list and in total, and the encoding time of both.
+
+Usage
+    python ./benchmarks/compactEncoding.py [-n COUNT] [-a ARRAY_SIZE]
+"""
+import argparse
+import os
+import sys
+import time
+from io import BytesIO
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createStore                            # noqa: E402
+from pkgs.decoder import indexObjects                           # noqa: E402
+from pkgs.encoder import DatastoreEncoder                       # noqa: E402
+
+
+def encode(store, compact: bool) -> tuple[bytes, float]:
+    """
+    Encode a datastore.
+
+    Param
+        store: The datastore node.
+        compact: True to use the compact encoding, false otherwise.
+
+    Return
+        The encoded datastore and the encoding time, in seconds.
+    """
+    fp = BytesIO()
+    start = time.perf_counter()
+    DatastoreEncoder(fp, compact=compact).encode(store)
+    return fp.getvalue(), time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=100000,
+                           help='The store size in objects.')
+    argParser.add_argument('-a', '--array-size', type=int, default=8,
+                           help='The number of elements of the arrays.')
+    args = argParser.parse_args()
+    store = createStore(args.count, args.array_size)
+    default, defaultTime = encode(store, False)
+    compact, compactTime = encode(store, True)
+    defaultIndex = indexObjects(default)
+    compactIndex = indexObjects(compact)
+
+    print(f"{'list':<14}{'default (B)':>14}{'compact (B)':>14}"
+          f"{'reduction':>12}")
+    for listName, offsets in defaultIndex.items():
+        defaultSize = offsets[-1] - offsets[0]
+        compactSize = compactIndex[listName][-1] - compactIndex[listName][0]
+        reduction = 1 - compactSize / defaultSize if defaultSize else 0.0
+        print(f"{listName:<14}{defaultSize:>14}{compactSize:>14}"
+              f"{reduction * 100:>11.1f}%")
+    print(f"{'total':<14}{len(default):>14}{len(compact):>14}"
+          f"{(1 - len(compact) / len(default)) * 100:>11.1f}%")
+    print(f"encode time:  {defaultTime * 1000:.0f} ms default, "
+          f"{compactTime * 1000:.0f} ms compact")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Datastore patch benchmark.
+
+Report the size of the patch updating an encoded datastore after editing a
+few objects, against the size of the full image, and the time to create and
+apply it.
+
+Usage
+    python ./benchmarks/datastorePatch.py [-n COUNT] [-e EDITS]
+"""
+import argparse
+import os
+import sys
+import time
+from io import BytesIO
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createObject, createStore              # noqa: E402
+from pkgs.datastore import NodeType                             # noqa: E402
+from pkgs.encoder import DatastoreEncoder, applyPatch, \
+    createPatch                                                 # noqa: E402
+
+
+def encode(store) -> bytes:
+    """
+    Encode a datastore.
+
+    Param
+        store: The datastore node.
+
+    Return
+        The encoded datastore.
+    """
+    fp = BytesIO()
+    DatastoreEncoder(fp).encode(store)
+    return fp.getvalue()
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=100000,
+                           help='The store size in objects.')
+    argParser.add_argument('-e', '--edits', type=int, default=20,
+                           help='The number of edited objects.')
+    args = argParser.parse_args()
+    store = createStore(args.count)
+    old = encode(store)
+    intList = store.getChild(4)
+    for edit in range(args.edits):
+        intList.getChild(edit * 97).setDefault(-edit - 100)
+    intList.removeChildAt(1)
+    intList.addChild(createObject(NodeType.INT, args.count))
+    new = encode(store)
+
+    start = time.perf_counter()
+    patch = createPatch(old, new)
+    createTime = time.perf_counter() - start
+    start = time.perf_counter()
+    patched = applyPatch(old, patch)
+    applyTime = time.perf_counter() - start
+    assert patched == new
+
+    print(f"objects:          {args.count} ({len(new) / 1e6:.1f} MB)")
+    print(f"edited objects:   {args.edits} modified, 1 added, 1 removed")
+    print(f"patch size:       {len(patch)} bytes "
+          f"({len(patch) / len(new) * 100:.3f} % of the image)")
+    print(f"create patch:     {createTime * 1000:.0f} ms")
+    print(f"apply patch:      {applyTime * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Datastore encoder throughput benchmark.
+
+Report the encoding throughput in objects per second and the peak memory
+allocated while encoding stores of increasing size.
+
+Usage
+    python ./benchmarks/encoderThroughput.py [-n COUNT [COUNT ...]]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createStore                            # noqa: E402
+from pkgs.encoder import DatastoreEncoder                       # noqa: E402
+
+
+def measureEncoding(objCount: int) -> tuple[float, int, int]:
+    """
+    Measure the encoding of a store.
+
+    Param
+        objCount: The number of objects of the store.
+
+    Return
+        The throughput in objects per second, the peak memory allocated
+        while encoding and the encoded size.
+    """
+    store = createStore(objCount)
+    with tempfile.TemporaryFile() as fp:
+        tracemalloc.start()
+        DatastoreEncoder(fp).encode(store)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        size = fp.tell()
+    start = time.perf_counter()
+    with tempfile.TemporaryFile() as fp:
+        DatastoreEncoder(fp).encode(store)
+    elapsed = time.perf_counter() - start
+    return objCount / elapsed, peak, size
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, nargs='+',
+                           default=[1000, 10000, 100000],
+                           help='The store sizes in objects.')
+    args = argParser.parse_args()
+    print(f"{'objects':>10}{'objects/s':>14}{'peak (B)':>12}{'size (B)':>14}")
+    for objCount in args.count:
+        throughput, peak, size = measureEncoding(objCount)
+        print(f"{objCount:>10}{throughput:>14.0f}{peak:>12}{size:>14}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Image compression benchmark.
+
+Train a preset dictionary from a previous datastore image, then report the
+compression ratio of the next image in independent chunks, with and
+without the dictionary, and the decompression throughput, for the default
+and compact encodings.
+
+Usage
+    python ./benchmarks/imageCompression.py [-n COUNT] [-c CHUNK_SIZE]
+"""
+import argparse
+import os
+import sys
+import time
+from io import BytesIO
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createObject, createStore              # noqa: E402
+from pkgs.datastore import NodeType                             # noqa: E402
+from pkgs.encoder import compressImage, DatastoreEncoder, \
+    decompressChunk, readCompressedHeader, \
+    trainDictionary                                             # noqa: E402
+
+
+def encode(store, compact: bool) -> bytes:
+    """
+    Encode a datastore.
+
+    Param
+        store: The datastore node.
+        compact: True to use the compact encoding, false otherwise.
+
+    Return
+        The encoded datastore.
+    """
+    fp = BytesIO()
+    DatastoreEncoder(fp, compact=compact).encode(store)
+    return fp.getvalue()
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=100000,
+                           help='The store size in objects.')
+    argParser.add_argument('-c', '--chunk-size', type=int, default=4096,
+                           help='The uncompressed chunk size in bytes.')
+    args = argParser.parse_args()
+    store = createStore(args.count)
+    previous = {compact: encode(store, compact) for compact in (False, True)}
+    intList = store.getChild(4)
+    for edit in range(0, intList.getChildCount(), 13):
+        intList.getChild(edit).setDefault(-edit)
+    intList.addChildrenAt(0, [createObject(NodeType.INT, args.count + index)
+                              for index in range(args.count // 50)])
+
+    print(f"{'encoding':<10}{'dictionary':>12}{'image (B)':>12}"
+          f"{'compressed':>12}{'ratio':>8}{'compress':>11}"
+          f"{'decompress':>13}")
+    for compact in (False, True):
+        image = encode(store, compact)
+        start = time.perf_counter()
+        dictionary = trainDictionary([previous[compact]])
+        trainTime = time.perf_counter() - start
+        for label, preset in (('none', b''), ('trained', dictionary)):
+            start = time.perf_counter()
+            compressed = compressImage(image, args.chunk_size, preset)
+            compressTime = time.perf_counter() - start
+            header = readCompressedHeader(compressed)
+            start = time.perf_counter()
+            for index in range(header.getChunkCount()):
+                decompressChunk(compressed, index, preset, header)
+            decompressTime = time.perf_counter() - start
+            print(f"{'compact' if compact else 'default':<10}{label:>12}"
+                  f"{len(image):>12}{len(compressed):>12}"
+                  f"{len(image) / len(compressed):>7.1f}x"
+                  f"{compressTime * 1000:>8.0f} ms"
+                  f"{len(image) / decompressTime / 1e6:>8.0f} MB/s")
+        print(f"{'':<10}{'training':>12} {trainTime * 1000:.0f} ms, "
+              f"{header.getChunkCount()} chunks of {args.chunk_size} bytes, "
+              f"{decompressTime / header.getChunkCount() * 1e6:.1f} us per "
+              f"chunk")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Incremental datastore encoding benchmark.
+
+Report the time of a full export and of a re-export after editing a single
+object, with and without the incremental encoder.
+
+Usage
+    python ./benchmarks/incrementalEncoding.py [-n COUNT] [-r REPEAT]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createStore                            # noqa: E402
+from pkgs.encoder import DatastoreEncoder, \
+    IncrementalDatastoreEncoder                                 # noqa: E402
+from pkgs.datastore import NodeType                             # noqa: E402
+
+
+def findObject(store, type: NodeType):
+    """
+    Find the first object of a type in a store.
+
+    Param
+        store: The datastore node.
+        type: The object type.
+
+    Return
+        The first object of the type.
+    """
+    for row in range(store.getChildCount()):
+        objList = store.getChild(row)
+        if objList.getName() == type.name and objList.getChildCount() > 0:
+            return objList.getChild(objList.getChildCount() // 2)
+    raise ValueError(f"no {type.name} object in the store")
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=50000,
+                           help='The store size in objects.')
+    argParser.add_argument('-r', '--repeat', type=int, default=20,
+                           help='The number of edits to time.')
+    args = argParser.parse_args()
+    store = createStore(args.count)
+    node = findObject(store, NodeType.INT)
+
+    start = time.perf_counter()
+    DatastoreEncoder(io.BytesIO()).encode(store)
+    full = time.perf_counter() - start
+
+    uut = IncrementalDatastoreEncoder()
+    start = time.perf_counter()
+    first = uut.encode(store)
+    initial = time.perf_counter() - start
+
+    elapsed = 0.0
+    for edit in range(args.repeat):
+        node.setDefault(edit)
+        start = time.perf_counter()
+        data = uut.encode(store)
+        elapsed += time.perf_counter() - start
+    reencode = elapsed / args.repeat
+
+    fp = io.BytesIO()
+    DatastoreEncoder(fp).encode(store)
+    assert fp.getvalue() == data and len(first) > 0
+    print(f"objects:               {args.count}")
+    print(f"full export:           {full * 1000:.1f} ms")
+    print(f"first incremental:     {initial * 1000:.1f} ms")
+    print(f"re-export after edit:  {reencode * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
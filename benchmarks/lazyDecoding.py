@@ -0,0 +1,66 @@
+"""
+Lazy datastore decoding benchmark.
+
+Report the time to open an encoded datastore with the lazy reader, to
+browse a few objects, and to decode the whole file with cbor2.
+
+Usage
+    python ./benchmarks/lazyDecoding.py [-n COUNT]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import cbor2
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createStore                            # noqa: E402
+from pkgs.decoder import LazyDatastoreReader                    # noqa: E402
+from pkgs.encoder import DatastoreEncoder                       # noqa: E402
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=200000,
+                           help='The store size in objects.')
+    args = argParser.parse_args()
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, 'store.cbor')
+        with open(path, 'wb') as fp:
+            DatastoreEncoder(fp).encode(createStore(args.count))
+        size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        with open(path, 'rb') as fp:
+            cbor2.load(fp)
+        fullTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reader = LazyDatastoreReader(path)
+        store = reader.createStore()
+        openTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        browsed = 0
+        for row in range(store.getChildCount()):
+            objList = store.getChild(row)
+            for index in range(min(100, objList.getChildCount())):
+                objList.getChild(index)
+                browsed += 1
+        browseTime = time.perf_counter() - start
+        reader.close()
+
+    print(f"objects:              {args.count} ({size / 1e6:.1f} MB)")
+    print(f"cbor2 full decode:    {fullTime * 1000:.0f} ms")
+    print(f"lazy open and index:  {openTime * 1000:.0f} ms")
+    print(f"browse {browsed} objects:  {browseTime * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Datastore node memory benchmark.
+
+Report the memory used by a node of each object type, including its data,
+when stored in an object list.
+
+Usage
+    python ./benchmarks/nodeMemory.py [-n COUNT]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', 'src'))
+
+from pkgs.datastore import ButtonArrayData, ButtonArrayNode, ButtonData, \
+    ButtonNode, FloatArrayData, FloatArrayNode, FloatData, FloatNode, \
+    IntArrayData, IntArrayNode, IntData, IntNode, MultiStateData, \
+    MultiStateNode, NodeType, ObjectListNode, UintArrayData, UintArrayNode, \
+    UintData, UintNode                                          # noqa: E402
+
+
+_factories = {
+    NodeType.BUTTON: lambda: ButtonNode('NEW_BUTTON', ButtonData()),
+    NodeType.BUTTON_ARRAY:
+        lambda: ButtonArrayNode('NEW_BUTTON_ARRAY', ButtonArrayData()),
+    NodeType.FLOAT: lambda: FloatNode('NEW_FLOAT', FloatData()),
+    NodeType.FLOAT_ARRAY:
+        lambda: FloatArrayNode('NEW_FLOAT_ARRAY', FloatArrayData()),
+    NodeType.INT: lambda: IntNode('NEW_INT', IntData()),
+    NodeType.INT_ARRAY: lambda: IntArrayNode('NEW_INT_ARRAY', IntArrayData()),
+    NodeType.MULTI_STATE:
+        lambda: MultiStateNode('NEW_MULTI_STATE', MultiStateData()),
+    NodeType.UINT: lambda: UintNode('NEW_UINT', UintData()),
+    NodeType.UINT_ARRAY:
+        lambda: UintArrayNode('NEW_UINT_ARRAY', UintArrayData()),
+}
+
+
+def measureBytesPerNode(type: NodeType, count: int) -> float:
+    """
+    Measure the memory used by one node of the given type.
+
+    Param
+        type: The node type.
+        count: The number of nodes to create.
+
+    Return
+        The average number of bytes per node.
+    """
+    factory = _factories[type]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objList = ObjectListNode(type.name, None)
+    objList.addChildrenAt(0, [factory() for _ in range(count)])
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=100000,
+                           help='The number of nodes created per type.')
+    args = argParser.parse_args()
+    print(f"{'type':<14}{'bytes/node':>12}")
+    for type in _factories:
+        print(f"{type.name:<14}{measureBytesPerNode(type, args.count):>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Flash layout benchmark.
+
+Report the time to plan the flash layout of the non-volatile memory objects
+of a datastore, with arrays of varying sizes, and the resulting page count,
+fill and fragmentation.
+
+Usage
+    python ./benchmarks/nvmLayout.py [-n COUNT] [-s SECTOR_SIZE]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createStore                            # noqa: E402
+from pkgs.compiler import planNvmLayout                         # noqa: E402
+from pkgs.datastore import NodeType                             # noqa: E402
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=20000,
+                           help='The store size in objects.')
+    argParser.add_argument('-s', '--sector-size', type=int, default=4096,
+                           help='The flash sector size in bytes.')
+    args = argParser.parse_args()
+    store = createStore(args.count, 64)
+    rand = random.Random(0)
+    for objList in store.getChildren():
+        if objList.getName() in (NodeType.INT_ARRAY.name,
+                                 NodeType.UINT_ARRAY.name,
+                                 NodeType.FLOAT_ARRAY.name):
+            for node in objList.getChildren():
+                del node.getElements()[rand.randint(1, 64):]
+
+    start = time.perf_counter()
+    layout = planNvmLayout(store, args.sector_size)
+    elapsed = time.perf_counter() - start
+
+    print(f"objects:          {args.count} "
+          f"({len(layout.placements)} in NVM)")
+    print(f"sectors:          {layout.getPageCount()} of "
+          f"{args.sector_size} bytes ({layout.usableSize} usable)")
+    print(f"fill:             {layout.getFill() * 100:.2f} %")
+    print(f"fragmentation:    {layout.getFragmentation() * 100:.2f} %")
+    print(f"plan time:        {elapsed * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Object search benchmark.
+
+Report the latency of each keystroke of a search typed in the datastore
+filter model, against a QSortFilterProxyModel rescanning the datastore
+model.
+
+Usage
+    python ./benchmarks/objectSearch.py [-n COUNT] [-t TEXT]
+"""
+import argparse
+import os
+import sys
+import time
+
+from PySide6 import QtCore as qtc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createStore                            # noqa: E402
+from pkgs.datastore import ObjectListNode                       # noqa: E402
+from pkgs.ui.models import DatastoreFilterModel, \
+    DatastoreModel                                              # noqa: E402
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=100000,
+                           help='The store size in objects.')
+    argParser.add_argument('-t', '--text', type=str, default='uint_1234',
+                           help='The typed search text.')
+    args = argParser.parse_args()
+    app = qtc.QCoreApplication([])
+    root = ObjectListNode('', None)
+    store = createStore(args.count)
+    root.addChild(store)
+
+    storeModel = DatastoreModel(root, pageSize=args.count)
+    filterModel = DatastoreFilterModel(root)
+    filterModel.setSourceModel(storeModel)
+    start = time.perf_counter()
+    filterModel._getSearchIndex()
+    indexTime = time.perf_counter() - start
+
+    proxyModel = qtc.QSortFilterProxyModel()
+    proxyModel.setRecursiveFilteringEnabled(True)
+    proxyModel.setFilterCaseSensitivity(qtc.Qt.CaseSensitivity.CaseInsensitive)
+    proxyModel.setSourceModel(storeModel)
+    proxyModel.rowCount(qtc.QModelIndex())
+
+    print(f"objects:      {args.count}")
+    print(f"index build:  {indexTime * 1000:.0f} ms")
+    print(f"{'text':<16}{'results':>10}{'index (ms)':>12}{'rescan (ms)':>13}")
+    for length in range(1, len(args.text) + 1):
+        text = args.text[:length]
+        start = time.perf_counter()
+        filterModel.setFilterText(text)
+        searchTime = time.perf_counter() - start
+        start = time.perf_counter()
+        proxyModel.setFilterFixedString(text)
+        rescanTime = time.perf_counter() - start
+        print(f"{text:<16}{len(filterModel._matches):>10}"
+              f"{searchTime * 1000:>12.1f}{rescanTime * 1000:>13.1f}")
+    del app
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Paged image benchmark.
+
+Report the page count and padding of the paged image of an encoded
+datastore, the time to create it, and the bytes read to fetch one object
+page by page against reading the whole image.
+
+Usage
+    python ./benchmarks/pagedImage.py [-n COUNT] [-p PAGE_SIZE]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from io import BytesIO
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createStore                            # noqa: E402
+from pkgs.decoder import skipItem                               # noqa: E402
+from pkgs.encoder import createPagedImage, DatastoreEncoder, \
+    readPageIndex, readPagedObject                              # noqa: E402
+
+
+def getPagesRead(image: bytes, pageIndex, listName: str, id: int) -> int:
+    """
+    Get the number of pages read to fetch an object.
+
+    Param
+        image: The paged image.
+        pageIndex: The page index of the image.
+        listName: The object list name.
+        id: The object id.
+
+    Return
+        The number of data pages from the start of the object run to the
+        end of the object.
+    """
+    pageSize = pageIndex.pageSize
+    start, skipCount = pageIndex.locate(listName, id)
+    end = start
+    for _ in range(skipCount + 1):
+        end = skipItem(image, end)
+    return (end - 1) // pageSize - start // pageSize + 1
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=100000,
+                           help='The store size in objects.')
+    argParser.add_argument('-p', '--page-size', type=int, default=4096,
+                           help='The page size in bytes.')
+    argParser.add_argument('-r', '--reads', type=int, default=1000,
+                           help='The number of random object reads.')
+    args = argParser.parse_args()
+    store = createStore(args.count)
+    fp = BytesIO()
+    DatastoreEncoder(fp).encode(store)
+    encoded = fp.getvalue()
+
+    for allowSpanning in (False, True):
+        start = time.perf_counter()
+        image = createPagedImage(encoded, args.page_size, allowSpanning)
+        createTime = time.perf_counter() - start
+        pageIndex = readPageIndex(image)
+        indexPages = pageIndex.dataOffset // args.page_size
+        objects = [(objList.getName(), node.getId())
+                   for objList in store.getChildren()
+                   for node in objList.getChildren()]
+        readCount = min(args.reads, len(objects))
+        reads = random.sample(objects, readCount)
+        start = time.perf_counter()
+        for listName, id in reads:
+            readPagedObject(image, listName, id, pageIndex)
+        readTime = time.perf_counter() - start
+        pagesRead = sum(getPagesRead(image, pageIndex, listName, id)
+                        for listName, id in reads)
+        print(f"{'spanning' if allowSpanning else 'no spanning'}:")
+        print(f"  image:          {len(image) / 1e6:.1f} MB, "
+              f"{indexPages} index + {pageIndex.pageCount} data pages "
+              f"({(len(image) / len(encoded) - 1) * 100:.1f} % overhead)")
+        print(f"  create image:   {createTime * 1000:.0f} ms")
+        print(f"  object read:    {indexPages} index pages once, then "
+              f"{pagesRead / readCount:.2f} pages "
+              f"({pagesRead / readCount * args.page_size:.0f} bytes) "
+              f"against {len(encoded)} bytes for the whole store, "
+              f"{readTime / readCount * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Datastore diff benchmark.
+
+Report the time of a first diff between two datastores, and of a diff after
+editing a few objects of the new one, reusing the cached hashes.
+
+Usage
+    python ./benchmarks/storeDiff.py [-n COUNT] [-r REPEAT]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createStore                            # noqa: E402
+from pkgs.datastore import StoreDiffer                          # noqa: E402
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=100000,
+                           help='The store size in objects.')
+    argParser.add_argument('-r', '--repeat', type=int, default=20,
+                           help='The number of edits to time.')
+    args = argParser.parse_args()
+    old = createStore(args.count)
+    new = createStore(args.count)
+    intList = new.getChild(4)
+    buttonList = new.getChild(0)
+
+    uut = StoreDiffer()
+    start = time.perf_counter()
+    diffs = uut.diff(old, new)
+    initial = time.perf_counter() - start
+    assert not diffs
+
+    elapsed = 0.0
+    for edit in range(args.repeat):
+        intList.getChild(edit).setDefault(-edit - 100)
+        buttonList.getChild(edit).setName(f"RENAMED_{edit}")
+        start = time.perf_counter()
+        diffs = uut.diff(old, new)
+        elapsed += time.perf_counter() - start
+    assert len(diffs) == 2 * args.repeat
+    print(f"objects:            {args.count} per store")
+    print(f"first diff:         {initial * 1000:.1f} ms")
+    print(f"diff after edit:    {elapsed / args.repeat * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark datastore factory.
+
+Build populated datastores spreading the objects over every object type.
+"""
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', 'src'))
+
+from pkgs.datastore import ButtonArrayData, ButtonArrayElement, \
+    ButtonArrayNode, ButtonData, ButtonNode, DatastoreNode, FloatArrayData, \
+    FloatArrayElement, FloatArrayNode, FloatData, FloatNode, IntArrayData, \
+    IntArrayElement, IntArrayNode, IntData, IntNode, MultiStateData, \
+    MultiStateNode, NodeType, ObjectListNode, StateNode, UintArrayData, \
+    UintArrayElement, UintArrayNode, UintData, UintNode         # noqa: E402
+
+
+def createObject(type: NodeType, index: int, arraySize: int = 8):
+    """
+    Create an object of the given type.
+
+    Param
+        type: The object type.
+        index: The object index, used to vary the object name and values.
+        arraySize: The number of elements of the array objects.
+
+    Return
+        The new object node.
+    """
+    name = f"{type.name}_{index}"
+    match type:
+        case NodeType.BUTTON:
+            return ButtonNode(name, ButtonData(1000 + index, 5000 + index))
+        case NodeType.BUTTON_ARRAY:
+            elements = [ButtonArrayElement(f"{name}_{i}")
+                        for i in range(arraySize)]
+            return ButtonArrayNode(name, ButtonArrayData(elements=elements))
+        case NodeType.FLOAT:
+            return FloatNode(name, FloatData(-index - 1.5, index + 1.5,
+                                             index * .5))
+        case NodeType.FLOAT_ARRAY:
+            elements = [FloatArrayElement(f"{name}_{i}", -i - .5, i + .5,
+                                          i * .25) for i in range(arraySize)]
+            return FloatArrayNode(name, FloatArrayData(index % 2 == 0,
+                                                       elements))
+        case NodeType.INT:
+            return IntNode(name, IntData(-index - 1, index + 1, index % 7))
+        case NodeType.INT_ARRAY:
+            elements = [IntArrayElement(f"{name}_{i}", -i - 1, i + 1, i % 3)
+                        for i in range(arraySize)]
+            return IntArrayNode(name, IntArrayData(index % 2 == 0, elements))
+        case NodeType.MULTI_STATE:
+            states = [StateNode(f"{name}_STATE_{i}", i) for i in range(4)]
+            return MultiStateNode(name, MultiStateData(states, index % 4,
+                                                       index % 2 == 0))
+        case NodeType.UINT:
+            return UintNode(name, UintData(0, index + 1, index % 5))
+        case NodeType.UINT_ARRAY:
+            elements = [UintArrayElement(f"{name}_{i}", 0, i + 1, i % 2)
+                        for i in range(arraySize)]
+            return UintArrayNode(name, UintArrayData(index % 2 == 0,
+                                                     elements))
+
+
+def createStore(objCount: int, arraySize: int = 8) -> DatastoreNode:
+    """
+    Create a datastore holding the given number of objects.
+
+    Param
+        objCount: The total number of objects.
+        arraySize: The number of elements of the array objects.
+
+    Return
+        The new datastore.
+    """
+    store = DatastoreNode.createNewStore(ObjectListNode('', None))
+    lists = [store.getChild(row) for row in range(store.getChildCount())]
+    for position, objList in enumerate(lists):
+        type = NodeType[objList.getName()]
+        count = objCount // len(lists) + \
+            (1 if position < objCount % len(lists) else 0)
+        objList.addChildrenAt(0, [createObject(type, index, arraySize)
+                                  for index in range(count)])
+    return store
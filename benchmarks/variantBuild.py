@@ -0,0 +1,57 @@
+"""
+Multi-variant build benchmark.
+
+Report the time to build a set of variant definitions with an increasing
+number of worker processes.
+
+Usage
+    python ./benchmarks/variantBuild.py [-n VARIANTS] [-s SIZE]
+                                        [-j JOBS [JOBS ...]]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createStore                            # noqa: E402
+from pkgs.compiler import buildVariants, getOutputPath          # noqa: E402
+from pkgs.datastore import storeToDict                          # noqa: E402
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--variants', type=int, default=32,
+                           help='The number of variants.')
+    argParser.add_argument('-s', '--size', type=int, default=5000,
+                           help='The variant size in objects.')
+    argParser.add_argument('-j', '--jobs', type=int, nargs='+',
+                           default=sorted({1, 2, 4, os.cpu_count() or 1}),
+                           help='The worker counts to measure.')
+    args = argParser.parse_args()
+    with tempfile.TemporaryDirectory() as tmpDir:
+        definition = storeToDict(createStore(args.size))
+        variants = []
+        for index in range(args.variants):
+            path = os.path.join(tmpDir, f"variant{index}.json")
+            with open(path, 'w') as fp:
+                json.dump(definition, fp)
+            variants.append((path, getOutputPath(path)))
+        print(f"{'workers':>8}{'wall (ms)':>12}{'build (ms)':>12}"
+              f"{'speedup':>10}")
+        serial = None
+        for jobs in args.jobs:
+            summary = buildVariants(variants, jobs)[1]
+            serial = serial or summary.wallTime
+            print(f"{jobs:>8}{summary.wallTime * 1000:>12.0f}"
+                  f"{summary.cpuTime * 1000:>12.0f}"
+                  f"{serial / summary.wallTime:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+YAML definition benchmark.
+
+Report the time to save and load a datastore definition as YAML with the
+libyaml and the pure Python loader and dumper, and as JSON for reference.
+
+Usage
+    python ./benchmarks/yamlDefinition.py [-n COUNT]
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+import yaml
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storeFactory import createStore                            # noqa: E402
+from pkgs.datastore import loadYamlDefinition, saveYamlDefinition, \
+    storeFromDict, storeToDict                                  # noqa: E402
+from pkgs.datastore import definition                           # noqa: E402
+
+
+def measure(fn, *args) -> tuple[float, object]:
+    """
+    Measure a function call.
+
+    Param
+        fn: The function.
+        args: The function arguments.
+
+    Return
+        The elapsed time in seconds and the function result.
+    """
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def measureYaml(store, loader, dumper) -> tuple[float, float, int]:
+    """
+    Measure the YAML save and load of a store.
+
+    Param
+        store: The datastore node.
+        loader: The YAML loader class.
+        dumper: The YAML dumper class.
+
+    Return
+        The save time, the load time and the definition size.
+    """
+    definition._YamlLoader = loader
+    definition._YamlDumper = dumper
+    fp = io.StringIO()
+    saveTime = measure(saveYamlDefinition, store, fp)[0]
+    fp.seek(0)
+    loadTime, loaded = measure(loadYamlDefinition, fp)
+    assert storeToDict(loaded) == storeToDict(store)
+    return saveTime, loadTime, len(fp.getvalue())
+
+
+def main() -> None:
+    """
+    Benchmark main.
+    """
+    argParser = argparse.ArgumentParser(allow_abbrev=False)
+    argParser.add_argument('-n', '--count', type=int, default=50000,
+                           help='The store size in objects.')
+    args = argParser.parse_args()
+    store = createStore(args.count)
+    formats = []
+    if hasattr(yaml, 'CSafeLoader'):
+        formats.append(('YAML (libyaml)', yaml.CSafeLoader,
+                        yaml.CSafeDumper))
+    formats.append(('YAML (Python)', yaml.SafeLoader, yaml.SafeDumper))
+    print(f"{'format':<16}{'save (ms)':>12}{'load (ms)':>12}{'size (B)':>12}")
+    for name, loader, dumper in formats:
+        saveTime, loadTime, size = measureYaml(store, loader, dumper)
+        print(f"{name:<16}{saveTime * 1000:>12.0f}{loadTime * 1000:>12.0f}"
+              f"{size:>12}")
+    saveTime, data = measure(lambda: json.dumps(storeToDict(store)))
+    loadTime = measure(lambda: storeFromDict(json.loads(data)))[0]
+    print(f"{'JSON':<16}{saveTime * 1000:>12.0f}{loadTime * 1000:>12.0f}"
+          f"{len(data):>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+import argparse
+import logging
+import sys
+
+from pkgs.compiler import BuildOptions, BuildSummary, buildVariants, \
+    DEFAULT_HEADROOM, getOutputPath, VariantResult
+from pkgs.encoder import DEFAULT_CHUNK_SIZE, trainDictionary
+
+
+def _parseArguments(argv: list[str] = None) -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Param
+        argv: The arguments, the process arguments if none.
+
+    Return
+        The parsed arguments.
+    """
+    argParser = argparse.ArgumentParser(
+        prog='cbor-datastore', allow_abbrev=False,
+        description='Encode datastore definitions to CBOR.')
+    argParser.add_argument('definitions', type=str, nargs='+',
+                           help='The datastore definition files, one per '
+                           'variant.')
+    outputGroup = argParser.add_mutually_exclusive_group()
+    outputGroup.add_argument('-o', '--output', type=str, default=None,
+                             help='The encoded datastore file of a single '
+                             'definition. Defaults to the definition file '
+                             'with the .cbor extension.')
+    outputGroup.add_argument('-d', '--output-dir', type=str, default=None,
+                             help='The directory of the encoded datastore '
+                             'files. Defaults to the definition directories.')
+    argParser.add_argument('-n', '--names', action='store_true',
+                           help='Write the object name table of each '
+                           'encoded datastore next to it, with the '
+                           '.names.cbor extension.')
+    argParser.add_argument('-c', '--compact', action='store_true',
+                           help='Use the compact encoding, with integer map '
+                           'keys, front coded names and narrowed value '
+                           'arrays.')
+    argParser.add_argument('-H', '--header', action='store_true',
+                           help='Write the C header of each encoded '
+                           'datastore next to it, with the .h extension.')
+    argParser.add_argument('-s', '--sector-size', type=int, default=None,
+                           help='Write the non-volatile memory layout of '
+                           'each encoded datastore next to it, with the '
+                           '.layout.json extension, packing the objects in '
+                           'flash sectors of this size in bytes.')
+    argParser.add_argument('--headroom', type=float, default=DEFAULT_HEADROOM,
+                           help='The fraction of each flash sector left free '
+                           'for wear levelling. Defaults to '
+                           f"{DEFAULT_HEADROOM}.")
+    argParser.add_argument('-p', '--page-size', type=int, default=None,
+                           help='Write the paged image of each encoded '
+                           'datastore next to it, with the .pages '
+                           'extension, splitting the objects in pages of '
+                           'this size in bytes behind a page index.')
+    argParser.add_argument('--allow-spanning', action='store_true',
+                           help='Let the objects of the paged images '
+                           'straddle pages instead of padding the pages.')
+    argParser.add_argument('-z', '--compress', action='store_true',
+                           help='Write the compressed image of each paged '
+                           'image, or of each encoded datastore without '
+                           'paged image, next to it, with the .z extension '
+                           'appended.')
+    argParser.add_argument('--chunk-size', type=int, default=None,
+                           help='The uncompressed size of the independently '
+                           'decompressed chunks in bytes. Defaults to the '
+                           f"page size, or {DEFAULT_CHUNK_SIZE} without "
+                           'paged image.')
+    argParser.add_argument('--dictionary', type=str, default=None,
+                           help='The preset dictionary file of the '
+                           'compression.')
+    argParser.add_argument('--train', type=str, nargs='+', default=None,
+                           help='Train the preset dictionary from these '
+                           'previous images and write it to the '
+                           '--dictionary file before compressing.')
+    argParser.add_argument('-j', '--jobs', type=int, default=None,
+                           help='The number of worker processes. Defaults '
+                           'to the number of processors.')
+    argParser.add_argument('-v', '--verbose', action='store_true',
+                           help='Log the encoding progress.')
+    args = argParser.parse_args(argv)
+    if args.output is not None and len(args.definitions) > 1:
+        argParser.error('--output requires a single definition, use '
+                        '--output-dir for multiple definitions')
+    if args.sector_size is not None and args.sector_size < 1:
+        argParser.error('--sector-size must be at least 1')
+    if args.page_size is not None and args.page_size < 1:
+        argParser.error('--page-size must be at least 1')
+    if args.allow_spanning and args.page_size is None:
+        argParser.error('--allow-spanning requires --page-size')
+    if args.chunk_size is not None and args.chunk_size < 1:
+        argParser.error('--chunk-size must be at least 1')
+    if (args.chunk_size is not None or args.dictionary is not None) and \
+            not args.compress:
+        argParser.error('--chunk-size and --dictionary require --compress')
+    if args.train is not None and args.dictionary is None:
+        argParser.error('--train requires --dictionary')
+    if not 0 <= args.headroom < 1:
+        argParser.error('--headroom must be in [0, 1)')
+    if args.jobs is not None and args.jobs < 1:
+        argParser.error('--jobs must be at least 1')
+    return args
+
+
+def _getVariants(args: argparse.Namespace) -> list[tuple[str, str]]:
+    """
+    Get the definition and output paths of each variant.
+
+    Param
+        args: The parsed arguments.
+
+    Return
+        The (definition path, output path) of each variant.
+    """
+    if args.output is not None:
+        return [(args.definitions[0], args.output)]
+    return [(path, getOutputPath(path, args.output_dir))
+            for path in args.definitions]
+
+
+def _loadDictionary(args: argparse.Namespace) -> bytes:
+    """
+    Load the preset dictionary of the compression, training it first when
+    requested.
+
+    Param
+        args: The parsed arguments.
+
+    Return
+        The dictionary, empty if none.
+    """
+    if args.dictionary is None:
+        return b''
+    if args.train is not None:
+        samples = []
+        for path in args.train:
+            with open(path, 'rb') as fp:
+                samples.append(fp.read())
+        with open(args.dictionary, 'wb') as fp:
+            fp.write(trainDictionary(samples))
+    with open(args.dictionary, 'rb') as fp:
+        return fp.read()
+
+
+def _printReport(results: list[VariantResult],
+                 summary: BuildSummary) -> None:
+    """
+    Print the per-variant timing and size and the build summary.
+
+    Param
+        results: The variant build results.
+        summary: The build summary.
+    """
+    print(f"{'variant':<40}{'objects':>10}{'size (B)':>12}{'time (ms)':>12}")
+    for result in results:
+        if result.error is None:
+            print(f"{result.definitionPath:<40}{result.objCount:>10}"
+                  f"{result.size:>12}{result.elapsed * 1000:>12.1f}")
+        else:
+            print(f"{result.definitionPath:<40}{'failed':>10}{'-':>12}"
+                  f"{result.elapsed * 1000:>12.1f}")
+    speedup = summary.cpuTime / summary.wallTime if summary.wallTime else 0.0
+    print(f"{summary.variantCount - summary.failedCount}/"
+          f"{summary.variantCount} variants built, "
+          f"{summary.totalSize} bytes in {summary.wallTime * 1000:.1f} ms "
+          f"(build time {summary.cpuTime * 1000:.1f} ms, "
+          f"{speedup:.1f}x parallel speedup)")
+
+
+def main(argv: list[str] = None) -> int:
+    """
+    Command-line compiler main.
+
+    Param
+        argv: The arguments, the process arguments if none.
+
+    Return
+        The exit status.
+    """
+    args = _parseArguments(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose
+                        else logging.WARNING,
+                        format='%(levelname)s:%(name)s:%(message)s')
+    try:
+        dictionary = _loadDictionary(args)
+    except OSError as error:
+        logging.getLogger('app.compiler').error(
+            f"unable to load the dictionary: {error}")
+        return 1
+    options = BuildOptions(names=args.names, header=args.header,
+                           compact=args.compact,
+                           sectorSize=args.sector_size,
+                           headroom=args.headroom, pageSize=args.page_size,
+                           allowSpanning=args.allow_spanning,
+                           compress=args.compress, chunkSize=args.chunk_size,
+                           dictionary=dictionary)
+    results, summary = buildVariants(_getVariants(args), args.jobs, options)
+    _printReport(results, summary)
+    return 1 if summary.failedCount else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
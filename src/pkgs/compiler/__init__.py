@@ -0,0 +1,9 @@
+from .headerGenerator import generateHeader, getHeaderPath, \
+    HeaderGenerator                                             # noqa: F401
+from .nvmLayout import DEFAULT_HEADROOM, getLayoutPath, getNvmSize, \
+    getNvmSizeFromCount, layoutToDict, NvmLayout, NvmLayoutPlanner, \
+    NvmPlacement, planNvmLayout                                 # noqa: F401
+from .perfectHash import createPerfectHash, PerfectHash         # noqa: F401
+from .sizeTracker import EncodedSizeTracker, NodeSize           # noqa: F401
+from .variantBuilder import BuildOptions, BuildSummary, buildVariant, \
+    buildVariants, getOutputPath, VariantResult                 # noqa: F401
@@ -0,0 +1,414 @@
+import math
+import os
+import re
+
+from .perfectHash import FNV_PRIME, PerfectHash, createPerfectHash
+from ..datastore import BaseNode, DatastoreNode, NodeType
+from ..encoder import getObjectSlots
+
+
+# The C type of the limits of the float, int and uint objects.
+_LIMIT_TYPES = {
+    NodeType.FLOAT: 'double',
+    NodeType.INT: 'int64_t',
+    NodeType.UINT: 'uint64_t',
+}
+
+_LINE_WIDTH = 79
+_INT64_MIN = -1 << 63
+
+
+def getHeaderPath(outputPath: str) -> str:
+    """
+    Get the C header path of an encoded datastore.
+
+    Param
+        outputPath: The encoded datastore path.
+
+    Return
+        The encoded datastore path with the .h extension.
+    """
+    return f"{os.path.splitext(outputPath)[0]}.h"
+
+
+def _toIdentifier(name: str) -> str:
+    """
+    Convert a name to an upper case C identifier part.
+
+    Param
+        name: The name.
+
+    Return
+        The name, upper case, with the characters not allowed in a C
+        identifier replaced by underscores.
+    """
+    return re.sub(r'[^0-9A-Za-z_]', '_', name).upper()
+
+
+def _formatString(name: str) -> str:
+    """
+    Format a name as a C string literal.
+
+    Param
+        name: The name.
+
+    Return
+        The string literal of the UTF-8 encoded name.
+    """
+    chars = []
+    for byte in name.encode():
+        if 0x20 <= byte < 0x7f and byte not in b'"\\?':
+            chars.append(chr(byte))
+        else:
+            chars.append(f"\\{byte:03o}")
+    return f"\"{''.join(chars)}\""
+
+
+def _formatLimit(type: NodeType, value: float | int) -> str:
+    """
+    Format an object limit as a C constant.
+
+    Param
+        type: The object type.
+        value: The limit value.
+
+    Return
+        The C constant.
+    """
+    match type:
+        case NodeType.FLOAT:
+            if not math.isfinite(value):
+                raise ValueError(f"{value} is not a finite C constant")
+            return repr(float(value))
+        case NodeType.INT:
+            if value == _INT64_MIN:
+                return '(-INT64_C(9223372036854775807) - 1)'
+            return f"INT64_C({value})"
+        case _:
+            return f"UINT64_C({value})"
+
+
+def _formatArray(values: list[str], indent: str = '    ') -> list[str]:
+    """
+    Format the values of a C array initializer on lines.
+
+    Param
+        values: The formatted values.
+        indent: The line indentation.
+
+    Return
+        The initializer lines.
+    """
+    lines = []
+    line = indent
+    for value in values:
+        if len(line) + len(value) + 1 > _LINE_WIDTH and line != indent:
+            lines.append(line.rstrip())
+            line = indent
+        line += f"{value}, "
+    if line != indent:
+        lines.append(line.rstrip())
+    return lines
+
+
+class HeaderGenerator(object):
+    """
+    The C header generator of a datastore.
+
+    The header declares for each object list an enum of the object ids,
+    ending with the count of ids, and a function looking up the id of an
+    object by name. It also declares a table of the minimum, maximum and
+    default values of the float, int and uint objects indexed by id, and an
+    enum of the states of each multi-state object.
+
+    The name lookup is a minimal perfect hash: the name is hashed once,
+    selects its only candidate slot and is compared to the name of that
+    slot, so a lookup takes a constant time. The tables and the lookup
+    functions are constant data, kept in flash, and are compiled in the
+    source file defining the <PREFIX>_IMPLEMENTATION macro before including
+    the header.
+    """
+    def __init__(self, prefix: str = None) -> None:
+        """
+        Constructor.
+
+        Param
+            prefix: The prefix of the C identifiers, the datastore name if
+                none.
+        """
+        self._prefix = prefix
+        self._identifiers: set[str] = set()
+
+    def _define(self, identifier: str) -> str:
+        """
+        Reserve a C identifier.
+
+        Param
+            identifier: The identifier.
+
+        Return
+            The identifier.
+        """
+        if identifier in self._identifiers:
+            raise ValueError(f"{identifier} is defined twice, rename one of "
+                             f"the objects")
+        self._identifiers.add(identifier)
+        return identifier
+
+    def _generateIdEnum(self, prefix: str, listName: str,
+                        slots: list[BaseNode | None]) -> list[str]:
+        """
+        Generate the id enum of an object list.
+
+        Param
+            prefix: The identifier prefix.
+            listName: The object list name.
+            slots: The objects of the list indexed by id.
+
+        Return
+            The enum lines.
+        """
+        lines = [f"/* {listName} object ids */", 'typedef enum {']
+        for node in slots:
+            if node is not None:
+                identifier = self._define(
+                    f"{prefix}_{listName}_{_toIdentifier(node.getName())}")
+                lines.append(f"    {identifier} = {node.getId()},")
+        identifier = self._define(f"{prefix}_{listName}_COUNT")
+        lines.append(f"    {identifier} = {len(slots)}")
+        lines.append(f"}} {prefix.lower()}_{listName.lower()}_id_t;")
+        return lines
+
+    def _generateStateEnum(self, prefix: str, node: BaseNode) -> list[str]:
+        """
+        Generate the state enum of a multi-state object.
+
+        The enum ends with the state count, so a multi-state without state
+        still gives a valid C enum.
+
+        Param
+            prefix: The identifier prefix.
+            node: The multi-state node.
+
+        Return
+            The enum lines.
+        """
+        name = _toIdentifier(node.getName())
+        lines = [f"/* {node.getName()} states */", 'typedef enum {']
+        states = node.getStateList()
+        for state in states:
+            identifier = self._define(
+                f"{prefix}_{name}_{_toIdentifier(state.getName())}")
+            lines.append(f"    {identifier} = {state.getValue()},")
+        identifier = self._define(f"{prefix}_{name}_STATE_COUNT")
+        lines.append(f"    {identifier} = {len(states)}")
+        lines.append(f"}} {prefix.lower()}_{name.lower()}_state_t;")
+        return lines
+
+    def _generateLimits(self, prefix: str, type: NodeType,
+                        slots: list[BaseNode | None]) -> list[str]:
+        """
+        Generate the limit table of a float, int or uint object list.
+
+        Param
+            prefix: The identifier prefix.
+            type: The object type.
+            slots: The objects of the list indexed by id.
+
+        Return
+            The table definition lines.
+        """
+        lines = [f"const {prefix.lower()}_{type.name.lower()}_limits_t "
+                 f"{prefix}_{type.name}_LIMITS[{prefix}_{type.name}_COUNT] "
+                 f"= {{"]
+        for node in slots:
+            if node is not None:
+                values = ', '.join([_formatLimit(type, value) for value in
+                                    (node.getMinimum(), node.getMaximum(),
+                                     node.getDefault())])
+                identifier = \
+                    f"{prefix}_{type.name}_{_toIdentifier(node.getName())}"
+                lines.append(f"    [{identifier}] = {{{values}}},")
+        lines.append('};')
+        return lines
+
+    def _generateLookup(self, prefix: str, listName: str,
+                        perfectHash: PerfectHash) -> list[str]:
+        """
+        Generate the name lookup of an object list.
+
+        Param
+            prefix: The identifier prefix.
+            listName: The object list name.
+            perfectHash: The perfect hash of the object names.
+
+        Return
+            The lookup definition lines.
+        """
+        function = f"{prefix.lower()}_{listName.lower()}_find"
+        if not perfectHash.names:
+            return [f"int32_t {function}(const char *name)", '{',
+                    '    (void)name;', '    return -1;', '}']
+        table = f"{prefix}_{listName}"
+        bucketCount = len(perfectHash.displacements)
+        count = len(perfectHash.names)
+        return [
+            f"static const int32_t {table}_DISPLACEMENTS[{bucketCount}] = {{",
+            *_formatArray([str(value)
+                           for value in perfectHash.displacements]),
+            '};',
+            f"static const char *const {table}_NAMES[{count}] = {{",
+            *_formatArray([_formatString(name)
+                           for name in perfectHash.names]),
+            '};',
+            f"static const int32_t {table}_IDS[{count}] = {{",
+            *_formatArray([str(value) for value in perfectHash.ids]),
+            '};',
+            '',
+            f"int32_t {function}(const char *name)",
+            '{',
+            f"    return {prefix.lower()}_find(name, "
+            f"0x{perfectHash.basis:08x}u, {table}_DISPLACEMENTS,",
+            f"        {bucketCount}u, {table}_NAMES, {table}_IDS, {count}u);",
+            '}',
+        ]
+
+    def _generateCommon(self, prefix: str) -> list[str]:
+        """
+        Generate the hash and lookup functions shared by the object lists.
+
+        Param
+            prefix: The identifier prefix.
+
+        Return
+            The function definition lines.
+        """
+        lower = prefix.lower()
+        return [
+            f"static uint32_t {lower}_hash(uint32_t basis, const char *name)",
+            '{',
+            '    uint32_t hash = basis;',
+            "    while (*name != '\\0') {",
+            f"        hash = (hash ^ (uint8_t)*name++) * 0x{FNV_PRIME:08x}u;",
+            '    }',
+            '    return hash;',
+            '}',
+            '',
+            f"static uint32_t {lower}_mix(uint32_t hash)",
+            '{',
+            '    hash ^= hash >> 16;',
+            '    hash *= 0x85ebca6bu;',
+            '    hash ^= hash >> 13;',
+            '    hash *= 0xc2b2ae35u;',
+            '    return hash ^ (hash >> 16);',
+            '}',
+            '',
+            f"static int32_t {lower}_find(const char *name, uint32_t basis,",
+            '    const int32_t *displacements, uint32_t bucketCount,',
+            '    const char *const *names, const int32_t *ids, '
+            'uint32_t count)',
+            '{',
+            f"    uint32_t hash = {lower}_hash(basis, name);",
+            '    int32_t displacement = displacements[hash % bucketCount];',
+            '    uint32_t slot = displacement < 0',
+            '        ? (uint32_t)(-displacement - 1)',
+            f"        : {lower}_mix(hash ^ (uint32_t)displacement) % count;",
+            '    return strcmp(names[slot], name) == 0 ? ids[slot] : -1;',
+            '}',
+        ]
+
+    def generate(self, store: DatastoreNode) -> str:
+        """
+        Generate the C header of a datastore.
+
+        Param
+            store: The datastore node.
+
+        Return
+            The C header.
+        """
+        self._identifiers.clear()
+        prefix = _toIdentifier(self._prefix if self._prefix is not None
+                               else store.getName())
+        if not prefix or prefix[0].isdigit():
+            prefix = f"DS_{prefix}"
+        lower = prefix.lower()
+        declarations = []
+        definitions = []
+        lookups = []
+        for objList in store.getChildren():
+            type = NodeType[objList.getName()]
+            slots = getObjectSlots(objList)
+            declarations += self._generateIdEnum(prefix, type.name, slots)
+            declarations.append('')
+            if type == NodeType.MULTI_STATE:
+                for node in objList.getChildren():
+                    declarations += self._generateStateEnum(prefix, node)
+                    declarations.append('')
+            if type in _LIMIT_TYPES:
+                limitType = self._define(f"{lower}_{type.name.lower()}"
+                                         f"_limits_t")
+                declarations += [
+                    'typedef struct {',
+                    *[f"    {_LIMIT_TYPES[type]} {field};"
+                      for field in ('min', 'max', 'def')],
+                    f"}} {limitType};",
+                ]
+                if slots:
+                    table = self._define(f"{prefix}_{type.name}_LIMITS")
+                    declarations.append(f"extern const {limitType} {table}"
+                                        f"[{prefix}_{type.name}_COUNT];")
+                    definitions += self._generateLimits(prefix, type, slots)
+                    definitions.append('')
+                declarations.append('')
+            ids = {node.getName(): node.getId()
+                   for node in objList.getChildren()}
+            function = self._define(f"{lower}_{type.name.lower()}_find")
+            declarations += [f"/* Get the {type.name} object id of a name, "
+                             f"-1 if there is none. */",
+                             f"int32_t {function}(const char *name);", '']
+            lookups += self._generateLookup(prefix, type.name,
+                                            createPerfectHash(ids))
+            lookups.append('')
+        lines = [
+            '/*',
+            f" * Generated from the {store.getName()} datastore, do not "
+            f"edit.",
+            ' *',
+            f" * Define {prefix}_IMPLEMENTATION in one source file before "
+            f"including",
+            ' * this header to compile the tables and the lookup functions.',
+            ' */',
+            f"#ifndef {prefix}_H",
+            f"#define {prefix}_H",
+            '',
+            '#include <stdint.h>',
+            '',
+            *declarations,
+            f"#ifdef {prefix}_IMPLEMENTATION",
+            '',
+            '#include <string.h>',
+            '',
+            *definitions,
+            *self._generateCommon(prefix),
+            '',
+            *lookups,
+            f"#endif /* {prefix}_IMPLEMENTATION */",
+            '',
+            f"#endif /* {prefix}_H */",
+        ]
+        return '\n'.join(lines) + '\n'
+
+
+def generateHeader(store: DatastoreNode, prefix: str = None) -> str:
+    """
+    Generate the C header of a datastore.
+
+    Param
+        store: The datastore node.
+        prefix: The prefix of the C identifiers, the datastore name if none.
+
+    Return
+        The C header.
+    """
+    return HeaderGenerator(prefix).generate(store)
@@ -0,0 +1,310 @@
+import os
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+
+from ..datastore import BaseNode, DatastoreNode, NodeType
+
+
+# The default fraction of each sector left free for wear levelling.
+DEFAULT_HEADROOM = 0.25
+# The size of an array element value, int64_t, uint64_t or double like the
+# C header.
+_VALUE_SIZE = 8
+_NVM_TYPES = (NodeType.INT_ARRAY, NodeType.UINT_ARRAY, NodeType.FLOAT_ARRAY,
+              NodeType.MULTI_STATE)
+
+
+@dataclass(slots=True)
+class NvmPlacement:
+    """
+    The placement of an object in non-volatile memory.
+    """
+    listName: str
+    id: int
+    name: str
+    size: int
+    page: int
+    offset: int
+
+
+@dataclass(slots=True)
+class NvmLayout:
+    """
+    The layout of the non-volatile memory objects in flash pages.
+
+    The offsets are relative to the start of the first page. The fill is
+    the fraction of the usable page space holding objects, and the
+    fragmentation is the fraction of the free usable space outside the
+    page with the most free space, 0 when the free space is in one page.
+    """
+    sectorSize: int
+    usableSize: int
+    alignment: int
+    placements: list[NvmPlacement] = field(default_factory=list)
+    pageUsage: list[int] = field(default_factory=list)
+    objectSize: int = 0
+    paddingSize: int = 0
+
+    def getPageCount(self) -> int:
+        """
+        Get the number of pages.
+
+        Return
+            The page count.
+        """
+        return len(self.pageUsage)
+
+    def getFreeSizes(self) -> list[int]:
+        """
+        Get the free usable space of each page.
+
+        Return
+            The free size of each page, in bytes.
+        """
+        return [max(0, self.usableSize - used) for used in self.pageUsage]
+
+    def getFill(self) -> float:
+        """
+        Get the fraction of the usable page space holding objects.
+
+        Return
+            The page fill, 0 when there is no page.
+        """
+        capacity = self.usableSize * len(self.pageUsage)
+        if not capacity:
+            return 0.0
+        return 1.0 - sum(self.getFreeSizes()) / capacity
+
+    def getFragmentation(self) -> float:
+        """
+        Get the fraction of the free usable space outside the page with the
+        most free space.
+
+        Return
+            The free space fragmentation, 0 when there is no free space.
+        """
+        freeSizes = self.getFreeSizes()
+        totalFree = sum(freeSizes)
+        if not totalFree:
+            return 0.0
+        return 1.0 - max(freeSizes) / totalFree
+
+    def getOffsetMap(self) -> dict[str, dict[str, int]]:
+        """
+        Get the offset of each placed object.
+
+        Return
+            The offset of each object by name, by object list name.
+        """
+        offsets: dict[str, dict[str, int]] = {}
+        for placement in self.placements:
+            offsets.setdefault(placement.listName, {})[placement.name] = \
+                placement.offset
+        return offsets
+
+
+def getLayoutPath(outputPath: str) -> str:
+    """
+    Get the non-volatile memory layout path of an encoded datastore.
+
+    Param
+        outputPath: The encoded datastore path.
+
+    Return
+        The encoded datastore path with the .layout.json extension.
+    """
+    return f"{os.path.splitext(outputPath)[0]}.layout.json"
+
+
+def getNvmSize(node: BaseNode) -> int:
+    """
+    Get the non-volatile memory size of an object.
+
+    The array elements take 8 bytes each, and a multi-state takes the
+    smallest of 1, 2 or 4 bytes holding its state index.
+
+    Param
+        node: The int array, uint array, float array or multi-state node.
+
+    Return
+        The object size, in bytes.
+    """
+    items = node.getStateList() if node.getType() == NodeType.MULTI_STATE \
+        else node.getElements()
+    return getNvmSizeFromCount(node.getType(), len(items))
+
+
+def getNvmSizeFromCount(type: NodeType, count: int) -> int:
+    """
+    Get the non-volatile memory size of an object from its element or state
+    count.
+
+    Param
+        type: The object type, int array, uint array, float array or
+            multi-state.
+        count: The number of array elements or states.
+
+    Return
+        The object size, in bytes.
+    """
+    if type == NodeType.MULTI_STATE:
+        return 1 if count <= 0x100 else 2 if count <= 0x10000 else 4
+    return count * _VALUE_SIZE
+
+
+class NvmLayoutPlanner(object):
+    """
+    The planner packing the non-volatile memory objects of a datastore in
+    flash pages.
+
+    A page is a flash sector of which only the usable size holds objects,
+    the rest being left free for wear levelling. The objects are packed
+    best fit decreasing: from the largest, each object goes to the page
+    with the least free space that fits it, and a new page is started
+    when none does. Keeping the pages sorted by free space makes each
+    placement a binary search, so a layout takes O(n log n) for n objects.
+
+    An object larger than the usable size spans consecutive sectors, using
+    the whole of all but its last sector, whose remaining usable space
+    takes other objects. A last sector used beyond its usable size takes
+    no other object. The objects without value, such as empty arrays,
+    are not placed.
+
+    Param
+        sectorSize: The flash sector size, in bytes.
+        headroom: The fraction of each sector left free for wear
+            levelling, from 0 included to 1 excluded.
+        alignment: The object alignment, a power of two dividing the
+            sector size.
+    """
+    def __init__(self, sectorSize: int, headroom: float = DEFAULT_HEADROOM,
+                 alignment: int = 4) -> None:
+        if alignment <= 0 or alignment & (alignment - 1):
+            raise ValueError(f"the alignment {alignment} is not a power of "
+                             f"two")
+        if sectorSize <= 0 or sectorSize % alignment:
+            raise ValueError(f"the sector size {sectorSize} is not a "
+                             f"multiple of the alignment {alignment}")
+        if not 0 <= headroom < 1:
+            raise ValueError(f"the headroom {headroom} is not in [0, 1)")
+        self._sectorSize = sectorSize
+        self._alignment = alignment
+        self._usableSize = int(sectorSize * (1 - headroom)) \
+            // alignment * alignment
+        if self._usableSize <= 0:
+            raise ValueError(f"no usable space in a {sectorSize} byte "
+                             f"sector with a {headroom} headroom")
+
+    def _align(self, size: int) -> int:
+        """
+        Round a size up to the object alignment.
+
+        Param
+            size: The size, in bytes.
+
+        Return
+            The aligned size.
+        """
+        return -(-size // self._alignment) * self._alignment
+
+    def plan(self, store: DatastoreNode) -> NvmLayout:
+        """
+        Plan the non-volatile memory layout of a datastore.
+
+        Param
+            store: The datastore node.
+
+        Return
+            The layout of the objects stored in non-volatile memory.
+        """
+        objects = []
+        for objList in store.getChildren():
+            if NodeType[objList.getName()] not in _NVM_TYPES:
+                continue
+            for node in objList.getChildren():
+                if node.isInNvm():
+                    size = getNvmSize(node)
+                    if size:
+                        objects.append((-size, objList.getName(),
+                                        node.getId(), node))
+        objects.sort(key=lambda obj: obj[:3])
+        layout = NvmLayout(self._sectorSize, self._usableSize,
+                           self._alignment)
+        # The (free size, page) of the pages with usable space left.
+        freePages: list[tuple[int, int]] = []
+        for negSize, listName, id, node in objects:
+            size = -negSize
+            alignedSize = self._align(size)
+            index = bisect_left(freePages, (alignedSize, -1))
+            if index < len(freePages):
+                free, page = freePages.pop(index)
+                offset = page * self._sectorSize + layout.pageUsage[page]
+                layout.pageUsage[page] += alignedSize
+                free -= alignedSize
+            else:
+                page = len(layout.pageUsage)
+                offset = page * self._sectorSize
+                # The whole sectors before the last one of the object.
+                spanCount = (alignedSize - 1) // self._sectorSize
+                layout.pageUsage += [self._sectorSize] * spanCount
+                used = alignedSize - spanCount * self._sectorSize
+                layout.pageUsage.append(used)
+                free = max(0, self._usableSize - used)
+                page += spanCount
+            if free >= self._alignment:
+                insort(freePages, (free, page))
+            layout.placements.append(NvmPlacement(listName, id,
+                                                  node.getName(), size,
+                                                  offset // self._sectorSize,
+                                                  offset))
+            layout.objectSize += size
+            layout.paddingSize += alignedSize - size
+        layout.placements.sort(key=lambda placement: placement.offset)
+        return layout
+
+
+def planNvmLayout(store: DatastoreNode, sectorSize: int,
+                  headroom: float = DEFAULT_HEADROOM,
+                  alignment: int = 4) -> NvmLayout:
+    """
+    Plan the non-volatile memory layout of a datastore.
+
+    Param
+        store: The datastore node.
+        sectorSize: The flash sector size, in bytes.
+        headroom: The fraction of each sector left free for wear levelling.
+        alignment: The object alignment, a power of two dividing the sector
+            size.
+
+    Return
+        The layout of the objects stored in non-volatile memory.
+    """
+    return NvmLayoutPlanner(sectorSize, headroom, alignment).plan(store)
+
+
+def layoutToDict(layout: NvmLayout) -> dict:
+    """
+    Convert a non-volatile memory layout to a dictionary.
+
+    Param
+        layout: The layout.
+
+    Return
+        The layout dictionary, holding the layout parameters and statistics
+        and the placement of each object by object list.
+    """
+    objects: dict[str, list[dict]] = {}
+    for placement in layout.placements:
+        objects.setdefault(placement.listName, []).append({
+            'name': placement.name, 'id': placement.id,
+            'page': placement.page, 'offset': placement.offset,
+            'size': placement.size})
+    return {'sectorSize': layout.sectorSize,
+            'usableSize': layout.usableSize,
+            'alignment': layout.alignment,
+            'pageCount': layout.getPageCount(),
+            'objectSize': layout.objectSize,
+            'paddingSize': layout.paddingSize,
+            'fill': round(layout.getFill(), 4),
+            'fragmentation': round(layout.getFragmentation(), 4),
+            'objects': objects}
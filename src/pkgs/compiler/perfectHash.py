@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+
+
+FNV_BASIS = 0x811c9dc5
+FNV_PRIME = 0x01000193
+_MASK = 0xffffffff
+_BUCKET_SIZE = 2
+_MAX_DISPLACEMENT = 0x7fffffff
+
+
+def hashName(basis: int, name: bytes) -> int:
+    """
+    Hash a name with the 32-bit FNV-1a hash.
+
+    Param
+        basis: The hash basis.
+        name: The UTF-8 encoded name.
+
+    Return
+        The name hash.
+    """
+    value = basis
+    for byte in name:
+        value = ((value ^ byte) * FNV_PRIME) & _MASK
+    return value
+
+
+def mixHash(value: int) -> int:
+    """
+    Scramble a 32-bit hash with the MurmurHash3 finalizer.
+
+    Param
+        value: The hash.
+
+    Return
+        The scrambled hash.
+    """
+    value ^= value >> 16
+    value = (value * 0x85ebca6b) & _MASK
+    value ^= value >> 13
+    value = (value * 0xc2b2ae35) & _MASK
+    return value ^ (value >> 16)
+
+
+@dataclass(slots=True)
+class PerfectHash:
+    """
+    The minimal perfect hash of a set of names, by hash and displace.
+
+    A name hash selects a bucket. The displacement of a bucket holding
+    several names is mixed with the hash to give the slot of the name, a
+    negative displacement -slot - 1 gives the slot of the single name of
+    the bucket. Every name gets its own slot, and there are as many slots
+    as names. Any other name also gets a slot, which is why the name of the
+    slot must be compared to the looked up name.
+    """
+    basis: int
+    displacements: list[int]
+    names: list[str]
+    ids: list[int]
+
+    def getSlot(self, name: str) -> int:
+        """
+        Get the slot of a name.
+
+        Param
+            name: The name.
+
+        Return
+            The name slot.
+        """
+        value = hashName(self.basis, name.encode())
+        displacement = self.displacements[value % len(self.displacements)]
+        if displacement < 0:
+            return -displacement - 1
+        return mixHash(value ^ displacement) % len(self.names)
+
+    def lookup(self, name: str) -> int | None:
+        """
+        Look up the id of a name.
+
+        Param
+            name: The name.
+
+        Return
+            The id of the name, none if the name is unknown.
+        """
+        if not self.names:
+            return None
+        slot = self.getSlot(name)
+        return self.ids[slot] if self.names[slot] == name else None
+
+
+def _hashNames(names: list[str]) -> tuple[int, list[int]]:
+    """
+    Hash names, changing the hash basis until the hashes are unique.
+
+    Param
+        names: The unique names.
+
+    Return
+        The hash basis and the name hashes.
+    """
+    encoded = [name.encode() for name in names]
+    basis = FNV_BASIS
+    while True:
+        hashes = [hashName(basis, name) for name in encoded]
+        if len(set(hashes)) == len(hashes):
+            return basis, hashes
+        basis = (basis + FNV_PRIME) & _MASK
+
+
+def createPerfectHash(ids: dict[str, int]) -> PerfectHash:
+    """
+    Create the minimal perfect hash of names.
+
+    The buckets are filled from the largest, searching for each the first
+    displacement sending its names to free slots, and the single name
+    buckets take the remaining slots. There is a bucket for every two
+    names, which keeps the displacements small and the search short.
+
+    Param
+        ids: The id of each name.
+
+    Return
+        The perfect hash of the names.
+    """
+    names = list(ids)
+    count = len(names)
+    bucketCount = max(1, -(-count // _BUCKET_SIZE))
+    basis, hashes = _hashNames(names)
+    buckets: list[list[int]] = [[] for _ in range(bucketCount)]
+    for index, value in enumerate(hashes):
+        buckets[value % bucketCount].append(index)
+    order = sorted(range(bucketCount),
+                   key=lambda bucket: -len(buckets[bucket]))
+    displacements = [0] * bucketCount
+    slotNames: list[int | None] = [None] * count
+    position = 0
+    for position, bucket in enumerate(order):
+        members = buckets[bucket]
+        if len(members) <= 1:
+            break
+        displacement = 0
+        while True:
+            slots = {mixHash(hashes[index] ^ displacement) % count
+                     for index in members}
+            if len(slots) == len(members) and \
+                    all(slotNames[slot] is None for slot in slots):
+                break
+            displacement += 1
+            if displacement > _MAX_DISPLACEMENT:
+                raise ValueError('unable to create the perfect hash')
+        displacements[bucket] = displacement
+        for index in members:
+            slotNames[mixHash(hashes[index] ^ displacement) % count] = index
+    else:
+        position = bucketCount
+    free = [slot for slot in range(count) if slotNames[slot] is None]
+    for bucket in order[position:]:
+        if not buckets[bucket]:
+            break
+        slot = free.pop()
+        displacements[bucket] = -slot - 1
+        slotNames[slot] = buckets[bucket][0]
+    return PerfectHash(basis, displacements,
+                       [names[index] for index in slotNames],
+                       [ids[names[index]] for index in slotNames])
@@ -0,0 +1,343 @@
+from dataclasses import dataclass
+from io import BytesIO
+
+import cbor2
+
+from .nvmLayout import getNvmSize, getNvmSizeFromCount
+from ..datastore import BaseNode, DatastoreNode, NodeType
+from ..decoder import LazyObjectListNode
+from ..encoder import DatastoreEncoder
+
+
+_NVM_TYPES = (NodeType.INT_ARRAY, NodeType.UINT_ARRAY, NodeType.FLOAT_ARRAY,
+              NodeType.MULTI_STATE)
+
+
+def _getHeadSize(argument: int) -> int:
+    """
+    Get the size of the head of a CBOR data item.
+
+    Param
+        argument: The head argument.
+
+    Return
+        The size of the shortest head holding the argument, in bytes.
+    """
+    if argument < 24:
+        return 1
+    if argument < 0x100:
+        return 2
+    if argument < 0x10000:
+        return 3
+    return 5 if argument < 0x100000000 else 9
+
+
+@dataclass(slots=True)
+class NodeSize:
+    """
+    The encoded and non-volatile memory sizes of a node, in bytes.
+    """
+    encoded: int = 0
+    nvm: int = 0
+
+
+class _ListSize(object):
+    """
+    The running size totals of an object list.
+    """
+    __slots__ = ('keySize', 'encoded', 'nvm', 'maxId')
+
+    def __init__(self, objList: BaseNode) -> None:
+        """
+        Constructor.
+
+        Param
+            objList: The object list node.
+        """
+        self.keySize = len(cbor2.dumps(objList.getName()))
+        self.encoded = 0
+        self.nvm = 0
+        self.maxId: int | None = -1
+
+
+class EncodedSizeTracker(object):
+    """
+    The running encoded size and non-volatile memory size of a datastore.
+
+    The tracker keeps the size of every object and the size totals of every
+    object list, and listens to the datastore to keep them current. An edit
+    only marks the modified object as stale, at the cost of the walk to the
+    store done by every modification. The stale objects are encoded again
+    the next time a size is read, and the difference with their previous
+    size is applied to their list totals, so no size read encodes more than
+    the objects modified since the previous one.
+
+    The encoded sizes match the DatastoreEncoder output without name table,
+    and the non-volatile memory sizes the flash layout sizes of the objects
+    stored in non-volatile memory.
+
+    The objects of a lazily read datastore not created yet are not decoded:
+    their encoded size is read from the offsets of the encoded file and
+    their non-volatile memory size from the heads of their fields. Such an
+    object is only encoded once it is modified.
+
+    Param
+        store: The datastore node.
+    """
+    def __init__(self, store: DatastoreNode) -> None:
+        self._store = store
+        self._buffer = BytesIO()
+        self._encoder = DatastoreEncoder(self._buffer)
+        self._sizes: dict[BaseNode, NodeSize] = {}
+        self._lists: dict[BaseNode, _ListSize] = {}
+        # The sizes read from the encoded file, by object id, by list.
+        self._peeked: dict[BaseNode, dict[int, NodeSize]] = {}
+        self._stale: set[BaseNode] = set()
+        self._encodedCount = 0
+        for objList in store.getChildren():
+            if isinstance(objList, LazyObjectListNode):
+                self._peekList(objList)
+            else:
+                self._stale.update(objList.getChildren())
+        store.addObjectListener(self)
+
+    def _peekList(self, objList: LazyObjectListNode) -> None:
+        """
+        Add the sizes of the objects of a lazy object list not created yet
+        to the list totals, and mark the created objects as stale.
+
+        Param
+            objList: The lazy object list node.
+        """
+        type = NodeType[objList.getName()]
+        countKey = 'states' if type == NodeType.MULTI_STATE else 'elements'
+        listSize = self._getListSize(objList)
+        peeked = self._peeked[objList] = {}
+        for row in range(objList.getChildCount()):
+            peek = objList.peekChild(row)
+            if peek is None:
+                self._stale.add(objList.getChild(row))
+                continue
+            objId, encoded, fields = peek
+            size = peeked[objId] = NodeSize(encoded)
+            if type in _NVM_TYPES and fields.get('inNvm'):
+                size.nvm = getNvmSizeFromCount(type, fields.get(countKey, 0))
+            listSize.encoded += size.encoded
+            listSize.nvm += size.nvm
+            listSize.maxId = max(listSize.maxId, objId)
+
+    def _getPeekedSize(self, node: BaseNode,
+                       pop: bool = False) -> NodeSize | None:
+        """
+        Get the size of an object read from the encoded file.
+
+        Param
+            node: The object node.
+            pop: True to forget the size, false otherwise.
+
+        Return
+            The object size, none if the object size was not read from the
+            encoded file.
+        """
+        peeked = self._peeked.get(node.getParent())
+        if not peeked:
+            return None
+        return peeked.pop(node.getId(), None) if pop \
+            else peeked.get(node.getId())
+
+    def _getListSize(self, objList: BaseNode) -> _ListSize:
+        """
+        Get the size totals of an object list.
+
+        Param
+            objList: The object list node.
+
+        Return
+            The list size totals.
+        """
+        listSize = self._lists.get(objList)
+        if listSize is None:
+            listSize = self._lists[objList] = _ListSize(objList)
+        return listSize
+
+    def _measure(self, node: BaseNode) -> NodeSize:
+        """
+        Measure an object.
+
+        Param
+            node: The object node.
+
+        Return
+            The object sizes.
+        """
+        self._encodedCount += 1
+        self._encoder.encodeObject(node)
+        size = NodeSize(self._buffer.tell())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        if node.getType() in _NVM_TYPES and node.isInNvm():
+            size.nvm = getNvmSize(node)
+        return size
+
+    def _update(self) -> None:
+        """
+        Measure the stale objects and update their list totals.
+        """
+        if not self._stale:
+            return
+        for node in self._stale:
+            listSize = self._getListSize(node.getParent())
+            previous = self._sizes.get(node)
+            if previous is None:
+                previous = self._getPeekedSize(node, True)
+            size = self._sizes[node] = self._measure(node)
+            if previous is not None:
+                listSize.encoded -= previous.encoded
+                listSize.nvm -= previous.nvm
+            elif listSize.maxId is not None:
+                listSize.maxId = max(listSize.maxId, node.getId())
+            listSize.encoded += size.encoded
+            listSize.nvm += size.nvm
+        self._stale.clear()
+
+    def _getEncodedListSize(self, objList: BaseNode,
+                            listSize: _ListSize) -> int:
+        """
+        Get the encoded size of an object list with its name.
+
+        Param
+            objList: The object list node.
+            listSize: The list size totals.
+
+        Return
+            The encoded list size, the null of the ids without object
+            included.
+        """
+        if listSize.maxId is None:
+            listSize.maxId = max([node.getId()
+                                  for node in objList.getChildren()],
+                                 default=-1)
+        slotCount = listSize.maxId + 1
+        return listSize.keySize + _getHeadSize(slotCount) + \
+            listSize.encoded + slotCount - objList.getChildCount()
+
+    def getSize(self, node: BaseNode) -> NodeSize:
+        """
+        Get the sizes of an object, an object list or the datastore.
+
+        Param
+            node: The node.
+
+        Return
+            The encoded and non-volatile memory sizes of the node.
+        """
+        self._update()
+        match node.getType():
+            case NodeType.STORE:
+                size = NodeSize(_getHeadSize(node.getChildCount()))
+                for objList in node.getChildren():
+                    listSize = self._getListSize(objList)
+                    size.encoded += self._getEncodedListSize(objList,
+                                                             listSize)
+                    size.nvm += listSize.nvm
+                return size
+            case NodeType.OBJ_LIST:
+                listSize = self._getListSize(node)
+                return NodeSize(self._getEncodedListSize(node, listSize),
+                                listSize.nvm)
+            case _:
+                size = self._sizes.get(node)
+                if size is None:
+                    size = self._getPeekedSize(node)
+                return NodeSize(size.encoded, size.nvm) if size is not None \
+                    else NodeSize()
+
+    def getBudgetWarnings(self) -> list[str]:
+        """
+        Get the warnings of the datastore sizes exceeding their budget.
+
+        The budgets are read from the datastore metadata.
+
+        Return
+            The warnings, empty when the datastore fits its budgets.
+        """
+        metadata = self._store.getMetadata()
+        size = self.getSize(self._store)
+        warnings = []
+        for label, used, budget in (('encoded size', size.encoded,
+                                     metadata.flashBudget),
+                                    ('NVM size', size.nvm,
+                                     metadata.nvmBudget)):
+            if budget is not None and used > budget:
+                warnings.append(f"{self._store.getName()} {label} {used} B "
+                                f"exceeds its {budget} B budget")
+        return warnings
+
+    def getEncodedCount(self) -> int:
+        """
+        Get the number of objects measured since the tracker was created.
+
+        Return
+            The number of object encodings.
+        """
+        return self._encodedCount
+
+    def objectsAdded(self, nodes: list[BaseNode]) -> None:
+        """
+        Mark objects added to the datastore as stale.
+
+        Param
+            nodes: The added objects.
+        """
+        self._stale.update(nodes)
+
+    def objectsRemoved(self, nodes: list[BaseNode]) -> None:
+        """
+        Remove the sizes of objects removed from the datastore from their
+        list totals.
+
+        Param
+            nodes: The removed objects.
+        """
+        for node in nodes:
+            self._stale.discard(node)
+            size = self._sizes.pop(node, None)
+            if size is None:
+                size = self._getPeekedSize(node, True)
+            if size is None:
+                continue
+            listSize = self._getListSize(node.getParent())
+            listSize.encoded -= size.encoded
+            listSize.nvm -= size.nvm
+            if node.getId() == listSize.maxId:
+                listSize.maxId = None
+
+    def objectRenamed(self, node: BaseNode, oldName: str) -> None:
+        """
+        Ignore the renaming of an object, the names not being encoded.
+
+        Param
+            node: The renamed object.
+            oldName: The previous name of the object.
+        """
+        pass
+
+    def objectsCreated(self, objList: BaseNode) -> None:
+        """
+        Ignore the creation of the objects of a lazily read list, which are
+        sized when they are accessed.
+
+        Param
+            objList: The object list.
+        """
+        pass
+
+    def objectModified(self, node: BaseNode) -> None:
+        """
+        Mark a modified object as stale.
+
+        Param
+            node: The modified object.
+        """
+        if node in self._sizes or self._getPeekedSize(node) is not None:
+            self._stale.add(node)
@@ -0,0 +1,195 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from dataclasses import dataclass
+from logging import getLogger
+
+from .headerGenerator import generateHeader, getHeaderPath
+from .nvmLayout import DEFAULT_HEADROOM, getLayoutPath, layoutToDict, \
+    planNvmLayout
+from ..datastore import loadDefinitionFile
+from ..decoder import getNameTablePath
+from ..encoder import compressImage, createPagedImage, DatastoreEncoder, \
+    DEFAULT_CHUNK_SIZE, getCompressedPath, getPagedImagePath
+
+
+@dataclass(frozen=True, slots=True)
+class BuildOptions:
+    """
+    The encoding options and the extra outputs of a variant build.
+
+    The extra outputs are written next to the encoded datastore: the object
+    name table, the C header, the non-volatile memory layout when a sector
+    size is given, the paged image when a page size is given, and the
+    compressed image of the paged image, or of the encoded datastore
+    without paged image.
+    """
+    names: bool = False
+    header: bool = False
+    compact: bool = False
+    # The flash sector size of the non-volatile memory layout, and the
+    # fraction of each sector left free for wear levelling.
+    sectorSize: int | None = None
+    headroom: float = DEFAULT_HEADROOM
+    # The page size of the paged image, and whether its objects straddle
+    # pages.
+    pageSize: int | None = None
+    allowSpanning: bool = False
+    # The compressed image chunk size, the page size or DEFAULT_CHUNK_SIZE
+    # without paged image if none, and its preset dictionary, none if
+    # empty.
+    compress: bool = False
+    chunkSize: int | None = None
+    dictionary: bytes = b''
+
+
+@dataclass(slots=True)
+class VariantResult:
+    """
+    The build result of a variant.
+    """
+    definitionPath: str
+    outputPath: str
+    objCount: int = 0
+    size: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class BuildSummary:
+    """
+    The summary of a multi-variant build.
+    """
+    variantCount: int
+    failedCount: int
+    totalSize: int
+    cpuTime: float
+    wallTime: float
+
+
+def getOutputPath(definitionPath: str, outputDir: str = None) -> str:
+    """
+    Get the encoded datastore path of a definition.
+
+    Param
+        definitionPath: The definition path.
+        outputDir: The output directory, the definition directory if none.
+
+    Return
+        The definition path with the .cbor extension, in the output
+        directory if one is given.
+    """
+    outputPath = f"{os.path.splitext(definitionPath)[0]}.cbor"
+    if outputDir is not None:
+        outputPath = os.path.join(outputDir, os.path.basename(outputPath))
+    return outputPath
+
+
+def buildVariant(definitionPath: str, outputPath: str,
+                 options: BuildOptions = BuildOptions()) -> VariantResult:
+    """
+    Encode the definition of a variant.
+
+    Param
+        definitionPath: The definition path.
+        outputPath: The encoded datastore path.
+        options: The build options.
+
+    Return
+        The variant build result, the size being the encoded datastore size
+        without name table. A variant failing to build is reported by the
+        result error instead of raising.
+    """
+    result = VariantResult(definitionPath, outputPath)
+    start = time.perf_counter()
+    try:
+        store = loadDefinitionFile(definitionPath)
+        with open(outputPath, 'wb') as fp:
+            if options.names:
+                with open(getNameTablePath(outputPath), 'wb') as nameFp:
+                    result.objCount = DatastoreEncoder(
+                        fp, nameFp, options.compact).encode(store)
+            else:
+                result.objCount = DatastoreEncoder(
+                    fp, compact=options.compact).encode(store)
+            result.size = fp.tell()
+        if options.header:
+            with open(getHeaderPath(outputPath), 'w') as fp:
+                fp.write(generateHeader(store))
+        if options.sectorSize is not None:
+            layout = planNvmLayout(store, options.sectorSize,
+                                   options.headroom)
+            with open(getLayoutPath(outputPath), 'w') as fp:
+                json.dump(layoutToDict(layout), fp, indent=2)
+        imagePath = outputPath
+        if options.pageSize is not None:
+            with open(outputPath, 'rb') as fp:
+                image = createPagedImage(fp.read(), options.pageSize,
+                                         options.allowSpanning)
+            imagePath = getPagedImagePath(outputPath)
+            with open(imagePath, 'wb') as fp:
+                fp.write(image)
+        if options.compress:
+            with open(imagePath, 'rb') as fp:
+                image = fp.read()
+            chunkSize = options.chunkSize or options.pageSize or \
+                DEFAULT_CHUNK_SIZE
+            with open(getCompressedPath(imagePath), 'wb') as fp:
+                fp.write(compressImage(image, chunkSize, options.dictionary))
+    except (OSError, ValueError) as error:
+        result.error = str(error)
+    except Exception as error:
+        # Reported as a failed variant so it does not abort the other
+        # variants of a parallel build.
+        result.error = f"{type(error).__name__}: {error}"
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def buildVariants(variants: list[tuple[str, str]], maxWorkers: int = None,
+                  options: BuildOptions = BuildOptions()) -> tuple[
+                      list[VariantResult], BuildSummary]:
+    """
+    Encode the definitions of multiple variants in parallel.
+
+    The variants are spread over a pool of worker processes. A single
+    variant, or a single worker, is built in the calling process to avoid
+    the pool startup cost.
+
+    Param
+        variants: The (definition path, output path) of each variant.
+        maxWorkers: The maximum number of worker processes, the number of
+                    processors if none.
+        options: The build options of every variant.
+
+    Return
+        The variant build results, in the variants order, and the build
+        summary.
+    """
+    logger = getLogger('app.compiler')
+    workerCount = min(len(variants), maxWorkers or os.cpu_count() or 1)
+    logger.info(f"building {len(variants)} variants with "
+                f"{workerCount} workers")
+    start = time.perf_counter()
+    if workerCount <= 1:
+        results = [buildVariant(*variant, options) for variant in variants]
+    else:
+        definitionPaths, outputPaths = zip(*variants)
+        with ProcessPoolExecutor(max_workers=workerCount) as executor:
+            results = list(executor.map(buildVariant, definitionPaths,
+                                        outputPaths, repeat(options)))
+    wallTime = time.perf_counter() - start
+    for result in results:
+        if result.error is not None:
+            logger.error(f"unable to build {result.definitionPath}: "
+                         f"{result.error}")
+    summary = BuildSummary(len(results),
+                           sum(result.error is not None
+                               for result in results),
+                           sum(result.size for result in results),
+                           sum(result.elapsed for result in results),
+                           wallTime)
+    return results, summary
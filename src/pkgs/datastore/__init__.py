@@ -0,0 +1,25 @@
+from .arrayElementStore import ArrayElementStore, \
+    ArrayElementView                                            # noqa: F401
+from .baseNode import BaseNode, NodeType                        # noqa: F401
+from .childList import ChildList                                # noqa: F401
+from .buttonNode import ButtonArrayData, ButtonArrayElement, ButtonArrayNode, \
+    ButtonData, ButtonNode                                      # noqa: F401
+from .floatNode import FloatArrayData, FloatArrayElement, FloatArrayElements, \
+    FloatArrayNode, FloatData, FloatNode                        # noqa: F401
+from .datastoreNode import DatastoreMetadata, DatastoreNode     # noqa: F401
+from .definition import loadDefinition, loadDefinitionFile, \
+    loadYamlDefinition, objectFromDict, objectToDict, saveDefinition, \
+    saveDefinitionFile, saveYamlDefinition, storeFromDict, \
+    storeToDict                                                 # noqa: F401
+from .diff import DiffKind, FieldDiff, ObjectDiff, StoreDiffer, \
+    diffStores                                                  # noqa: F401
+from .intNode import IntArrayData, IntArrayElement, IntArrayElements, \
+    IntArrayNode, IntData, IntNode                              # noqa: F401
+from .multiStateNode import MultiStateData, MultiStateNode      # noqa: F401
+from .nodeLogger import NodeLoggerAdapter, getNodeLogger        # noqa: F401
+from .objectListNode import ObjectListNode                      # noqa: F401
+from .uintNode import UintArrayData, UintArrayElement, UintArrayElements, \
+    UintArrayNode, UintData, UintNode                           # noqa: F401
+from .searchIndex import ObjectSearchIndex                      # noqa: F401
+from .stateNode import StateNode                                # noqa: F401
+from .undoStack import FieldChange, UndoStack                   # noqa: F401
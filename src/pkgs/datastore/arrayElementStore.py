@@ -0,0 +1,299 @@
+from array import array
+from typing import Iterable, Iterator
+
+
+class ArrayElementView(object):
+    """
+    The view of an element of a numeric array.
+
+    The view reads and writes the element through the columns of its store.
+    """
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store: 'ArrayElementStore', index: int) -> None:
+        """
+        Constructor.
+
+        Param
+            store: The element store.
+            index: The element index in the store.
+        """
+        self._store = store
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._store._names[self._index]
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._store._names[self._index] = name
+        self._store._touch()
+
+    @property
+    def min(self) -> int | float:
+        return self._store._columns['min'][self._index]
+
+    @min.setter
+    def min(self, min: int | float) -> None:
+        self._store._setValue('min', self._index, min)
+
+    @property
+    def max(self) -> int | float:
+        return self._store._columns['max'][self._index]
+
+    @max.setter
+    def max(self, max: int | float) -> None:
+        self._store._setValue('max', self._index, max)
+
+    @property
+    def default(self) -> int | float:
+        return self._store._columns['default'][self._index]
+
+    @default.setter
+    def default(self, default: int | float) -> None:
+        self._store._setValue('default', self._index, default)
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return (self.name, self.min, self.max, self.default) == \
+                (other.name, other.min, other.max, other.default)
+        except AttributeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r}, " \
+            f"min={self.min!r}, max={self.max!r}, default={self.default!r})"
+
+
+class ArrayElementStore(object):
+    """
+    The column store of numeric array elements.
+
+    The element names are kept in a list and the minimum, maximum and default
+    values each in a typed array, so large arrays stay compact and the value
+    columns can be read, written and exported in bulk.
+    """
+    __slots__ = ('_names', '_columns', '_owner')
+
+    FIELDS = ('min', 'max', 'default')
+    TYPECODE = 'q'
+    ELEMENT_CLS = None
+
+    def __init__(self, elements: Iterable = ()) -> None:
+        """
+        Constructor.
+
+        Param
+            elements: The initial elements.
+        """
+        self._names: list[str] = []
+        self._columns = {field: array(self.TYPECODE) for field in self.FIELDS}
+        self._owner = None
+        self.extend(elements)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[ArrayElementView]:
+        return (ArrayElementView(self, index) for index in range(len(self)))
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            store = type(self)()
+            store._names = self._names[index]
+            for field in self.FIELDS:
+                store._columns[field] = self._columns[field][index]
+            return store
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError('array element index out of range')
+        return ArrayElementView(self, index)
+
+    def __setitem__(self, index: int, element) -> None:
+        values = self._getValues(element)
+        self._names[index] = element.name
+        for field, value in zip(self.FIELDS, values):
+            self._columns[field][index] = value
+        self._touch()
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self._names[index]
+        for field in self.FIELDS:
+            del self._columns[field][index]
+        self._touch()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ArrayElementStore):
+            return self._names == other._names and \
+                all(self._columns[field] == other._columns[field]
+                    for field in self.FIELDS)
+        if isinstance(other, list):
+            return len(self) == len(other) and \
+                all(view == element for view, element in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def _touch(self) -> None:
+        """
+        Mark the owner array node as modified.
+        """
+        if self._owner is not None:
+            self._owner.bumpRevision()
+
+    def _toColumn(self, values: Iterable, name: str) -> array:
+        """
+        Convert values to the column type.
+
+        A value error is raised when a value is out of the column range, so
+        no column is modified by invalid values.
+
+        Param
+            values: The values.
+            name: The name of the values owner, for the error message.
+
+        Return
+            The values in the column type.
+        """
+        try:
+            return array(self.TYPECODE, values)
+        except OverflowError as error:
+            raise ValueError(f"{name}: {error}") from error
+
+    def _getValues(self, element) -> array:
+        """
+        Get the values of an element in the column type.
+
+        Param
+            element: The element.
+
+        Return
+            The minimum, maximum and default values of the element.
+        """
+        return self._toColumn([getattr(element, field)
+                               for field in self.FIELDS],
+                              f"element {element.name}")
+
+    def _setValue(self, field: str, index: int, value: int | float) -> None:
+        """
+        Set a value of an element.
+
+        Param
+            field: The column field (min, max or default).
+            index: The element index.
+            value: The new value.
+        """
+        self._columns[field][index] = \
+            self._toColumn([value], f"element {self._names[index]}")[0]
+        self._touch()
+
+    def setOwner(self, owner) -> None:
+        """
+        Set the array node owning the elements.
+
+        Param
+            owner: The owner array node.
+        """
+        self._owner = owner
+
+    def append(self, element) -> None:
+        """
+        Append an element.
+
+        Param
+            element: The element to append.
+        """
+        self.insert(len(self), element)
+
+    def extend(self, elements: Iterable) -> None:
+        """
+        Append multiple elements.
+
+        Param
+            elements: The elements to append.
+        """
+        for element in elements:
+            self.append(element)
+
+    def insert(self, index: int, element) -> None:
+        """
+        Insert an element.
+
+        Param
+            index: The insertion index.
+            element: The element to insert.
+        """
+        values = self._getValues(element)
+        self._names.insert(index, element.name)
+        for field, value in zip(self.FIELDS, values):
+            self._columns[field].insert(index, value)
+        self._touch()
+
+    def pop(self, index: int = -1):
+        """
+        Remove an element.
+
+        Param
+            index: The index of the element to remove.
+
+        Return
+            The removed element.
+        """
+        element = self.ELEMENT_CLS(self._names.pop(index),
+                                   *(self._columns[field].pop(index)
+                                     for field in self.FIELDS))
+        self._touch()
+        return element
+
+    def getNames(self) -> list[str]:
+        """
+        Get the element names.
+
+        Return
+            A copy of the element names.
+        """
+        return list(self._names)
+
+    def setNames(self, names: Iterable[str]) -> None:
+        """
+        Set all the element names.
+
+        Param
+            names: The element names.
+        """
+        names = list(names)
+        if len(names) != len(self):
+            raise ValueError(f"expected {len(self)} names, got {len(names)}")
+        self._names = names
+        self._touch()
+
+    def getColumn(self, field: str) -> memoryview:
+        """
+        Get a value column without copying it.
+
+        Param
+            field: The column field (min, max or default).
+
+        Return
+            A read-only view of the column. The store cannot be resized
+            while the view is alive.
+        """
+        return memoryview(self._columns[field]).toreadonly()
+
+    def setColumn(self, field: str, values: Iterable) -> None:
+        """
+        Set all the values of a column.
+
+        Param
+            field: The column field (min, max or default).
+            values: The new values.
+        """
+        column = self._toColumn(values, f"{field} column")
+        if len(column) != len(self):
+            raise ValueError(f"expected {len(self)} values, "
+                             f"got {len(column)}")
+        self._columns[field] = column
+        self._touch()
@@ -0,0 +1,395 @@
+from enum import Enum
+from itertools import count
+
+from .childList import ChildList
+from .nodeLogger import NodeLoggerAdapter, getNodeLogger
+
+
+class NodeType(Enum):
+    """
+    The node type enum
+    """
+    STORE = 1
+    OBJ_LIST = 2
+    BUTTON = 3
+    BUTTON_ARRAY = 4
+    FLOAT = 5
+    FLOAT_ARRAY = 6
+    INT = 7
+    INT_ARRAY = 8
+    MULTI_STATE = 9
+    UINT = 10
+    UINT_ARRAY = 11
+
+
+_NO_CHILDREN = ChildList()
+_revisionClock = count(1)
+
+
+class BaseNode(object):
+    """
+    Datastore base tree node.
+    """
+    __slots__ = ('_name', '_type', '_parent', '_children', '_row',
+                 '_revision', '_id')
+
+    def __init__(self, name: str, type: NodeType,
+                 parent: 'BaseNode' = None) -> None:
+        """
+        Base datastore tree node.
+        """
+        self._name = name
+        self._type = type
+        self._parent = parent
+        self._children = _NO_CHILDREN
+        self._row: int | None = None
+        self._revision = next(_revisionClock)
+        self._id: int | None = None
+        if parent is not None:
+            parent.addChild(self)
+
+    @property
+    def _logger(self) -> NodeLoggerAdapter:
+        """
+        The node logger, shared with the other nodes of the same type.
+        """
+        return getNodeLogger(self._type.name, self._name)
+
+    def _getWritableChildren(self) -> ChildList:
+        """
+        Get the node children container for modification.
+
+        Nodes without children share an empty container until their first
+        child is added.
+
+        Return
+            The node children container.
+        """
+        if self._children is _NO_CHILDREN:
+            self._children = ChildList()
+        return self._children
+
+    def getRevision(self) -> int:
+        """
+        Get the node revision.
+
+        The revision changes every time the node or one of its descendants
+        is modified.
+
+        Return
+            The node revision.
+        """
+        return self._revision
+
+    def bumpRevision(self) -> None:
+        """
+        Mark the node as modified, updating its revision and the revision of
+        its ancestors.
+
+        The object list holding the modified node, if any, is notified of
+        the modification of its object.
+        """
+        revision = next(_revisionClock)
+        node = self
+        while node is not None:
+            node._revision = revision
+            parent = node._parent
+            if parent is not None and parent._type == NodeType.OBJ_LIST:
+                parent._childModified(node)
+            node = parent
+
+    def _isModifiedSince(self, revision: int) -> bool:
+        """
+        Check if the node itself was modified after a revision, ignoring the
+        modifications of its descendants.
+
+        The node revision also covers the descendants, the nodes with
+        children must override this method.
+
+        Param
+            revision: The revision.
+
+        Return
+            True if the node was modified, false otherwise.
+        """
+        return self._revision > revision
+
+    def _getModifiedChildren(self, revision: int) -> list['BaseNode']:
+        """
+        Get the children modified, or with modified descendants, after a
+        revision.
+
+        Param
+            revision: The revision.
+
+        Return
+            The modified children, in row order.
+        """
+        return [child for child in self._children
+                if child._revision > revision]
+
+    def getDirtySubtrees(self, revision: int) -> list['BaseNode']:
+        """
+        Get the subtrees modified after a revision.
+
+        A subtree is dirty when its root was modified, or added, after the
+        revision. Only the branches holding a modification are visited.
+
+        Param
+            revision: The revision, e.g. the revision of the last save.
+
+        Return
+            The roots of the dirty subtrees, in tree order.
+        """
+        dirty = []
+        nodes = [self] if self._revision > revision else []
+        while nodes:
+            node = nodes.pop()
+            if node._isModifiedSince(revision):
+                dirty.append(node)
+            else:
+                nodes.extend(reversed(node._getModifiedChildren(revision)))
+        return dirty
+
+    def getName(self) -> str:
+        """
+        Get the node name.
+
+        Return
+            The node name.
+        """
+        return self._name
+
+    def setName(self, name: str) -> None:
+        """
+        Set the node name.
+
+        Param
+            name: The node name.
+        """
+        oldName = self._name
+        self._name = name
+        if self._parent is not None:
+            self._parent._childRenamed(self, oldName)
+        self.bumpRevision()
+
+    def getId(self) -> int | None:
+        """
+        Get the object id.
+
+        The id is given by the object list of the datastore holding the
+        object, is unique within the list and is kept when the object is
+        renamed or moved within the list.
+
+        Return
+            The object id, none if the node is not in a datastore object
+            list.
+        """
+        return self._id
+
+    def getType(self) -> NodeType:
+        """
+        Get the node type.
+
+        Return
+            The node type.
+        """
+        return self._type
+
+    def getChildCount(self) -> int:
+        """
+        Get the node child count.
+
+        Return
+            The node child count.
+        """
+        return len(self._children)
+
+    def getChild(self, row: int) -> 'BaseNode':
+        """
+        Get the node child node at the given row.
+
+        Param
+            row: The row of the requested child.
+
+        Return
+            The child node at the given row.
+        """
+        if row < len(self._children):
+            return self._children[row]
+        return None
+
+    def getChildren(self) -> list['BaseNode']:
+        """
+        Get the node children.
+
+        Return
+            A copy of the node children list.
+        """
+        return self._children[:]
+
+    def addChild(self, child: 'BaseNode') -> None:
+        """
+        Add a child to the node.
+
+        Param
+            child: The child to add.
+        """
+        self._getWritableChildren().append(child)
+        child._parent = self
+        self._childrenAdded([child])
+        self.bumpRevision()
+
+    def addChildAt(self, row: int, child: 'BaseNode') -> bool:
+        """
+        Add a child at the given row.
+
+        Param
+            row: The insertion row.
+            child: The child to add.
+
+        Return
+            True if successful, false otherwise.
+        """
+        if row >= 0 and row <= len(self._children):
+            self._logger.info(f"adding child at {row}")
+            self._getWritableChildren().insert(row, [child])
+            child._parent = self
+            self._childrenAdded([child])
+            self.bumpRevision()
+            return True
+        return False
+
+    def addChildrenAt(self, row: int, children: list['BaseNode']) -> bool:
+        """
+        Add children at the given row.
+
+        Param
+            row: The insertion row.
+            children: The children to add.
+
+        Return
+            True if successful, false otherwise.
+        """
+        if row >= 0 and row <= len(self._children):
+            self._logger.info(f"adding {len(children)} children at {row}")
+            self._getWritableChildren().insert(row, children)
+            for child in children:
+                child._parent = self
+            self._childrenAdded(children)
+            self.bumpRevision()
+            return True
+        return False
+
+    def removeChildAt(self, row: int) -> bool:
+        """
+        Remove the child at the given row.
+
+        Param
+            row: The row of the child node to remove.
+
+        Return
+            True fi successful, false otherwise.
+        """
+        if row >= 0 and row < len(self._children):
+            self._childrenRemoved(self._children.pop(row))
+            self.bumpRevision()
+            return True
+        return False
+
+    def removeChildrenAt(self, row: int, count: int) -> bool:
+        """
+        Remove children starting at the given row.
+
+        Param
+            row: The row of the first child node to remove.
+            count: The number of child nodes to remove.
+
+        Return
+            True if successful, false otherwise.
+        """
+        if row >= 0 and count > 0 and row + count <= len(self._children):
+            self._childrenRemoved(self._children.pop(row, count))
+            self.bumpRevision()
+            return True
+        return False
+
+    def _childrenAdded(self, children: list['BaseNode']) -> None:
+        """
+        Handle the addition of children to the node.
+
+        Param
+            children: The added children.
+        """
+        pass
+
+    def _childrenRemoved(self, children: list['BaseNode']) -> None:
+        """
+        Handle the removal of children from the node.
+
+        Param
+            children: The removed children.
+        """
+        pass
+
+    def _childModified(self, child: 'BaseNode') -> None:
+        """
+        Handle the modification of a child of the node, or of one of its
+        descendants.
+
+        Param
+            child: The modified child.
+        """
+        pass
+
+    def _childRenamed(self, child: 'BaseNode', oldName: str) -> None:
+        """
+        Handle the renaming of a child of the node.
+
+        Param
+            child: The renamed child.
+            oldName: The previous name of the child.
+        """
+        pass
+
+    def getParent(self) -> 'BaseNode':
+        """
+        Get the parent.
+
+        Return
+            The node parent.
+        """
+        return self._parent
+
+    def getStore(self) -> 'BaseNode':
+        """
+        Get the datastore containing the node.
+
+        Return
+            The closest datastore ancestor of the node, none if the node is
+            not in a datastore.
+        """
+        node = self._parent
+        while node is not None and node._type != NodeType.STORE:
+            node = node._parent
+        return node
+
+    def getRow(self) -> int | None:
+        """
+        Get the node row.
+
+        Return
+            The row of the node if it has a parent, none otherwise.
+        """
+        if self._parent is not None:
+            return self._parent._children.rowOf(self)
+        return None
+
+    def isEditable(self) -> bool:
+        """
+        Check if the node can be edited.
+
+        Return
+            False if the node is an object list, true otherwise.
+        """
+        return self._type != NodeType.OBJ_LIST
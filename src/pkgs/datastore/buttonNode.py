@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from .baseNode import BaseNode, NodeType
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonData:
     """
     The button node data.
@@ -15,6 +15,8 @@ class ButtonNode(BaseNode):
     """
     The button node class.
     """
+    __slots__ = ('_data',)
+
     def __init__(self, name: str, data: ButtonData, parent: BaseNode = None):
         super().__init__(name, NodeType.BUTTON, parent=parent)
         self._data = data
@@ -36,6 +38,7 @@ class ButtonNode(BaseNode):
             time: The button long press time.
         """
         self._data.longPressTime = time
+        self.bumpRevision()
 
     def getInactiveTime(self) -> int:
         """
@@ -54,9 +57,10 @@ class ButtonNode(BaseNode):
             time: The button inactive time.
         """
         self._data.inactiveTime = time
+        self.bumpRevision()
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonArrayElement:
     """
     The button array element.
@@ -64,7 +68,7 @@ class ButtonArrayElement:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonArrayData:
     """
     The button array node data.
@@ -78,7 +82,36 @@ class ButtonArrayNode(BaseNode):
     """
     The button array node class.
     """
+    __slots__ = ('_data',)
+
     def __init__(self, name: str, data: ButtonArrayData,
                  parent: BaseNode = None):
         super().__init__(name, NodeType.BUTTON_ARRAY, parent=parent)
         self._data = data
+
+    def getLongPressTime(self) -> int:
+        """
+        Get the button array long press time.
+
+        Return
+            The button array long press time.
+        """
+        return self._data.longPressTime
+
+    def getInactiveTime(self) -> int:
+        """
+        Get the button array inactive time.
+
+        Return
+            The button array inactive time.
+        """
+        return self._data.inactiveTime
+
+    def getElements(self) -> list[ButtonArrayElement]:
+        """
+        Get the array elements.
+
+        Return
+            The array elements.
+        """
+        return self._data.elements
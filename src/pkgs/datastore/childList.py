@@ -0,0 +1,122 @@
+from typing import Iterator
+
+
+class ChildList(object):
+    """
+    The node children container.
+
+    The container keeps the row of each child in the child itself, so finding
+    the row of a child does not require searching the children. Rows after an
+    insertion or a removal are renumbered lazily the next time one of them is
+    requested.
+    """
+    __slots__ = ('_children', '_dirtyFrom')
+
+    def __init__(self, children: list = None) -> None:
+        """
+        Constructor.
+
+        Param
+            children: The initial children.
+        """
+        self._children = []
+        self._dirtyFrom = 0
+        if children is not None:
+            self.extend(children)
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def __getitem__(self, row: int | slice):
+        return self._children[row]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._children)
+
+    def __contains__(self, child) -> bool:
+        return self.rowOf(child) is not None
+
+    def _renumber(self) -> None:
+        """
+        Update the row of the children starting at the first dirty row.
+        """
+        for row in range(self._dirtyFrom, len(self._children)):
+            self._children[row]._row = row
+        self._dirtyFrom = len(self._children)
+
+    def append(self, child) -> None:
+        """
+        Append a child.
+
+        Param
+            child: The child to append.
+        """
+        if self._dirtyFrom == len(self._children):
+            child._row = len(self._children)
+            self._dirtyFrom += 1
+        else:
+            child._row = None
+        self._children.append(child)
+
+    def extend(self, children: list) -> None:
+        """
+        Append multiple children.
+
+        Param
+            children: The children to append.
+        """
+        self.insert(len(self._children), children)
+
+    def insert(self, row: int, children: list) -> None:
+        """
+        Insert children at the given row.
+
+        Param
+            row: The insertion row.
+            children: The children to insert.
+        """
+        length = len(self._children)
+        self._children[row:row] = children
+        if row == length and self._dirtyFrom == length:
+            self._renumber()
+        else:
+            for child in children:
+                child._row = None
+            self._dirtyFrom = min(self._dirtyFrom, row)
+
+    def pop(self, row: int, count: int = 1) -> list:
+        """
+        Remove children starting at the given row.
+
+        Param
+            row: The row of the first child to remove.
+            count: The number of children to remove.
+
+        Return
+            The removed children.
+        """
+        removed = self._children[row:row + count]
+        del self._children[row:row + count]
+        for child in removed:
+            child._row = None
+        self._dirtyFrom = min(self._dirtyFrom, row)
+        return removed
+
+    def rowOf(self, child) -> int | None:
+        """
+        Get the row of a child.
+
+        Param
+            child: The child.
+
+        Return
+            The row of the child if it is in the container, none otherwise.
+        """
+        row = getattr(child, '_row', None)
+        if not isinstance(row, int) or row >= self._dirtyFrom:
+            self._renumber()
+            row = getattr(child, '_row', None)
+        if isinstance(row, int) and row < len(self._children) and \
+                self._children[row] is child:
+            return row
+        return None
@@ -0,0 +1,383 @@
+import weakref
+from dataclasses import dataclass
+from datetime import datetime
+from .baseNode import BaseNode, NodeType
+from .objectListNode import ObjectListNode
+
+
+@dataclass(slots=True)
+class DatastoreMetadata:
+    lastModifiedAt: datetime
+    hasUnsavedChanges: bool = False
+    workingDir: str = '.'
+    # The encoded size and non-volatile memory size budgets, in bytes.
+    flashBudget: int | None = None
+    nvmBudget: int | None = None
+
+
+class DatastoreNode(BaseNode):
+    """
+    The datastore tree node class.
+
+    The datastore indexes its objects by name. The index is built the first
+    time it is used and then kept current by the object lists. The objects
+    of a lazily read list are indexed by their list and row until they are
+    all created, so that building the index does not create them. The object
+    additions, removals, renamings and modifications are also notified to
+    the object listeners, which must implement the objectsAdded(nodes),
+    objectsRemoved(nodes), objectRenamed(node, oldName), objectModified(node)
+    and objectsCreated(objList) methods, the last one being called once a
+    lazily read object list created all of its objects.
+
+    The datastore has unsaved changes when its revision changed since it
+    was last saved, i.e. when any node of the datastore was modified.
+
+    Param
+        name: The node name.
+        metadata: The datastore metadata.
+    """
+    __slots__ = ('_metadata', '_names', '_duplicates', '_listeners',
+                 '_modifiedRevision', '_savedRevision')
+
+    def __init__(self, name: str, parent: BaseNode,
+                 metadata: DatastoreMetadata) -> None:
+        self._names: dict[str, object] | None = None
+        self._duplicates: dict[str, list[object]] = {}
+        self._listeners = weakref.WeakSet()
+        super().__init__(name, NodeType.STORE, parent=parent)
+        self._metadata = metadata
+        self._modifiedRevision = self._revision
+        self._savedRevision = self._revision
+
+    def bumpRevision(self) -> None:
+        super().bumpRevision()
+        self._modifiedRevision = self._revision
+
+    def _isModifiedSince(self, revision: int) -> bool:
+        return self._modifiedRevision > revision
+
+    def _getNameIndex(self) -> dict[str, object]:
+        """
+        Get the object name index, building it on first use.
+
+        Return
+            The index key of the first object holding each name.
+        """
+        if self._names is None:
+            self._names = {}
+            for objList in self._children:
+                for name, key in objList._getIndexEntries():
+                    self._addName(key, name)
+        return self._names
+
+    def _getIndexKey(self, node: BaseNode | None) -> object:
+        """
+        Get the key identifying an object in the name index.
+
+        Param
+            node: The object node, none for no object.
+
+        Return
+            The index key given by the object list, the node itself if it
+            has no list.
+        """
+        if node is None or node._parent is None:
+            return node
+        return node._parent._getIndexKey(node)
+
+    def _addName(self, key: object, name: str) -> None:
+        """
+        Add an object to the name index.
+
+        Param
+            key: The object index key.
+            name: The object name.
+        """
+        found = self._names.setdefault(name, key)
+        if found != key:
+            self._duplicates.setdefault(name, [found]).append(key)
+
+    def _removeName(self, key: object, name: str) -> None:
+        """
+        Remove an object from the name index.
+
+        Param
+            key: The object index key.
+            name: The name under which the object is indexed.
+        """
+        keys = self._duplicates.get(name)
+        if keys is not None:
+            keys.remove(key)
+            self._names[name] = keys[0]
+            if len(keys) == 1:
+                del self._duplicates[name]
+        elif self._names.get(name) == key:
+            del self._names[name]
+
+    def _objectsCreated(self, objList: BaseNode) -> None:
+        """
+        Replace the index keys of the objects of a lazily read list by the
+        objects, once the list created all of them, and notify it.
+
+        Param
+            objList: The object list.
+        """
+        if self._names is not None:
+            children = objList._children
+            for name, key in self._names.items():
+                if isinstance(key, tuple) and key[0] is objList:
+                    self._names[name] = children[key[1]]
+            for keys in self._duplicates.values():
+                for index, key in enumerate(keys):
+                    if isinstance(key, tuple) and key[0] is objList:
+                        keys[index] = children[key[1]]
+        for listener in self._listeners:
+            listener.objectsCreated(objList)
+
+    def _indexObjects(self, nodes: list[BaseNode]) -> None:
+        """
+        Add objects added to an object list to the name index.
+
+        Param
+            nodes: The added objects.
+        """
+        if self._names is not None:
+            for node in nodes:
+                self._addName(self._getIndexKey(node), node._name)
+        for listener in self._listeners:
+            listener.objectsAdded(nodes)
+
+    def _unindexObjects(self, nodes: list[BaseNode]) -> None:
+        """
+        Remove objects removed from an object list from the name index.
+
+        Param
+            nodes: The removed objects.
+        """
+        if self._names is not None:
+            for node in nodes:
+                self._removeName(self._getIndexKey(node), node._name)
+        for listener in self._listeners:
+            listener.objectsRemoved(nodes)
+
+    def _reindexObject(self, node: BaseNode, oldName: str) -> None:
+        """
+        Update the name index of a renamed object.
+
+        Param
+            node: The renamed object.
+            oldName: The previous name of the object.
+        """
+        if self._names is not None:
+            key = self._getIndexKey(node)
+            self._removeName(key, oldName)
+            self._addName(key, node._name)
+        for listener in self._listeners:
+            listener.objectRenamed(node, oldName)
+
+    def _objectModified(self, node: BaseNode) -> None:
+        """
+        Notify the modification of an object.
+
+        Param
+            node: The modified object.
+        """
+        for listener in self._listeners:
+            listener.objectModified(node)
+
+    def _childrenAdded(self, children: list[BaseNode]) -> None:
+        if self._names is not None or self._listeners:
+            for objList in children:
+                self._indexObjects(list(objList._children))
+
+    def _childrenRemoved(self, children: list[BaseNode]) -> None:
+        if self._names is not None or self._listeners:
+            for objList in children:
+                self._unindexObjects(list(objList._children))
+
+    def addObjectListener(self, listener: object) -> None:
+        """
+        Add an object listener.
+
+        The datastore only keeps a weak reference to the listener.
+
+        Param
+            listener: The object listener.
+        """
+        self._listeners.add(listener)
+
+    def removeObjectListener(self, listener: object) -> None:
+        """
+        Remove an object listener.
+
+        Param
+            listener: The object listener.
+        """
+        self._listeners.discard(listener)
+
+    def findObject(self, name: str) -> BaseNode | None:
+        """
+        Find an object by name.
+
+        Param
+            name: The object name.
+
+        Return
+            The first object with this name, none if there is none.
+        """
+        key = self._getNameIndex().get(name)
+        if isinstance(key, tuple):
+            objList, row = key
+            return objList.getChild(row)
+        return key
+
+    def isNameAvailable(self, name: str, node: BaseNode = None) -> bool:
+        """
+        Check if a name can be given to an object.
+
+        Param
+            name: The object name.
+            node: The object to rename, none for a new object.
+
+        Return
+            True if no other object has this name, false otherwise.
+        """
+        found = self._getNameIndex().get(name)
+        if found is None:
+            return True
+        return found == self._getIndexKey(node) and \
+            name not in self._duplicates
+
+    def getDuplicateNames(self) -> list[str]:
+        """
+        Get the names held by more than one object.
+
+        Return
+            The duplicate object names.
+        """
+        self._getNameIndex()
+        return list(self._duplicates)
+
+    def getUniqueNames(self, prefix: str, count: int) -> list[str]:
+        """
+        Get names not used by any object.
+
+        The prefix is used as is if it is available, followed by a numeric
+        suffix otherwise.
+
+        Param
+            prefix: The name prefix.
+            count: The number of names.
+
+        Return
+            The available names.
+        """
+        names = self._getNameIndex()
+        available = []
+        candidate = prefix
+        suffix = 0
+        while len(available) < count:
+            if candidate not in names:
+                available.append(candidate)
+            suffix += 1
+            candidate = f"{prefix}_{suffix}"
+        return available
+
+    def getLastModifiedAt(self) -> str:
+        """
+        Get the store last modified timestamp.
+
+        Return
+            The formatted last modified timestamp.
+        """
+        return self._metadata.lastModifiedAt.strftime('%d/%m/%Y %H:%M:%S')
+
+    def setLastModifiedAt(self, lastModifiedAt: datetime) -> None:
+        """
+        Set the last modified timestamp.
+
+        Param
+            lastModifiedAt: The last modified timestamp.
+        """
+        self._metadata.lastModifiedAt = lastModifiedAt
+        self._metadata.hasUnsavedChanges = True
+
+    def hasUnsavedChanges(self) -> bool:
+        """
+        Check if the store has unsaved changes.
+
+        Return
+            True if the store has unsaved changes, false otherwise.
+        """
+        return self._metadata.hasUnsavedChanges or \
+            self._revision > self._savedRevision
+
+    def clearUnsavedChangesFlag(self) -> None:
+        """
+        Clear the unsaved changes flag, marking the current revision as
+        saved.
+        """
+        self._metadata.hasUnsavedChanges = False
+        self._savedRevision = self._revision
+
+    def getSavedRevision(self) -> int:
+        """
+        Get the revision of the store when it was last saved or loaded.
+
+        The subtrees modified since are given by
+        getDirtySubtrees(getSavedRevision()).
+
+        Return
+            The saved revision.
+        """
+        return self._savedRevision
+
+    def getWorkingDir(self) -> str:
+        """
+        Get the store working directory.
+
+        Return
+            The store working directory.
+        """
+        return self._metadata.workingDir
+
+    def setWorkingDir(self, workingDir: str) -> None:
+        """
+        Set the store working directory.
+
+        Param
+            workingDir: The working directory.
+        """
+        self._metadata.workingDir = workingDir
+        self.setLastModifiedAt(datetime.now())
+
+    def getMetadata(self) -> DatastoreMetadata:
+        """
+        Get the store metadata.
+
+        Return
+            The store metadata.
+        """
+        return self._metadata
+
+    @classmethod
+    def createNewStore(cls, root: BaseNode, name: str = 'datastore',
+                       metadata: DatastoreMetadata = None) -> 'DatastoreNode':
+        """
+        Create a new datastore structure.
+
+        Param
+            root: The datastore tree root node.
+            name: The datastore name.
+            metadata: The datastore metadata, new metadata if none.
+
+        Return
+            The new datastore structure.
+        """
+        if metadata is None:
+            metadata = DatastoreMetadata(datetime.now())
+        store = DatastoreNode(name, root, metadata)
+        for type in NodeType:
+            if type != NodeType.STORE and type != NodeType.OBJ_LIST:
+                ObjectListNode(type.name, store)
+        return store
@@ -0,0 +1,516 @@
+import json
+import os
+from datetime import datetime
+from typing import Callable, TextIO
+
+import yaml
+
+from .baseNode import BaseNode, NodeType
+from .buttonNode import ButtonArrayData, ButtonArrayElement, ButtonArrayNode, \
+    ButtonData, ButtonNode
+from .datastoreNode import DatastoreMetadata, DatastoreNode
+from .floatNode import FloatArrayData, FloatArrayElement, FloatArrayNode, \
+    FloatData, FloatNode
+from .intNode import IntArrayData, IntArrayElement, IntArrayNode, IntData, \
+    IntNode
+from .multiStateNode import MultiStateData, MultiStateNode
+from .objectListNode import ObjectListNode
+from .stateNode import StateNode
+from .uintNode import UintArrayData, UintArrayElement, UintArrayNode, \
+    UintData, UintNode
+
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
+
+def _buttonToDict(node: ButtonNode) -> dict:
+    """
+    Convert a button object to its definition.
+
+    Param
+        node: The button node.
+
+    Return
+        The button definition.
+    """
+    return {'name': node.getName(),
+            'longPressTime': node.getLongPressTime(),
+            'inactiveTime': node.getInactiveTime()}
+
+
+def _buttonArrayToDict(node: ButtonArrayNode) -> dict:
+    """
+    Convert a button array object to its definition.
+
+    Param
+        node: The button array node.
+
+    Return
+        The button array definition.
+    """
+    definition = _buttonToDict(node)
+    definition['elements'] = [element.name for element in node.getElements()]
+    return definition
+
+
+def _numberToDict(node: FloatNode | IntNode | UintNode) -> dict:
+    """
+    Convert a float, int or uint object to its definition.
+
+    Param
+        node: The float, int or uint node.
+
+    Return
+        The object definition.
+    """
+    return {'name': node.getName(), 'min': node.getMinimum(),
+            'max': node.getMaximum(), 'default': node.getDefault()}
+
+
+def _numberArrayToDict(node: FloatArrayNode | IntArrayNode |
+                       UintArrayNode) -> dict:
+    """
+    Convert a float, int or uint array object to its definition.
+
+    Param
+        node: The float, int or uint array node.
+
+    Return
+        The object definition.
+    """
+    return {'name': node.getName(), 'inNvm': node.isInNvm(),
+            'elements': [{'name': element.name, 'min': element.min,
+                          'max': element.max, 'default': element.default}
+                         for element in node.getElements()]}
+
+
+def _multiStateToDict(node: MultiStateNode) -> dict:
+    """
+    Convert a multi-state object to its definition.
+
+    Param
+        node: The multi-state node.
+
+    Return
+        The multi-state definition.
+    """
+    return {'name': node.getName(), 'inNvm': node.isInNvm(),
+            'default': node.getDefaultIndex(),
+            'states': [{'name': state.getName(), 'value': state.getValue()}
+                       for state in node.getStateList()]}
+
+
+def _checkName(name: object) -> str:
+    """
+    Check that an element or state name is a string.
+
+    YAML loads some unquoted names, e.g. ON and OFF, as other scalars.
+
+    Param
+        name: The name.
+
+    Return
+        The name.
+    """
+    if not isinstance(name, str):
+        raise ValueError(f"name {name!r} is not a string")
+    return name
+
+
+def _buttonFromDict(definition: dict) -> ButtonNode:
+    """
+    Create a button object from its definition.
+
+    Param
+        definition: The button definition.
+
+    Return
+        The button node.
+    """
+    fields = dict(definition)
+    name = fields.pop('name')
+    return ButtonNode(name, ButtonData(**fields))
+
+
+def _buttonArrayFromDict(definition: dict) -> ButtonArrayNode:
+    """
+    Create a button array object from its definition.
+
+    Param
+        definition: The button array definition.
+
+    Return
+        The button array node.
+    """
+    fields = dict(definition)
+    name = fields.pop('name')
+    fields['elements'] = [ButtonArrayElement(_checkName(element))
+                          for element in fields.get('elements', [])]
+    return ButtonArrayNode(name, ButtonArrayData(**fields))
+
+
+def _numberFromDict(nodeCls: type, dataCls: type) -> Callable:
+    """
+    Get the factory of a float, int or uint object.
+
+    Param
+        nodeCls: The node class.
+        dataCls: The node data class.
+
+    Return
+        The object factory.
+    """
+    def create(definition: dict) -> BaseNode:
+        fields = dict(definition)
+        name = fields.pop('name')
+        return nodeCls(name, dataCls(**fields))
+    return create
+
+
+def _numberArrayFromDict(nodeCls: type, dataCls: type,
+                         elementCls: type) -> Callable:
+    """
+    Get the factory of a float, int or uint array object.
+
+    Param
+        nodeCls: The node class.
+        dataCls: The node data class.
+        elementCls: The array element class.
+
+    Return
+        The object factory.
+    """
+    def create(definition: dict) -> BaseNode:
+        fields = dict(definition)
+        name = fields.pop('name')
+        fields['elements'] = [elementCls(**element)
+                              for element in fields.get('elements', [])]
+        for element in fields['elements']:
+            _checkName(element.name)
+        return nodeCls(name, dataCls(**fields))
+    return create
+
+
+def _multiStateFromDict(definition: dict) -> MultiStateNode:
+    """
+    Create a multi-state object from its definition.
+
+    Param
+        definition: The multi-state definition.
+
+    Return
+        The multi-state node.
+    """
+    fields = dict(definition)
+    name = fields.pop('name')
+    fields['states'] = [StateNode(_checkName(state['name']), state['value'])
+                        for state in fields.get('states', [])]
+    return MultiStateNode(name, MultiStateData(**fields))
+
+
+_OBJECT_CODECS = {
+    NodeType.BUTTON: (_buttonToDict, _buttonFromDict),
+    NodeType.BUTTON_ARRAY: (_buttonArrayToDict, _buttonArrayFromDict),
+    NodeType.FLOAT: (_numberToDict, _numberFromDict(FloatNode, FloatData)),
+    NodeType.FLOAT_ARRAY: (_numberArrayToDict, _numberArrayFromDict(
+        FloatArrayNode, FloatArrayData, FloatArrayElement)),
+    NodeType.INT: (_numberToDict, _numberFromDict(IntNode, IntData)),
+    NodeType.INT_ARRAY: (_numberArrayToDict, _numberArrayFromDict(
+        IntArrayNode, IntArrayData, IntArrayElement)),
+    NodeType.MULTI_STATE: (_multiStateToDict, _multiStateFromDict),
+    NodeType.UINT: (_numberToDict, _numberFromDict(UintNode, UintData)),
+    NodeType.UINT_ARRAY: (_numberArrayToDict, _numberArrayFromDict(
+        UintArrayNode, UintArrayData, UintArrayElement)),
+}
+
+
+_BUDGET_KEYS = ('flashBudget', 'nvmBudget')
+
+
+def _withId(node: BaseNode, definition: dict) -> dict:
+    """
+    Add the object id to an object definition.
+
+    Param
+        node: The object node.
+        definition: The object definition.
+
+    Return
+        The object definition starting with the object id, the definition
+        as is if the object has no id.
+    """
+    if node.getId() is None:
+        return definition
+    return {'id': node.getId(), **definition}
+
+
+def objectToDict(node: BaseNode) -> dict:
+    """
+    Convert an object to its definition.
+
+    Param
+        node: The object node.
+
+    Return
+        The object definition.
+    """
+    if node.getType() not in _OBJECT_CODECS:
+        raise ValueError(f"{node.getType().name} is an unsupported object "
+                         f"type")
+    return _withId(node, _OBJECT_CODECS[node.getType()][0](node))
+
+
+def objectFromDict(type: NodeType, definition: dict) -> BaseNode:
+    """
+    Create an object from its definition.
+
+    Param
+        type: The object type.
+        definition: The object definition. The object keeps the id of the
+            definition when it is added to a datastore object list, unless
+            another object of the list has it.
+
+    Return
+        The object node, without parent.
+    """
+    if type not in _OBJECT_CODECS:
+        raise ValueError(f"{type.name} is an unsupported object type")
+    if not isinstance(definition, dict):
+        raise ValueError(f"invalid {type.name} object: not a mapping")
+    objId = None
+    if 'id' in definition:
+        definition = dict(definition)
+        objId = definition.pop('id')
+        if not isinstance(objId, int) or isinstance(objId, bool) or \
+                objId < 0:
+            raise ValueError(f"invalid {type.name} object id {objId!r}")
+    name = definition.get('name')
+    if name is not None and not isinstance(name, str):
+        raise ValueError(f"invalid {type.name} object name {name!r}: not a "
+                         f"string")
+    try:
+        node = _OBJECT_CODECS[type][1](definition)
+    except (AttributeError, KeyError, TypeError, ValueError) as error:
+        label = f"{type.name} object {name}" if name is not None \
+            else f"{type.name} object"
+        raise ValueError(f"invalid {label}: {error!r}") from error
+    node._id = objId
+    return node
+
+
+def storeToDict(store: DatastoreNode) -> dict:
+    """
+    Convert a datastore to its definition.
+
+    Param
+        store: The datastore node.
+
+    Return
+        The datastore definition.
+    """
+    objects = {}
+    for row in range(store.getChildCount()):
+        objList = store.getChild(row)
+        toDict = _OBJECT_CODECS[NodeType[objList.getName()]][0]
+        objects[objList.getName()] = [_withId(node, toDict(node))
+                                      for node in objList.getChildren()]
+    metadata = store.getMetadata()
+    metadataDef = {'lastModifiedAt': metadata.lastModifiedAt.isoformat(),
+                   'workingDir': metadata.workingDir}
+    for key in _BUDGET_KEYS:
+        if getattr(metadata, key) is not None:
+            metadataDef[key] = getattr(metadata, key)
+    return {'name': store.getName(), 'metadata': metadataDef,
+            'objects': objects}
+
+
+def _budgetFromDict(metadataDef: dict, key: str) -> int | None:
+    """
+    Get a size budget of a datastore metadata definition.
+
+    Param
+        metadataDef: The metadata definition.
+        key: The budget key.
+
+    Return
+        The budget in bytes, none if the definition has no budget.
+    """
+    budget = metadataDef.get(key)
+    if budget is not None and (not isinstance(budget, int) or
+                               isinstance(budget, bool) or budget < 0):
+        raise ValueError(f"{key} {budget!r} is not a size in bytes")
+    return budget
+
+
+def storeFromDict(definition: dict, root: BaseNode = None) -> DatastoreNode:
+    """
+    Create a datastore from its definition.
+
+    Param
+        definition: The datastore definition.
+        root: The datastore tree root node, a new root is created if none.
+
+    Return
+        The datastore node.
+    """
+    if not isinstance(definition, dict):
+        raise ValueError('invalid definition: not a mapping')
+    objects = definition.get('objects', {})
+    if not isinstance(objects, dict):
+        raise ValueError('invalid objects: not a mapping of object lists')
+    for listName in objects:
+        if listName not in NodeType.__members__ or \
+                NodeType[listName] not in _OBJECT_CODECS:
+            raise ValueError(f"{listName} is an unsupported object list")
+        if not isinstance(objects[listName], list):
+            raise ValueError(f"invalid {listName}: not a list of objects")
+    metadataDef = definition.get('metadata', {})
+    if not isinstance(metadataDef, dict):
+        raise ValueError('invalid metadata: not a mapping')
+    lastModifiedAt = metadataDef.get('lastModifiedAt', datetime.now())
+    try:
+        metadata = DatastoreMetadata(
+            lastModifiedAt if isinstance(lastModifiedAt, datetime)
+            else datetime.fromisoformat(lastModifiedAt),
+            workingDir=metadataDef.get('workingDir', '.'),
+            flashBudget=_budgetFromDict(metadataDef, 'flashBudget'),
+            nvmBudget=_budgetFromDict(metadataDef, 'nvmBudget'))
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"invalid metadata: {error!r}") from error
+    children = {}
+    for listName, objDefs in objects.items():
+        type = NodeType[listName]
+        children[listName] = []
+        for index, objDef in enumerate(objDefs):
+            try:
+                children[listName].append(objectFromDict(type, objDef))
+            except ValueError as error:
+                raise ValueError(f"object {index}: {error}") from error
+    if root is None:
+        root = ObjectListNode('', None)
+    store = DatastoreNode.createNewStore(root, definition.get('name',
+                                                              'datastore'),
+                                         metadata)
+    for row in range(store.getChildCount()):
+        objList = store.getChild(row)
+        if objList.getName() in children:
+            objList.addChildrenAt(0, children[objList.getName()])
+    store.clearUnsavedChangesFlag()
+    return store
+
+
+def loadDefinition(fp: TextIO, root: BaseNode = None) -> DatastoreNode:
+    """
+    Load a datastore from a JSON definition.
+
+    Param
+        fp: The definition input stream.
+        root: The datastore tree root node, a new root is created if none.
+
+    Return
+        The datastore node.
+    """
+    return storeFromDict(json.load(fp), root)
+
+
+def saveDefinition(store: DatastoreNode, fp: TextIO) -> None:
+    """
+    Save a datastore as a JSON definition.
+
+    Param
+        store: The datastore node.
+        fp: The definition output stream.
+    """
+    json.dump(storeToDict(store), fp, indent=2)
+
+
+def loadYamlDefinition(fp: TextIO, root: BaseNode = None) -> DatastoreNode:
+    """
+    Load a datastore from a YAML definition.
+
+    The libyaml loader is used when it is available.
+
+    Param
+        fp: The definition input stream.
+        root: The datastore tree root node, a new root is created if none.
+
+    Return
+        The datastore node.
+    """
+    try:
+        definition = yaml.load(fp, Loader=_YamlLoader)
+    except yaml.YAMLError as error:
+        raise ValueError(f"invalid YAML definition: {error}") from error
+    if not isinstance(definition, dict):
+        raise ValueError('invalid YAML definition: not a mapping')
+    return storeFromDict(definition, root)
+
+
+def saveYamlDefinition(store: DatastoreNode, fp: TextIO) -> None:
+    """
+    Save a datastore as a YAML definition.
+
+    The libyaml dumper is used when it is available. The objects are written
+    one per line.
+
+    Param
+        store: The datastore node.
+        fp: The definition output stream.
+    """
+    yaml.dump(storeToDict(store), fp, Dumper=_YamlDumper, sort_keys=False,
+              default_flow_style=None, width=1 << 16)
+
+
+_FILE_FORMATS = {
+    '.json': (loadDefinition, saveDefinition),
+    '.yaml': (loadYamlDefinition, saveYamlDefinition),
+    '.yml': (loadYamlDefinition, saveYamlDefinition),
+}
+
+
+def _getFileFormat(path: str) -> tuple[Callable, Callable]:
+    """
+    Get the definition format of a file from its extension.
+
+    Param
+        path: The definition file path.
+
+    Return
+        The load and save functions of the format.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _FILE_FORMATS:
+        raise ValueError(f"{extension or path} is an unsupported "
+                         f"definition format")
+    return _FILE_FORMATS[extension]
+
+
+def loadDefinitionFile(path: str, root: BaseNode = None) -> DatastoreNode:
+    """
+    Load a datastore from a JSON or YAML definition file.
+
+    Param
+        path: The definition file path.
+        root: The datastore tree root node, a new root is created if none.
+
+    Return
+        The datastore node.
+    """
+    load = _getFileFormat(path)[0]
+    with open(path, 'r') as fp:
+        return load(fp, root)
+
+
+def saveDefinitionFile(store: DatastoreNode, path: str) -> None:
+    """
+    Save a datastore to a JSON or YAML definition file.
+
+    Param
+        store: The datastore node.
+        path: The definition file path.
+    """
+    save = _getFileFormat(path)[1]
+    with open(path, 'w') as fp:
+        save(store, fp)
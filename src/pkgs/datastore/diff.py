@@ -0,0 +1,349 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from hashlib import blake2b
+from typing import Any, Hashable
+
+from .baseNode import BaseNode, NodeType
+from .datastoreNode import DatastoreNode
+from .definition import objectToDict
+
+
+class DiffKind(Enum):
+    """
+    The object difference kind enum.
+    """
+    ADDED = 1
+    REMOVED = 2
+    RENAMED = 3
+    MODIFIED = 4
+
+
+@dataclass(slots=True)
+class FieldDiff:
+    """
+    The difference of an object field.
+
+    The array elements and the multi-state states are identified by name in
+    the field path, e.g. elements.SPEED.max or states.ON.value. An added or
+    removed element or state has no old or new value.
+    """
+    field: str
+    old: Any
+    new: Any
+
+
+@dataclass(slots=True)
+class ObjectDiff:
+    """
+    The difference of an object between two datastores.
+
+    The name is the object name in the new datastore, or in the old one for
+    a removed object.
+    """
+    kind: DiffKind
+    type: NodeType
+    name: str
+    oldName: str | None = None
+    fields: list[FieldDiff] = field(default_factory=list)
+
+
+def _buttonKey(node: BaseNode) -> Hashable:
+    """
+    Get the content of a button object.
+    """
+    return (node.getLongPressTime(), node.getInactiveTime())
+
+
+def _buttonArrayKey(node: BaseNode) -> Hashable:
+    """
+    Get the content of a button array object.
+    """
+    return (node.getLongPressTime(), node.getInactiveTime(),
+            tuple([element.name for element in node.getElements()]))
+
+
+def _numberKey(node: BaseNode) -> Hashable:
+    """
+    Get the content of a float, int or uint object.
+    """
+    return (node.getMinimum(), node.getMaximum(), node.getDefault())
+
+
+def _numberArrayKey(node: BaseNode) -> Hashable:
+    """
+    Get the content of a float, int or uint array object, hashing the value
+    columns as bytes.
+    """
+    elements = node.getElements()
+    return (node.isInNvm(), tuple(elements.getNames()),
+            elements.getColumn('min').tobytes(),
+            elements.getColumn('max').tobytes(),
+            elements.getColumn('default').tobytes())
+
+
+def _multiStateKey(node: BaseNode) -> Hashable:
+    """
+    Get the content of a multi-state object.
+    """
+    return (node.isInNvm(), node.getDefaultIndex(),
+            tuple([(state.getName(), state.getValue())
+                   for state in node.getStateList()]))
+
+
+# The digest size of the object and object list contents, in bytes.
+_DIGEST_SIZE = 16
+
+# The object content, without the name, as a hashable value.
+_CONTENT_KEYS = {
+    NodeType.BUTTON: _buttonKey,
+    NodeType.BUTTON_ARRAY: _buttonArrayKey,
+    NodeType.FLOAT: _numberKey,
+    NodeType.FLOAT_ARRAY: _numberArrayKey,
+    NodeType.INT: _numberKey,
+    NodeType.INT_ARRAY: _numberArrayKey,
+    NodeType.MULTI_STATE: _multiStateKey,
+    NodeType.UINT: _numberKey,
+    NodeType.UINT_ARRAY: _numberArrayKey,
+}
+
+
+def _getItemName(item: str | dict) -> str:
+    """
+    Get the name of an array element or a state definition.
+
+    Param
+        item: The element or state definition.
+
+    Return
+        The item name.
+    """
+    return item if isinstance(item, str) else item['name']
+
+
+def _diffItems(key: str, old: list, new: list) -> list[FieldDiff]:
+    """
+    Compare the array elements or the states of two object definitions.
+
+    Param
+        key: The definition key.
+        old: The old elements or states.
+        new: The new elements or states.
+
+    Return
+        The differences of the elements or states.
+    """
+    oldItems = {_getItemName(item): item for item in old}
+    newItems = {_getItemName(item): item for item in new}
+    diffs = []
+    for name, item in newItems.items():
+        previous = oldItems.get(name)
+        if previous is None:
+            diffs.append(FieldDiff(f"{key}.{name}", None, item))
+        elif previous != item:
+            diffs.extend(FieldDiff(f"{key}.{name}.{itemField}",
+                                   previous[itemField], item[itemField])
+                         for itemField in item
+                         if previous[itemField] != item[itemField])
+    diffs.extend(FieldDiff(f"{key}.{name}", item, None)
+                 for name, item in oldItems.items() if name not in newItems)
+    if not diffs and old != new:
+        diffs.append(FieldDiff(key, [_getItemName(item) for item in old],
+                               [_getItemName(item) for item in new]))
+    return diffs
+
+
+def _diffFields(old: BaseNode, new: BaseNode) -> list[FieldDiff]:
+    """
+    Compare the fields of two objects of the same type.
+
+    Param
+        old: The old object.
+        new: The new object.
+
+    Return
+        The field differences, the name and id excepted.
+    """
+    oldDef = objectToDict(old)
+    newDef = objectToDict(new)
+    diffs = []
+    for key, value in newDef.items():
+        previous = oldDef.get(key)
+        if key == 'name' or key == 'id' or previous == value:
+            continue
+        if key == 'elements' or key == 'states':
+            diffs.extend(_diffItems(key, previous, value))
+        else:
+            diffs.append(FieldDiff(key, previous, value))
+    return diffs
+
+
+class StoreDiffer(object):
+    """
+    The structural diff of two datastores.
+
+    The objects are matched by name and type within each object list. An
+    unmatched object of the new datastore with the same content as an
+    unmatched object of the old one is reported as renamed.
+
+    The content key and digest of every object, and the digest of every
+    object list, are cached with the node revision, so comparing the
+    datastores again only reads the modified nodes. Object lists with the
+    same digest are skipped, and the fields are only compared for the
+    objects whose content key differs. Equal Python hashes are never taken
+    as equal content: the dictionaries matching the renamed objects compare
+    the content keys themselves.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._objects: dict[BaseNode, tuple[int, Hashable, bytes]] = {}
+        self._lists: dict[BaseNode, tuple[int, bytes]] = {}
+
+    def _getObjectContent(self, node: BaseNode) -> tuple[Hashable, bytes]:
+        """
+        Get the content key and digest of an object, ignoring its name.
+
+        Param
+            node: The object node.
+
+        Return
+            The object content key and its BLAKE2b digest.
+        """
+        revision = node.getRevision()
+        cached = self._objects.get(node)
+        if cached is not None and cached[0] == revision:
+            return cached[1], cached[2]
+        key = _CONTENT_KEYS[node.getType()](node)
+        digest = blake2b(repr(key).encode(),
+                         digest_size=_DIGEST_SIZE).digest()
+        self._objects[node] = (revision, key, digest)
+        return key, digest
+
+    def _getListDigest(self, objList: BaseNode) -> bytes:
+        """
+        Get the digest of an object list, independent of the object order.
+
+        Param
+            objList: The object list node.
+
+        Return
+            The BLAKE2b digest of the sorted object names and contents.
+        """
+        revision = objList.getRevision()
+        cached = self._lists.get(objList)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        getObjectContent = self._getObjectContent
+        entries = sorted(node.getName().encode() + b'\0' +
+                         getObjectContent(node)[1]
+                         for node in objList.getChildren())
+        digest = blake2b(digest_size=_DIGEST_SIZE)
+        for entry in entries:
+            digest.update(entry)
+        listDigest = digest.digest()
+        self._lists[objList] = (revision, listDigest)
+        return listDigest
+
+    def _diffLists(self, type: NodeType, old: list[BaseNode],
+                   new: list[BaseNode]) -> list[ObjectDiff]:
+        """
+        Compare the objects of two object lists.
+
+        Param
+            type: The object type.
+            old: The old objects.
+            new: The new objects.
+
+        Return
+            The object differences.
+        """
+        oldByName: dict[str, list[BaseNode]] = {}
+        for node in old:
+            oldByName.setdefault(node.getName(), []).append(node)
+        getObjectContent = self._getObjectContent
+        diffs = []
+        added = []
+        for node in new:
+            matches = oldByName.get(node.getName())
+            if not matches:
+                added.append(node)
+                continue
+            previous = matches.pop(0)
+            if getObjectContent(previous)[0] != getObjectContent(node)[0]:
+                fields = _diffFields(previous, node)
+                if fields:
+                    diffs.append(ObjectDiff(DiffKind.MODIFIED, type,
+                                            node.getName(), fields=fields))
+        unmatched = {node for nodes in oldByName.values() for node in nodes}
+        removed = [node for node in old if node in unmatched]
+        removedByKey: dict[Hashable, list[BaseNode]] = {}
+        for node in removed:
+            removedByKey.setdefault(getObjectContent(node)[0],
+                                    []).append(node)
+        renamed = set()
+        for node in added:
+            matches = removedByKey.get(getObjectContent(node)[0])
+            if matches:
+                previous = matches.pop(0)
+                renamed.add(previous)
+                diffs.append(ObjectDiff(DiffKind.RENAMED, type,
+                                        node.getName(), previous.getName()))
+            else:
+                diffs.append(ObjectDiff(DiffKind.ADDED, type,
+                                        node.getName()))
+        diffs.extend(ObjectDiff(DiffKind.REMOVED, type, node.getName())
+                     for node in removed if node not in renamed)
+        return diffs
+
+    def diff(self, old: DatastoreNode,
+             new: DatastoreNode) -> list[ObjectDiff]:
+        """
+        Compare the objects of two datastores.
+
+        Param
+            old: The old datastore.
+            new: The new datastore.
+
+        Return
+            The object differences, grouped by object list.
+        """
+        oldLists = {objList.getName(): objList
+                    for objList in old.getChildren()}
+        newLists = {objList.getName(): objList
+                    for objList in new.getChildren()}
+        diffs = []
+        for name in list(newLists) + [name for name in oldLists
+                                      if name not in newLists]:
+            oldList = oldLists.get(name)
+            newList = newLists.get(name)
+            if oldList is not None and newList is not None and \
+                    self._getListDigest(oldList) == \
+                    self._getListDigest(newList):
+                continue
+            diffs.extend(self._diffLists(
+                NodeType[name],
+                oldList.getChildren() if oldList is not None else [],
+                newList.getChildren() if newList is not None else []))
+        return diffs
+
+    def clear(self) -> None:
+        """
+        Drop the cached contents and digests.
+        """
+        self._objects.clear()
+        self._lists.clear()
+
+
+def diffStores(old: DatastoreNode, new: DatastoreNode) -> list[ObjectDiff]:
+    """
+    Compare the objects of two datastores.
+
+    Param
+        old: The old datastore.
+        new: The new datastore.
+
+    Return
+        The object differences, grouped by object list.
+    """
+    return StoreDiffer().diff(old, new)
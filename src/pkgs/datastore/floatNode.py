@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
+from .arrayElementStore import ArrayElementStore
 from .baseNode import BaseNode, NodeType
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatData:
     """
     The float node data.
@@ -16,6 +17,8 @@ class FloatNode(BaseNode):
     """
     The float node class.
     """
+    __slots__ = ('_data',)
+
     def __init__(self, name: str, data: FloatData, parent: BaseNode = None):
         super().__init__(name, NodeType.FLOAT, parent=parent)
         self._data = data
@@ -37,6 +40,7 @@ class FloatNode(BaseNode):
             min: The minimum value of the float.
         """
         self._data.min = min
+        self.bumpRevision()
 
     def getMaximum(self) -> float:
         """
@@ -55,6 +59,7 @@ class FloatNode(BaseNode):
             min: The maximum value of the float.
         """
         self._data.max = max
+        self.bumpRevision()
 
     def getDefault(self) -> float:
         """
@@ -73,9 +78,10 @@ class FloatNode(BaseNode):
             min: The default value of the float.
         """
         self._data.default = default
+        self.bumpRevision()
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatArrayElement:
     """
     The float array element.
@@ -86,20 +92,56 @@ class FloatArrayElement:
     default: float = 0.0
 
 
-@dataclass
+class FloatArrayElements(ArrayElementStore):
+    """
+    The float array elements.
+    """
+    __slots__ = ()
+
+    TYPECODE = 'd'
+    ELEMENT_CLS = FloatArrayElement
+
+
+@dataclass(slots=True)
 class FloatArrayData:
     """
     The float array node data.
     """
     inNvm: bool = False
-    elements: list[FloatArrayElement] = field(default_factory=list)
+    elements: FloatArrayElements = field(default_factory=FloatArrayElements)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.elements, FloatArrayElements):
+            self.elements = FloatArrayElements(self.elements)
 
 
 class FloatArrayNode(BaseNode):
     """
     The float array node class.
     """
+    __slots__ = ('_data',)
+
     def __init__(self, name: str, data: FloatArrayData,
                  parent: BaseNode = None):
         super().__init__(name, NodeType.FLOAT_ARRAY, parent=parent)
         self._data = data
+        data.elements.setOwner(self)
+
+    def isInNvm(self) -> bool:
+        """
+        Check if the array is stored in non-volatile memory.
+
+        Return
+            True if the array is stored in non-volatile memory, false
+            otherwise.
+        """
+        return self._data.inNvm
+
+    def getElements(self) -> FloatArrayElements:
+        """
+        Get the array elements.
+
+        Return
+            The array elements.
+        """
+        return self._data.elements
@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
+from .arrayElementStore import ArrayElementStore
 from .baseNode import BaseNode, NodeType
 
 
-@dataclass
+@dataclass(slots=True)
 class IntData:
     """
     The int node data.
@@ -16,6 +17,8 @@ class IntNode(BaseNode):
     """
     The int node class.
     """
+    __slots__ = ('_data',)
+
     def __init__(self, name: str, data: IntData, parent: BaseNode = None):
         super().__init__(name, NodeType.INT, parent=parent)
         self._data = data
@@ -37,6 +40,7 @@ class IntNode(BaseNode):
             min: The minimum value of the int.
         """
         self._data.min = min
+        self.bumpRevision()
 
     def getMaximum(self) -> int:
         """
@@ -55,6 +59,7 @@ class IntNode(BaseNode):
             min: The maximum value of the int.
         """
         self._data.max = max
+        self.bumpRevision()
 
     def getDefault(self) -> int:
         """
@@ -73,9 +78,10 @@ class IntNode(BaseNode):
             min: The default value of the int.
         """
         self._data.default = default
+        self.bumpRevision()
 
 
-@dataclass
+@dataclass(slots=True)
 class IntArrayElement:
     """
     The int array element.
@@ -86,19 +92,55 @@ class IntArrayElement:
     default: int = 0
 
 
-@dataclass
+class IntArrayElements(ArrayElementStore):
+    """
+    The int array elements.
+    """
+    __slots__ = ()
+
+    TYPECODE = 'q'
+    ELEMENT_CLS = IntArrayElement
+
+
+@dataclass(slots=True)
 class IntArrayData:
     """
     The int array node data.
     """
     inNvm: bool = False
-    elements: list[IntArrayElement] = field(default_factory=list)
+    elements: IntArrayElements = field(default_factory=IntArrayElements)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.elements, IntArrayElements):
+            self.elements = IntArrayElements(self.elements)
 
 
 class IntArrayNode(BaseNode):
     """
     The int array node class.
     """
+    __slots__ = ('_data',)
+
     def __init__(self, name: str, data: IntArrayData, parent: BaseNode = None):
         super().__init__(name, NodeType.INT_ARRAY, parent=parent)
         self._data = data
+        data.elements.setOwner(self)
+
+    def isInNvm(self) -> bool:
+        """
+        Check if the array is stored in non-volatile memory.
+
+        Return
+            True if the array is stored in non-volatile memory, false
+            otherwise.
+        """
+        return self._data.inNvm
+
+    def getElements(self) -> IntArrayElements:
+        """
+        Get the array elements.
+
+        Return
+            The array elements.
+        """
+        return self._data.elements
@@ -3,7 +3,7 @@ from .baseNode import BaseNode, NodeType
 from .stateNode import StateNode
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiStateData:
     """
     The multi-state node data.
@@ -17,10 +17,14 @@ class MultiStateNode(BaseNode):
     """
     The multi-state node class.
     """
+    __slots__ = ('_data',)
+
     def __init__(self, name: str, data: MultiStateData,
                  parent: BaseNode = None):
         super().__init__(name, NodeType.MULTI_STATE, parent=parent)
         self._data = data
+        for state in data.states:
+            state.setParent(self)
 
     def getStateList(self) -> list[StateNode]:
         """
@@ -48,3 +52,14 @@ class MultiStateNode(BaseNode):
             index: The default state index.
         """
         self._data.default = index
+        self.bumpRevision()
+
+    def isInNvm(self) -> bool:
+        """
+        Check if the multi-state is stored in non-volatile memory.
+
+        Return
+            True if the multi-state is stored in non-volatile memory, false
+            otherwise.
+        """
+        return self._data.inNvm
@@ -0,0 +1,38 @@
+from logging import LoggerAdapter, getLogger
+
+
+class NodeLoggerAdapter(LoggerAdapter):
+    """
+    The node logger adapter.
+
+    The adapter prefixes the messages with the node name so that the nodes
+    can share the logger of their category instead of each one registering
+    its own logger.
+    """
+    def process(self, msg: str, kwargs: dict) -> tuple[str, dict]:
+        """
+        Prefix the message with the node name.
+
+        Param
+            msg: The logged message.
+            kwargs: The logging call keyword arguments.
+
+        Return
+            The prefixed message and the keyword arguments.
+        """
+        return f"{self.extra['node']}: {msg}", kwargs
+
+
+def getNodeLogger(category: str, name: str) -> NodeLoggerAdapter:
+    """
+    Get the logger of a node.
+
+    Param
+        category: The node category (i.e. the node type name).
+        name: The node name.
+
+    Return
+        The node logger, backed by the shared logger of the category.
+    """
+    return NodeLoggerAdapter(getLogger(f"app.datastoreModel.{category}"),
+                             {'node': name})
@@ -0,0 +1,106 @@
+from typing import Iterator
+from .baseNode import BaseNode, NodeType
+
+
+class ObjectListNode(BaseNode):
+    """
+    The object list node class.
+
+    The object additions, removals, renamings and modifications are
+    forwarded to the datastore owning the list to keep its name index
+    current and notify its object listeners.
+
+    The objects added to the list of a datastore are given an id, unique
+    within the list. An object keeps its id while it stays in the list, so
+    the ids do not depend on the object order. The added objects without id
+    or with an id already used get the next id, and the ids of the removed
+    objects are not given again.
+    """
+    __slots__ = ('_modifiedRevision', '_nextId')
+
+    def __init__(self, name: str, parent: BaseNode) -> None:
+        super().__init__(name, NodeType.OBJ_LIST, parent=parent)
+        self._modifiedRevision = self._revision
+        self._nextId = 0
+
+    def bumpRevision(self) -> None:
+        super().bumpRevision()
+        self._modifiedRevision = self._revision
+
+    def _isModifiedSince(self, revision: int) -> bool:
+        return self._modifiedRevision > revision
+
+    def _isInStore(self) -> bool:
+        """
+        Check if the list is owned by a datastore.
+
+        Return
+            True if the list parent is a datastore, false otherwise.
+        """
+        return self._parent is not None and \
+            self._parent.getType() == NodeType.STORE
+
+    def _assignIds(self, children: list[BaseNode]) -> None:
+        """
+        Give an id to the added objects without a free id.
+
+        Param
+            children: The added objects.
+        """
+        used = set()
+        if any(child._id is not None for child in children):
+            added = set(children)
+            used = {node._id for node in self._children if node not in added}
+        for child in children:
+            if child._id is None or child._id in used:
+                child._id = self._nextId
+            used.add(child._id)
+            self._nextId = max(self._nextId, child._id + 1)
+
+    def getNextId(self) -> int:
+        """
+        Get the id given to the next object added without id.
+
+        Return
+            The next object id, greater than the id of every object of the
+            list.
+        """
+        return self._nextId
+
+    def _childrenAdded(self, children: list[BaseNode]) -> None:
+        if self._isInStore():
+            self._assignIds(children)
+            self._parent._indexObjects(children)
+
+    def _childrenRemoved(self, children: list[BaseNode]) -> None:
+        if self._isInStore():
+            self._parent._unindexObjects(children)
+
+    def _childRenamed(self, child: BaseNode, oldName: str) -> None:
+        if self._isInStore():
+            self._parent._reindexObject(child, oldName)
+
+    def _childModified(self, child: BaseNode) -> None:
+        if self._isInStore():
+            self._parent._objectModified(child)
+
+    def _getIndexEntries(self) -> Iterator[tuple[str, object]]:
+        """
+        Get the name index entries of the objects.
+
+        Return
+            The name and the index key of each object.
+        """
+        return ((child._name, child) for child in self._children)
+
+    def _getIndexKey(self, child: BaseNode) -> object:
+        """
+        Get the key identifying an object in the name index.
+
+        Param
+            child: The object node.
+
+        Return
+            The object node.
+        """
+        return child
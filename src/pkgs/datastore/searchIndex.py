@@ -0,0 +1,227 @@
+from typing import Iterable
+
+from .baseNode import BaseNode, NodeType
+from .datastoreNode import DatastoreNode
+
+
+def _getTrigrams(text: str) -> set[str]:
+    """
+    Get the trigrams of a text.
+
+    Param
+        text: The text.
+
+    Return
+        The three characters substrings of the text.
+    """
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+
+def _getIndexKey(node: BaseNode) -> object:
+    """
+    Get the key identifying an object in the index.
+
+    Param
+        node: The object node.
+
+    Return
+        The index key given by the object list, the node itself if it has
+        no list.
+    """
+    parent = node.getParent()
+    if parent is None:
+        return node
+    return parent._getIndexKey(node)
+
+
+def _getObject(key: object) -> BaseNode:
+    """
+    Get the object identified by an index key, creating it if needed.
+
+    Param
+        key: The index key.
+
+    Return
+        The object node.
+    """
+    if isinstance(key, tuple):
+        objList, row = key
+        return objList.getChild(row)
+    return key
+
+
+class ObjectSearchIndex(object):
+    """
+    The trigram index of the datastore object names.
+
+    Searches are case-insensitive substring matches. The candidates of a
+    search of three characters or more are the objects holding every
+    trigram of the searched text, shorter searches scan the names. The index
+    implements the datastore object listener interface to stay current.
+
+    Like the datastore name index, the objects of a lazily read list are
+    indexed by their list and row, with the names read without creating
+    them, until the list creates all of its objects. Only the matching
+    objects are created by a search.
+    """
+    __slots__ = ('_names', '_trigrams', '__weakref__')
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._names: dict[object, str] = {}
+        self._trigrams: dict[str, set[object]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _addObject(self, key: object, name: str) -> None:
+        """
+        Index an object.
+
+        Param
+            key: The object index key.
+            name: The object name.
+        """
+        name = name.lower()
+        self._names[key] = name
+        for trigram in _getTrigrams(name):
+            keys = self._trigrams.get(trigram)
+            if keys is None:
+                self._trigrams[trigram] = {key}
+            else:
+                keys.add(key)
+
+    def _removeObject(self, key: object) -> None:
+        """
+        Remove an object from the index.
+
+        Param
+            key: The object index key.
+        """
+        name = self._names.pop(key, None)
+        if name is None:
+            return
+        for trigram in _getTrigrams(name):
+            keys = self._trigrams[trigram]
+            keys.discard(key)
+            if not keys:
+                del self._trigrams[trigram]
+
+    def addStore(self, store: DatastoreNode) -> None:
+        """
+        Index every object of a datastore.
+
+        Param
+            store: The datastore node.
+        """
+        for listRow in range(store.getChildCount()):
+            for name, key in store.getChild(listRow)._getIndexEntries():
+                self._addObject(key, name)
+
+    def removeStore(self, store: DatastoreNode) -> None:
+        """
+        Remove every object of a datastore from the index.
+
+        Param
+            store: The datastore node.
+        """
+        for listRow in range(store.getChildCount()):
+            for _, key in store.getChild(listRow)._getIndexEntries():
+                self._removeObject(key)
+
+    def objectsAdded(self, nodes: list[BaseNode]) -> None:
+        """
+        Index objects added to a datastore.
+
+        Param
+            nodes: The added objects.
+        """
+        for node in nodes:
+            self._addObject(_getIndexKey(node), node.getName())
+
+    def objectsRemoved(self, nodes: list[BaseNode]) -> None:
+        """
+        Remove objects removed from a datastore from the index.
+
+        Param
+            nodes: The removed objects.
+        """
+        for node in nodes:
+            self._removeObject(_getIndexKey(node))
+
+    def objectRenamed(self, node: BaseNode, oldName: str) -> None:
+        """
+        Update the index of a renamed object.
+
+        Param
+            node: The renamed object.
+            oldName: The previous name of the object.
+        """
+        key = _getIndexKey(node)
+        self._removeObject(key)
+        self._addObject(key, node.getName())
+
+    def objectsCreated(self, objList: BaseNode) -> None:
+        """
+        Replace the index keys of the objects of a lazily read list by the
+        objects, once the list created all of them.
+
+        Param
+            objList: The object list.
+        """
+        keys = [key for key in self._names
+                if isinstance(key, tuple) and key[0] is objList]
+        for key in keys:
+            name = self._names[key]
+            self._removeObject(key)
+            self._addObject(objList._children[key[1]], name)
+
+    def objectModified(self, node: BaseNode) -> None:
+        """
+        Ignore the modification of an object, which keeps its name.
+
+        Param
+            node: The modified object.
+        """
+        pass
+
+    def search(self, text: str, types: set[NodeType] = None,
+               within: Iterable[BaseNode] = None) -> set[BaseNode]:
+        """
+        Search the objects whose name contains a text.
+
+        Param
+            text: The searched text, case-insensitive.
+            types: The types of the searched objects, every type if none.
+            within: The objects to search, every indexed object if none.
+                Narrowing the previous results of a shorter text avoids
+                searching the whole index.
+
+        Return
+            The matching objects.
+        """
+        text = text.lower()
+        names = self._names
+        if within is not None:
+            keys = [_getIndexKey(node) for node in within]
+            matches = {key for key in keys if text in names.get(key, '')}
+        elif len(text) < 3:
+            matches = {key for key, name in names.items() if text in name}
+        else:
+            postings = []
+            for trigram in _getTrigrams(text):
+                keys = self._trigrams.get(trigram)
+                if keys is None:
+                    return set()
+                postings.append(keys)
+            postings.sort(key=len)
+            matches = {key for key in postings[0].intersection(
+                *postings[1:]) if text in names[key]}
+        if types is not None:
+            typeNames = {type.name for type in types}
+            matches = {key for key in matches
+                       if (key[0].getName() if isinstance(key, tuple)
+                           else key.getType().name) in typeNames}
+        return {_getObject(key) for key in matches}
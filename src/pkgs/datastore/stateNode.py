@@ -1,14 +1,13 @@
-import logging
-
-from PySide6.QtCore import Qt
-
 from .baseNode import BaseNode
+from .nodeLogger import NodeLoggerAdapter, getNodeLogger
 
 
 class StateNode(object):
     """
     The state node for the multi-state object.
     """
+    __slots__ = ('_name', '_value', '_parent')
+
     def __init__(self, name: str, value: int, parent: BaseNode = None):
         """
         Constructor.
@@ -18,10 +17,41 @@ class StateNode(object):
             value: The state value.
             parent: The node parent.
         """
-        self._logger = logging.getLogger(f"app.datastoreModel.MULTI_STATE."
-                                         f"stateList.{name}")
         self._name = name
         self._value = value
+        self._parent = parent
+
+    @property
+    def _logger(self) -> NodeLoggerAdapter:
+        """
+        The state logger, shared with the other states.
+        """
+        return getNodeLogger('MULTI_STATE.stateList', self._name)
+
+    def _bumpParentRevision(self) -> None:
+        """
+        Mark the parent multi-state as modified.
+        """
+        if self._parent is not None:
+            self._parent.bumpRevision()
+
+    def getParent(self) -> BaseNode:
+        """
+        Get the state parent.
+
+        Return
+            The parent multi-state node.
+        """
+        return self._parent
+
+    def setParent(self, parent: BaseNode) -> None:
+        """
+        Set the state parent.
+
+        Param
+            parent: The parent multi-state node.
+        """
+        self._parent = parent
 
     def getName(self) -> str:
         """
@@ -40,6 +70,7 @@ class StateNode(object):
             name: The state name.
         """
         self._name = name
+        self._bumpParentRevision()
 
     def getValue(self) -> int:
         """
@@ -58,3 +89,4 @@ class StateNode(object):
             value: The state value.
         """
         self._value = value
+        self._bumpParentRevision()
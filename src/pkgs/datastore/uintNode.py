@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
+from .arrayElementStore import ArrayElementStore
 from .baseNode import BaseNode, NodeType
 
 
-@dataclass
+@dataclass(slots=True)
 class UintData:
     """
     The uint node data.
@@ -16,6 +17,8 @@ class UintNode(BaseNode):
     """
     The uint node class.
     """
+    __slots__ = ('_data',)
+
     def __init__(self, name: str, data: UintData, parent: BaseNode = None):
         super().__init__(name, NodeType.UINT, parent=parent)
         self._data = data
@@ -37,6 +40,7 @@ class UintNode(BaseNode):
             min: The minimum value of the uint.
         """
         self._data.min = min
+        self.bumpRevision()
 
     def getMaximum(self) -> int:
         """
@@ -55,6 +59,7 @@ class UintNode(BaseNode):
             min: The maximum value of the uint.
         """
         self._data.max = max
+        self.bumpRevision()
 
     def getDefault(self) -> int:
         """
@@ -73,9 +78,10 @@ class UintNode(BaseNode):
             min: The default value of the uint.
         """
         self._data.default = default
+        self.bumpRevision()
 
 
-@dataclass
+@dataclass(slots=True)
 class UintArrayElement:
     """
     The uint array element.
@@ -86,20 +92,56 @@ class UintArrayElement:
     default: int
 
 
-@dataclass
+class UintArrayElements(ArrayElementStore):
+    """
+    The uint array elements.
+    """
+    __slots__ = ()
+
+    TYPECODE = 'Q'
+    ELEMENT_CLS = UintArrayElement
+
+
+@dataclass(slots=True)
 class UintArrayData:
     """
     The uint array node data.
     """
     inNvm: bool = False
-    elements: list[UintArrayElement] = field(default_factory=list)
+    elements: UintArrayElements = field(default_factory=UintArrayElements)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.elements, UintArrayElements):
+            self.elements = UintArrayElements(self.elements)
 
 
 class UintArrayNode(BaseNode):
     """
     The uint array node class.
     """
+    __slots__ = ('_data',)
+
     def __init__(self, name: str, data: UintArrayData,
                  parent: BaseNode = None):
         super().__init__(name, NodeType.UINT_ARRAY, parent=parent)
         self._data = data
+        data.elements.setOwner(self)
+
+    def isInNvm(self) -> bool:
+        """
+        Check if the array is stored in non-volatile memory.
+
+        Return
+            True if the array is stored in non-volatile memory, false
+            otherwise.
+        """
+        return self._data.inNvm
+
+    def getElements(self) -> UintArrayElements:
+        """
+        Get the array elements.
+
+        Return
+            The array elements.
+        """
+        return self._data.elements
@@ -0,0 +1,239 @@
+import sys
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+from .baseNode import BaseNode
+
+
+@dataclass(slots=True)
+class FieldChange:
+    """
+    The change of a node field, applied through the node setter.
+
+    A name change is refused when the name is used by another object of the
+    datastore, since other objects can be renamed between a change and its
+    undo or redo.
+
+    Param
+        node: The changed node.
+        field: The field name, the node setter being set<field>.
+        old: The field value before the change.
+        new: The field value after the change.
+    """
+    node: Any
+    field: str
+    old: Any
+    new: Any
+
+    def _apply(self, value: Any) -> None:
+        """
+        Set the field value.
+
+        Raise a value error without changing the node if the value is a name
+        used by another object.
+
+        Param
+            value: The field value.
+        """
+        if self.field == 'Name' and isinstance(self.node, BaseNode):
+            store = self.node.getStore()
+            if store is not None and \
+                    not store.isNameAvailable(value, self.node):
+                raise ValueError(f"{value} is already used by another "
+                                 f"object")
+        getattr(self.node, f"set{self.field}")(value)
+
+    def undo(self) -> None:
+        """
+        Restore the value before the change.
+        """
+        self._apply(self.old)
+
+    def redo(self) -> None:
+        """
+        Apply the value after the change.
+        """
+        self._apply(self.new)
+
+    def getSize(self) -> int:
+        """
+        Get the approximate memory used by the change.
+
+        The node is not counted since it is shared with the datastore.
+
+        Return
+            The change size in bytes.
+        """
+        return sys.getsizeof(self) + sys.getsizeof(self.old) + \
+            sys.getsizeof(self.new)
+
+
+class UndoStack(object):
+    """
+    The undo stack of the datastore field changes.
+
+    The stack only records the changed field values. The oldest changes are
+    dropped when the recorded changes use more than the memory budget, and
+    the mergeable changes of the same field pushed in a row are merged into
+    a single change.
+    """
+    def __init__(self, memoryBudget: int = 1 << 20,
+                 onChange: Callable[[], None] = None) -> None:
+        """
+        Constructor.
+
+        Param
+            memoryBudget: The memory budget of the recorded changes in bytes,
+                the changes are applied without being recorded if 0.
+            onChange: The function called after the recorded changes
+                changed.
+        """
+        self._memoryBudget = memoryBudget
+        self._undoChanges: deque[FieldChange] = deque()
+        self._redoChanges: list[FieldChange] = []
+        self._memoryUsage = 0
+        self._canMerge = False
+        self._onChange = onChange
+
+    def _notify(self) -> None:
+        """
+        Call the change function, if any.
+        """
+        if self._onChange is not None:
+            self._onChange()
+
+    def _trim(self) -> None:
+        """
+        Drop the oldest changes until the changes fit in the memory budget.
+        """
+        while self._memoryUsage > self._memoryBudget and self._undoChanges:
+            self._memoryUsage -= self._undoChanges.popleft().getSize()
+
+    def push(self, change: FieldChange, merge: bool = False) -> None:
+        """
+        Apply a change and record it, clearing the changes to redo.
+
+        Param
+            change: The field change.
+            merge: True to merge the change with the previous change of the
+                same field if it was pushed last and mergeable.
+        """
+        change.redo()
+        for redoChange in self._redoChanges:
+            self._memoryUsage -= redoChange.getSize()
+        self._redoChanges.clear()
+        top = self._undoChanges[-1] if self._undoChanges else None
+        if merge and self._canMerge and top is not None and \
+                top.node is change.node and top.field == change.field:
+            self._memoryUsage -= top.getSize()
+            top.new = change.new
+            self._memoryUsage += top.getSize()
+        else:
+            self._undoChanges.append(change)
+            self._memoryUsage += change.getSize()
+        self._canMerge = merge
+        self._trim()
+        self._notify()
+
+    def pushFieldChange(self, node: Any, field: str, value: Any,
+                        merge: bool = False) -> None:
+        """
+        Set a node field and record the change.
+
+        Param
+            node: The node.
+            field: The field name, the node getter and setter being
+                get<field> and set<field>.
+            value: The new field value.
+            merge: True to merge the change with the previous change of the
+                same field if it was pushed last and mergeable.
+        """
+        old = getattr(node, f"get{field}")()
+        if old != value:
+            self.push(FieldChange(node, field, old, value), merge)
+
+    def undo(self) -> FieldChange | None:
+        """
+        Undo the last change.
+
+        A change that cannot be undone, e.g. a name now used by another
+        object, raises a value error and stays the next change to undo.
+
+        Return
+            The undone change, none if there is nothing to undo.
+        """
+        self._canMerge = False
+        if not self._undoChanges:
+            return None
+        change = self._undoChanges[-1]
+        change.undo()
+        self._undoChanges.pop()
+        self._redoChanges.append(change)
+        self._notify()
+        return change
+
+    def redo(self) -> FieldChange | None:
+        """
+        Redo the last undone change.
+
+        A change that cannot be redone, e.g. a name now used by another
+        object, raises a value error and stays the next change to redo.
+
+        Return
+            The redone change, none if there is nothing to redo.
+        """
+        self._canMerge = False
+        if not self._redoChanges:
+            return None
+        change = self._redoChanges[-1]
+        change.redo()
+        self._redoChanges.pop()
+        self._undoChanges.append(change)
+        self._notify()
+        return change
+
+    def canUndo(self) -> bool:
+        """
+        Check if there is a change to undo.
+
+        Return
+            True if there is a change to undo, false otherwise.
+        """
+        return len(self._undoChanges) > 0
+
+    def canRedo(self) -> bool:
+        """
+        Check if there is a change to redo.
+
+        Return
+            True if there is a change to redo, false otherwise.
+        """
+        return len(self._redoChanges) > 0
+
+    def getUndoCount(self) -> int:
+        """
+        Get the number of changes to undo.
+
+        Return
+            The number of changes to undo.
+        """
+        return len(self._undoChanges)
+
+    def getMemoryUsage(self) -> int:
+        """
+        Get the approximate memory used by the recorded changes.
+
+        Return
+            The memory usage in bytes.
+        """
+        return self._memoryUsage
+
+    def clear(self) -> None:
+        """
+        Drop every recorded change.
+        """
+        self._undoChanges.clear()
+        self._redoChanges.clear()
+        self._memoryUsage = 0
+        self._canMerge = False
+        self._notify()
@@ -0,0 +1,5 @@
+from .cborIndex import indexObjects, readHead, readText, \
+    skipItem                                                    # noqa: F401
+from .lazyDecoder import COMPACT_KEYS, decodedToDefinition, \
+    getNameTablePath, LazyChildList, LazyDatastoreReader, \
+    LazyObjectListNode                                          # noqa: F401
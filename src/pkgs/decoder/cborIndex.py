@@ -0,0 +1,173 @@
+from array import array
+
+MAJOR_UINT = 0
+MAJOR_NINT = 1
+MAJOR_BYTES = 2
+MAJOR_TEXT = 3
+MAJOR_ARRAY = 4
+MAJOR_MAP = 5
+MAJOR_TAG = 6
+MAJOR_SIMPLE = 7
+
+_ARGUMENT_SIZES = {24: 1, 25: 2, 26: 4, 27: 8}
+
+
+def readHead(buffer, pos: int) -> tuple[int, int, int]:
+    """
+    Read the head of a CBOR data item.
+
+    Param
+        buffer: The encoded data.
+        pos: The offset of the data item.
+
+    Return
+        The major type, the argument and the offset following the head.
+    """
+    try:
+        initial = buffer[pos]
+    except IndexError:
+        raise ValueError(f"truncated CBOR data at {pos}") from None
+    major = initial >> 5
+    info = initial & 0x1f
+    pos += 1
+    if info < 24:
+        return major, info, pos
+    size = _ARGUMENT_SIZES.get(info)
+    if size is None:
+        raise ValueError(f"unsupported CBOR additional information {info} "
+                         f"at {pos - 1}")
+    if pos + size > len(buffer):
+        raise ValueError(f"truncated CBOR data at {pos}")
+    return major, int.from_bytes(buffer[pos:pos + size], 'big'), pos + size
+
+
+def readText(buffer, pos: int) -> tuple[str, int]:
+    """
+    Read a CBOR text string.
+
+    Param
+        buffer: The encoded data.
+        pos: The offset of the text string.
+
+    Return
+        The text and the offset following the text string.
+    """
+    major, length, pos = readHead(buffer, pos)
+    if major != MAJOR_TEXT:
+        raise ValueError(f"expected a CBOR text string at {pos}")
+    if pos + length > len(buffer):
+        raise ValueError(f"truncated CBOR data at {pos}")
+    return bytes(buffer[pos:pos + length]).decode('utf-8'), pos + length
+
+
+def _createSkipTable() -> list[tuple[int, int | None, int] | None]:
+    """
+    Create the item skipping table.
+
+    Return
+        For each initial byte, the item kind, the argument when it is stored
+        in the initial byte (none otherwise) and the argument size, or none
+        when the initial byte is not supported.
+    """
+    kinds = {MAJOR_UINT: _KIND_SCALAR, MAJOR_NINT: _KIND_SCALAR,
+             MAJOR_BYTES: _KIND_STRING, MAJOR_TEXT: _KIND_STRING,
+             MAJOR_ARRAY: _KIND_ARRAY, MAJOR_MAP: _KIND_MAP,
+             MAJOR_TAG: _KIND_TAG, MAJOR_SIMPLE: _KIND_SCALAR}
+    table = []
+    for initial in range(256):
+        kind = kinds[initial >> 5]
+        info = initial & 0x1f
+        if info < 24:
+            table.append((kind, info, 0))
+        elif info in _ARGUMENT_SIZES:
+            table.append((kind, None, _ARGUMENT_SIZES[info]))
+        else:
+            table.append(None)
+    return table
+
+
+_KIND_SCALAR = 0
+_KIND_STRING = 1
+_KIND_ARRAY = 2
+_KIND_MAP = 3
+_KIND_TAG = 4
+_SKIP_TABLE = _createSkipTable()
+
+
+def skipItem(buffer, pos: int) -> int:
+    """
+    Skip a CBOR data item without decoding it.
+
+    Only the item heads are read: strings are skipped in one step and the
+    nested items of arrays, maps and tags are counted instead of being
+    decoded. Indefinite lengths are not supported.
+
+    Param
+        buffer: The encoded data.
+        pos: The offset of the data item.
+
+    Return
+        The offset following the data item.
+    """
+    table = _SKIP_TABLE
+    fromBytes = int.from_bytes
+    start = pos
+    pending = 1
+    try:
+        while pending:
+            pending -= 1
+            kind, argument, size = table[buffer[pos]]
+            pos += 1
+            if argument is None:
+                argument = fromBytes(buffer[pos:pos + size], 'big')
+                pos += size
+            if kind == _KIND_SCALAR:
+                continue
+            if kind == _KIND_STRING:
+                pos += argument
+            elif kind == _KIND_ARRAY:
+                pending += argument
+            elif kind == _KIND_MAP:
+                pending += 2 * argument
+            else:
+                pending += 1
+    except IndexError:
+        raise ValueError(f"truncated CBOR data item at {start}") from None
+    except TypeError:
+        raise ValueError(f"unsupported CBOR data item at {pos}") from None
+    if pos > len(buffer):
+        raise ValueError(f"truncated CBOR data item at {start}")
+    return pos
+
+
+def indexObjects(buffer) -> dict[str, array]:
+    """
+    Index the offset of the objects of an encoded datastore.
+
+    The encoded datastore is a map of the object lists by name, each list
+    being an array of objects. The objects are skipped without being
+    decoded.
+
+    Param
+        buffer: The encoded datastore.
+
+    Return
+        The object offsets of each object list, in encoding order. The
+        offsets of a list end with the offset following its last object.
+    """
+    major, listCount, pos = readHead(buffer, 0)
+    if major != MAJOR_MAP:
+        raise ValueError('not an encoded datastore')
+    index = {}
+    for _ in range(listCount):
+        listName, pos = readText(buffer, pos)
+        major, objCount, pos = readHead(buffer, pos)
+        if major != MAJOR_ARRAY:
+            raise ValueError(f"{listName} is not an object list")
+        offsets = array('Q')
+        for _ in range(objCount):
+            offsets.append(pos)
+            pos = skipItem(buffer, pos)
+        offsets.append(pos)
+        index[listName] = offsets
+    return index
@@ -0,0 +1,676 @@
+import mmap
+import os
+import sys
+from array import array
+from datetime import datetime
+from functools import partial
+from logging import getLogger
+from typing import Callable, Iterator
+
+import cbor2
+
+from .cborIndex import indexObjects, MAJOR_ARRAY, MAJOR_MAP, MAJOR_NINT, \
+    MAJOR_SIMPLE, MAJOR_TEXT, MAJOR_UINT, readHead, readText, skipItem
+from ..datastore import BaseNode, ChildList, DatastoreMetadata, \
+    DatastoreNode, NodeType, ObjectListNode, objectFromDict
+
+
+_NULL = 0xf6
+
+# RFC 8746 typed array tags: (typecode, little endian).
+_TYPED_ARRAYS = {
+    64: ('B', False),
+    65: ('H', False),
+    66: ('I', False),
+    67: ('Q', False),
+    69: ('H', True),
+    70: ('I', True),
+    71: ('Q', True),
+    72: ('b', False),
+    73: ('h', False),
+    74: ('i', False),
+    75: ('q', False),
+    77: ('h', True),
+    78: ('i', True),
+    79: ('q', True),
+    81: ('f', False),
+    82: ('d', False),
+    85: ('f', True),
+    86: ('d', True),
+}
+
+# The object map keys of the compact encoding, by field name. The keys are
+# part of the encoded format: a new field takes a new key and a key is never
+# reused.
+COMPACT_KEYS = {
+    'inNvm': 0,
+    'elements': 1,
+    'min': 2,
+    'max': 3,
+    'default': 4,
+    'states': 5,
+    'longPressTime': 6,
+    'inactiveTime': 7,
+}
+_COMPACT_FIELDS = {key: field for field, key in COMPACT_KEYS.items()}
+
+
+def _decodeTypedArray(value) -> list:
+    """
+    Decode an RFC 8746 typed array.
+
+    Param
+        value: The decoded CBOR tag.
+
+    Return
+        The array values.
+    """
+    if not isinstance(value, cbor2.CBORTag) or value.tag not in _TYPED_ARRAYS:
+        raise ValueError(f"expected a typed array, got {value!r}")
+    typecode, little = _TYPED_ARRAYS[value.tag]
+    values = array(typecode, value.value)
+    if little != (sys.byteorder == 'little'):
+        values.byteswap()
+    return values.tolist()
+
+
+def _decodeNames(names: list) -> list[str]:
+    """
+    Decode a list of names, front coded or not.
+
+    A front coded name is an array of the number of UTF-8 bytes it shares
+    with the previous name and of the rest of the name.
+
+    Param
+        names: The decoded names.
+
+    Return
+        The names.
+    """
+    decoded = []
+    previous = b''
+    for name in names:
+        if isinstance(name, list):
+            length, suffix = name
+            name = (previous[:length] + suffix.encode()).decode()
+        decoded.append(name)
+        previous = name.encode()
+    return decoded
+
+
+def getNameTablePath(path: str) -> str:
+    """
+    Get the default name table path of an encoded datastore.
+
+    Param
+        path: The encoded datastore path.
+
+    Return
+        The encoded datastore path with the .names.cbor extension.
+    """
+    return f"{os.path.splitext(path)[0]}.names.cbor"
+
+
+def decodedToDefinition(type: NodeType, encoded: dict) -> dict:
+    """
+    Convert a decoded object to its definition.
+
+    The objects of the compact encoding, keyed by integers, are converted
+    the same way.
+
+    Param
+        type: The object type.
+        encoded: The decoded object map.
+
+    Return
+        The object definition, without name and id.
+    """
+    definition = {_COMPACT_FIELDS.get(key, key): value
+                  for key, value in encoded.items()}
+    match type:
+        case NodeType.BUTTON_ARRAY:
+            definition['elements'] = _decodeNames(
+                definition.get('elements', []))
+        case NodeType.FLOAT_ARRAY | NodeType.INT_ARRAY | NodeType.UINT_ARRAY:
+            columns = [_decodeTypedArray(definition.pop(field))
+                       for field in ('min', 'max', 'default')]
+            definition['elements'] = [
+                {'name': name, 'min': min, 'max': max, 'default': default}
+                for name, min, max, default in
+                zip(_decodeNames(definition.get('elements', [])), *columns)]
+        case NodeType.MULTI_STATE:
+            states = definition.get('states', [])
+            definition['states'] = [
+                {'name': name, 'value': value}
+                for name, (_, value) in
+                zip(_decodeNames([state[0] for state in states]), states)]
+    return definition
+
+
+class LazyChildList(object):
+    """
+    The children container of an object list read from an encoded store.
+
+    The children are created the first time they are accessed, with the
+    revision 0 since they were not modified since the store was read. The
+    first modification of the container creates the remaining children,
+    after which the container behaves like a ChildList.
+    """
+    __slots__ = ('_owner', '_count', '_load', '_created', '_loaded',
+                 '_children')
+
+    def __init__(self, owner: BaseNode, count: int,
+                 load: Callable[[int], BaseNode],
+                 created: Callable[[], None] = None) -> None:
+        """
+        Constructor.
+
+        Param
+            owner: The node owning the children.
+            count: The number of children.
+            load: The function creating the child at a given index.
+            created: The function called once every child is created,
+                before the first modification, none if not needed.
+        """
+        self._owner = owner
+        self._count = count
+        self._load = load
+        self._created = created
+        self._loaded: dict[int, BaseNode] = {}
+        self._children: ChildList | None = None
+
+    def __len__(self) -> int:
+        if self._children is not None:
+            return len(self._children)
+        return self._count
+
+    def __getitem__(self, row: int | slice):
+        if self._children is not None:
+            return self._children[row]
+        if isinstance(row, slice):
+            return [self._getChild(index)
+                    for index in range(*row.indices(self._count))]
+        if row < 0:
+            row += self._count
+        if row < 0 or row >= self._count:
+            raise IndexError('child row out of range')
+        return self._getChild(row)
+
+    def __iter__(self) -> Iterator:
+        if self._children is not None:
+            return iter(self._children)
+        return (self._getChild(row) for row in range(self._count))
+
+    def __contains__(self, child) -> bool:
+        return self.rowOf(child) is not None
+
+    def _getChild(self, row: int) -> BaseNode:
+        """
+        Get a child, creating it if it was not accessed yet.
+
+        Param
+            row: The child row.
+
+        Return
+            The child.
+        """
+        child = self._loaded.get(row)
+        if child is None:
+            child = self._load(row)
+            child._parent = self._owner
+            child._row = row
+            child._revision = 0
+            self._loaded[row] = child
+        return child
+
+    def _getWritableChildren(self) -> ChildList:
+        """
+        Create every child not accessed yet before a modification.
+
+        Return
+            The children container.
+        """
+        if self._children is None:
+            self._children = ChildList([self._getChild(row)
+                                        for row in range(self._count)])
+            self._loaded.clear()
+            if self._created is not None:
+                self._created()
+        return self._children
+
+    def isLoaded(self, row: int) -> bool:
+        """
+        Check if the child at a given row was created.
+
+        Param
+            row: The child row.
+
+        Return
+            True if the child was created, false otherwise.
+        """
+        return self._children is not None or row in self._loaded
+
+    def getLoadedChildren(self) -> list:
+        """
+        Get the children already created.
+
+        Return
+            The created children, in row order.
+        """
+        if self._children is not None:
+            return self._children[:]
+        return [self._loaded[row] for row in sorted(self._loaded)]
+
+    def append(self, child) -> None:
+        """
+        Append a child.
+
+        Param
+            child: The child to append.
+        """
+        self._getWritableChildren().append(child)
+
+    def extend(self, children: list) -> None:
+        """
+        Append multiple children.
+
+        Param
+            children: The children to append.
+        """
+        self._getWritableChildren().extend(children)
+
+    def insert(self, row: int, children: list) -> None:
+        """
+        Insert children at the given row.
+
+        Param
+            row: The insertion row.
+            children: The children to insert.
+        """
+        self._getWritableChildren().insert(row, children)
+
+    def pop(self, row: int, count: int = 1) -> list:
+        """
+        Remove children starting at the given row.
+
+        Param
+            row: The row of the first child to remove.
+            count: The number of children to remove.
+
+        Return
+            The removed children.
+        """
+        return self._getWritableChildren().pop(row, count)
+
+    def rowOf(self, child) -> int | None:
+        """
+        Get the row of a child.
+
+        Param
+            child: The child.
+
+        Return
+            The row of the child if it is in the container, none otherwise.
+        """
+        if self._children is not None:
+            return self._children.rowOf(child)
+        row = getattr(child, '_row', None)
+        if isinstance(row, int) and self._loaded.get(row) is child:
+            return row
+        return None
+
+
+class LazyObjectListNode(ObjectListNode):
+    """
+    The object list node of an encoded store, creating its objects when
+    they are accessed.
+    """
+    __slots__ = ('_peek', '_readName')
+
+    def __init__(self, name: str, parent: BaseNode, count: int,
+                 load: Callable[[int], BaseNode], nextId: int = 0,
+                 peek: Callable[[int], tuple[int, int, dict]] = None,
+                 readName: Callable[[int], str] = None) -> None:
+        """
+        Constructor.
+
+        Param
+            name: The object list name.
+            parent: The datastore node.
+            count: The number of objects.
+            load: The function creating the object at a given index.
+            nextId: The id given to the next object added without id,
+                greater than the id of every object of the list.
+            peek: The function reading the id, encoded size and scalar
+                fields of the object at a given index without creating it,
+                none if the objects can only be created.
+            readName: The function reading the name of the object at a given
+                index without creating it, none if the objects must be
+                created to be indexed by name.
+        """
+        super().__init__(name, parent)
+        self._children = LazyChildList(self, count, load,
+                                       self._childrenCreated)
+        self._nextId = nextId
+        self._peek = peek
+        self._readName = readName
+
+    def _isIndexedByRow(self) -> bool:
+        """
+        Check if the objects are indexed by name with their row.
+
+        Return
+            True if the objects were not all created and their names can be
+            read without creating them, false otherwise.
+        """
+        return self._readName is not None and \
+            self._children._children is None
+
+    def _childrenCreated(self) -> None:
+        if self._isInStore():
+            self._parent._objectsCreated(self)
+
+    def _getIndexEntries(self) -> Iterator[tuple[str, object]]:
+        if not self._isIndexedByRow():
+            return super()._getIndexEntries()
+        loaded = self._children._loaded
+        return ((loaded[row]._name if row in loaded else self._readName(row),
+                 (self, row)) for row in range(len(self._children)))
+
+    def _getIndexKey(self, child: BaseNode) -> object:
+        if not self._isIndexedByRow():
+            return child
+        return (self, child._row)
+
+    def _getModifiedChildren(self, revision: int) -> list[BaseNode]:
+        return [child for child in self._children.getLoadedChildren()
+                if child.getRevision() > revision]
+
+    def peekChild(self, row: int) -> tuple[int, int, dict] | None:
+        """
+        Read an object not created yet without creating it.
+
+        Param
+            row: The object row.
+
+        Return
+            The object id, encoded size and scalar fields, as given by
+            LazyDatastoreReader.peekObject, none if the object was created
+            or cannot be read without creating it.
+        """
+        if self._peek is None or self._children.isLoaded(row):
+            return None
+        return self._peek(row)
+
+
+class LazyDatastoreReader(object):
+    """
+    The memory-mapped lazy reader of encoded datastores.
+
+    The reader maps the encoded file in memory and indexes the offset of
+    every object in a single pass that skips over the objects without
+    decoding them. Objects are only decoded when they are accessed.
+
+    The object names are read from the name table written with the encoded
+    file. Without name table, the objects are named after their list and
+    id.
+    """
+    def __init__(self, path: str, namePath: str = None) -> None:
+        """
+        Constructor.
+
+        Param
+            path: The encoded datastore path.
+            namePath: The name table path, the default name table path of
+                the encoded datastore if none, used only if it exists.
+        """
+        self._logger = getLogger('app.decoder')
+        self._path = path
+        self._file = open(path, 'rb')
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+        except ValueError:
+            self._buffer = b''
+        self._offsets: dict[str, array] = {}
+        self._ids: dict[str, array] = {}
+        self._names = b''
+        self._nameOffsets: dict[str, array] = {}
+        try:
+            self._buildIndex()
+            if namePath is None:
+                namePath = getNameTablePath(path)
+                if not os.path.exists(namePath):
+                    namePath = None
+            if namePath is not None:
+                self._loadNameTable(namePath)
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> 'LazyDatastoreReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _buildIndex(self) -> None:
+        """
+        Index the offset of the objects of every object list.
+        """
+        try:
+            self._offsets = indexObjects(self._buffer)
+        except ValueError as error:
+            raise ValueError(f"{self._path}: {error}") from error
+        buffer = self._buffer
+        for listName, offsets in self._offsets.items():
+            self._ids[listName] = array('Q', [
+                objId for objId in range(len(offsets) - 1)
+                if buffer[offsets[objId]] != _NULL])
+        self._logger.info(f"{self._path}: {self.getObjectCount()} objects "
+                          f"indexed")
+
+    def _loadNameTable(self, path: str) -> None:
+        """
+        Read and index the name table.
+
+        Param
+            path: The name table path.
+        """
+        with open(path, 'rb') as fp:
+            self._names = fp.read()
+        try:
+            self._nameOffsets = indexObjects(self._names)
+        except ValueError as error:
+            raise ValueError(f"{path}: {error}") from error
+        for listName, offsets in self._offsets.items():
+            nameOffsets = self._nameOffsets.get(listName)
+            if nameOffsets is None or len(nameOffsets) != len(offsets):
+                raise ValueError(f"{path}: the {listName} names do not "
+                                 f"match the encoded datastore")
+
+    def close(self) -> None:
+        """
+        Unmap and close the encoded file.
+        """
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
+
+    def getListNames(self) -> list[str]:
+        """
+        Get the names of the object lists.
+
+        Return
+            The object list names, in file order.
+        """
+        return list(self._offsets)
+
+    def getObjectCount(self, listName: str = None) -> int:
+        """
+        Get the number of objects of an object list or of the file.
+
+        Param
+            listName: The object list name, every list if none.
+
+        Return
+            The number of objects.
+        """
+        if listName is None:
+            return sum(len(ids) for ids in self._ids.values())
+        return len(self._ids[listName])
+
+    def getObjectId(self, listName: str, index: int) -> int:
+        """
+        Get the id of an object.
+
+        Param
+            listName: The object list name.
+            index: The object index in its list.
+
+        Return
+            The object id.
+        """
+        ids = self._ids[listName]
+        if index < 0 or index >= len(ids):
+            raise IndexError(f"{listName} object index out of range")
+        return ids[index]
+
+    def getObjectName(self, listName: str, index: int) -> str:
+        """
+        Get the name of an object.
+
+        Param
+            listName: The object list name.
+            index: The object index in its list.
+
+        Return
+            The object name from the name table, the list name followed by
+            the object id without name table.
+        """
+        objId = self.getObjectId(listName, index)
+        if not self._nameOffsets:
+            return f"{listName}_{objId}"
+        return readText(self._names, self._nameOffsets[listName][objId])[0]
+
+    def getObjectSpan(self, listName: str, index: int) -> tuple[int, int]:
+        """
+        Get the location of an encoded object.
+
+        Param
+            listName: The object list name.
+            index: The object index in its list.
+
+        Return
+            The start and end offsets of the encoded object.
+        """
+        objId = self.getObjectId(listName, index)
+        offsets = self._offsets[listName]
+        return offsets[objId], offsets[objId + 1]
+
+    def decodeObject(self, listName: str, index: int) -> dict:
+        """
+        Decode an object.
+
+        Param
+            listName: The object list name.
+            index: The object index in its list.
+
+        Return
+            The decoded object map, without name.
+        """
+        start, end = self.getObjectSpan(listName, index)
+        return cbor2.loads(self._buffer[start:end])
+
+    def peekObject(self, listName: str,
+                   index: int) -> tuple[int, int, dict]:
+        """
+        Read the id, the encoded size and the scalar fields of an object
+        without decoding it.
+
+        Only the heads of the map entries are read: the array fields, such
+        as the elements or the states, are given by their item count and
+        the typed array fields are left out. The compact encoding keys are
+        given by their field name.
+
+        Param
+            listName: The object list name.
+            index: The object index in its list.
+
+        Return
+            The object id, the encoded object size and the object fields.
+        """
+        objId = self.getObjectId(listName, index)
+        start, end = self.getObjectSpan(listName, index)
+        buffer = self._buffer
+        major, count, pos = readHead(buffer, start)
+        if major != MAJOR_MAP:
+            raise ValueError(f"{self._path}: {listName} object {objId} is "
+                             f"not a map")
+        fields = {}
+        for _ in range(count):
+            major, key, valuePos = readHead(buffer, pos)
+            if major == MAJOR_TEXT:
+                key, valuePos = readText(buffer, pos)
+            elif major == MAJOR_UINT:
+                key = _COMPACT_FIELDS.get(key, key)
+            major, argument, _ = readHead(buffer, valuePos)
+            pos = skipItem(buffer, valuePos)
+            if major == MAJOR_ARRAY:
+                fields[key] = argument
+            elif major in (MAJOR_UINT, MAJOR_NINT, MAJOR_SIMPLE):
+                fields[key] = cbor2.loads(buffer[valuePos:pos])
+        return objId, end - start, fields
+
+    def loadObject(self, listName: str, index: int) -> BaseNode:
+        """
+        Decode an object and create its node.
+
+        Param
+            listName: The object list name.
+            index: The object index in its list.
+
+        Return
+            The object node, without parent.
+        """
+        type = NodeType[listName]
+        definition = decodedToDefinition(type,
+                                         self.decodeObject(listName, index))
+        definition['name'] = self.getObjectName(listName, index)
+        definition['id'] = self.getObjectId(listName, index)
+        return objectFromDict(type, definition)
+
+    def createStore(self, root: BaseNode = None) -> DatastoreNode:
+        """
+        Create a datastore browsing the encoded file.
+
+        The object lists of the store create their objects when they are
+        accessed. The reader must stay open while the store is used.
+
+        Param
+            root: The datastore tree root node, a new root is created if none.
+
+        Return
+            The datastore node.
+        """
+        if root is None:
+            root = ObjectListNode('', None)
+        name = os.path.splitext(os.path.basename(self._path))[0]
+        metadata = DatastoreMetadata(
+            datetime.fromtimestamp(os.path.getmtime(self._path)),
+            workingDir=os.path.dirname(os.path.abspath(self._path)))
+        store = DatastoreNode(name, root, metadata)
+        for type in NodeType:
+            if type == NodeType.STORE or type == NodeType.OBJ_LIST:
+                continue
+            if type.name in self._offsets:
+                LazyObjectListNode(type.name, store,
+                                   self.getObjectCount(type.name),
+                                   partial(self.loadObject, type.name),
+                                   len(self._offsets[type.name]) - 1,
+                                   partial(self.peekObject, type.name),
+                                   partial(self.getObjectName, type.name))
+            else:
+                ObjectListNode(type.name, store)
+        store.clearUnsavedChangesFlag()
+        return store
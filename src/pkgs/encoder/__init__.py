@@ -0,0 +1,10 @@
+from .datastoreEncoder import DatastoreEncoder, getObjectSlots, \
+    iterObjectSlots                                             # noqa: F401
+from .datastorePatch import applyPatch, createPatch             # noqa: F401
+from .imageCompression import compressImage, CompressedHeader, \
+    decompressChunk, decompressImage, DEFAULT_CHUNK_SIZE, \
+    DEFAULT_DICTIONARY_SIZE, getCompressedPath, readCompressedHeader, \
+    trainDictionary                                             # noqa: F401
+from .incrementalEncoder import IncrementalDatastoreEncoder     # noqa: F401
+from .pagedImage import createPagedImage, getPagedImagePath, PageIndex, \
+    PagedList, readPageIndex, readPagedObject                   # noqa: F401
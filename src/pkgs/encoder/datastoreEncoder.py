@@ -0,0 +1,429 @@
+import sys
+from array import array
+from itertools import repeat
+from logging import getLogger
+from typing import BinaryIO, Iterator
+
+from cbor2 import CBOREncoder
+
+from ..datastore import ArrayElementStore, BaseNode, ButtonArrayNode, \
+    ButtonNode, DatastoreNode, FloatArrayNode, FloatNode, IntArrayNode, \
+    IntNode, MultiStateNode, NodeType, UintArrayNode, UintNode
+from ..decoder.lazyDecoder import COMPACT_KEYS
+
+
+_MAJOR_BYTES = 2
+_MAJOR_ARRAY = 4
+_MAJOR_MAP = 5
+_MAJOR_TAG = 6
+
+# RFC 8746 typed array tags (big endian, little endian) per array typecode.
+_TYPED_ARRAY_TAGS = {
+    'B': (64, 64),
+    'H': (65, 69),
+    'I': (66, 70),
+    'Q': (67, 71),
+    'b': (72, 72),
+    'h': (73, 77),
+    'i': (74, 78),
+    'q': (75, 79),
+    'f': (81, 85),
+    'd': (82, 86),
+}
+# The narrower typecodes of each column typecode, from the narrowest.
+_NARROW_TYPECODES = {
+    'Q': 'BHI',
+    'q': 'bhi',
+    'd': 'f',
+}
+# The shortest shared prefix worth front coding a name, in bytes.
+_MIN_PREFIX_SIZE = 3
+
+
+def _narrowColumn(column: memoryview) -> memoryview:
+    """
+    Convert a value column to the narrowest typecode holding its values
+    exactly.
+
+    Param
+        column: The column.
+
+    Return
+        The narrowed column, the column itself if no narrower typecode holds
+        its values.
+    """
+    values = column.tolist()
+    for typecode in _NARROW_TYPECODES[column.format]:
+        narrow = array(typecode)
+        try:
+            narrow.fromlist(values)
+        except OverflowError:
+            continue
+        if narrow.tolist() == values:
+            return memoryview(narrow)
+    return column
+
+
+def _getSharedPrefix(first: str, second: str) -> int:
+    """
+    Get the length of the prefix shared by two strings.
+
+    The length is found by a binary search comparing slices, so short names
+    are compared in a few steps.
+
+    Param
+        first: The first string.
+        second: The second string.
+
+    Return
+        The number of leading characters the strings share.
+    """
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[:middle] == second[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _scanObjectIds(objList: BaseNode) -> tuple[int, bool]:
+    """
+    Scan the object ids of an object list.
+
+    Param
+        objList: The object list node.
+
+    Return
+        The greatest id of the list plus one, 0 if the list is empty, and
+        true if the ids increase with the rows, false otherwise.
+    """
+    greatest = -1
+    ordered = True
+    for row in range(objList.getChildCount()):
+        objId = objList.getChild(row).getId()
+        if objId > greatest:
+            greatest = objId
+        else:
+            ordered = False
+    return greatest + 1, ordered
+
+
+def _iterObjectSlots(objList: BaseNode,
+                     ordered: bool) -> Iterator[BaseNode | None]:
+    """
+    Iterate the objects of an object list in id order.
+
+    Param
+        objList: The object list node.
+        ordered: True if the ids increase with the rows, false otherwise.
+
+    Return
+        The object of each id up to the greatest id of the list, none for
+        the ids no object has.
+    """
+    if ordered:
+        nodes = (objList.getChild(row)
+                 for row in range(objList.getChildCount()))
+    else:
+        nodes = iter(sorted(objList.getChildren(), key=BaseNode.getId))
+    nextId = 0
+    for node in nodes:
+        yield from repeat(None, node.getId() - nextId)
+        yield node
+        nextId = node.getId() + 1
+
+
+def iterObjectSlots(objList: BaseNode) -> Iterator[BaseNode | None]:
+    """
+    Iterate the objects of an object list in id order.
+
+    The objects are walked in row order, without copying the list, when
+    their ids increase with their rows, which is the case unless objects
+    were inserted before others. They are sorted by id otherwise.
+
+    Param
+        objList: The object list node.
+
+    Return
+        The object of each id up to the greatest id of the list, none for
+        the ids no object has.
+    """
+    return _iterObjectSlots(objList, _scanObjectIds(objList)[1])
+
+
+def getObjectSlots(objList: BaseNode) -> list[BaseNode | None]:
+    """
+    Get the objects of an object list indexed by id.
+
+    Param
+        objList: The object list node.
+
+    Return
+        The object of each id up to the greatest id of the list, none for
+        the ids no object has.
+    """
+    return list(iterObjectSlots(objList))
+
+
+class DatastoreEncoder(object):
+    """
+    The datastore CBOR encoder.
+
+    The encoder walks the datastore tree and writes definite-length CBOR
+    straight to the output stream, one object at a time, so the memory used
+    does not depend on the store size. The name table is written at the same
+    time, one name at a time.
+
+    The encoded store is a map of the object lists keyed by list name. Each
+    list is an array of object maps indexed by object id, with null at the
+    ids no object has, so an object is found by id without any search. The
+    objects are encoded without their name and the values of the numeric
+    array elements are written as RFC 8746 typed arrays.
+
+    The object names can be written to a separate name table, a map of
+    arrays of names indexed the same way as the object lists.
+
+    The compact encoding keeps this layout but shrinks the objects: the map
+    keys are the small integers of COMPACT_KEYS, the element and state
+    names sharing at least 3 bytes with the previous name of their object
+    are front coded as an array of the shared byte count and of the rest of
+    the name, and the value columns use the narrowest typed array holding
+    their values exactly. Each object stays self-contained, so the objects
+    can still be indexed, patched and paged one by one.
+    """
+    def __init__(self, fp: BinaryIO, nameFp: BinaryIO = None,
+                 compact: bool = False) -> None:
+        """
+        Constructor.
+
+        Param
+            fp: The output stream.
+            nameFp: The name table output stream, no name table if none.
+            compact: True to use the compact encoding, false otherwise.
+        """
+        self._logger = getLogger('app.encoder')
+        self._fp = fp
+        self._encoder = CBOREncoder(fp)
+        self._nameEncoder = CBOREncoder(nameFp) if nameFp is not None \
+            else None
+        self._compact = compact
+
+    def _encodeField(self, key: str) -> None:
+        """
+        Encode an object map key.
+
+        Param
+            key: The field name.
+        """
+        self._encoder.encode(COMPACT_KEYS[key] if self._compact else key)
+
+    def _encodeKey(self, key: str, value) -> None:
+        """
+        Encode a map key and its value.
+
+        Param
+            key: The map key.
+            value: The value.
+        """
+        self._encodeField(key)
+        self._encoder.encode(value)
+
+    def _encodeName(self, name: str, previous: str) -> None:
+        """
+        Encode an element or state name, front coded in the compact
+        encoding.
+
+        Param
+            name: The name.
+            previous: The previous name of the object.
+        """
+        if self._compact and name[:1] == previous[:1]:
+            prefix = _getSharedPrefix(previous, name)
+            prefixSize = prefix if name.isascii() else \
+                len(name[:prefix].encode())
+            if prefixSize >= _MIN_PREFIX_SIZE:
+                self._encoder.encode_length(_MAJOR_ARRAY, 2)
+                self._encoder.encode(prefixSize)
+                self._encoder.encode(name[prefix:])
+                return
+        self._encoder.encode(name)
+
+    def _encodeNames(self, names: list[str]) -> None:
+        """
+        Encode the element names of an array object.
+
+        Param
+            names: The element names.
+        """
+        self._encoder.encode_length(_MAJOR_ARRAY, len(names))
+        previous = ''
+        for name in names:
+            self._encodeName(name, previous)
+            previous = name
+
+    def _encodeColumn(self, key: str, elements: ArrayElementStore,
+                      field: str) -> None:
+        """
+        Encode an array element column as a typed array without copying it.
+
+        Param
+            key: The map key.
+            elements: The array elements.
+            field: The column field.
+        """
+        column = elements.getColumn(field)
+        if self._compact:
+            narrow = _narrowColumn(column)
+            if narrow is not column:
+                column.release()
+                column = narrow
+        tag = _TYPED_ARRAY_TAGS[column.format][sys.byteorder == 'little']
+        self._encodeField(key)
+        self._encoder.encode_length(_MAJOR_TAG, tag)
+        self._encoder.encode_length(_MAJOR_BYTES, column.nbytes)
+        self._fp.write(column)
+        column.release()
+
+    def _encodeButton(self, node: ButtonNode) -> None:
+        """
+        Encode a button object.
+
+        Param
+            node: The button node.
+        """
+        self._encoder.encode_length(_MAJOR_MAP, 2)
+        self._encodeKey('longPressTime', node.getLongPressTime())
+        self._encodeKey('inactiveTime', node.getInactiveTime())
+
+    def _encodeButtonArray(self, node: ButtonArrayNode) -> None:
+        """
+        Encode a button array object.
+
+        Param
+            node: The button array node.
+        """
+        elements = node.getElements()
+        self._encoder.encode_length(_MAJOR_MAP, 3)
+        self._encodeKey('longPressTime', node.getLongPressTime())
+        self._encodeKey('inactiveTime', node.getInactiveTime())
+        self._encodeField('elements')
+        self._encodeNames([element.name for element in elements])
+
+    def _encodeNumber(self, node: FloatNode | IntNode | UintNode) -> None:
+        """
+        Encode a float, int or uint object.
+
+        Param
+            node: The float, int or uint node.
+        """
+        self._encoder.encode_length(_MAJOR_MAP, 3)
+        self._encodeKey('min', node.getMinimum())
+        self._encodeKey('max', node.getMaximum())
+        self._encodeKey('default', node.getDefault())
+
+    def _encodeNumberArray(self, node: FloatArrayNode | IntArrayNode |
+                           UintArrayNode) -> None:
+        """
+        Encode a float, int or uint array object.
+
+        Param
+            node: The float, int or uint array node.
+        """
+        elements = node.getElements()
+        self._encoder.encode_length(_MAJOR_MAP, 5)
+        self._encodeKey('inNvm', node.isInNvm())
+        self._encodeField('elements')
+        self._encodeNames(elements.getNames())
+        self._encodeColumn('min', elements, 'min')
+        self._encodeColumn('max', elements, 'max')
+        self._encodeColumn('default', elements, 'default')
+
+    def _encodeMultiState(self, node: MultiStateNode) -> None:
+        """
+        Encode a multi-state object.
+
+        Param
+            node: The multi-state node.
+        """
+        states = node.getStateList()
+        self._encoder.encode_length(_MAJOR_MAP, 3)
+        self._encodeKey('inNvm', node.isInNvm())
+        self._encodeKey('default', node.getDefaultIndex())
+        self._encodeField('states')
+        self._encoder.encode_length(_MAJOR_ARRAY, len(states))
+        previous = ''
+        for state in states:
+            self._encoder.encode_length(_MAJOR_ARRAY, 2)
+            self._encodeName(state.getName(), previous)
+            self._encoder.encode(state.getValue())
+            previous = state.getName()
+
+    def encodeObject(self, node: BaseNode) -> None:
+        """
+        Encode an object.
+
+        Param
+            node: The object node.
+        """
+        match node.getType():
+            case NodeType.BUTTON:
+                self._encodeButton(node)
+            case NodeType.BUTTON_ARRAY:
+                self._encodeButtonArray(node)
+            case NodeType.FLOAT | NodeType.INT | NodeType.UINT:
+                self._encodeNumber(node)
+            case NodeType.FLOAT_ARRAY | NodeType.INT_ARRAY | \
+                    NodeType.UINT_ARRAY:
+                self._encodeNumberArray(node)
+            case NodeType.MULTI_STATE:
+                self._encodeMultiState(node)
+            case _:
+                raise ValueError(f"{node.getType().name} is an "
+                                 f"unsupported object type")
+
+    def _encodeObjectList(self, objList: BaseNode) -> None:
+        """
+        Encode an object list, and its names to the name table.
+
+        Param
+            objList: The object list node.
+        """
+        slotCount, ordered = _scanObjectIds(objList)
+        self._encoder.encode(objList.getName())
+        self._encoder.encode_length(_MAJOR_ARRAY, slotCount)
+        if self._nameEncoder is not None:
+            self._nameEncoder.encode(objList.getName())
+            self._nameEncoder.encode_length(_MAJOR_ARRAY, slotCount)
+        for node in _iterObjectSlots(objList, ordered):
+            if node is None:
+                self._encoder.encode(None)
+            else:
+                self.encodeObject(node)
+            if self._nameEncoder is not None:
+                self._nameEncoder.encode(node.getName() if node is not None
+                                         else None)
+
+    def encode(self, store: DatastoreNode) -> int:
+        """
+        Encode a datastore.
+
+        Param
+            store: The datastore node.
+
+        Return
+            The number of encoded objects.
+        """
+        self._logger.info(f"encoding {store.getName()}")
+        objCount = 0
+        self._encoder.encode_length(_MAJOR_MAP, store.getChildCount())
+        if self._nameEncoder is not None:
+            self._nameEncoder.encode_length(_MAJOR_MAP,
+                                            store.getChildCount())
+        for row in range(store.getChildCount()):
+            objList = store.getChild(row)
+            self._encodeObjectList(objList)
+            objCount += objList.getChildCount()
+        self._logger.debug(f"{objCount} objects encoded")
+        return objCount
@@ -0,0 +1,252 @@
+import heapq
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+
+import cbor2
+
+from ..decoder.cborIndex import skipItem
+
+
+_COMPRESSED_VERSION = 1
+# The deflate window, the largest useful dictionary size.
+DEFAULT_DICTIONARY_SIZE = 32768
+DEFAULT_CHUNK_SIZE = 4096
+# The length of the substrings counted by the dictionary trainer.
+_DMER_SIZE = 8
+# The length of the sample segments the dictionary is made of.
+_SEGMENT_SIZE = 64
+# The largest amount of sample data counted by the dictionary trainer.
+_MAX_SAMPLE_SIZE = 1 << 20
+
+
+@dataclass(slots=True)
+class CompressedHeader:
+    """
+    The header of a compressed datastore image.
+
+    The chunk offsets are relative to the end of the header and end with
+    the offset following the last chunk.
+    """
+    chunkSize: int
+    size: int
+    dictionaryId: int
+    headerSize: int
+    offsets: list[int] = field(default_factory=list)
+
+    def getChunkCount(self) -> int:
+        """
+        Get the number of chunks.
+
+        Return
+            The chunk count.
+        """
+        return len(self.offsets) - 1
+
+
+def getCompressedPath(path: str) -> str:
+    """
+    Get the compressed image path of an encoded datastore or paged image.
+
+    Param
+        path: The image path.
+
+    Return
+        The image path with the .z extension appended.
+    """
+    return f"{path}.z"
+
+
+def _sampleData(samples: list[bytes], maxSize: int) -> bytes:
+    """
+    Take evenly spread windows of the samples, up to a total size.
+
+    Param
+        samples: The sample images.
+        maxSize: The largest total size.
+
+    Return
+        The sample data.
+    """
+    total = sum(len(sample) for sample in samples)
+    if total <= maxSize:
+        return b''.join(samples)
+    windowCount = maxSize // (16 * _SEGMENT_SIZE)
+    windowSize = maxSize // windowCount
+    step = total / windowCount
+    data = b''.join(samples)
+    return b''.join(data[int(index * step):int(index * step) + windowSize]
+                    for index in range(windowCount))
+
+
+def trainDictionary(samples: list[bytes],
+                    size: int = DEFAULT_DICTIONARY_SIZE) -> bytes:
+    """
+    Train a preset dictionary from sample images.
+
+    The dictionary is made of sample segments chosen greedily by the
+    number of occurrences of the substrings they hold and no segment chosen
+    before holds, the covered substrings counting once. Rescoring lazily
+    the segment on top of a heap keeps the selection in O(n log n) for n
+    segments. The best segments are put at the end of the dictionary, where
+    the deflate references are the shortest.
+
+    Param
+        samples: The sample images, such as the previous images of the
+            datastore.
+        size: The dictionary size, in bytes.
+
+    Return
+        The dictionary, empty without sample data.
+    """
+    data = _sampleData(samples, _MAX_SAMPLE_SIZE)
+    # The substring at each position, as an id indexing the counts.
+    dmerIds: dict[bytes, int] = {}
+    ids = [dmerIds.setdefault(data[pos:pos + _DMER_SIZE], len(dmerIds))
+           for pos in range(len(data) - _DMER_SIZE + 1)]
+    counts = [0] * len(dmerIds)
+    for id, count in Counter(ids).items():
+        if count > 1:
+            counts[id] = count
+    span = _SEGMENT_SIZE - _DMER_SIZE + 1
+
+    def getScore(start: int) -> int:
+        return sum(map(counts.__getitem__, set(ids[start:start + span])))
+
+    heap = [(-getScore(start), start)
+            for start in range(0, len(data) - _SEGMENT_SIZE + 1,
+                               _SEGMENT_SIZE // 2)]
+    heapq.heapify(heap)
+    segments = []
+    dictionarySize = 0
+    while heap and dictionarySize < size:
+        _, start = heapq.heappop(heap)
+        score = getScore(start)
+        if not score:
+            continue
+        if heap and score < -heap[0][0]:
+            heapq.heappush(heap, (-score, start))
+            continue
+        segments.append(data[start:start + _SEGMENT_SIZE])
+        dictionarySize += _SEGMENT_SIZE
+        for id in ids[start:start + span]:
+            counts[id] = 0
+    return b''.join(reversed(segments))[-size:] if size else b''
+
+
+def compressImage(image: bytes, chunkSize: int = DEFAULT_CHUNK_SIZE,
+                  dictionary: bytes = b'', level: int = 9) -> bytes:
+    """
+    Compress an encoded datastore or paged image in independent chunks.
+
+    The compressed image is a CBOR array holding the format version, the
+    chunk size, the image size, the Adler-32 of the dictionary and the
+    offsets of the chunks after the header, followed by the chunks. Each
+    chunk is a raw deflate stream of chunk size bytes of the image, the
+    last one being shorter, compressed with the preset dictionary and
+    decompressed on its own. A paged image compressed with its page size
+    as chunk size is decompressed one page at a time.
+
+    Param
+        image: The image.
+        chunkSize: The uncompressed chunk size, in bytes.
+        dictionary: The preset dictionary, none if empty.
+        level: The zlib compression level.
+
+    Return
+        The compressed image.
+    """
+    if chunkSize <= 0:
+        raise ValueError(f"the chunk size {chunkSize} is not positive")
+    chunks = []
+    offsets = [0]
+    for start in range(0, len(image), chunkSize):
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15,
+                                      zdict=dictionary) if dictionary \
+            else zlib.compressobj(level, zlib.DEFLATED, -15)
+        chunk = compressor.compress(image[start:start + chunkSize]) + \
+            compressor.flush()
+        chunks.append(chunk)
+        offsets.append(offsets[-1] + len(chunk))
+    header = cbor2.dumps([_COMPRESSED_VERSION, chunkSize, len(image),
+                          zlib.adler32(dictionary), offsets])
+    return header + b''.join(chunks)
+
+
+def readCompressedHeader(compressed) -> CompressedHeader:
+    """
+    Read the header of a compressed image.
+
+    A value error is raised when the data is not a supported compressed
+    image.
+
+    Param
+        compressed: The compressed image, or its start holding the header.
+
+    Return
+        The compressed image header.
+    """
+    try:
+        headerSize = skipItem(compressed, 0)
+        version, chunkSize, size, dictionaryId, offsets = \
+            cbor2.loads(compressed[:headerSize])
+    except (cbor2.CBORDecodeError, TypeError, ValueError) as error:
+        raise ValueError(f"invalid compressed image: {error}") from error
+    if version != _COMPRESSED_VERSION:
+        raise ValueError(f"unsupported compressed image version {version}")
+    return CompressedHeader(chunkSize, size, dictionaryId, headerSize,
+                            offsets)
+
+
+def decompressChunk(compressed, index: int, dictionary: bytes = b'',
+                    header: CompressedHeader = None) -> bytes:
+    """
+    Decompress a chunk of a compressed image.
+
+    A value error is raised when the dictionary is not the compression
+    dictionary or when the chunk is corrupted.
+
+    Param
+        compressed: The compressed image.
+        index: The chunk index.
+        dictionary: The preset dictionary of the compression.
+        header: The compressed image header, read from the image if none.
+
+    Return
+        The uncompressed chunk.
+    """
+    if header is None:
+        header = readCompressedHeader(compressed)
+    if zlib.adler32(dictionary) != header.dictionaryId:
+        raise ValueError('the dictionary is not the compression dictionary')
+    if not 0 <= index < header.getChunkCount():
+        raise IndexError(f"chunk {index} out of range")
+    start = header.headerSize + header.offsets[index]
+    end = header.headerSize + header.offsets[index + 1]
+    decompressor = zlib.decompressobj(-15, zdict=dictionary) if dictionary \
+        else zlib.decompressobj(-15)
+    try:
+        chunk = decompressor.decompress(compressed[start:end]) + \
+            decompressor.flush()
+    except zlib.error as error:
+        raise ValueError(f"corrupted chunk {index}: {error}") from error
+    expected = min(header.chunkSize, header.size - index * header.chunkSize)
+    if not decompressor.eof or len(chunk) != expected:
+        raise ValueError(f"corrupted chunk {index}")
+    return chunk
+
+
+def decompressImage(compressed, dictionary: bytes = b'') -> bytes:
+    """
+    Decompress a compressed image.
+
+    Param
+        compressed: The compressed image.
+        dictionary: The preset dictionary of the compression.
+
+    Return
+        The image.
+    """
+    header = readCompressedHeader(compressed)
+    return b''.join(decompressChunk(compressed, index, dictionary, header)
+                    for index in range(header.getChunkCount()))
@@ -0,0 +1,169 @@
+from io import BytesIO
+from logging import getLogger
+
+from cbor2 import CBOREncoder
+
+from .datastoreEncoder import DatastoreEncoder, getObjectSlots
+from ..datastore import BaseNode, DatastoreNode
+
+
+_MAJOR_ARRAY = 4
+_MAJOR_MAP = 5
+_NULL = b'\xf6'
+
+
+class _Fragment(object):
+    """
+    The encoded fragment of a subtree.
+    """
+    __slots__ = ('revision', 'data', 'children')
+
+    def __init__(self, revision: int, data: bytes,
+                 children: dict[BaseNode, '_Fragment'] = None) -> None:
+        """
+        Constructor.
+
+        Param
+            revision: The subtree revision when it was encoded.
+            data: The encoded subtree.
+            children: The fragments of the subtree children.
+        """
+        self.revision = revision
+        self.data = data
+        self.children = children
+
+
+class IncrementalDatastoreEncoder(object):
+    """
+    The incremental datastore CBOR encoder.
+
+    The encoder keeps the encoded fragment of every subtree with the
+    revision it was encoded at. Encoding the store again only re-encodes the
+    subtrees whose revision changed, i.e. the path from each modified node
+    to the store, and reuses the cached bytes of everything else. Node
+    revisions are unique, so the cache is never reused for another store.
+    The output is identical to the DatastoreEncoder output, without name
+    table.
+    """
+    def __init__(self, compact: bool = False) -> None:
+        """
+        Constructor.
+
+        Param
+            compact: True to use the compact encoding, false otherwise.
+        """
+        self._logger = getLogger('app.encoder')
+        self._buffer = BytesIO()
+        self._encoder = CBOREncoder(self._buffer)
+        self._objEncoder = DatastoreEncoder(self._buffer, compact=compact)
+        self._cache: _Fragment | None = None
+        self._encodedCount = 0
+
+    def _takeBuffer(self) -> bytes:
+        """
+        Take the content of the encoding buffer.
+
+        Return
+            The encoded bytes.
+        """
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def _encodeObject(self, node: BaseNode,
+                      cached: _Fragment | None) -> _Fragment:
+        """
+        Encode an object.
+
+        Param
+            node: The object node.
+            cached: The previous fragment of the object.
+
+        Return
+            The object fragment.
+        """
+        if cached is not None and cached.revision == node.getRevision():
+            return cached
+        self._encodedCount += 1
+        self._objEncoder.encodeObject(node)
+        return _Fragment(node.getRevision(), self._takeBuffer())
+
+    def _encodeObjectList(self, objList: BaseNode,
+                          cached: _Fragment | None) -> _Fragment:
+        """
+        Encode an object list with its name as the store map key.
+
+        Param
+            objList: The object list node.
+            cached: The previous fragment of the object list.
+
+        Return
+            The object list fragment.
+        """
+        if cached is not None and cached.revision == objList.getRevision():
+            return cached
+        previous = cached.children if cached is not None else {}
+        children = {}
+        slots = getObjectSlots(objList)
+        self._encoder.encode(objList.getName())
+        self._encoder.encode_length(_MAJOR_ARRAY, len(slots))
+        parts = [self._takeBuffer()]
+        for child in slots:
+            if child is None:
+                parts.append(_NULL)
+                continue
+            fragment = self._encodeObject(child, previous.get(child))
+            children[child] = fragment
+            parts.append(fragment.data)
+        return _Fragment(objList.getRevision(), b''.join(parts), children)
+
+    def _encodeStore(self, store: DatastoreNode,
+                     cached: _Fragment | None) -> _Fragment:
+        """
+        Encode the store.
+
+        Param
+            store: The datastore node.
+            cached: The previous fragment of the store.
+
+        Return
+            The store fragment.
+        """
+        if cached is not None and cached.revision == store.getRevision():
+            return cached
+        previous = cached.children if cached is not None else {}
+        children = {}
+        count = store.getChildCount()
+        self._encoder.encode_length(_MAJOR_MAP, count)
+        parts = [self._takeBuffer()]
+        for row in range(count):
+            objList = store.getChild(row)
+            fragment = self._encodeObjectList(objList, previous.get(objList))
+            children[objList] = fragment
+            parts.append(fragment.data)
+        return _Fragment(store.getRevision(), b''.join(parts), children)
+
+    def encode(self, store: DatastoreNode) -> bytes:
+        """
+        Encode a datastore, reusing the fragments of the unmodified subtrees.
+
+        Param
+            store: The datastore node.
+
+        Return
+            The encoded datastore.
+        """
+        self._encodedCount = 0
+        self._cache = self._encodeStore(store, self._cache)
+        self._logger.debug(f"{self._encodedCount} objects re-encoded")
+        return self._cache.data
+
+    def getEncodedCount(self) -> int:
+        """
+        Get the number of objects encoded by the last encoding.
+
+        Return
+            The number of objects that were not taken from the cache.
+        """
+        return self._encodedCount
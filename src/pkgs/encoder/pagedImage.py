@@ -0,0 +1,185 @@
+import os
+from bisect import bisect_right
+from dataclasses import dataclass, field
+
+import cbor2
+
+from ..decoder.cborIndex import indexObjects, skipItem
+
+
+_PAGED_VERSION = 1
+# The page padding byte, the erased flash state and a CBOR break code which
+# never starts a data item.
+_PADDING = 0xff
+
+
+@dataclass(slots=True)
+class PagedList:
+    """
+    The page index of an object list.
+
+    Each run is a sequence of consecutive objects of the list starting in
+    the same page, given by the id of its first object and the offset of
+    that object from the start of the data pages.
+    """
+    count: int
+    firstIds: list[int] = field(default_factory=list)
+    offsets: list[int] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PageIndex:
+    """
+    The page index of a paged datastore image.
+    """
+    pageSize: int
+    dataOffset: int
+    pageCount: int
+    lists: dict[str, PagedList] = field(default_factory=dict)
+
+    def locate(self, listName: str, id: int) -> tuple[int, int] | None:
+        """
+        Get the offset of the run holding an object.
+
+        Param
+            listName: The object list name.
+            id: The object id.
+
+        Return
+            The image offset of the run holding the object and the number of
+            objects preceding it in the run, none if the list has no such
+            id.
+        """
+        pagedList = self.lists.get(listName)
+        if pagedList is None or not 0 <= id < pagedList.count:
+            return None
+        run = bisect_right(pagedList.firstIds, id) - 1
+        return self.dataOffset + pagedList.offsets[run], \
+            id - pagedList.firstIds[run]
+
+
+def getPagedImagePath(outputPath: str) -> str:
+    """
+    Get the paged image path of an encoded datastore.
+
+    Param
+        outputPath: The encoded datastore path.
+
+    Return
+        The encoded datastore path with the .pages extension.
+    """
+    return f"{os.path.splitext(outputPath)[0]}.pages"
+
+
+def createPagedImage(encoded: bytes, pageSize: int,
+                     allowSpanning: bool = False) -> bytes:
+    """
+    Split an encoded datastore into fixed-size pages.
+
+    The image starts with the page index, a CBOR array holding the format
+    version, the page size, the data page count and a map of the runs of
+    each object list by name. The runs of a list are a CBOR array of its
+    object count followed by a flat array of (first id, page, offset)
+    triples, one per page in which an object of the list starts. The index
+    is padded to whole pages and followed by the data pages, holding the
+    encoded objects, null at the ids without object, in list order.
+
+    An object is found by reading the index, selecting the last run whose
+    first id is not greater than the object id and skipping the objects
+    preceding it in the run, so a read only touches the index pages and
+    the pages of the object. Unless spanning is allowed, an object never
+    straddles two pages: the rest of a page which cannot hold the next
+    object is padded with 0xff bytes, the erased flash state, and a value
+    error is raised on an object larger than a page.
+
+    Param
+        encoded: The encoded datastore, as output by the datastore
+            encoders.
+        pageSize: The page size, in bytes.
+        allowSpanning: True to pack the objects without padding, letting
+            them straddle pages, false otherwise.
+
+    Return
+        The paged image.
+    """
+    if pageSize <= 0:
+        raise ValueError(f"the page size {pageSize} is not positive")
+    data = bytearray()
+    lists = {}
+    for listName, offsets in indexObjects(encoded).items():
+        runs = []
+        page = -1
+        for id in range(len(offsets) - 1):
+            size = offsets[id + 1] - offsets[id]
+            used = len(data) % pageSize
+            if not allowSpanning and used + size > pageSize:
+                if size > pageSize:
+                    raise ValueError(f"{listName} object {id} of {size} "
+                                     f"bytes does not fit a {pageSize} byte "
+                                     f"page, allow spanning to split it")
+                data += bytes([_PADDING]) * (pageSize - used)
+            if len(data) // pageSize != page:
+                page = len(data) // pageSize
+                runs += (id, page, len(data) % pageSize)
+            data += encoded[offsets[id]:offsets[id + 1]]
+        lists[listName] = [len(offsets) - 1, runs]
+    pageCount = -(-len(data) // pageSize)
+    data += bytes([_PADDING]) * (pageCount * pageSize - len(data))
+    index = cbor2.dumps([_PAGED_VERSION, pageSize, pageCount, lists])
+    padding = -len(index) % pageSize
+    return index + bytes([_PADDING]) * padding + data
+
+
+def readPageIndex(image) -> PageIndex:
+    """
+    Read the page index of a paged datastore image.
+
+    A value error is raised when the image is not a supported paged image.
+
+    Param
+        image: The paged image, or its start holding the index pages.
+
+    Return
+        The page index.
+    """
+    try:
+        indexSize = skipItem(image, 0)
+        version, pageSize, pageCount, lists = cbor2.loads(image[:indexSize])
+    except (cbor2.CBORDecodeError, TypeError, ValueError) as error:
+        raise ValueError(f"invalid paged image: {error}") from error
+    if version != _PAGED_VERSION:
+        raise ValueError(f"unsupported paged image version {version}")
+    pageIndex = PageIndex(pageSize, -(-indexSize // pageSize) * pageSize,
+                          pageCount)
+    for listName, (count, runs) in lists.items():
+        pageIndex.lists[listName] = PagedList(
+            count, runs[0::3], [page * pageSize + offset
+                                for page, offset in zip(runs[1::3],
+                                                        runs[2::3])])
+    return pageIndex
+
+
+def readPagedObject(image, listName: str, id: int,
+                    pageIndex: PageIndex = None) -> bytes | None:
+    """
+    Read an encoded object of a paged datastore image.
+
+    Param
+        image: The paged image.
+        listName: The object list name.
+        id: The object id.
+        pageIndex: The page index of the image, read from the image if none.
+
+    Return
+        The encoded object, the encoded null if no object has the id, none
+        if the list has no such id.
+    """
+    if pageIndex is None:
+        pageIndex = readPageIndex(image)
+    location = pageIndex.locate(listName, id)
+    if location is None:
+        return None
+    pos, skipCount = location
+    for _ in range(skipCount):
+        pos = skipItem(image, pos)
+    return bytes(image[pos:skipItem(image, pos)])
@@ -1,15 +1,12 @@
-from .baseNode import BaseNode, NodeType                        # noqa: F401
-from .buttonNode import ButtonArrayData, ButtonArrayElement, ButtonArrayNode, \
-    ButtonData, ButtonNode                                      # noqa: F401
-from .floatNode import FloatArrayData, FloatArrayElement, FloatArrayNode, \
-    FloatData, FloatNode                                        # noqa: F401
+from ...datastore import ArrayElementStore, ArrayElementView, BaseNode, \
+    ButtonArrayData, ButtonArrayElement, ButtonArrayNode, ButtonData, \
+    ButtonNode, ChildList, DatastoreMetadata, DatastoreNode, FloatArrayData, \
+    FloatArrayElement, FloatArrayElements, FloatArrayNode, FloatData, \
+    FloatNode, IntArrayData, IntArrayElement, IntArrayElements, IntArrayNode, \
+    IntData, IntNode, MultiStateData, MultiStateNode, NodeLoggerAdapter, \
+    FieldChange, NodeType, ObjectListNode, ObjectSearchIndex, StateNode, \
+    UintArrayData, UintArrayElement, UintArrayElements, UintArrayNode, \
+    UintData, UintNode, UndoStack, getNodeLogger                # noqa: F401
+from .datastoreFilterModel import DatastoreFilterModel          # noqa: F401
 from .datastoreModel import DatastoreModel                      # noqa: F401
-from .datastoreNode import DatastoreMetadata, DatastoreNode     # noqa: F401
-from .intNode import IntArrayData, IntArrayElement, IntArrayNode, \
-    IntData, IntNode                                            # noqa: F401
-from .multiStateNode import MultiStateData, MultiStateNode      # noqa: F401
-from .objectListNode import ObjectListNode                      # noqa: F401
-from .uintNode import UintArrayData, UintArrayElement, UintArrayNode, \
-    UintData, UintNode                                          # noqa: F401
 from .stateListModel import StateListModel                      # noqa: F401
-from .stateNode import StateNode                                # noqa: F401
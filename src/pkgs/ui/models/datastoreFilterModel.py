@@ -0,0 +1,448 @@
+from bisect import bisect
+from logging import getLogger
+from time import perf_counter
+from typing import Iterable
+
+from PySide6 import QtCore as qtc
+
+from ...datastore import BaseNode, NodeType, ObjectSearchIndex
+
+
+class DatastoreFilterModel(qtc.QAbstractProxyModel):
+    """
+    The search results model of the datastores.
+
+    The model shows the objects whose name contains the filter text under
+    their datastore and object list, without paging. The objects are
+    searched with a trigram index built the first time the model filters,
+    and kept current by listening to the datastores. A filter text
+    extending the previous one only searches the previous results, and the
+    object additions, removals and renamings only update the affected
+    rows.
+
+    Param
+        root: The datastore tree root node.
+        parent: The model parent object.
+    """
+    def __init__(self, root: BaseNode, parent: qtc.QObject = None) -> None:
+        super(DatastoreFilterModel, self).__init__(parent)
+        self._logger = getLogger('app.datastoreFilterModel')
+        self._root = root
+        self._searchIndex: ObjectSearchIndex = None
+        self._text = ''
+        self._types: set[NodeType] | None = None
+        self._matches: set[BaseNode] | None = None
+        self._children: dict[BaseNode, list[BaseNode]] = {}
+        self._rows: dict[BaseNode, int] = {}
+        self._objectRows: dict[BaseNode, tuple[BaseNode, int]] | None = None
+
+    def _getSearchIndex(self) -> ObjectSearchIndex:
+        """
+        Get the search index, indexing the datastores on first use.
+
+        Return
+            The search index.
+        """
+        if self._searchIndex is None:
+            self._searchIndex = ObjectSearchIndex()
+            for row in range(self._root.getChildCount()):
+                store = self._root.getChild(row)
+                self._searchIndex.addStore(store)
+                store.addObjectListener(self)
+            self._logger.info(f"{len(self._searchIndex)} objects indexed")
+        return self._searchIndex
+
+    def _buildRows(self, matches: set[BaseNode]) -> None:
+        """
+        Build the rows of the search results.
+
+        The matching objects are sorted by row, so the objects of lazily
+        read lists which do not match are not created. The rows of the
+        objects are only computed when they are needed.
+
+        Param
+            matches: The matching objects.
+        """
+        objects: dict[BaseNode, list[BaseNode]] = {}
+        for node in matches:
+            objects.setdefault(node.getParent(), []).append(node)
+        for nodes in objects.values():
+            nodes.sort(key=BaseNode.getRow)
+        lists: dict[BaseNode, list[BaseNode]] = {}
+        for objList in objects:
+            lists.setdefault(objList.getParent(), []).append(objList)
+        for objLists in lists.values():
+            objLists.sort(key=BaseNode.getRow)
+        self._children = {self._root: sorted(lists, key=BaseNode.getRow)}
+        self._children.update(lists)
+        self._rows = {}
+        for children in self._children.values():
+            self._rows.update(zip(children, range(len(children))))
+        self._children.update(objects)
+        self._objectRows = None
+
+    def _getRow(self, node: BaseNode) -> int | None:
+        """
+        Get the row of a node in the search results.
+
+        Param
+            node: The node.
+
+        Return
+            The node row, none if the node is not in the search results.
+        """
+        row = self._rows.get(node)
+        if row is None and node in self._matches:
+            row = self._getObjectRows()[node][1]
+        return row
+
+    def _getObjectRows(self) -> dict[BaseNode, tuple[BaseNode, int]]:
+        """
+        Get the object list and row of the matching objects, computing them
+        on first use after the results changed.
+
+        Return
+            The object list and row of each matching object.
+        """
+        if self._objectRows is None:
+            self._objectRows = {}
+            for objList in self._rows:
+                if objList.getType() == NodeType.OBJ_LIST:
+                    for row, node in enumerate(self._children[objList]):
+                        self._objectRows[node] = (objList, row)
+        return self._objectRows
+
+    def _getIndex(self, node: BaseNode) -> qtc.QModelIndex:
+        """
+        Get the index of a datastore or object list of the search results.
+
+        Param
+            node: The datastore or object list node, or the root node.
+
+        Return
+            The node index, an invalid index for the root node.
+        """
+        if node is self._root:
+            return qtc.QModelIndex()
+        return self.createIndex(self._rows[node], 0, node)
+
+    def _isMatching(self, node: BaseNode) -> bool:
+        """
+        Check if an object matches the filter text and types.
+
+        Param
+            node: The object node.
+
+        Return
+            True if the object matches, false otherwise.
+        """
+        return self._text in node.getName().lower() and \
+            (self._types is None or node.getType() in self._types)
+
+    def _insertRow(self, parent: BaseNode, node: BaseNode) -> None:
+        """
+        Insert a node in the search results in row order, inserting its
+        parent first if it is not shown.
+
+        Param
+            parent: The parent node.
+            node: The node.
+        """
+        if parent not in self._children:
+            self._insertRow(parent.getParent(), parent)
+        children = self._children[parent]
+        row = bisect(children, node.getRow(), key=BaseNode.getRow)
+        self.beginInsertRows(self._getIndex(parent), row, row)
+        children.insert(row, node)
+        if parent.getType() != NodeType.OBJ_LIST:
+            self._children[node] = []
+            self._rows.update(zip(children, range(len(children))))
+        else:
+            self._matches.add(node)
+        self._objectRows = None
+        self.endInsertRows()
+
+    def _removeRow(self, parent: BaseNode, row: int) -> None:
+        """
+        Remove a node from the search results, removing its parent too if
+        it has no other child shown.
+
+        Param
+            parent: The parent node.
+            row: The node row.
+        """
+        children = self._children[parent]
+        self.beginRemoveRows(self._getIndex(parent), row, row)
+        node = children.pop(row)
+        if parent.getType() != NodeType.OBJ_LIST:
+            del self._children[node]
+            del self._rows[node]
+            self._rows.update(zip(children, range(len(children))))
+        else:
+            self._matches.discard(node)
+        self._objectRows = None
+        self.endRemoveRows()
+        if not children and parent is not self._root:
+            self._removeRow(parent.getParent(), self._rows[parent])
+
+    def _update(self, within: Iterable[BaseNode] = None) -> None:
+        """
+        Search the objects and reset the model with the results.
+
+        Param
+            within: The objects to search, every object if none.
+        """
+        start = perf_counter()
+        matches = self._getSearchIndex().search(self._text, self._types,
+                                                within)
+        self.beginResetModel()
+        self._matches = matches
+        self._buildRows(matches)
+        self.endResetModel()
+        self._logger.debug(f"{len(matches)} objects matching '{self._text}' "
+                           f"in {(perf_counter() - start) * 1000:.1f} ms")
+
+    def getFilterText(self) -> str:
+        """
+        Get the filter text.
+
+        Return
+            The lower case filter text.
+        """
+        return self._text
+
+    def setFilterText(self, text: str) -> None:
+        """
+        Set the filter text, showing the objects whose name contains it.
+
+        Param
+            text: The filter text, case-insensitive.
+        """
+        text = text.lower()
+        within = None
+        if self._matches is not None and self._text in text:
+            within = self._matches
+        self._text = text
+        self._update(within)
+
+    def setFilterTypes(self, types: Iterable[NodeType] = None) -> None:
+        """
+        Set the types of the shown objects.
+
+        Param
+            types: The object types, every type if none.
+        """
+        self._types = set(types) if types is not None else None
+        self._update()
+
+    def objectsAdded(self, nodes: list[BaseNode]) -> None:
+        """
+        Insert the matching objects added to a datastore in the search
+        results.
+
+        Param
+            nodes: The added objects.
+        """
+        self._searchIndex.objectsAdded(nodes)
+        for node in nodes:
+            if self._isMatching(node):
+                self._insertRow(node.getParent(), node)
+
+    def objectsRemoved(self, nodes: list[BaseNode]) -> None:
+        """
+        Remove the objects removed from a datastore from the search results.
+
+        Param
+            nodes: The removed objects.
+        """
+        self._searchIndex.objectsRemoved(nodes)
+        objectRows = self._getObjectRows()
+        removed = sorted((objectRows[node] for node in nodes
+                          if node in self._matches),
+                         key=lambda location: location[1], reverse=True)
+        for objList, row in removed:
+            self._removeRow(objList, row)
+
+    def objectRenamed(self, node: BaseNode, oldName: str) -> None:
+        """
+        Update the search results after an object was renamed.
+
+        Param
+            node: The renamed object.
+            oldName: The previous name of the object.
+        """
+        self._searchIndex.objectRenamed(node, oldName)
+        if node in self._matches:
+            objList, row = self._getObjectRows()[node]
+            if self._isMatching(node):
+                index = self.createIndex(row, 0, node)
+                self.dataChanged.emit(index, index)
+            else:
+                self._removeRow(objList, row)
+        elif self._isMatching(node):
+            self._insertRow(node.getParent(), node)
+
+    def objectsCreated(self, objList: BaseNode) -> None:
+        """
+        Update the search index once a lazily read object list created all
+        of its objects.
+
+        Param
+            objList: The object list.
+        """
+        self._searchIndex.objectsCreated(objList)
+
+    def objectModified(self, node: BaseNode) -> None:
+        """
+        Ignore the modification of an object, which does not change the
+        search results.
+
+        Param
+            node: The modified object.
+        """
+        pass
+
+    def mapToSource(self, index: qtc.QModelIndex) -> qtc.QModelIndex:
+        """
+        Get the datastore model index of a search result.
+
+        Param
+            index: The search result index.
+
+        Return
+            The datastore model index.
+        """
+        if not index.isValid():
+            return qtc.QModelIndex()
+        return self.sourceModel().getNodeIndex(index.internalPointer())
+
+    def mapFromSource(self, index: qtc.QModelIndex) -> qtc.QModelIndex:
+        """
+        Get the search result index of a datastore model index.
+
+        Param
+            index: The datastore model index.
+
+        Return
+            The search result index, an invalid index if the node is not in
+            the search results.
+        """
+        if not index.isValid():
+            return qtc.QModelIndex()
+        node = index.internalPointer()
+        row = self._getRow(node) if self._matches is not None else None
+        if row is None:
+            return qtc.QModelIndex()
+        return self.createIndex(row, 0, node)
+
+    def rowCount(self, index: qtc.QModelIndex) -> int:
+        """
+        Get the row count.
+
+        Param
+            index: The index of the node.
+
+        Return
+            The number of children of the node in the search results.
+        """
+        node = self._root
+        if index.isValid():
+            node = index.internalPointer()
+        return len(self._children.get(node, ()))
+
+    def columnCount(self, index: qtc.QModelIndex) -> int:
+        """
+        Get the column count.
+
+        Param
+            index: The index of the node.
+
+        Return
+            The column count.
+        """
+        return 1
+
+    def hasChildren(self, index: qtc.QModelIndex) -> bool:
+        """
+        Check if the node has children in the search results.
+
+        Param
+            index: The index of the node.
+
+        Return
+            True if the node has children, false otherwise.
+        """
+        return self.rowCount(index) > 0
+
+    def canFetchMore(self, index: qtc.QModelIndex) -> bool:
+        """
+        Check if more children can be fetched, the search results are never
+        paged.
+
+        Param
+            index: The index of the node.
+
+        Return
+            False.
+        """
+        return False
+
+    def fetchMore(self, index: qtc.QModelIndex) -> None:
+        """
+        Fetch more children, the search results are never paged.
+
+        Param
+            index: The index of the node.
+        """
+        pass
+
+    def parent(self, index: qtc.QModelIndex) -> qtc.QModelIndex:
+        """
+        Get the parent index of the node at the given index.
+
+        Param
+            index: The index of the node.
+
+        Return
+            The index of the parent.
+        """
+        parent = index.internalPointer().getParent()
+        if parent is None or parent is self._root:
+            return qtc.QModelIndex()
+        return self.createIndex(self._rows[parent], 0, parent)
+
+    def index(self, row: int, column: int,
+              index: qtc.QModelIndex) -> qtc.QModelIndex:
+        """
+        Get the node index at the given row and column.
+
+        Param
+            row: The node row.
+            column: The node column.
+            index: The node parent.
+
+        Return
+            The node index.
+        """
+        node = self._root
+        if index.isValid():
+            node = index.internalPointer()
+        children = self._children.get(node, ())
+        if row < 0 or row >= len(children):
+            return qtc.QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def sibling(self, row: int, column: int,
+                index: qtc.QModelIndex) -> qtc.QModelIndex:
+        """
+        Get the sibling index of a node.
+
+        Param
+            row: The sibling row.
+            column: The sibling column.
+            index: The index of the node.
+
+        Return
+            The sibling index.
+        """
+        return self.index(row, column, self.parent(index))
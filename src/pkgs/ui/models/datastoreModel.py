@@ -1,123 +1,190 @@
 from logging import getLogger
+from typing import Callable
 from PySide6 import QtCore as qtc
 
-from .baseNode import BaseNode, NodeType
-from .buttonNode import ButtonArrayData, ButtonArrayNode, \
-    ButtonData, ButtonNode
-from .floatNode import FloatArrayData, FloatArrayNode, FloatData, FloatNode
-from .intNode import IntArrayData, IntArrayNode, IntData, IntNode
-from .multiStateNode import MultiStateData, MultiStateNode
-from .uintNode import UintArrayData, UintArrayNode, UintData, UintNode
+from ...datastore import BaseNode, ButtonArrayData, ButtonArrayNode, \
+    ButtonData, ButtonNode, FloatArrayData, FloatArrayNode, FloatData, \
+    FloatNode, IntArrayData, IntArrayNode, IntData, IntNode, MultiStateData, \
+    MultiStateNode, NodeType, UintArrayData, UintArrayNode, UintData, \
+    UintNode, UndoStack
 
 
 class DatastoreModel(qtc.QAbstractItemModel):
     """
     The datastore model class.
+
+    The children of a node are revealed to the view in pages: the view only
+    sees the first page of rows and fetches the next ones as it scrolls.
+
+    Param
+        root: The datastore tree root node.
+        parent: The model parent object.
+        pageSize: The number of rows revealed at once.
+        undoStack: The undo stack recording the renames, the renames are not
+            recorded if none.
     """
-    def __init__(self, root: BaseNode, parent: qtc.QObject = None):
+    def __init__(self, root: BaseNode, parent: qtc.QObject = None,
+                 pageSize: int = 256, undoStack: UndoStack = None):
         super(DatastoreModel, self).__init__(parent)
         self._logger = getLogger('app.datastoreModel')
         self._root = root
+        self._pageSize = pageSize
+        self._fetched: dict[BaseNode, int] = {}
+        self._undoStack = undoStack if undoStack is not None else UndoStack(0)
 
-    def _insertButtonNode(self, list: BaseNode, row: int) -> None:
+    def _getFetchedCount(self, node: BaseNode) -> int:
         """
-        Insert a button node.
+        Get the number of children of a node revealed to the view.
 
         Param
-            list: The button list.
-            row: The insertion row.
+            node: The node.
+
+        Return
+            The number of revealed children, the first page of children if
+            none were revealed yet. The count is only kept for the nodes
+            with children.
         """
-        self._logger.info(f"inserting a new button at index {row}")
-        node = ButtonNode('NEW_BUTTON', ButtonData())
-        list.addChildAt(row, node)
+        fetched = self._fetched.get(node)
+        if fetched is None:
+            childCount = node.getChildCount()
+            if not childCount:
+                return 0
+            fetched = min(childCount, self._pageSize)
+            self._fetched[node] = fetched
+        return fetched
 
-    def _insertButtonArrayNode(self, list: BaseNode, row: int) -> None:
+    def _forgetFetchedCount(self, node: BaseNode) -> None:
         """
-        Insert a button array node.
+        Forget the number of revealed children of a node removed from the
+        model, and of its descendants.
 
         Param
-            list: The button array list node.
-            row: The insertion row.
+            node: The removed node.
         """
-        node = ButtonArrayNode('NEW_BUTTON_ARRAY', ButtonArrayData())
-        list.addChildAt(row, node)
+        if self._fetched.pop(node, None) is not None:
+            for child in node.getChildren():
+                self._forgetFetchedCount(child)
 
-    def _insertFloatNode(self, list: BaseNode, row: int) -> None:
+    def beginResetModel(self) -> None:
         """
-        Insert a float node.
+        Begin a model reset, forgetting the children revealed to the view.
+        """
+        self._fetched.clear()
+        super(DatastoreModel, self).beginResetModel()
 
-        Param
-            list: The float list node.
-            row: The insertion row.
+    def _createButtonNode(self) -> BaseNode:
         """
-        node = FloatNode('NEW_FLOAT', FloatData())
-        list.addChildAt(row, node)
+        Create a button node.
 
-    def _insertFloatArrayNode(self, list: BaseNode, row: int) -> None:
+        Return
+            The new button node.
         """
-        Insert a float array node.
+        return ButtonNode('NEW_BUTTON', ButtonData())
 
-        Param
-            list: The float array list node.
-            row: The insertion row.
+    def _createButtonArrayNode(self) -> BaseNode:
         """
-        node = FloatArrayNode('NEW_FLOAT_ARRAY', FloatArrayData())
-        list.addChildAt(row, node)
+        Create a button array node.
 
-    def _insertIntNode(self, list: BaseNode, row: int) -> None:
+        Return
+            The new button array node.
         """
-        Insert a int node.
+        return ButtonArrayNode('NEW_BUTTON_ARRAY', ButtonArrayData())
 
-        Param
-            list: The int list node.
-            row: The insertion row.
+    def _createFloatNode(self) -> BaseNode:
         """
-        node = IntNode('NEW_INT', IntData())
-        list.addChildAt(row, node)
+        Create a float node.
 
-    def _insertIntArrayNode(self, list: BaseNode, row: int) -> None:
+        Return
+            The new float node.
         """
-        Insert a int array node.
+        return FloatNode('NEW_FLOAT', FloatData())
 
-        Param
-            list: The int array list node.
-            row: The insertion row.
+    def _createFloatArrayNode(self) -> BaseNode:
         """
-        node = IntArrayNode('NEW_INT_ARRAY', IntArrayData())
-        list.addChildAt(row, node)
+        Create a float array node.
 
-    def _insertMultiStateNode(self, list: BaseNode, row: int) -> None:
+        Return
+            The new float array node.
         """
-        Insert a multi-state node.
+        return FloatArrayNode('NEW_FLOAT_ARRAY', FloatArrayData())
 
-        Param
-            list: The multi-state list node.
-            row: The insertion row.
+    def _createIntNode(self) -> BaseNode:
         """
-        node = MultiStateNode('NEW_MULTI_STATE', MultiStateData())
-        list.addChildAt(row, node)
+        Create a int node.
 
-    def _insertUintNode(self, list: BaseNode, row: int) -> None:
+        Return
+            The new int node.
         """
-        Insert a uint node.
+        return IntNode('NEW_INT', IntData())
 
-        Param
-            list: The uint list node.
-            row: The insertion row.
+    def _createIntArrayNode(self) -> BaseNode:
+        """
+        Create a int array node.
+
+        Return
+            The new int array node.
+        """
+        return IntArrayNode('NEW_INT_ARRAY', IntArrayData())
+
+    def _createMultiStateNode(self) -> BaseNode:
         """
-        node = UintNode('NEW_UINT', UintData())
-        list.addChildAt(row, node)
+        Create a multi-state node.
 
-    def _insertUintArrayNode(self, list: BaseNode, row: int) -> None:
+        Return
+            The new multi-state node.
+        """
+        return MultiStateNode('NEW_MULTI_STATE', MultiStateData())
+
+    def _createUintNode(self) -> BaseNode:
+        """
+        Create a uint node.
+
+        Return
+            The new uint node.
         """
-        Insert a uint array node.
+        return UintNode('NEW_UINT', UintData())
+
+    def _createUintArrayNode(self) -> BaseNode:
+        """
+        Create a uint array node.
+
+        Return
+            The new uint array node.
+        """
+        return UintArrayNode('NEW_UINT_ARRAY', UintArrayData())
+
+    def _getNodeFactory(self, list: BaseNode) -> Callable[[], BaseNode]:
+        """
+        Get the node factory of an object list.
 
         Param
-            list: The uint array list node.
-            row: The insertion row.
+            list: The object list node.
+
+        Return
+            The factory creating the list objects, none if the list is not
+            supported.
         """
-        node = UintArrayNode('NEW_UINT_ARRAY', UintArrayData())
-        list.addChildAt(row, node)
+        match list.getName():
+            case NodeType.BUTTON.name:
+                return self._createButtonNode
+            case NodeType.BUTTON_ARRAY.name:
+                return self._createButtonArrayNode
+            case NodeType.FLOAT.name:
+                return self._createFloatNode
+            case NodeType.FLOAT_ARRAY.name:
+                return self._createFloatArrayNode
+            case NodeType.INT.name:
+                return self._createIntNode
+            case NodeType.INT_ARRAY.name:
+                return self._createIntArrayNode
+            case NodeType.MULTI_STATE.name:
+                return self._createMultiStateNode
+            case NodeType.UINT.name:
+                return self._createUintNode
+            case NodeType.UINT_ARRAY.name:
+                return self._createUintArrayNode
+            case _:
+                return None
 
     def rowCount(self, index: qtc.QModelIndex) -> int:
         """
@@ -132,7 +199,41 @@ class DatastoreModel(qtc.QAbstractItemModel):
         node = self._root
         if index.isValid():
             node = index.internalPointer()
-        return node.getChildCount()
+        return self._getFetchedCount(node)
+
+    def canFetchMore(self, parent: qtc.QModelIndex) -> bool:
+        """
+        Check if the node has children not revealed to the view yet.
+
+        Param
+            parent: The index of the node.
+
+        Return
+            True if some children are not revealed yet, false otherwise.
+        """
+        node = self._root
+        if parent.isValid():
+            node = parent.internalPointer()
+        return self._getFetchedCount(node) < node.getChildCount()
+
+    def fetchMore(self, parent: qtc.QModelIndex) -> None:
+        """
+        Reveal the next page of children of the node to the view.
+
+        Param
+            parent: The index of the node.
+        """
+        node = self._root
+        if parent.isValid():
+            node = parent.internalPointer()
+        fetched = self._getFetchedCount(node)
+        count = min(node.getChildCount() - fetched, self._pageSize)
+        if count <= 0:
+            return
+        self._logger.debug(f"fetching {count} {node.getName()} at {fetched}")
+        self.beginInsertRows(parent, fetched, fetched + count - 1)
+        self._fetched[node] = fetched + count
+        self.endInsertRows()
 
     def columnCount(self, index: qtc.QModelIndex) -> int:
         """
@@ -166,7 +267,9 @@ class DatastoreModel(qtc.QAbstractItemModel):
 
     def setData(self, index: qtc.QModelIndex, data: str, role: int) -> bool:
         """
-        Set the display data of the noe at the given index.
+        Set the display data of the node at the given index.
+
+        Object names must be unique in their datastore.
 
         Param
             index: The index of the node.
@@ -178,7 +281,12 @@ class DatastoreModel(qtc.QAbstractItemModel):
         """
         if index.isValid() and role == qtc.Qt.ItemDataRole.EditRole:
             node = index.internalPointer()
-            node.setName(data)
+            store = node.getStore()
+            if store is not None and not store.isNameAvailable(data, node):
+                self._logger.warning(f"{data} is already used by another "
+                                     f"object")
+                return False
+            self._undoStack.pushFieldChange(node, 'Name', data)
             return True
         return False
 
@@ -210,7 +318,11 @@ class DatastoreModel(qtc.QAbstractItemModel):
         node = self._root
         if index.isValid():
             node = index.internalPointer()
-        return node.getFlags()
+        flags = qtc.Qt.ItemFlag.ItemIsSelectable | \
+            qtc.Qt.ItemFlag.ItemIsEnabled
+        if node.isEditable():
+            flags |= qtc.Qt.ItemFlag.ItemIsEditable
+        return flags
 
     def parent(self, index: qtc.QModelIndex) -> qtc.QModelIndex:
         """
@@ -251,6 +363,58 @@ class DatastoreModel(qtc.QAbstractItemModel):
             return qtc.QModelIndex()
         return self.createIndex(row, column, child)
 
+    def getNodeIndex(self, node: BaseNode) -> qtc.QModelIndex:
+        """
+        Get the index of a node.
+
+        Param
+            node: The node.
+
+        Return
+            The node index, an invalid index for the root node or a node
+            removed from the tree.
+        """
+        row = node.getRow() if node is not None else None
+        if row is None or node is self._root:
+            return qtc.QModelIndex()
+        return self.createIndex(row, 0, node)
+
+    def insertRows(self, row: int, count: int,
+                   parent: qtc.QModelIndex) -> bool:
+        """
+        Insert rows.
+
+        Param
+            row: The position of the first new row.
+            count: The number of rows to insert.
+            parent: The index of the node in which to insert the rows.
+
+        Return
+            True if the operation succeeds, false otherwise.
+        """
+        if not parent.isValid() or count < 1:
+            return False
+        node = parent.internalPointer()
+        factory = self._getNodeFactory(node)
+        if factory is None or row < 0 or row > node.getChildCount():
+            return False
+        self._logger.debug(f"inserting {count} {node.getName()} at {row}")
+        children = [factory() for _ in range(count)]
+        store = node.getStore()
+        if store is not None:
+            names = store.getUniqueNames(children[0].getName(), count)
+            for child, name in zip(children, names):
+                child.setName(name)
+        fetched = self._getFetchedCount(node)
+        if row > fetched:
+            node.addChildrenAt(row, children)
+            return True
+        self.beginInsertRows(parent, row, row + count - 1)
+        node.addChildrenAt(row, children)
+        self._fetched[node] = fetched + count
+        self.endInsertRows()
+        return True
+
     def insertRow(self, row: int, parent: qtc.QModelIndex) -> bool:
         """
         Insert a row.
@@ -262,35 +426,41 @@ class DatastoreModel(qtc.QAbstractItemModel):
         Return
             True if the operation succeeds, false otherwise.
         """
-        if not parent.isValid():
+        return self.insertRows(row, 1, parent)
+
+    def removeRows(self, row: int, count: int,
+                   parent: qtc.QModelIndex) -> bool:
+        """
+        Remove rows.
+
+        Param
+            row: The first row to remove.
+            count: The number of rows to remove.
+            parent: The index of the node in which to remove the rows.
+
+        Return
+            True if successful, false otherwise.
+        """
+        if not parent.isValid() or count < 1:
             return False
         node = parent.internalPointer()
-        result = True
-        self.beginInsertRows(parent, row, row + 1)
-        self._logger.debug(f"new object type: {node.getName()}")
-        match node.getName():
-            case NodeType.BUTTON.name:
-                self._insertButtonNode(node, row)
-            case NodeType.BUTTON_ARRAY.name:
-                self._insertButtonArrayNode(node, row)
-            case NodeType.FLOAT.name:
-                self._insertFloatNode(node, row)
-            case NodeType.FLOAT_ARRAY.name:
-                self._insertFloatArrayNode(node, row)
-            case NodeType.INT.name:
-                self._insertIntNode(node, row)
-            case NodeType.INT_ARRAY.name:
-                self._insertIntArrayNode(node, row)
-            case NodeType.MULTI_STATE.name:
-                self._insertMultiStateNode(node, row)
-            case NodeType.UINT.name:
-                self._insertUintNode(node, row)
-            case NodeType.UINT_ARRAY.name:
-                self._insertUintArrayNode(node, row)
-            case _:
-                result = False
-        self.endInsertRows()
-        return result
+        if self._getNodeFactory(node) is None or row < 0 or \
+                row + count > node.getChildCount():
+            return False
+        self._logger.debug(f"removing {count} {node.getName()} at {row}")
+        fetched = self._getFetchedCount(node)
+        last = min(row + count, fetched)
+        removed = [node.getChild(index) for index in range(row, row + count)]
+        if row >= last:
+            node.removeChildrenAt(row, count)
+        else:
+            self.beginRemoveRows(parent, row, last - 1)
+            node.removeChildrenAt(row, count)
+            self._fetched[node] = fetched - (last - row)
+            self.endRemoveRows()
+        for child in removed:
+            self._forgetFetchedCount(child)
+        return True
 
     def removeRow(self, row: int, parent: qtc.QModelIndex) -> bool:
         """
@@ -303,19 +473,4 @@ class DatastoreModel(qtc.QAbstractItemModel):
         Return
             True if successful, false otherwise.
         """
-        if not parent.isValid():
-            return False
-        node = parent.internalPointer()
-        result = True
-        self.beginRemoveRows(parent, row, row + 1)
-        match node.getName():
-            case NodeType.BUTTON.name | NodeType.BUTTON_ARRAY.name | \
-                    NodeType.FLOAT.name | NodeType.FLOAT_ARRAY.name | \
-                    NodeType.INT.name | NodeType.INT_ARRAY.name | \
-                    NodeType.MULTI_STATE.name | NodeType.UINT.name | \
-                    NodeType.UINT_ARRAY.name:
-                node.removeChildAt(row)
-            case _:
-                result = False
-        self.endRemoveRows()
-        return result
+        return self.removeRows(row, 1, parent)
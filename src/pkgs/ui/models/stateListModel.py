@@ -2,7 +2,7 @@ import logging
 
 from PySide6 import QtCore as qtc
 
-from .stateNode import StateNode
+from ...datastore import BaseNode, StateNode, UndoStack
 
 
 class StateListModel(qtc.QAbstractTableModel):
@@ -10,18 +10,31 @@ class StateListModel(qtc.QAbstractTableModel):
     The state list model.
     """
     def __init__(self, states: list[StateNode] = [],
-                 parent: qtc.QObject = None) -> None:
+                 parent: qtc.QObject = None, owner: BaseNode = None,
+                 undoStack: UndoStack = None) -> None:
         """
         Constructor.
 
         Param
             states: The list of state.
             parent: The parent of the model.
+            owner: The multi-state node owning the states.
+            undoStack: The undo stack recording the state changes, the
+                changes are not recorded if none.
         """
         super(StateListModel, self).__init__(parent)
         self._logger = logging.getLogger('app.datastoreModel.MULTI_STATE.'
                                          'stateList')
         self._states = states
+        self._owner = owner
+        self._undoStack = undoStack if undoStack is not None else UndoStack(0)
+
+    def _bumpOwnerRevision(self) -> None:
+        """
+        Mark the multi-state node owning the states as modified.
+        """
+        if self._owner is not None:
+            self._owner.bumpRevision()
 
     def rowCount(self, parent: qtc.QModelIndex) -> int:
         """
@@ -107,10 +120,9 @@ class StateListModel(qtc.QAbstractTableModel):
             True if successful, false otherwise.
         """
         if role == qtc.Qt.ItemDataRole.EditRole:
-            if index.column() == 0:
-                self._states[index.row()].setName(value)
-            else:
-                self._states[index.row()].setValue(value)
+            field = 'Name' if index.column() == 0 else 'Value'
+            self._undoStack.pushFieldChange(self._states[index.row()], field,
+                                            value)
             return True
         return False
 
@@ -126,7 +138,8 @@ class StateListModel(qtc.QAbstractTableModel):
             True.
         """
         self.beginInsertRows(qtc.QModelIndex(), row, row + 1)
-        self._states.insert(row, StateNode(f"STATE_{row}", row))
+        self._states.insert(row, StateNode(f"STATE_{row}", row, self._owner))
+        self._bumpOwnerRevision()
         self.endInsertRows()
         self.layoutChanged.emit()
         return True
@@ -145,6 +158,7 @@ class StateListModel(qtc.QAbstractTableModel):
         if row >= 0 and row < len(self._states):
             self.beginRemoveRows(qtc.QModelIndex(), row, row + 1)
             self._states.pop(row)
+            self._bumpOwnerRevision()
             self.endRemoveRows()
             self.layoutChanged.emit()
             return True
@@ -4,21 +4,29 @@ import PySide6.QtCore as qtc
 import PySide6.QtWidgets as qtw
 
 from .buttonEditor_ui import Ui_ButtonEditor
-from ..models import ButtonNode
+from ..models import ButtonNode, UndoStack
 
 
 class ButtonEditor(qtw.QWidget, Ui_ButtonEditor):
     """
     The button editor widget.
     """
-    def __init__(self, button: ButtonNode, parent: qtw.QWidget = None) -> None:
+    def __init__(self, button: ButtonNode, parent: qtw.QWidget = None,
+                 undoStack: UndoStack = None) -> None:
         """
         Constructor.
+
+        Param
+            button: The edited button.
+            parent: The parent widget.
+            undoStack: The undo stack recording the changes, the changes are
+                not recorded if none.
         """
         super(ButtonEditor, self).__init__(parent)
         self._logger = logging.getLogger('app.windows.main.buttonEditor')
         self._logger.info('creating button editor widget')
         self._button = button
+        self._undoStack = undoStack if undoStack is not None else UndoStack(0)
         self.setupUi(self)
         self._initUi()
 
@@ -41,7 +49,8 @@ class ButtonEditor(qtw.QWidget, Ui_ButtonEditor):
         """
         self._logger.info(f"{self._button.getName()} save new long press time "
                           f"{longPressTime}")
-        self._button.setLongPressTime(longPressTime)
+        self._undoStack.pushFieldChange(self._button, 'LongPressTime',
+                                        longPressTime, merge=True)
 
     @qtc.Slot()
     def _saveInactiveTime(self, inactiveTime: int) -> None:
@@ -53,4 +62,5 @@ class ButtonEditor(qtw.QWidget, Ui_ButtonEditor):
         """
         self._logger.info(f"{self._button.getName()} save new inactive time "
                           f"{inactiveTime}")
-        self._button.setInactiveTime(inactiveTime)
+        self._undoStack.pushFieldChange(self._button, 'InactiveTime',
+                                        inactiveTime, merge=True)
@@ -5,22 +5,29 @@ import PySide6.QtCore as qtc
 import PySide6.QtWidgets as qtw
 
 from .floatEditor_ui import Ui_FloatEditor
-from ..models import FloatNode
+from ..models import FloatNode, UndoStack
 
 
 class FloatEditor(qtw.QWidget, Ui_FloatEditor):
     """
     The float object editor widget.
     """
-    def __init__(self, floatObj: FloatNode,
-                 parent: qtw.QWidget = None) -> None:
+    def __init__(self, floatObj: FloatNode, parent: qtw.QWidget = None,
+                 undoStack: UndoStack = None) -> None:
         """
         Constructor.
+
+        Param
+            floatObj: The edited float object.
+            parent: The parent widget.
+            undoStack: The undo stack recording the changes, the changes are
+                not recorded if none.
         """
         super(FloatEditor, self).__init__(parent)
         self._logger = logging.getLogger('app.windows.main.floatEditor')
         self._logger.info('creating float editor widget')
         self._float = floatObj
+        self._undoStack = undoStack if undoStack is not None else UndoStack(0)
         self.setupUi(self)
         self._initUi()
 
@@ -55,7 +62,8 @@ class FloatEditor(qtw.QWidget, Ui_FloatEditor):
         Param
             default: The new default value.
         """
-        self._float.setDefault(default)
+        self._undoStack.pushFieldChange(self._float, 'Default', default,
+                                        merge=True)
 
     @qtc.Slot()
     def _saveMinValue(self, min: float) -> None:
@@ -65,7 +73,8 @@ class FloatEditor(qtw.QWidget, Ui_FloatEditor):
         Param
             min: The new minimum value.
         """
-        self._float.setMinimum(min)
+        self._undoStack.pushFieldChange(self._float, 'Minimum', min,
+                                        merge=True)
         self.dsbDefaultValue.setMinimum(min)
         self.dsbMaxValue.setMinimum(min + 1.0)
 
@@ -77,6 +86,7 @@ class FloatEditor(qtw.QWidget, Ui_FloatEditor):
         Param
             max: The new maximum value.
         """
-        self._float.setMaximum(max)
+        self._undoStack.pushFieldChange(self._float, 'Maximum', max,
+                                        merge=True)
         self.dsbDefaultValue.setMaximum(max)
         self.dsbMinValue.setMaximum(max - 1.0)
@@ -4,7 +4,7 @@ import PySide6.QtCore as qtc
 import PySide6.QtWidgets as qtw
 
 from .multiStateEditor_ui import Ui_MultiStateEditor
-from ..models import MultiStateNode, StateListModel
+from ..models import MultiStateNode, StateListModel, UndoStack
 
 
 class MultiStateEditor(qtw.QWidget, Ui_MultiStateEditor):
@@ -12,14 +12,22 @@ class MultiStateEditor(qtw.QWidget, Ui_MultiStateEditor):
     The button editor widget.
     """
     def __init__(self, multiState: MultiStateNode,
-                 parent: qtw.QWidget = None) -> None:
+                 parent: qtw.QWidget = None,
+                 undoStack: UndoStack = None) -> None:
         """
         Constructor.
+
+        Param
+            multiState: The edited multi-state object.
+            parent: The parent widget.
+            undoStack: The undo stack recording the changes, the changes are
+                not recorded if none.
         """
         super(MultiStateEditor, self).__init__(parent)
         self._logger = logging.getLogger('app.windows.main.multiStateEditor')
         self._logger.info('creating int editor widget')
         self._multiState = multiState
+        self._undoStack = undoStack if undoStack is not None else UndoStack(0)
         self.setupUi(self)
         self._initUi()
 
@@ -27,7 +35,9 @@ class MultiStateEditor(qtw.QWidget, Ui_MultiStateEditor):
         """
         Initialize the UI connecting signals and slots.
         """
-        model = StateListModel(self._multiState.getStateList())
+        model = StateListModel(self._multiState.getStateList(),
+                               owner=self._multiState,
+                               undoStack=self._undoStack)
         self.tvStateList.setModel(model)
         self.tvStateList.selectionModel().selectionChanged \
             .connect(self._newStateSelection)
@@ -52,7 +62,8 @@ class MultiStateEditor(qtw.QWidget, Ui_MultiStateEditor):
         Param
             default: The new default index.
         """
-        self._multiState.setDefaultIndex(default)
+        self._undoStack.pushFieldChange(self._multiState, 'DefaultIndex',
+                                        default)
 
     @qtc.Slot()
     def _addState(self) -> None:
@@ -4,21 +4,29 @@ import PySide6.QtCore as qtc
 import PySide6.QtWidgets as qtw
 
 from .intEditor_ui import Ui_IntEditor
-from ..models import UintNode
+from ..models import UintNode, UndoStack
 
 
 class UintEditor(qtw.QWidget, Ui_IntEditor):
     """
     The button editor widget.
     """
-    def __init__(self, uint: UintNode, parent: qtw.QWidget = None) -> None:
+    def __init__(self, uint: UintNode, parent: qtw.QWidget = None,
+                 undoStack: UndoStack = None) -> None:
         """
         Constructor.
+
+        Param
+            uint: The edited uint object.
+            parent: The parent widget.
+            undoStack: The undo stack recording the changes, the changes are
+                not recorded if none.
         """
         super(UintEditor, self).__init__(parent)
         self._logger = logging.getLogger('app.windows.main.uintEditor')
         self._logger.info('creating int editor widget')
         self._uint = uint
+        self._undoStack = undoStack if undoStack is not None else UndoStack(0)
         self.setupUi(self)
         self._initUi()
 
@@ -53,7 +61,8 @@ class UintEditor(qtw.QWidget, Ui_IntEditor):
         Param
             default: The new default value.
         """
-        self._uint.setDefault(default)
+        self._undoStack.pushFieldChange(self._uint, 'Default', default,
+                                        merge=True)
 
     @qtc.Slot()
     def _saveMinValue(self, min: int) -> None:
@@ -63,7 +72,8 @@ class UintEditor(qtw.QWidget, Ui_IntEditor):
         Param
             min: The new minimum value.
         """
-        self._uint.setMinimum(min)
+        self._undoStack.pushFieldChange(self._uint, 'Minimum', min,
+                                        merge=True)
         self.sbDefaultValue.setMinimum(min)
         self.sbMaxValue.setMinimum(min + 1)
 
@@ -75,6 +85,7 @@ class UintEditor(qtw.QWidget, Ui_IntEditor):
         Param
             max: The new maximum value.
         """
-        self._uint.setMaximum(max)
+        self._undoStack.pushFieldChange(self._uint, 'Maximum', max,
+                                        merge=True)
         self.sbDefaultValue.setMaximum(max)
         self.sbMinValue.setMaximum(max - 1)
@@ -1,16 +1,43 @@
 import logging
+import os
 import sys
 
 import PySide6.QtCore as qtc
 import PySide6.QtWidgets as qtw
 
 from .appWindow_ui import Ui_appWindow
-from ..models import BaseNode, DatastoreModel, DatastoreNode, NodeType, \
-    ObjectListNode
+from ...compiler import EncodedSizeTracker
+from ...datastore import loadDefinitionFile, saveDefinitionFile
+from ...decoder import LazyDatastoreReader
+from ..models import BaseNode, DatastoreFilterModel, DatastoreModel, \
+    DatastoreNode, NodeType, ObjectListNode, UndoStack
 from ..widgets import ButtonEditor, FloatEditor, IntEditor, MultiStateEditor, \
     UintEditor
 
 
+_DEFINITION_FILTER = 'Datastore definitions (*.yaml *.yml *.json)'
+_OPEN_FILTER = 'Datastores (*.yaml *.yml *.json *.cbor);;' \
+    f"{_DEFINITION_FILTER};;Encoded datastores (*.cbor)"
+# Object count above which the object lists are not expanded.
+_LARGE_STORE_THRESHOLD = 10000
+
+
+def _formatUsage(used: int, budget: int | None) -> str:
+    """
+    Format a size and its budget.
+
+    Param
+        used: The size, in bytes.
+        budget: The size budget, in bytes, no budget if none.
+
+    Return
+        The size, out of its budget if there is one.
+    """
+    if budget is None:
+        return f"{used} B"
+    return f"{used} / {budget} B"
+
+
 class AppWindow(qtw.QMainWindow, Ui_appWindow):
     """
     The application main window.
@@ -25,6 +52,11 @@ class AppWindow(qtw.QMainWindow, Ui_appWindow):
         self._storeRoot: ObjectListNode = None
         self._objectEditor: qtw.QWidget = None
         self._arrayEditor: qtw.QWidget = None
+        self._readers: list[LazyDatastoreReader] = []
+        self._sizeTrackers: dict[DatastoreNode, EncodedSizeTracker] = {}
+        self._storeModel: DatastoreModel = None
+        self._filterModel: DatastoreFilterModel = None
+        self._undoStack = UndoStack(onChange=self._updateUndoActions)
         self.setupUi(self)
         self._initUi()
 
@@ -34,8 +66,13 @@ class AppWindow(qtw.QMainWindow, Ui_appWindow):
         """
         self._storeRoot = ObjectListNode('', None)
         self.actionNew.triggered.connect(self._createNewStore)
+        self.actionOpen.triggered.connect(self._openStore)
+        self.actionSave.triggered.connect(self._saveStore)
+        self.actionUndo.triggered.connect(self._undo)
+        self.actionRedo.triggered.connect(self._redo)
         self.pbAddObject.clicked.connect(self._createNewObject)
         self.pbDeleteObject.clicked.connect(self._deleteObject)
+        self.leSearch.textChanged.connect(self._filterObjects)
 
     def _displayEditor(self, selected: BaseNode) -> None:
         """
@@ -43,19 +80,24 @@ class AppWindow(qtw.QMainWindow, Ui_appWindow):
         """
         match selected.getType():
             case NodeType.BUTTON:
-                self._objectEditor = ButtonEditor(selected)
+                self._objectEditor = ButtonEditor(
+                    selected, undoStack=self._undoStack)
                 self.vlEditor.insertWidget(0, self._objectEditor)
             case NodeType.FLOAT:
-                self._objectEditor = FloatEditor(selected)
+                self._objectEditor = FloatEditor(
+                    selected, undoStack=self._undoStack)
                 self.vlEditor.insertWidget(0, self._objectEditor)
             case NodeType.INT:
-                self._objectEditor = IntEditor(selected)
+                self._objectEditor = IntEditor(
+                    selected, undoStack=self._undoStack)
                 self.vlEditor.insertWidget(0, self._objectEditor)
             case NodeType.MULTI_STATE:
-                self._objectEditor = MultiStateEditor(selected)
+                self._objectEditor = MultiStateEditor(
+                    selected, undoStack=self._undoStack)
                 self.vlEditor.insertWidget(0, self._objectEditor)
             case NodeType.UINT:
-                self._objectEditor = UintEditor(selected)
+                self._objectEditor = UintEditor(
+                    selected, undoStack=self._undoStack)
                 self.vlEditor.insertWidget(0, self._objectEditor)
             case _:
                 raise ValueError(f"{selected.getType().name} is an "
@@ -83,39 +125,291 @@ class AppWindow(qtw.QMainWindow, Ui_appWindow):
         """
         self._logger.info('creating new datastore')
         DatastoreNode.createNewStore(self._storeRoot)
-        model = DatastoreModel(self._storeRoot)
+        self._setStoreModel()
+
+    def _setStoreModel(self) -> None:
+        """
+        Create the tree view model of the datastores.
+
+        The search results model is created the first time the objects are
+        filtered. The selection is refreshed when a model is reset, since
+        the reset clears the current index without changing the selection.
+        """
+        self._storeModel = DatastoreModel(self._storeRoot,
+                                          undoStack=self._undoStack)
+        self._storeModel.modelReset.connect(self._newStoreSelection)
+        self._filterModel = None
+        self._setViewModel(self._storeModel)
+        self._expandStores()
+        self.leSearch.clear()
+
+    def _setViewModel(self, model: qtc.QAbstractItemModel) -> None:
+        """
+        Set the tree view model, clearing the selection.
+
+        Param
+            model: The datastore model or the search results model.
+        """
+        self._hideEditor()
+        self.pbAddObject.setEnabled(False)
+        self.pbDeleteObject.setEnabled(False)
         self.tvObjectList.setModel(model)
         self.tvObjectList.selectionModel().selectionChanged \
             .connect(self._newStoreSelection)
+        self._updateSizeLabel()
+
+    def _expandStores(self) -> None:
+        """
+        Expand the datastore tree view.
+
+        The object lists are not expanded for large datastores, since
+        expanding them would reveal every object to the view.
+        """
+        objCount = self._getObjectCount()
+        if objCount > _LARGE_STORE_THRESHOLD:
+            self._logger.info(f"large datastores ({objCount} objects), "
+                              f"object lists not expanded")
+            self.tvObjectList.setUniformRowHeights(True)
+            self.tvObjectList.expandToDepth(0)
+        else:
+            self.tvObjectList.expandAll()
+
+    def _getObjectCount(self) -> int:
+        """
+        Get the number of objects of every datastore.
+
+        Return
+            The number of objects.
+        """
+        objCount = 0
+        for storeRow in range(self._storeRoot.getChildCount()):
+            store = self._storeRoot.getChild(storeRow)
+            for listRow in range(store.getChildCount()):
+                objCount += store.getChild(listRow).getChildCount()
+        return objCount
+
+    @qtc.Slot(str)
+    def _filterObjects(self, text: str) -> None:
+        """
+        Show the objects whose name contains the search text, or every
+        object when the search text is empty.
+
+        Param
+            text: The search text.
+        """
+        if self._storeModel is None:
+            return
+        if not text:
+            if self.tvObjectList.model() is not self._storeModel:
+                self._setViewModel(self._storeModel)
+                self._expandStores()
+            return
+        if self._filterModel is None:
+            self._filterModel = DatastoreFilterModel(self._storeRoot)
+            self._filterModel.setSourceModel(self._storeModel)
+            self._filterModel.modelReset.connect(self._newStoreSelection)
+        self._filterModel.setFilterText(text)
+        if self.tvObjectList.model() is not self._filterModel:
+            self._setViewModel(self._filterModel)
         self.tvObjectList.expandAll()
 
+    def _getSelection(self) -> tuple[qtc.QAbstractItemModel,
+                                     qtc.QModelIndex]:
+        """
+        Get the datastore model and the index of the selected node, mapping
+        the selected search result to the datastore model.
+
+        Return
+            The datastore model and the index of the selected node.
+        """
+        model = self.tvObjectList.model()
+        selected = self.tvObjectList.currentIndex()
+        if model is not None and model is self._filterModel:
+            selected = model.mapToSource(selected)
+            model = model.sourceModel()
+        return model, selected
+
+    def _updateUndoActions(self) -> None:
+        """
+        Update the undo and redo actions enable state, and the sizes after
+        the object change.
+        """
+        self.actionUndo.setEnabled(self._undoStack.canUndo())
+        self.actionRedo.setEnabled(self._undoStack.canRedo())
+        self._updateSizeLabel()
+
+    def _updateSizeLabel(self) -> None:
+        """
+        Show the encoded and non-volatile memory sizes of the selected node
+        and of its datastore, warning when the datastore exceeds its size
+        budgets.
+
+        The sizes are kept current by a size tracker per datastore, created
+        the first time the datastore sizes are shown.
+        """
+        node = self.tvObjectList.currentIndex().internalPointer()
+        if node is None:
+            self.lbSize.clear()
+            self.lbSize.setToolTip('')
+            self.lbSize.setStyleSheet('')
+            return
+        store = node if node.getType() == NodeType.STORE else node.getStore()
+        tracker = self._sizeTrackers.get(store)
+        if tracker is None:
+            tracker = self._sizeTrackers[store] = EncodedSizeTracker(store)
+        lines = []
+        if node is not store:
+            size = tracker.getSize(node)
+            lines.append(f"{node.getName()}: {size.encoded} B encoded, "
+                         f"{size.nvm} B NVM")
+        metadata = store.getMetadata()
+        size = tracker.getSize(store)
+        lines.append(f"{store.getName()}: "
+                     f"{_formatUsage(size.encoded, metadata.flashBudget)} "
+                     f"encoded, {_formatUsage(size.nvm, metadata.nvmBudget)} "
+                     f"NVM")
+        warnings = tracker.getBudgetWarnings()
+        self.lbSize.setText('\n'.join(lines))
+        self.lbSize.setToolTip('\n'.join(warnings))
+        self.lbSize.setStyleSheet('color: red;' if warnings else '')
+
+    def _refreshObject(self) -> None:
+        """
+        Refresh the object names and the editor of the selected object after
+        an undo or a redo.
+        """
+        self.tvObjectList.viewport().update()
+        selected = self.tvObjectList.currentIndex().internalPointer()
+        if self._objectEditor is not None and selected is not None:
+            self._hideEditor()
+            self._displayEditor(selected)
+
+    @qtc.Slot()
+    def _undo(self) -> None:
+        """
+        Undo the last object change.
+        """
+        try:
+            change = self._undoStack.undo()
+        except ValueError as error:
+            self._logger.warning(f"cannot undo: {error}")
+            self._createErrorMsgBox(qtw.QMessageBox.Warning, error)
+            return
+        if change is not None:
+            self._logger.info(f"undo {change.field} change of "
+                              f"{change.node.getName()}")
+            self._refreshObject()
+
+    @qtc.Slot()
+    def _redo(self) -> None:
+        """
+        Redo the last undone object change.
+        """
+        try:
+            change = self._undoStack.redo()
+        except ValueError as error:
+            self._logger.warning(f"cannot redo: {error}")
+            self._createErrorMsgBox(qtw.QMessageBox.Warning, error)
+            return
+        if change is not None:
+            self._logger.info(f"redo {change.field} change of "
+                              f"{change.node.getName()}")
+            self._refreshObject()
+
+    @qtc.Slot()
+    def _openStore(self) -> None:
+        """
+        Open a datastore definition file or an encoded datastore.
+
+        Encoded datastores are mapped in memory and their objects are only
+        decoded when they are displayed.
+        """
+        path, _ = qtw.QFileDialog.getOpenFileName(self, 'Open Datastore', '.',
+                                                  _OPEN_FILTER)
+        if not path:
+            return
+        self._logger.info(f"opening datastore {path}")
+        try:
+            if path.lower().endswith('.cbor'):
+                reader = LazyDatastoreReader(path)
+                reader.createStore(self._storeRoot)
+                self._readers.append(reader)
+            else:
+                loadDefinitionFile(path, self._storeRoot)
+        except (OSError, ValueError) as error:
+            self._createErrorMsgBox(qtw.QMessageBox.Warning, error)
+            return
+        self._setStoreModel()
+
+    def _getCurrentStore(self) -> DatastoreNode | None:
+        """
+        Get the datastore of the current selection.
+
+        Return
+            The datastore of the selected node, the last datastore when
+            nothing is selected, none when there is no datastore.
+        """
+        node = self.tvObjectList.currentIndex().internalPointer()
+        while node is not None and node.getType() != NodeType.STORE:
+            node = node.getParent()
+        if node is None and self._storeRoot.getChildCount() > 0:
+            node = self._storeRoot.getChild(
+                self._storeRoot.getChildCount() - 1)
+        return node
+
+    @qtc.Slot()
+    def _saveStore(self) -> None:
+        """
+        Save the current datastore to a definition file.
+        """
+        store = self._getCurrentStore()
+        if store is None:
+            return
+        path, _ = qtw.QFileDialog.getSaveFileName(
+            self, 'Save Datastore',
+            os.path.join(store.getWorkingDir(), f"{store.getName()}.yaml"),
+            _DEFINITION_FILTER)
+        if not path:
+            return
+        self._logger.info(f"saving datastore {path}")
+        try:
+            store.setWorkingDir(os.path.dirname(path))
+            saveDefinitionFile(store, path)
+        except (OSError, ValueError) as error:
+            self._createErrorMsgBox(qtw.QMessageBox.Warning, error)
+            return
+        store.clearUnsavedChangesFlag()
+
     @qtc.Slot()
     def _newStoreSelection(self) -> None:
         """
         Update the create and delete button enable state when the store
-        selection change.
+        selection change, disabling both when nothing is selected.
         """
         addIsEnabled = False
         deleteIsEnabled = False
-        selected = self.tvObjectList.currentIndex().internalPointer()
-        type = selected.getType()
+        index = self.tvObjectList.currentIndex()
         self._hideEditor()
+        selected = index.internalPointer() if index.isValid() else None
+        type = selected.getType() if selected is not None else None
         if type == NodeType.OBJ_LIST:
             addIsEnabled = True
-        if type != NodeType.STORE and type != NodeType.OBJ_LIST:
+        elif type is not None and type != NodeType.STORE:
             addIsEnabled = True
             deleteIsEnabled = True
             self._displayEditor(selected)
         self.pbAddObject.setEnabled(addIsEnabled)
         self.pbDeleteObject.setEnabled(deleteIsEnabled)
+        self._updateSizeLabel()
 
     @qtc.Slot()
     def _createNewObject(self) -> None:
         """
         Create a new object in the datastore.
         """
-        model = self.tvObjectList.model()
-        selected = self.tvObjectList.currentIndex()
+        model, selected = self._getSelection()
+        if not selected.isValid():
+            return
         selectedNode = selected.internalPointer()
         selectedType = selectedNode.getType()
         if selectedType == NodeType.OBJ_LIST:
@@ -126,14 +420,16 @@ class AppWindow(qtw.QMainWindow, Ui_appWindow):
             parentType = parent.internalPointer().getType()
             self._logger.info(f"creating a new {parentType.name}")
             model.insertRow(selected.row() + 1, parent)
+        self._updateSizeLabel()
 
     @qtc.Slot()
     def _deleteObject(self) -> None:
         """
         Delete the selected object.
         """
-        model = self.tvObjectList.model()
-        selected = self.tvObjectList.currentIndex()
+        model, selected = self._getSelection()
+        if not selected.isValid():
+            return
         selectedNode = selected.internalPointer()
         selectedType = selectedNode.getType()
         if selectedType != NodeType.STORE and \
@@ -141,6 +437,7 @@ class AppWindow(qtw.QMainWindow, Ui_appWindow):
             parent = model.parent(selected)
             self._logger.info(f"deleting {selectedNode.getName()} object")
             model.removeRow(selected.row(), parent)
+        self._updateSizeLabel()
 
     @qtc.Slot(qtw.QMessageBox.Icon, Exception)
     def _createErrorMsgBox(self, lvl: qtw.QMessageBox.Icon,
@@ -17,9 +17,9 @@ from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
     QPainter, QPalette, QPixmap, QRadialGradient,
     QTransform)
 from PySide6.QtWidgets import (QApplication, QGridLayout, QGroupBox, QHeaderView,
-    QMainWindow, QMenu, QMenuBar, QPushButton,
-    QSizePolicy, QSpacerItem, QStatusBar, QToolBar,
-    QTreeView, QVBoxLayout, QWidget)
+    QLabel, QLineEdit, QMainWindow, QMenu, QMenuBar,
+    QPushButton, QSizePolicy, QSpacerItem, QStatusBar,
+    QToolBar, QTreeView, QVBoxLayout, QWidget)
 from ..assets import resources_rc
 
 class Ui_appWindow(object):
@@ -52,6 +52,18 @@ class Ui_appWindow(object):
         icon4 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.DocumentNew))
         self.actionNew.setIcon(icon4)
         self.actionNew.setFont(font)
+        self.actionUndo = QAction(appWindow)
+        self.actionUndo.setObjectName(u"actionUndo")
+        self.actionUndo.setEnabled(False)
+        icon5 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.EditUndo))
+        self.actionUndo.setIcon(icon5)
+        self.actionUndo.setFont(font)
+        self.actionRedo = QAction(appWindow)
+        self.actionRedo.setObjectName(u"actionRedo")
+        self.actionRedo.setEnabled(False)
+        icon6 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.EditRedo))
+        self.actionRedo.setIcon(icon6)
+        self.actionRedo.setFont(font)
         self.actionGenerate_All = QAction(appWindow)
         self.actionGenerate_All.setObjectName(u"actionGenerate_All")
         self.actionGenerate_All.setFont(font)
@@ -74,32 +86,44 @@ class Ui_appWindow(object):
         self.objectListGroupBox.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.gridLayout_2 = QGridLayout(self.objectListGroupBox)
         self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.leSearch = QLineEdit(self.objectListGroupBox)
+        self.leSearch.setObjectName(u"leSearch")
+        self.leSearch.setClearButtonEnabled(True)
+
+        self.gridLayout_2.addWidget(self.leSearch, 0, 0, 1, 3)
+
         self.pbDeleteObject = QPushButton(self.objectListGroupBox)
         self.pbDeleteObject.setObjectName(u"pbDeleteObject")
         self.pbDeleteObject.setEnabled(False)
-        icon5 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.EditDelete))
-        self.pbDeleteObject.setIcon(icon5)
+        icon7 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.EditDelete))
+        self.pbDeleteObject.setIcon(icon7)
         self.pbDeleteObject.setIconSize(QSize(24, 24))
 
-        self.gridLayout_2.addWidget(self.pbDeleteObject, 1, 1, 1, 1)
+        self.gridLayout_2.addWidget(self.pbDeleteObject, 2, 1, 1, 1)
 
         self.tvObjectList = QTreeView(self.objectListGroupBox)
         self.tvObjectList.setObjectName(u"tvObjectList")
 
-        self.gridLayout_2.addWidget(self.tvObjectList, 0, 0, 1, 3)
+        self.gridLayout_2.addWidget(self.tvObjectList, 1, 0, 1, 3)
 
         self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
-        self.gridLayout_2.addItem(self.horizontalSpacer, 1, 2, 1, 1)
+        self.gridLayout_2.addItem(self.horizontalSpacer, 2, 2, 1, 1)
 
         self.pbAddObject = QPushButton(self.objectListGroupBox)
         self.pbAddObject.setObjectName(u"pbAddObject")
         self.pbAddObject.setEnabled(False)
-        icon6 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.ListAdd))
-        self.pbAddObject.setIcon(icon6)
+        icon8 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.ListAdd))
+        self.pbAddObject.setIcon(icon8)
         self.pbAddObject.setIconSize(QSize(24, 24))
 
-        self.gridLayout_2.addWidget(self.pbAddObject, 1, 0, 1, 1)
+        self.gridLayout_2.addWidget(self.pbAddObject, 2, 0, 1, 1)
+
+        self.lbSize = QLabel(self.objectListGroupBox)
+        self.lbSize.setObjectName(u"lbSize")
+        self.lbSize.setWordWrap(True)
+
+        self.gridLayout_2.addWidget(self.lbSize, 3, 0, 1, 3)
 
 
         self.gridLayout.addWidget(self.objectListGroupBox, 0, 0, 1, 1)
@@ -126,6 +150,9 @@ class Ui_appWindow(object):
         self.menuFile = QMenu(self.menubar)
         self.menuFile.setObjectName(u"menuFile")
         self.menuFile.setFont(font)
+        self.menuEdit = QMenu(self.menubar)
+        self.menuEdit.setObjectName(u"menuEdit")
+        self.menuEdit.setFont(font)
         self.menuDatastore_Tool = QMenu(self.menubar)
         self.menuDatastore_Tool.setObjectName(u"menuDatastore_Tool")
         self.menuDatastore_Tool.setFont(font)
@@ -138,11 +165,14 @@ class Ui_appWindow(object):
         appWindow.addToolBar(Qt.ToolBarArea.TopToolBarArea, self.toolBar)
 
         self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuEdit.menuAction())
         self.menubar.addAction(self.menuDatastore_Tool.menuAction())
         self.menuFile.addAction(self.actionNew)
         self.menuFile.addAction(self.actionOpen)
         self.menuFile.addAction(self.actionSave)
         self.menuFile.addAction(self.actionSave_as)
+        self.menuEdit.addAction(self.actionUndo)
+        self.menuEdit.addAction(self.actionRedo)
         self.menuDatastore_Tool.addAction(self.actionGenerate_All)
         self.menuDatastore_Tool.addAction(self.actionGenerate_CDDL)
         self.menuDatastore_Tool.addAction(self.actionGenerate_Header)
@@ -162,11 +192,20 @@ class Ui_appWindow(object):
         self.actionSave.setText(QCoreApplication.translate("appWindow", u"Save", None))
         self.actionSave_as.setText(QCoreApplication.translate("appWindow", u"Save as", None))
         self.actionNew.setText(QCoreApplication.translate("appWindow", u"New", None))
+        self.actionUndo.setText(QCoreApplication.translate("appWindow", u"Undo", None))
+#if QT_CONFIG(shortcut)
+        self.actionUndo.setShortcut(QCoreApplication.translate("appWindow", u"Ctrl+Z", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionRedo.setText(QCoreApplication.translate("appWindow", u"Redo", None))
+#if QT_CONFIG(shortcut)
+        self.actionRedo.setShortcut(QCoreApplication.translate("appWindow", u"Ctrl+Shift+Z", None))
+#endif // QT_CONFIG(shortcut)
         self.actionGenerate_All.setText(QCoreApplication.translate("appWindow", u"Generate All", None))
         self.actionGenerate_CDDL.setText(QCoreApplication.translate("appWindow", u"Generate CDDL", None))
         self.actionGenerate_Header.setText(QCoreApplication.translate("appWindow", u"Generate Header", None))
         self.actionGenerate_Binary.setText(QCoreApplication.translate("appWindow", u"Generate Binary", None))
         self.objectListGroupBox.setTitle(QCoreApplication.translate("appWindow", u"Datastore's Objects", None))
+        self.leSearch.setPlaceholderText(QCoreApplication.translate("appWindow", u"Search objects", None))
 #if QT_CONFIG(tooltip)
         self.pbDeleteObject.setToolTip(QCoreApplication.translate("appWindow", u"Remove object", None))
 #endif // QT_CONFIG(tooltip)
@@ -175,8 +214,10 @@ class Ui_appWindow(object):
         self.pbAddObject.setToolTip(QCoreApplication.translate("appWindow", u"Add object", None))
 #endif // QT_CONFIG(tooltip)
         self.pbAddObject.setText("")
+        self.lbSize.setText("")
         self.gbEditor.setTitle(QCoreApplication.translate("appWindow", u"Object Editor", None))
         self.menuFile.setTitle(QCoreApplication.translate("appWindow", u"File", None))
+        self.menuEdit.setTitle(QCoreApplication.translate("appWindow", u"Edit", None))
         self.menuDatastore_Tool.setTitle(QCoreApplication.translate("appWindow", u"Datastore Tool", None))
         self.toolBar.setWindowTitle(QCoreApplication.translate("appWindow", u"toolBar", None))
     # retranslateUi
@@ -0,0 +1,123 @@
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
+
+import os
+import shutil
+import subprocess
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.compiler import HeaderGenerator, generateHeader, \
+    getHeaderPath                                               # noqa: E402
+from pkgs.datastore import DatastoreNode, FloatData, FloatNode, IntData, \
+    IntNode, MultiStateData, MultiStateNode, NodeType, ObjectListNode, \
+    StateNode                                                   # noqa: E402
+
+
+class TestHeaderGenerator(TestCase):
+    """
+    HeaderGenerator test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._store = DatastoreNode.createNewStore(ObjectListNode('', None))
+        self._store.setName('motor')
+        self._lists = {objList.getName(): objList
+                       for objList in self._store.getChildren()}
+        self._lists[NodeType.INT.name].addChildrenAt(0, [
+            IntNode('SPEED', IntData(0, 100, 10)),
+            IntNode('TORQUE', IntData(-5, 5, 0)),
+            IntNode('FAN', IntData(0, 3, 1))])
+        self._lists[NodeType.FLOAT.name].addChildrenAt(0, [
+            FloatNode('GAIN', FloatData(0.0, 1.5, 0.25))])
+        self._lists[NodeType.MULTI_STATE.name].addChildrenAt(0, [
+            MultiStateNode('MODE', MultiStateData([StateNode('OFF', 0),
+                                                   StateNode('ON', 2)]))])
+        self._uut = HeaderGenerator()
+
+    def test_getHeaderPath(self) -> None:
+        """
+        The getHeaderPath function must replace the encoded datastore
+        extension by .h.
+        """
+        self.assertEqual(os.path.join('out', 'a.h'),
+                         getHeaderPath(os.path.join('out', 'a.cbor')))
+
+    def test_generateIdEnums(self) -> None:
+        """
+        The generate method must declare the id enum of each object list,
+        skipping the free ids and ending with the id count.
+        """
+        intList = self._lists[NodeType.INT.name]
+        intList.removeChildAt(1)
+        header = self._uut.generate(self._store)
+        self.assertIn('    MOTOR_INT_SPEED = 0,\n'
+                      '    MOTOR_INT_FAN = 2,\n'
+                      '    MOTOR_INT_COUNT = 3\n'
+                      '} motor_int_id_t;', header)
+        self.assertIn('    MOTOR_FLOAT_GAIN = 0,', header)
+        self.assertIn('int32_t motor_int_find(const char *name);', header)
+
+    def test_generateStatesAndLimits(self) -> None:
+        """
+        The generate method must declare the states of the multi-state
+        objects and define the limit tables of the number objects.
+        """
+        header = generateHeader(self._store, 'ecu')
+        self.assertIn('    ECU_MODE_OFF = 0,\n'
+                      '    ECU_MODE_ON = 2,\n'
+                      '    ECU_MODE_STATE_COUNT = 2\n'
+                      '} ecu_mode_state_t;', header)
+        self.assertIn('    [ECU_INT_TORQUE] = {INT64_C(-5), INT64_C(5), '
+                      'INT64_C(0)},', header)
+        self.assertIn('    [ECU_FLOAT_GAIN] = {0.0, 1.5, 0.25},', header)
+        self.assertNotIn('ECU_UINT_LIMITS', header)
+
+    def test_generateDuplicateIdentifier(self) -> None:
+        """
+        The generate method must raise a value error when two objects give
+        the same C identifier.
+        """
+        self._lists[NodeType.INT.name].addChild(
+            IntNode('speed', IntData()))
+        with self.assertRaises(ValueError):
+            self._uut.generate(self._store)
+
+    @skipUnless(shutil.which('gcc'), 'requires gcc')
+    def test_generateCompilableHeader(self) -> None:
+        """
+        The generated header must compile as C99 without warnings, a
+        multi-state without state included, and its lookup functions must
+        find every object id by name.
+        """
+        self._lists[NodeType.MULTI_STATE.name].addChild(
+            MultiStateNode('NEW_MULTI_STATE', MultiStateData([])))
+        with TemporaryDirectory() as tmpDir:
+            with open(os.path.join(tmpDir, 'motor.h'), 'w') as fp:
+                fp.write(self._uut.generate(self._store))
+            with open(os.path.join(tmpDir, 'main.c'), 'w') as fp:
+                fp.write('#include <stdio.h>\n'
+                         '#define MOTOR_IMPLEMENTATION\n'
+                         '#include "motor.h"\n'
+                         'int main(void)\n'
+                         '{\n'
+                         '    printf("%d %d %d %d %d %d\\n",\n'
+                         '        (int)motor_int_find("SPEED"),\n'
+                         '        (int)motor_int_find("FAN"),\n'
+                         '        (int)motor_int_find("PUMP"),\n'
+                         '        (int)motor_float_find("GAIN"),\n'
+                         '        (int)motor_uint_find("SPEED"),\n'
+                         '        (int)MOTOR_INT_LIMITS[MOTOR_INT_SPEED]'
+                         '.max);\n'
+                         '    return 0;\n'
+                         '}\n')
+            program = os.path.join(tmpDir, 'main')
+            subprocess.run(['gcc', '-std=c99', '-Wall', '-Wextra',
+                            '-pedantic', '-Werror', '-o', program,
+                            os.path.join(tmpDir, 'main.c')], check=True)
+            output = subprocess.run([program], check=True,
+                                    capture_output=True, text=True).stdout
+        self.assertEqual('0 2 -1 0 -1 100\n', output)
@@ -0,0 +1,184 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.compiler import NvmLayout, NvmLayoutPlanner, getLayoutPath, \
+    getNvmSize, layoutToDict, planNvmLayout                     # noqa: E402
+from pkgs.datastore import DatastoreNode, IntArrayData, IntArrayElement, \
+    IntArrayNode, MultiStateData, MultiStateNode, NodeType, ObjectListNode, \
+    StateNode                                                   # noqa: E402
+
+
+def _createArray(name: str, size: int, inNvm: bool = True) -> IntArrayNode:
+    """
+    Create an int array.
+
+    Param
+        name: The array name.
+        size: The number of elements.
+        inNvm: True if the array is stored in non-volatile memory, false
+            otherwise.
+
+    Return
+        The int array node.
+    """
+    return IntArrayNode(name, IntArrayData(inNvm, [
+        IntArrayElement(f"{name}_{index}", 0, 10, 0)
+        for index in range(size)]))
+
+
+class TestNvmLayoutPlanner(TestCase):
+    """
+    NvmLayoutPlanner test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._store = DatastoreNode.createNewStore(ObjectListNode('', None))
+        self._lists = {objList.getName(): objList
+                       for objList in self._store.getChildren()}
+
+    def _addArrays(self, sizes: list[int]) -> None:
+        """
+        Add int arrays stored in non-volatile memory.
+
+        Param
+            sizes: The number of elements of each array.
+        """
+        self._lists[NodeType.INT_ARRAY.name].addChildrenAt(0, [
+            _createArray(f"A{index}", size)
+            for index, size in enumerate(sizes)])
+
+    def test_getLayoutPath(self) -> None:
+        """
+        The getLayoutPath function must replace the encoded datastore
+        extension by .layout.json.
+        """
+        self.assertEqual(os.path.join('out', 'a.layout.json'),
+                         getLayoutPath(os.path.join('out', 'a.cbor')))
+
+    def test_getNvmSize(self) -> None:
+        """
+        The getNvmSize function must give 8 bytes per array element and the
+        smallest state index size to a multi-state.
+        """
+        self.assertEqual(24, getNvmSize(_createArray('A', 3)))
+        for stateCount, size in ((2, 1), (256, 1), (257, 2)):
+            node = MultiStateNode('M', MultiStateData(
+                [StateNode(f"S{index}", index)
+                 for index in range(stateCount)]))
+            self.assertEqual(size, getNvmSize(node))
+
+    def test_planBestFitDecreasing(self) -> None:
+        """
+        The plan method must place the largest objects first, each in the
+        page with the least free space fitting it, and only the objects
+        stored in non-volatile memory.
+        """
+        # 16, 48, 32, 24 and 40 bytes arrays in 64 usable bytes pages.
+        self._addArrays([2, 6, 4, 3, 5])
+        self._lists[NodeType.INT_ARRAY.name].addChild(
+            _createArray('VOLATILE', 1, False))
+        self._lists[NodeType.MULTI_STATE.name].addChild(MultiStateNode(
+            'MODE', MultiStateData([StateNode('OFF', 0)], inNvm=True)))
+        layout = NvmLayoutPlanner(128, 0.5, 8).plan(self._store)
+        self.assertEqual(64, layout.usableSize)
+        self.assertEqual([('A1', 0), ('A0', 48), ('A4', 128),
+                          ('A3', 168), ('A2', 256), ('MODE', 288)],
+                         [(placement.name, placement.offset)
+                          for placement in layout.placements])
+        self.assertEqual([64, 64, 40], layout.pageUsage)
+        self.assertEqual(161, layout.objectSize)
+        self.assertEqual(7, layout.paddingSize)
+        self.assertAlmostEqual(168 / 192, layout.getFill())
+        self.assertEqual({'INT_ARRAY': {'A1': 0, 'A0': 48, 'A4': 128,
+                                        'A3': 168, 'A2': 256},
+                          'MULTI_STATE': {'MODE': 288}},
+                         layout.getOffsetMap())
+
+    def test_planSpanningObject(self) -> None:
+        """
+        The plan method must spread an object larger than the usable page
+        size over consecutive sectors, and fill the usable space left in its
+        last sector.
+        """
+        self._addArrays([20, 2])
+        layout = planNvmLayout(self._store, 64, 0.25)
+        self.assertEqual([64, 64, 32 + 16], layout.pageUsage)
+        self.assertEqual([(0, 0), (2, 160)],
+                         [(placement.page, placement.offset)
+                          for placement in layout.placements])
+        self.assertEqual(0.0, layout.getFragmentation())
+
+    def test_planObjectBeyondUsableSize(self) -> None:
+        """
+        The plan method must not give the space left in the last sector of
+        an object ending beyond the usable size to another object, whether
+        the object spans sectors or not.
+        """
+        # 4000 and 3120 bytes arrays, 3072 usable bytes per sector.
+        self._addArrays([500, 390])
+        layout = planNvmLayout(self._store, 4096, 0.25)
+        self.assertEqual([4000, 3120], layout.pageUsage)
+        self.assertEqual([(0, 0), (1, 4096)],
+                         [(placement.page, placement.offset)
+                          for placement in layout.placements])
+        self.assertEqual([0, 0], layout.getFreeSizes())
+        # 8000 and 80 bytes arrays.
+        self._lists[NodeType.INT_ARRAY.name].removeChildAt(1)
+        self._lists[NodeType.INT_ARRAY.name].removeChildAt(0)
+        self._addArrays([1000, 10])
+        layout = planNvmLayout(self._store, 4096, 0.25)
+        self.assertEqual([4096, 3904, 80], layout.pageUsage)
+        self.assertEqual([(0, 0), (2, 8192)],
+                         [(placement.page, placement.offset)
+                          for placement in layout.placements])
+
+    def test_layoutStatistics(self) -> None:
+        """
+        The layout fill must be the fraction of the usable space in use, and
+        the fragmentation the fraction of the free space outside the page
+        with the most free space.
+        """
+        layout = NvmLayout(64, 48, 4, pageUsage=[64, 40, 16])
+        self.assertEqual([0, 8, 32], layout.getFreeSizes())
+        self.assertAlmostEqual(1 - 40 / 144, layout.getFill())
+        self.assertAlmostEqual(1 - 32 / 40, layout.getFragmentation())
+
+    def test_planEmptyLayout(self) -> None:
+        """
+        The plan method must return a layout without page when no object is
+        stored in non-volatile memory, skipping the empty arrays.
+        """
+        self._addArrays([0])
+        layout = planNvmLayout(self._store, 4096)
+        self.assertEqual(0, layout.getPageCount())
+        self.assertEqual(0.0, layout.getFill())
+        self.assertEqual({}, layoutToDict(layout)['objects'])
+
+    def test_invalidParameters(self) -> None:
+        """
+        The planner must raise a value error on an alignment which is not a
+        power of two, a sector size not aligned, a headroom out of [0, 1)
+        or no usable space.
+        """
+        for args in ((4096, 0.25, 3), (4098, 0.25, 4), (0, 0.25, 4),
+                     (4096, 1.0, 4), (4096, -0.1, 4), (8, 0.9, 4)):
+            with self.assertRaises(ValueError):
+                NvmLayoutPlanner(*args)
+
+    def test_layoutToDict(self) -> None:
+        """
+        The layoutToDict function must hold the layout statistics and the
+        placement of each object by object list.
+        """
+        self._addArrays([2])
+        layoutDict = layoutToDict(planNvmLayout(self._store, 4096))
+        self.assertEqual(1, layoutDict['pageCount'])
+        self.assertEqual(3072, layoutDict['usableSize'])
+        self.assertEqual([{'name': 'A0', 'id': 0, 'page': 0, 'offset': 0,
+                           'size': 16}], layoutDict['objects']['INT_ARRAY'])
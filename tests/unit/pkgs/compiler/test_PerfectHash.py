@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.compiler import createPerfectHash                     # noqa: E402
+
+
+class TestPerfectHash(TestCase):
+    """
+    Perfect hash test cases.
+    """
+    def test_lookupEveryName(self) -> None:
+        """
+        The perfect hash must give every name its own slot and its id.
+        """
+        ids = {f"OBJ_{index}": index * 2 for index in range(1000)}
+        uut = createPerfectHash(ids)
+        self.assertEqual(sorted(ids), sorted(uut.names))
+        for name, id in ids.items():
+            self.assertEqual(id, uut.lookup(name))
+
+    def test_lookupUnknownName(self) -> None:
+        """
+        The lookup method must return none for a name not in the hash.
+        """
+        uut = createPerfectHash({'SPEED': 0, 'TORQUE': 1, 'FAN': 2})
+        for name in ('', 'PUMP', 'speed', 'SPEED_'):
+            self.assertIsNone(uut.lookup(name))
+
+    def test_createSmallHashes(self) -> None:
+        """
+        The createPerfectHash function must handle no names and a single
+        name.
+        """
+        self.assertIsNone(createPerfectHash({}).lookup('SPEED'))
+        uut = createPerfectHash({'SPEED': 7})
+        self.assertEqual(7, uut.lookup('SPEED'))
+        self.assertIsNone(uut.lookup('FAN'))
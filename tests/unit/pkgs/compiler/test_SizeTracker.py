@@ -0,0 +1,159 @@
+from io import BytesIO
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.compiler import EncodedSizeTracker, NodeSize, \
+    planNvmLayout                                               # noqa: E402
+from pkgs.datastore import DatastoreMetadata, DatastoreNode, IntArrayData, \
+    IntArrayElement, IntArrayNode, IntData, IntNode, MultiStateData, \
+    MultiStateNode, NodeType, ObjectListNode, StateNode         # noqa: E402
+from pkgs.decoder import LazyDatastoreReader                    # noqa: E402
+from pkgs.encoder import DatastoreEncoder                       # noqa: E402
+
+
+class TestEncodedSizeTracker(TestCase):
+    """
+    EncodedSizeTracker test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._store = DatastoreNode.createNewStore(
+            ObjectListNode('', None), 'motor',
+            DatastoreMetadata(None, flashBudget=4096, nvmBudget=40))
+        self._lists = {objList.getName(): objList
+                       for objList in self._store.getChildren()}
+        self._ints = [IntNode(f"I{index}", IntData(default=index))
+                      for index in range(30)]
+        self._lists[NodeType.INT.name].addChildrenAt(0, self._ints)
+        self._array = IntArrayNode('GAINS', IntArrayData(True, [
+            IntArrayElement(f"G{index}", 0, 10, 0) for index in range(4)]))
+        self._lists[NodeType.INT_ARRAY.name].addChild(self._array)
+        self._uut = EncodedSizeTracker(self._store)
+
+    def _getEncodedSize(self) -> int:
+        """
+        Encode the datastore.
+
+        Return
+            The encoded datastore size, in bytes.
+        """
+        fp = BytesIO()
+        DatastoreEncoder(fp).encode(self._store)
+        return len(fp.getvalue())
+
+    def test_getSizeMatchEncoder(self) -> None:
+        """
+        The datastore size must match the encoder output after object
+        modifications, additions and removals, including the removal of
+        the object with the largest id.
+        """
+        self.assertEqual(self._getEncodedSize(),
+                         self._uut.getSize(self._store).encoded)
+        self._ints[3].setDefault(100000)
+        self.assertEqual(self._getEncodedSize(),
+                         self._uut.getSize(self._store).encoded)
+        self._lists[NodeType.INT.name].addChild(IntNode('NEW', IntData()))
+        self.assertEqual(self._getEncodedSize(),
+                         self._uut.getSize(self._store).encoded)
+        intList = self._lists[NodeType.INT.name]
+        intList.removeChildAt(intList.getChildCount() - 1)
+        intList.removeChildAt(5)
+        self.assertEqual(self._getEncodedSize(),
+                         self._uut.getSize(self._store).encoded)
+        self._array.getElements().pop()
+        self.assertEqual(self._getEncodedSize(),
+                         self._uut.getSize(self._store).encoded)
+
+    def test_getSizeOnlyMeasureModifiedObjects(self) -> None:
+        """
+        A size read must only encode the objects modified since the
+        previous one.
+        """
+        self._uut.getSize(self._store)
+        self.assertEqual(31, self._uut.getEncodedCount())
+        self._ints[0].setDefault(7)
+        self._ints[0].setDefault(8)
+        self._ints[9].setDefault(7)
+        self._ints[0].setName('RENAMED')
+        self._uut.getSize(self._store)
+        self.assertEqual(33, self._uut.getEncodedCount())
+        self._uut.getSize(self._store)
+        self.assertEqual(33, self._uut.getEncodedCount())
+
+    def test_getSizeNvm(self) -> None:
+        """
+        The non-volatile memory size of the datastore must match the object
+        size of its flash layout, and the object and list sizes must add
+        up.
+        """
+        self.assertEqual(planNvmLayout(self._store, 4096).objectSize,
+                         self._uut.getSize(self._store).nvm)
+        self.assertEqual(32, self._uut.getSize(self._array).nvm)
+        self.assertEqual(32, self._uut.getSize(
+            self._lists[NodeType.INT_ARRAY.name]).nvm)
+        self.assertEqual(0, self._uut.getSize(self._ints[0]).nvm)
+
+    def test_getSizeUnknownObject(self) -> None:
+        """
+        The size of an object not in the datastore must be zero.
+        """
+        self.assertEqual(NodeSize(),
+                         self._uut.getSize(IntNode('OTHER', IntData())))
+
+    def test_getBudgetWarnings(self) -> None:
+        """
+        The budget warnings must report the datastore sizes exceeding the
+        budgets of the datastore metadata.
+        """
+        self.assertEqual([], self._uut.getBudgetWarnings())
+        self._array.getElements().append(IntArrayElement('G4', 0, 10, 0))
+        self.assertEqual([], self._uut.getBudgetWarnings())
+        self._array.getElements().append(IntArrayElement('G5', 0, 10, 0))
+        self.assertEqual(['motor NVM size 48 B exceeds its 40 B budget'],
+                         self._uut.getBudgetWarnings())
+
+    def test_lazyStoreNotDecoded(self) -> None:
+        """
+        The sizes of a lazily read datastore must be read from the encoded
+        file without creating its objects, and an object must only be
+        encoded once it is modified.
+        """
+        self._lists[NodeType.MULTI_STATE.name].addChild(MultiStateNode(
+            'MODE', MultiStateData([StateNode('OFF', 0), StateNode('ON', 1)],
+                                   inNvm=True)))
+        expected = EncodedSizeTracker(self._store)
+        with TemporaryDirectory() as tmpDir:
+            path = os.path.join(tmpDir, 'motor.cbor')
+            with open(path, 'wb') as fp:
+                DatastoreEncoder(fp).encode(self._store)
+            with LazyDatastoreReader(path) as reader:
+                store = reader.createStore()
+                uut = EncodedSizeTracker(store)
+                lists = [store.getChild(row)
+                         for row in range(store.getChildCount())]
+                self.assertEqual(expected.getSize(self._store),
+                                 uut.getSize(store))
+                self.assertEqual([], [node for objList in lists
+                                      for node in
+                                      objList._children.getLoadedChildren()])
+                intList = store.getChild(4)
+                node = intList.getChild(3)
+                self.assertEqual(expected.getSize(self._ints[3]),
+                                 uut.getSize(node))
+                self.assertEqual(0, uut.getEncodedCount())
+                node.setDefault(100000)
+                self._ints[3].setDefault(100000)
+                self.assertEqual(expected.getSize(self._store),
+                                 uut.getSize(store))
+                self.assertEqual(1, uut.getEncodedCount())
+                intList.removeChildAt(3)
+                self._lists[NodeType.INT.name].removeChildAt(3)
+                self.assertEqual(expected.getSize(self._store),
+                                 uut.getSize(store))
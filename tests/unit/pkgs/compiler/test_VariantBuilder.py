@@ -0,0 +1,200 @@
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import cbor2
+import json
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.compiler import BuildOptions, buildVariant, buildVariants, \
+    getHeaderPath, getLayoutPath, getOutputPath                 # noqa: E402
+from pkgs.decoder import getNameTablePath                       # noqa: E402
+from pkgs.encoder import decompressImage, getCompressedPath, \
+    getPagedImagePath, readCompressedHeader, \
+    readPagedObject                                             # noqa: E402
+
+
+class TestVariantBuilder(TestCase):
+    """
+    Variant builder test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._executorCls = 'pkgs.compiler.variantBuilder.ProcessPoolExecutor'
+        self._tmpDir = TemporaryDirectory()
+        self._variants = []
+        for index in range(3):
+            path = os.path.join(self._tmpDir.name, f"variant{index}.json")
+            with open(path, 'w') as fp:
+                json.dump({'objects': {'INT': [{'name': f"I{row}"}
+                                               for row in
+                                               range(index + 1)]}}, fp)
+            self._variants.append((path, getOutputPath(path)))
+
+    def tearDown(self) -> None:
+        """
+        Test cases teardown.
+        """
+        self._tmpDir.cleanup()
+
+    def test_getOutputPath(self) -> None:
+        """
+        The getOutputPath function must replace the definition extension by
+        .cbor, in the output directory when one is given.
+        """
+        self.assertEqual(os.path.join('defs', 'a.cbor'),
+                         getOutputPath(os.path.join('defs', 'a.json')))
+        self.assertEqual(os.path.join('out', 'a.cbor'),
+                         getOutputPath(os.path.join('defs', 'a.json'), 'out'))
+
+    def test_buildVariantEncodeDefinition(self) -> None:
+        """
+        The buildVariant function must encode the definition and report the
+        object count, the output size and the build time.
+        """
+        definitionPath, outputPath = self._variants[2]
+        result = buildVariant(definitionPath, outputPath)
+        self.assertIsNone(result.error)
+        self.assertEqual(3, result.objCount)
+        self.assertEqual(os.path.getsize(outputPath), result.size)
+        self.assertGreater(result.elapsed, 0)
+
+    def test_buildVariantNameTable(self) -> None:
+        """
+        The buildVariant function must write the name table next to the
+        encoded datastore when requested, without counting it in the size.
+        """
+        definitionPath, outputPath = self._variants[1]
+        result = buildVariant(definitionPath, outputPath,
+                              BuildOptions(names=True))
+        with open(getNameTablePath(outputPath), 'rb') as fp:
+            self.assertEqual(['I0', 'I1'], cbor2.load(fp)['INT'])
+        self.assertEqual(os.path.getsize(outputPath), result.size)
+
+    def test_buildVariantHeader(self) -> None:
+        """
+        The buildVariant function must write the C header next to the
+        encoded datastore when requested.
+        """
+        definitionPath, outputPath = self._variants[1]
+        buildVariant(definitionPath, outputPath, BuildOptions(header=True))
+        with open(getHeaderPath(outputPath)) as fp:
+            header = fp.read()
+        self.assertIn('DATASTORE_INT_I1 = 1,', header)
+        self.assertIn('DATASTORE_INT_COUNT = 2', header)
+
+    def test_buildVariantLayout(self) -> None:
+        """
+        The buildVariant function must write the non-volatile memory layout
+        next to the encoded datastore when a sector size is given.
+        """
+        definitionPath, outputPath = self._variants[0]
+        buildVariant(definitionPath, outputPath,
+                     BuildOptions(sectorSize=256, headroom=0.5))
+        with open(getLayoutPath(outputPath)) as fp:
+            layout = json.load(fp)
+        self.assertEqual(128, layout['usableSize'])
+        self.assertEqual(0, layout['pageCount'])
+
+    def test_buildVariantPagedImage(self) -> None:
+        """
+        The buildVariant function must write the paged image next to the
+        encoded datastore when a page size is given.
+        """
+        definitionPath, outputPath = self._variants[2]
+        buildVariant(definitionPath, outputPath, BuildOptions(pageSize=32))
+        with open(getPagedImagePath(outputPath), 'rb') as fp:
+            image = fp.read()
+        self.assertEqual(0, len(image) % 32)
+        self.assertEqual({'min': -1000000, 'max': 1000000, 'default': 0},
+                         cbor2.loads(readPagedObject(image, 'INT', 2)))
+
+    def test_buildVariantCompact(self) -> None:
+        """
+        The buildVariant function must use the compact encoding when
+        requested.
+        """
+        definitionPath, outputPath = self._variants[0]
+        result = buildVariant(definitionPath, outputPath,
+                              BuildOptions(compact=True))
+        with open(outputPath, 'rb') as fp:
+            self.assertEqual([{2: -1000000, 3: 1000000, 4: 0}],
+                             cbor2.load(fp)['INT'])
+        self.assertEqual(os.path.getsize(outputPath), result.size)
+
+    def test_buildVariantCompress(self) -> None:
+        """
+        The buildVariant function must write the compressed image of the
+        paged image, in chunks of the page size, or of the encoded datastore
+        without paged image.
+        """
+        definitionPath, outputPath = self._variants[2]
+        dictionary = b'\xa3cmin:\xff\xf0\xbd\xbfcmax\x1a\x00\x0fB@'
+        for pageSize, imagePath, chunkSize in (
+                (None, outputPath, 4096),
+                (32, getPagedImagePath(outputPath), 32)):
+            buildVariant(definitionPath, outputPath,
+                         BuildOptions(pageSize=pageSize, compress=True,
+                                      dictionary=dictionary))
+            with open(getCompressedPath(imagePath), 'rb') as fp:
+                compressed = fp.read()
+            with open(imagePath, 'rb') as fp:
+                self.assertEqual(fp.read(),
+                                 decompressImage(compressed, dictionary))
+            self.assertEqual(chunkSize,
+                             readCompressedHeader(compressed).chunkSize)
+
+    def test_buildVariantReportError(self) -> None:
+        """
+        The buildVariant function must report the error of an invalid
+        definition instead of raising it.
+        """
+        path = os.path.join(self._tmpDir.name, 'missing.json')
+        result = buildVariant(path, getOutputPath(path))
+        self.assertIsNotNone(result.error)
+        self.assertEqual(0, result.size)
+        with patch('pkgs.compiler.variantBuilder.loadDefinitionFile',
+                   side_effect=RuntimeError('unexpected')):
+            result = buildVariant(*self._variants[0])
+        self.assertEqual('RuntimeError: unexpected', result.error)
+
+    def test_buildVariantsSingleWorkerInProcess(self) -> None:
+        """
+        The buildVariants function must build the variants in the calling
+        process when a single worker is requested.
+        """
+        with patch(self._executorCls) as mockedExecutor:
+            results, summary = buildVariants(self._variants, 1)
+            mockedExecutor.assert_not_called()
+        self.assertEqual([1, 2, 3], [result.objCount for result in results])
+        self.assertEqual(3, summary.variantCount)
+
+    def test_buildVariantsInParallel(self) -> None:
+        """
+        The buildVariants function must build the variants in worker
+        processes with the build options, return the results in the
+        variants order and summarize the build.
+        """
+        missing = os.path.join(self._tmpDir.name, 'missing.json')
+        variants = self._variants + [(missing, getOutputPath(missing))]
+        with self.assertLogs('app.compiler', 'ERROR'):
+            results, summary = buildVariants(variants, 2,
+                                             BuildOptions(header=True))
+        self.assertTrue(all(os.path.exists(getHeaderPath(variant[1]))
+                            for variant in self._variants))
+        self.assertEqual([variant[0] for variant in variants],
+                         [result.definitionPath for result in results])
+        self.assertEqual([1, 2, 3, 0],
+                         [result.objCount for result in results])
+        self.assertEqual(4, summary.variantCount)
+        self.assertEqual(1, summary.failedCount)
+        self.assertEqual(sum(os.path.getsize(variant[1])
+                             for variant in self._variants),
+                         summary.totalSize)
+        self.assertAlmostEqual(sum(result.elapsed for result in results),
+                               summary.cpuTime)
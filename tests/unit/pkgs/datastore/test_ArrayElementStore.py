@@ -0,0 +1,176 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import ArrayElementView, FloatArrayElements, \
+    IntArrayElement, IntArrayElements, UintArrayElements        # noqa: E402
+
+
+class TestArrayElementStore(TestCase):
+    """
+    ArrayElementStore test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._elements = [IntArrayElement('ELEM_0', -10, 10, 0),
+                          IntArrayElement('ELEM_1', -20, 20, 1),
+                          IntArrayElement('ELEM_2', -30, 30, 2)]
+        self._uut = IntArrayElements(self._elements)
+
+    def test_constructorSaveColumns(self) -> None:
+        """
+        The constructor must save the element names in a list and the values
+        in typed columns.
+        """
+        self.assertEqual(['ELEM_0', 'ELEM_1', 'ELEM_2'], self._uut._names)
+        self.assertEqual([-10, -20, -30], self._uut._columns['min'].tolist())
+        self.assertEqual([10, 20, 30], self._uut._columns['max'].tolist())
+        self.assertEqual([0, 1, 2], self._uut._columns['default'].tolist())
+        for column in self._uut._columns.values():
+            self.assertEqual(IntArrayElements.TYPECODE, column.typecode)
+
+    def test_columnTypecodes(self) -> None:
+        """
+        Each array type must store its values in a column of its own type.
+        """
+        self.assertEqual('q', IntArrayElements.TYPECODE)
+        self.assertEqual('Q', UintArrayElements.TYPECODE)
+        self.assertEqual('d', FloatArrayElements.TYPECODE)
+
+    def test_getItemReturnView(self) -> None:
+        """
+        Indexing the store must return a view of the element.
+        """
+        view = self._uut[-1]
+        self.assertIsInstance(view, ArrayElementView)
+        self.assertEqual(self._elements[-1], view)
+        with self.assertRaises(IndexError):
+            self._uut[len(self._elements)]
+
+    def test_viewWriteThrough(self) -> None:
+        """
+        Setting an element view field must update the store columns.
+        """
+        view = self._uut[1]
+        view.name = 'NEW_NAME'
+        view.min = -5
+        view.max = 5
+        view.default = 3
+        self.assertEqual('NEW_NAME', self._uut._names[1])
+        self.assertEqual(-5, self._uut._columns['min'][1])
+        self.assertEqual(5, self._uut._columns['max'][1])
+        self.assertEqual(3, self._uut._columns['default'][1])
+
+    def test_getItemSliceReturnStore(self) -> None:
+        """
+        Slicing the store must return a new store of the sliced elements.
+        """
+        result = self._uut[1:]
+        self.assertIsInstance(result, IntArrayElements)
+        self.assertEqual(self._elements[1:], result)
+
+    def test_setItemAndDelItem(self) -> None:
+        """
+        Setting an item must replace the element and deleting it must remove
+        it from every column.
+        """
+        element = IntArrayElement('REPLACED', -1, 1, 0)
+        self._uut[0] = element
+        self.assertEqual(element, self._uut[0])
+        del self._uut[0]
+        self.assertEqual(self._elements[1:], self._uut)
+
+    def test_insertAndPop(self) -> None:
+        """
+        The insert method must insert the element in every column and the pop
+        method must remove it and return it as an element.
+        """
+        element = IntArrayElement('INSERTED', -1, 1, 0)
+        self._uut.insert(1, element)
+        self.assertEqual(len(self._elements) + 1, len(self._uut))
+        self.assertEqual(element, self._uut[1])
+        result = self._uut.pop(1)
+        self.assertIsInstance(result, IntArrayElement)
+        self.assertEqual(element, result)
+        self.assertEqual(self._elements, self._uut)
+
+    def test_insertOutOfRangeElement(self) -> None:
+        """
+        The insert, set item, element setters and setColumn methods must
+        raise a value error, leaving every column unchanged, when a value is
+        out of the column range.
+        """
+        element = IntArrayElement('BIG', 0, 2 ** 64, 0)
+        with self.assertRaises(ValueError):
+            self._uut.insert(0, element)
+        with self.assertRaises(ValueError):
+            self._uut[0] = element
+        for field in ['min', 'max', 'default']:
+            with self.assertRaises(ValueError):
+                setattr(self._uut[1], field, 2 ** 63)
+        with self.assertRaises(ValueError):
+            self._uut.setColumn('max', [0, 2 ** 64, 0])
+        self.assertEqual(self._elements, self._uut)
+        with self.assertRaises(ValueError):
+            UintArrayElements([IntArrayElement('NEG', -1, 1, 0)])
+
+    def test_getColumnIsZeroCopy(self) -> None:
+        """
+        The getColumn method must return a read-only view of the column.
+        """
+        column = self._uut.getColumn('max')
+        self.assertTrue(column.readonly)
+        self.assertEqual([10, 20, 30], column.tolist())
+        self._uut[0].max = 15
+        self.assertEqual(15, column[0])
+        column.release()
+
+    def test_setColumnBulkUpdate(self) -> None:
+        """
+        The setColumn method must replace every value of the column and
+        refuse a value count different from the element count.
+        """
+        self._uut.setColumn('default', [7, 8, 9])
+        self.assertEqual([7, 8, 9], self._uut.getColumn('default').tolist())
+        with self.assertRaises(ValueError):
+            self._uut.setColumn('default', [1])
+
+    def test_setNames(self) -> None:
+        """
+        The setNames method must replace every name and refuse a name count
+        different from the element count.
+        """
+        names = ['A', 'B', 'C']
+        self._uut.setNames(names)
+        self.assertEqual(names, self._uut.getNames())
+        with self.assertRaises(ValueError):
+            self._uut.setNames(['A'])
+
+    def test_modificationsBumpOwnerRevision(self) -> None:
+        """
+        Every modification of the elements must bump the owner revision.
+        """
+        owner = Mock()
+        self._uut.setOwner(owner)
+        datasets = [
+            lambda: setattr(self._uut[0], 'name', 'NAME'),
+            lambda: setattr(self._uut[0], 'min', -1),
+            lambda: setattr(self._uut[0], 'max', 1),
+            lambda: setattr(self._uut[0], 'default', 0),
+            lambda: self._uut.__setitem__(0, self._elements[1]),
+            lambda: self._uut.append(self._elements[0]),
+            lambda: self._uut.pop(),
+            lambda: self._uut.__delitem__(0),
+            lambda: self._uut.setNames(['A', 'B']),
+            lambda: self._uut.setColumn('min', [0, 0]),
+        ]
+        for modify in datasets:
+            owner.reset_mock()
+            modify()
+            owner.bumpRevision.assert_called_once_with()
@@ -0,0 +1,355 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import BaseNode, ChildList, NodeType        # noqa: E402
+
+
+class TestBaseNode(TestCase):
+    """
+    BaseNode test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._testName = 'test node'
+        self._testType = NodeType.BUTTON_ARRAY
+        self._testParent = Mock()
+        self._testParent._parent = None
+        self._testChildren = [Mock(), Mock(), Mock()]
+        self._uut = BaseNode(self._testName, self._testType,
+                             parent=self._testParent)
+        self._uut._children = ChildList(self._testChildren)
+
+    def test_constructorSaveDataAddToParent(self) -> None:
+        """
+        The constructor must save the node name and type, create an empty
+        children list and add itself to the parent children if a parent is
+        given.
+        """
+        datasets = [{'name': 'node 1', 'type': NodeType.STORE, 'parent': None},
+                    {'name': 'node 2', 'type': NodeType.INT, 'parent': Mock()}]
+        for dataset in datasets:
+            uut = BaseNode(dataset['name'], dataset['type'],
+                           parent=dataset['parent'])
+            self.assertEqual(dataset['name'], uut._name)
+            self.assertEqual(dataset['type'], uut._type)
+            self.assertEqual(dataset['parent'], uut._parent)
+            if dataset['parent'] is not None:
+                dataset['parent'].addChild.assert_called_once_with(uut)
+
+    def test_constructorDoesNotAllocateChildren(self) -> None:
+        """
+        The constructor must not allocate an instance dictionary nor a
+        children container for the node.
+        """
+        first = BaseNode('first', NodeType.INT)
+        second = BaseNode('second', NodeType.INT)
+        self.assertFalse(hasattr(first, '__dict__'))
+        self.assertIs(first._children, second._children)
+        self.assertEqual(0, first.getChildCount())
+
+    def test_addChildAllocateChildren(self) -> None:
+        """
+        The first child added must allocate the node children container.
+        """
+        first = BaseNode('first', NodeType.OBJ_LIST)
+        second = BaseNode('second', NodeType.OBJ_LIST)
+        child = Mock()
+        first.addChild(child)
+        self.assertIsNot(first._children, second._children)
+        self.assertEqual(1, first.getChildCount())
+        self.assertEqual(0, second.getChildCount())
+
+    def test_loggerReturnSharedTypeLogger(self) -> None:
+        """
+        The logger must be the shared logger of the node type carrying the
+        node name.
+        """
+        with patch('pkgs.datastore.baseNode.getNodeLogger') \
+                as mockedGetNodeLogger:
+            logger = self._uut._logger
+            mockedGetNodeLogger.assert_called_once_with(self._testType.name,
+                                                        self._testName)
+            self.assertEqual(mockedGetNodeLogger.return_value, logger)
+
+    def test_bumpRevisionUpdateAncestors(self) -> None:
+        """
+        The bumpRevision method must give the node and all its ancestors a
+        new revision, greater than any previous revision, without modifying
+        its siblings.
+        """
+        root = BaseNode('root', NodeType.STORE)
+        objList = BaseNode('list', NodeType.OBJ_LIST, root)
+        first = BaseNode('first', NodeType.INT, objList)
+        second = BaseNode('second', NodeType.INT, objList)
+        siblingRevision = second.getRevision()
+        previous = root.getRevision()
+        first.bumpRevision()
+        self.assertGreater(first.getRevision(), previous)
+        self.assertEqual(first.getRevision(), objList.getRevision())
+        self.assertEqual(first.getRevision(), root.getRevision())
+        self.assertEqual(siblingRevision, second.getRevision())
+
+    def test_modificationsBumpRevision(self) -> None:
+        """
+        The name and children modifications must bump the node revision.
+        """
+        datasets = [
+            lambda uut: uut.setName('new name'),
+            lambda uut: uut.addChild(BaseNode('child', NodeType.INT)),
+            lambda uut: uut.addChildAt(0, BaseNode('child', NodeType.INT)),
+            lambda uut: uut.addChildrenAt(0, [BaseNode('child',
+                                                       NodeType.INT)]),
+            lambda uut: uut.removeChildAt(0),
+            lambda uut: uut.removeChildrenAt(0, 1),
+        ]
+        for modify in datasets:
+            uut = BaseNode('node', NodeType.OBJ_LIST)
+            BaseNode('child', NodeType.INT, uut)
+            previous = uut.getRevision()
+            modify(uut)
+            self.assertGreater(uut.getRevision(), previous)
+
+    def test_getDirtySubtreesLeaf(self) -> None:
+        """
+        The getDirtySubtrees method of a node without children must return
+        the node only if it was modified after the revision.
+        """
+        uut = BaseNode('node', NodeType.INT)
+        revision = uut.getRevision()
+        self.assertEqual([], uut.getDirtySubtrees(revision))
+        uut.setName('new name')
+        self.assertEqual([uut], uut.getDirtySubtrees(revision))
+
+    def test_getNameReturnNodeName(self) -> None:
+        """
+        The getName method must return the node name.
+        """
+        self.assertEqual(self._testName, self._uut.getName())
+
+    def test_setNameSaveNewName(self) -> None:
+        """
+        The setName method must save the new node name.
+        """
+        name = 'new name'
+        self._uut.setName(name)
+        self.assertEqual(name, self._uut._name)
+
+    def test_setNameNotifyParent(self) -> None:
+        """
+        The setName method must notify the parent of the previous name of
+        the node.
+        """
+        self._uut.setName('new name')
+        self._testParent._childRenamed.assert_called_once_with(
+            self._uut, self._testName)
+
+    def test_childrenModificationsNotifyNode(self) -> None:
+        """
+        The child additions and removals must be notified to the node with
+        the added or removed children.
+        """
+        newChildren = [Mock(), Mock()]
+        with patch.object(BaseNode, '_childrenAdded') as mockedAdded, \
+                patch.object(BaseNode, '_childrenRemoved') as mockedRemoved:
+            self._uut.addChild(newChildren[0])
+            mockedAdded.assert_called_once_with([newChildren[0]])
+            mockedAdded.reset_mock()
+            self._uut.addChildAt(0, newChildren[1])
+            mockedAdded.assert_called_once_with([newChildren[1]])
+            mockedAdded.reset_mock()
+            self._uut.addChildrenAt(1, newChildren)
+            mockedAdded.assert_called_once_with(newChildren)
+            self._uut.removeChildAt(0)
+            mockedRemoved.assert_called_once_with([newChildren[1]])
+            mockedRemoved.reset_mock()
+            self._uut.removeChildrenAt(0, 2)
+            mockedRemoved.assert_called_once_with(newChildren)
+
+    def test_getTypeReturnNodeType(self) -> None:
+        """
+        The getType method must return the node type.
+        """
+        self.assertEqual(self._testType, self._uut.getType())
+
+    def test_getChildCountReturnCount(self) -> None:
+        """
+        The getChildCount must return the node child count.
+        """
+        self.assertEqual(len(self._testChildren), self._uut.getChildCount())
+
+    def test_getChildDoesNotExist(self) -> None:
+        """
+        The getChild method must return None if the given row does not exists.
+        """
+        row = len(self._testChildren)
+        self.assertIsNone(self._uut.getChild(row))
+
+    def test_getChildExists(self) -> None:
+        """
+        The getChild method must return the node child at the given row.
+        """
+        row = len(self._testChildren) - 1
+        self.assertEqual(self._testChildren[row], self._uut.getChild(row))
+
+    def test_getChildrenReturnCopy(self) -> None:
+        """
+        The getChildren method must return a copy of the node children.
+        """
+        children = self._uut.getChildren()
+        self.assertEqual(self._testChildren, children)
+        children.pop()
+        self.assertEqual(len(self._testChildren), self._uut.getChildCount())
+
+    def test_addChildAppendNewChild(self) -> None:
+        newChildCount = len(self._uut._children) + 1
+        newChild = Mock()
+        self._uut.addChild(newChild)
+        self.assertEqual(newChildCount, len(self._uut._children))
+        self.assertEqual(newChild, self._uut._children[-1])
+        self.assertEqual(self._uut, newChild._parent)
+
+    def test_addChildAtRowOutOfRange(self) -> None:
+        """
+        The addChildAt must return false if the row is not valid.
+        """
+        length = len(self._uut._children)
+        rows = [-1, length + 1]
+        child = Mock()
+        for row in rows:
+            self.assertFalse(self._uut.addChildAt(row, child))
+            self.assertEqual(length, len(self._uut._children))
+
+    def test_addChildInsertChild(self) -> None:
+        """
+        The addChildAt must insert the new child and return true when the
+        operation succeeds.
+        """
+        newLength = len(self._uut._children) + 1
+        row = len(self._uut._children) - 2
+        child = Mock()
+        self.assertTrue(self._uut.addChildAt(row, child))
+        self.assertEqual(newLength, len(self._uut._children))
+        self.assertEqual(child, self._uut._children[row])
+        self.assertEqual(self._uut, child._parent)
+
+    def test_addChildrenAtRowOutOfRange(self) -> None:
+        """
+        The addChildrenAt must return false if the row is not valid.
+        """
+        length = len(self._uut._children)
+        rows = [-1, length + 1]
+        children = [Mock(), Mock()]
+        for row in rows:
+            self.assertFalse(self._uut.addChildrenAt(row, children))
+            self.assertEqual(length, len(self._uut._children))
+
+    def test_addChildrenAtInsertChildren(self) -> None:
+        """
+        The addChildrenAt must insert the new children in order and return
+        true when the operation succeeds.
+        """
+        children = [Mock(), Mock()]
+        newLength = len(self._uut._children) + len(children)
+        row = 1
+        self.assertTrue(self._uut.addChildrenAt(row, children))
+        self.assertEqual(newLength, len(self._uut._children))
+        for offset, child in enumerate(children):
+            self.assertEqual(child, self._uut._children[row + offset])
+            self.assertEqual(self._uut, child._parent)
+            self.assertEqual(row + offset, self._uut._children.rowOf(child))
+
+    def test_removeChildAtRowOutOfRange(self) -> None:
+        """
+        The removeChildAt method must return false if the row is not valid.
+        """
+        length = len(self._uut._children)
+        rows = [-1, length]
+        for row in rows:
+            self.assertFalse(self._uut.removeChildAt(row))
+            self.assertEqual(length, len(self._uut._children))
+
+    def test_removeChildAtRemoveChild(self) -> None:
+        """
+        The removeChildAt must remove the child at the given row and return
+        true when the operation succeeds.
+        """
+        length = len(self._uut._children) - 1
+        row = length - 1
+        removedChild = self._uut._children[row]
+        self.assertTrue(self._uut.removeChildAt(row))
+        self.assertEqual(length, len(self._uut._children))
+        self.assertFalse(removedChild in self._uut._children)
+
+    def test_removeChildrenAtRowOutOfRange(self) -> None:
+        """
+        The removeChildrenAt method must return false if the rows are not
+        valid.
+        """
+        length = len(self._uut._children)
+        datasets = [(-1, 1), (0, 0), (length - 1, 2)]
+        for row, count in datasets:
+            self.assertFalse(self._uut.removeChildrenAt(row, count))
+            self.assertEqual(length, len(self._uut._children))
+
+    def test_removeChildrenAtRemoveChildren(self) -> None:
+        """
+        The removeChildrenAt must remove the children starting at the given
+        row and return true when the operation succeeds.
+        """
+        removed = self._testChildren[:2]
+        remaining = self._testChildren[2:]
+        self.assertTrue(self._uut.removeChildrenAt(0, len(removed)))
+        self.assertEqual(remaining, list(self._uut._children))
+        for child in removed:
+            self.assertFalse(child in self._uut._children)
+
+    def test_getParent(self) -> None:
+        """
+        The getParent method must return the node parent.
+        """
+        self.assertEqual(self._testParent, self._uut.getParent())
+
+    def test_getStoreReturnClosestStore(self) -> None:
+        """
+        The getStore method must return the closest datastore ancestor, none
+        if the node is not in a datastore.
+        """
+        store = BaseNode('store', NodeType.STORE)
+        objList = BaseNode('INT', NodeType.OBJ_LIST, parent=store)
+        node = BaseNode('object', NodeType.INT, parent=objList)
+        self.assertIs(store, node.getStore())
+        self.assertIs(store, objList.getStore())
+        self.assertIsNone(store.getStore())
+
+    def test_getRowNoParent(self) -> None:
+        """
+        The getRow must return none if the node has no parent.
+        """
+        self._uut._parent = None
+        self.assertIsNone(self._uut.getRow())
+
+    def test_getRowWithParent(self) -> None:
+        """
+        The getRow must return the node row when it has a parent.
+        """
+        row = 3
+        self._testParent._children.rowOf.return_value = row
+        self.assertEqual(row, self._uut.getRow())
+        self._testParent._children.rowOf.assert_called_once_with(self._uut)
+
+    def test_isEditable(self) -> None:
+        """
+        The isEditable method must return false when the node is of the
+        object list type and true otherwise.
+        """
+        for type in NodeType:
+            self._uut._type = type
+            self.assertEqual(type != NodeType.OBJ_LIST,
+                             self._uut.isEditable())
@@ -6,7 +6,7 @@ import sys
 
 sys.path.append(os.path.abspath('./src'))
 
-from pkgs.ui.models import ButtonArrayData, ButtonArrayElement, \
+from pkgs.datastore import ButtonArrayData, ButtonArrayElement, \
     ButtonArrayNode, ButtonData, ButtonNode, NodeType     # noqa: E402
 
 
@@ -18,10 +18,13 @@ class TestButtonNode(TestCase):
         """
         Test cases setup.
         """
-        self._BaseNodeCls = 'pkgs.ui.models.buttonNode.BaseNode'
+        self._BaseNodeCls = 'pkgs.datastore.buttonNode.BaseNode'
         with patch(f"{self._BaseNodeCls}.__init__"):
             self._data = ButtonData(30000, 40000)
             self._uut = ButtonNode('test button', self._data)
+        bumpPatcher = patch.object(ButtonNode, 'bumpRevision')
+        self._mockedBumpRevision = bumpPatcher.start()
+        self.addCleanup(bumpPatcher.stop)
 
     def test_constructorBaseClassInitAndSaveData(self) -> None:
         """
@@ -51,6 +54,7 @@ class TestButtonNode(TestCase):
         time = 3000
         self._uut.setLongPressTime(time)
         self.assertEqual(time, self._uut._data.longPressTime)
+        self._mockedBumpRevision.assert_called_once_with()
 
     def test_getInactiveTimeReturnTime(self) -> None:
         """
@@ -66,6 +70,7 @@ class TestButtonNode(TestCase):
         time = 6000
         self._uut.setInactiveTime(time)
         self.assertEqual(time, self._uut._data.inactiveTime)
+        self._mockedBumpRevision.assert_called_once_with()
 
 
 class TestButtonArrayNode(TestCase):
@@ -76,7 +81,11 @@ class TestButtonArrayNode(TestCase):
         """
         Test cases setup.
         """
-        self._BaseNodeCls = 'pkgs.ui.models.buttonNode.BaseNode'
+        self._BaseNodeCls = 'pkgs.datastore.buttonNode.BaseNode'
+        with patch(f"{self._BaseNodeCls}.__init__"):
+            self._data = ButtonArrayData(1000, 2000,
+                                         [ButtonArrayElement('BUTTON_0')])
+            self._uut = ButtonArrayNode('test node', self._data)
 
     def test_constructorBaseClassInitAndSaveData(self) -> None:
         """
@@ -91,3 +100,22 @@ class TestButtonArrayNode(TestCase):
             mockedBaseNode.assert_called_once_with(name, NodeType.BUTTON_ARRAY,
                                                    parent=parent)
             self.assertEqual(data, uut._data)
+
+    def test_getLongPressTimeReturnTime(self) -> None:
+        """
+        The getLongPressTime method must return the array long press time.
+        """
+        self.assertEqual(self._data.longPressTime,
+                         self._uut.getLongPressTime())
+
+    def test_getInactiveTimeReturnTime(self) -> None:
+        """
+        The getInactiveTime method must return the array inactive time.
+        """
+        self.assertEqual(self._data.inactiveTime, self._uut.getInactiveTime())
+
+    def test_getElementsReturnElements(self) -> None:
+        """
+        The getElements method must return the array elements.
+        """
+        self.assertEqual(self._data.elements, self._uut.getElements())
@@ -0,0 +1,96 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import ChildList                            # noqa: E402
+
+
+class TestChildList(TestCase):
+    """
+    ChildList test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._children = [Mock(), Mock(), Mock()]
+        self._uut = ChildList(self._children)
+
+    def _assertRows(self) -> None:
+        """
+        Assert that every child row matches its position.
+        """
+        for row, child in enumerate(self._uut):
+            self.assertEqual(row, self._uut.rowOf(child))
+
+    def test_constructorSaveChildren(self) -> None:
+        """
+        The constructor must save the initial children in order.
+        """
+        self.assertEqual(len(self._children), len(self._uut))
+        self.assertEqual(self._children, list(self._uut))
+        self._assertRows()
+
+    def test_appendKeepRowsClean(self) -> None:
+        """
+        The append method must set the row of the appended child without
+        renumbering the other children.
+        """
+        child = Mock()
+        self._uut.append(child)
+        self.assertEqual(len(self._children), child._row)
+        self.assertEqual(len(self._uut), self._uut._dirtyFrom)
+        self._assertRows()
+
+    def test_insertUpdateRows(self) -> None:
+        """
+        The insert method must insert the children at the given row and the
+        rows of the shifted children must be updated.
+        """
+        children = [Mock(), Mock()]
+        row = 1
+        self._uut.insert(row, children)
+        self.assertEqual(children, list(self._uut[row:row + len(children)]))
+        self.assertEqual(row, self._uut._dirtyFrom)
+        self._assertRows()
+
+    def test_popReturnRemovedChildren(self) -> None:
+        """
+        The pop method must remove the children starting at the given row,
+        clear their row and return them.
+        """
+        row = 1
+        removed = self._uut.pop(row, 2)
+        self.assertEqual(self._children[row:row + 2], removed)
+        self.assertEqual(1, len(self._uut))
+        for child in removed:
+            self.assertIsNone(child._row)
+            self.assertFalse(child in self._uut)
+        self._assertRows()
+
+    def test_rowOfUnknownChild(self) -> None:
+        """
+        The rowOf method must return none when the child is not in the
+        container.
+        """
+        other = ChildList([Mock()])
+        self.assertIsNone(self._uut.rowOf(Mock()))
+        self.assertIsNone(self._uut.rowOf(other[0]))
+
+    def test_rowOfDoesNotSearchChildren(self) -> None:
+        """
+        The rowOf method must return the saved row of a clean child.
+        """
+        children = Mock()
+        self._uut._children = children
+        self._uut._dirtyFrom = 3
+        child = Mock()
+        child._row = 1
+        children.__getitem__ = Mock(return_value=child)
+        children.__len__ = Mock(return_value=3)
+        self.assertEqual(1, self._uut.rowOf(child))
+        children.index.assert_not_called()
@@ -0,0 +1,284 @@
+from datetime import datetime
+from freezegun import freeze_time
+from unittest import TestCase
+from unittest.mock import call, Mock, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import DatastoreMetadata, DatastoreNode, IntData, \
+    IntNode, NodeType, ObjectListNode                           # noqa: E402
+
+
+def _initRevision(node, *args, **kwargs) -> None:
+    """
+    Mocked base class constructor, only setting the node revision.
+    """
+    node._revision = 1
+
+
+class TestDatastoreNode(TestCase):
+    """
+    DatastoreNode test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._datetimeCls = 'pkgs.datastore.datastoreNode.datetime'
+        self._BaseNodeCls = 'pkgs.datastore.datastoreNode.BaseNode'
+        self._DatastoreNodeCls = 'pkgs.datastore.datastoreNode.DatastoreNode'
+        self._MetadataCls = 'pkgs.datastore.datastoreNode.DatastoreMetadata'
+        self._ObjectListNodeCls = 'pkgs.datastore.datastoreNode.ObjectListNode'
+        self._lastModifiedTimestamp = datetime.now()
+        self._workingDir = '/path/to/store'
+        self._root = Mock()
+        metadata = DatastoreMetadata(self._lastModifiedTimestamp,
+                                     workingDir=self._workingDir)
+        self._uut = DatastoreNode('store', self._root, metadata)
+
+    def test_constructorBaseClassInitAndSaveData(self) -> None:
+        """
+        The constructor must call the base class constructor with the right
+        parameters and save the metadata.
+        """
+        root = Mock()
+        name = 'test store'
+        metadata = DatastoreMetadata(datetime.now(), '/path/to/store')
+        with patch(f"{self._BaseNodeCls}.__init__", autospec=True,
+                   side_effect=_initRevision) as mockedBaseNode:
+            uut = DatastoreNode(name, root, metadata)
+            mockedBaseNode.assert_called_once_with(uut, name, NodeType.STORE,
+                                                   parent=root)
+            self.assertEqual(metadata, uut._metadata)
+
+    def test_getLastModifiedAtReturnFormatted(self) -> None:
+        """
+        The getLastModifiedAt method must return the last modified date as a
+        string with the dd/mm/yyyy HH:MM:SS.
+        """
+        modifiedAt = self._lastModifiedTimestamp.strftime('%d/%m/%Y %H:%M:%S')
+        self.assertEqual(modifiedAt, self._uut.getLastModifiedAt())
+
+    def test_setLastModifiedAtSaveNewDateFlagChanges(self) -> None:
+        """
+        The setLastModifiedAt method must save the new timestamp and flag the
+        unsaved changes.
+        """
+        modifiedAt = datetime.now()
+        self._uut.setLastModifiedAt(modifiedAt)
+        self.assertEqual(modifiedAt, self._uut._metadata.lastModifiedAt)
+        self.assertTrue(self._uut._metadata.hasUnsavedChanges)
+
+    def test_hasUnsavedChanges(self) -> None:
+        """
+        The hasUnsavedChanges method must return true if the store has unsaved
+        changes, false otherwise.
+        """
+        flags = [True, False]
+        for flag in flags:
+            self._uut._metadata.hasUnsavedChanges = flag
+            self.assertEqual(flag, self._uut.hasUnsavedChanges())
+
+    def test_clearUnsavedChangesFlag(self) -> None:
+        """
+        The clearUnsavedChangesFlag method must the clear the unsaved changes
+        flag.
+        """
+        self._uut._metadata.hasUnsavedChanges = True
+        self._uut.clearUnsavedChangesFlag()
+        self.assertFalse(self._uut._metadata.hasUnsavedChanges)
+
+    def test_unsavedChangesFollowRevision(self) -> None:
+        """
+        The hasUnsavedChanges method must return true once an object of the
+        store is modified, until the clearUnsavedChangesFlag method marks
+        the current revision as saved.
+        """
+        store = DatastoreNode.createNewStore(ObjectListNode('', None))
+        obj = IntNode('SPEED', IntData())
+        store.getChild(0).addChild(obj)
+        store.clearUnsavedChangesFlag()
+        self.assertFalse(store.hasUnsavedChanges())
+        self.assertEqual(store.getRevision(), store.getSavedRevision())
+        obj.setDefault(12)
+        self.assertTrue(store.hasUnsavedChanges())
+        self.assertEqual([obj],
+                         store.getDirtySubtrees(store.getSavedRevision()))
+        store.clearUnsavedChangesFlag()
+        self.assertFalse(store.hasUnsavedChanges())
+
+    def test_getWorkingDirReturnWorkingDir(self) -> None:
+        """
+        The getWorkingDir method must return the store working directory.
+        """
+        self.assertEqual(self._workingDir, self._uut.getWorkingDir())
+
+    @freeze_time('Jan 14th, 2025')
+    def test_setWorkingDirSaveWorkingDir(self) -> None:
+        """
+        The setWorkingDir method must save the new working directory and update
+        the store last modified timestamp.
+        """
+        workingDir = '/new/path/to/store'
+        with patch.object(DatastoreNode, 'setLastModifiedAt') \
+                as mockedLastModifiedAt:
+            self._uut.setWorkingDir(workingDir)
+            self.assertEqual(workingDir, self._uut._metadata.workingDir)
+            mockedLastModifiedAt.assert_called_once_with(datetime(2025, 1, 14))
+
+    def test_getMetadataReturnMetadata(self) -> None:
+        """
+        The getMetadata method must return the store metadata.
+        """
+        self.assertIs(self._uut._metadata, self._uut.getMetadata())
+
+    @freeze_time('Jan 14th, 2025')
+    def test_createNewStoreCreateStructure(self) -> None:
+        """
+        The createNewStore method must create all the empty object list nodes
+        and return the datastore node.
+        """
+        root = Mock()
+        storeMetadata = Mock()
+        newStore = Mock()
+        objectLists = []
+        calls = []
+        for type in NodeType:
+            if type != NodeType.STORE and type != NodeType.OBJ_LIST:
+                objectLists.append(Mock())
+                calls.append(call(type.name, newStore))
+        with patch(self._MetadataCls) as mockedStoreMetadata, \
+                patch(self._DatastoreNodeCls) as mockedStoreNode, \
+                patch(self._ObjectListNodeCls) as mockedObjListNode:
+            mockedStoreMetadata.return_value = storeMetadata
+            mockedStoreNode.return_value = newStore
+            self.assertEqual(newStore, DatastoreNode.createNewStore(root))
+            mockedStoreMetadata.assert_called_once_with(datetime(2025, 1, 14))
+            mockedStoreNode.assert_called_once_with('datastore', root,
+                                                    storeMetadata)
+            mockedObjListNode.assert_has_calls(calls)
+
+    def _createStoreObjects(self, names: list[str]) -> list[IntNode]:
+        """
+        Create a datastore with the given objects.
+
+        Param
+            names: The object names.
+
+        Return
+            The objects, in the datastore int list.
+        """
+        self._uut = DatastoreNode.createNewStore(
+            ObjectListNode('', None), metadata=DatastoreMetadata(
+                self._lastModifiedTimestamp))
+        self._intList = [self._uut.getChild(row)
+                         for row in range(self._uut.getChildCount())
+                         if self._uut.getChild(row).getName() ==
+                         NodeType.INT.name][0]
+        nodes = [IntNode(name, IntData()) for name in names]
+        self._intList.addChildrenAt(0, nodes)
+        return nodes
+
+    def test_findObjectReturnNamedObject(self) -> None:
+        """
+        The findObject method must return the object with the given name,
+        none if there is none.
+        """
+        nodes = self._createStoreObjects(['a', 'b'])
+        self.assertIs(nodes[1], self._uut.findObject('b'))
+        self.assertIsNone(self._uut.findObject('c'))
+
+    def test_nameIndexFollowsModifications(self) -> None:
+        """
+        The name index must be kept current by the object additions,
+        removals and renamings once it is built.
+        """
+        nodes = self._createStoreObjects(['a', 'b'])
+        self.assertIs(nodes[0], self._uut.findObject('a'))
+        newNode = IntNode('c', IntData())
+        self._intList.addChildAt(2, newNode)
+        self.assertIs(newNode, self._uut.findObject('c'))
+        nodes[0].setName('d')
+        self.assertIsNone(self._uut.findObject('a'))
+        self.assertIs(nodes[0], self._uut.findObject('d'))
+        self._intList.removeChildrenAt(0, 2)
+        self.assertIsNone(self._uut.findObject('d'))
+        self.assertIsNone(self._uut.findObject('b'))
+        self.assertIs(newNode, self._uut.findObject('c'))
+
+    def test_getDuplicateNamesReturnDuplicates(self) -> None:
+        """
+        The getDuplicateNames method must return the names held by more than
+        one object, until all but one of the objects are renamed.
+        """
+        nodes = self._createStoreObjects(['a', 'b', 'a', 'a'])
+        self.assertEqual(['a'], self._uut.getDuplicateNames())
+        nodes[0].setName('c')
+        self.assertEqual(['a'], self._uut.getDuplicateNames())
+        self.assertIs(nodes[2], self._uut.findObject('a'))
+        self._intList.removeChildAt(3)
+        self.assertEqual([], self._uut.getDuplicateNames())
+        self.assertIs(nodes[2], self._uut.findObject('a'))
+
+    def test_isNameAvailableCheckOtherObjects(self) -> None:
+        """
+        The isNameAvailable method must return true only if no object other
+        than the given one has the name.
+        """
+        nodes = self._createStoreObjects(['a', 'b', 'b'])
+        self.assertTrue(self._uut.isNameAvailable('c'))
+        self.assertFalse(self._uut.isNameAvailable('a'))
+        self.assertTrue(self._uut.isNameAvailable('a', nodes[0]))
+        self.assertFalse(self._uut.isNameAvailable('a', nodes[1]))
+        self.assertFalse(self._uut.isNameAvailable('b', nodes[1]))
+
+    def test_getUniqueNamesSkipUsedNames(self) -> None:
+        """
+        The getUniqueNames method must return the prefix followed by a
+        numeric suffix when it is used, skipping the used names.
+        """
+        self._createStoreObjects(['NEW_INT', 'NEW_INT_2'])
+        self.assertEqual(['NEW_INT_1', 'NEW_INT_3', 'NEW_INT_4'],
+                         self._uut.getUniqueNames('NEW_INT', 3))
+        self.assertEqual(['NEW_UINT'],
+                         self._uut.getUniqueNames('NEW_UINT', 1))
+
+    def test_objectListenersNotified(self) -> None:
+        """
+        The object listeners must be notified of the object additions,
+        removals, renamings and modifications until they are removed.
+        """
+        nodes = self._createStoreObjects(['a', 'b'])
+        listener = Mock()
+        self._uut.addObjectListener(listener)
+        newNode = IntNode('c', IntData())
+        self._intList.addChildAt(2, newNode)
+        listener.objectsAdded.assert_called_once_with([newNode])
+        nodes[0].setName('d')
+        listener.objectRenamed.assert_called_once_with(nodes[0], 'a')
+        listener.objectModified.assert_called_once_with(nodes[0])
+        nodes[1].setDefault(5)
+        listener.objectModified.assert_called_with(nodes[1])
+        self.assertEqual(2, listener.objectModified.call_count)
+        self._intList.removeChildrenAt(0, 2)
+        listener.objectsRemoved.assert_called_once_with(nodes)
+        self._uut.removeObjectListener(listener)
+        self._intList.removeChildAt(0)
+        listener.objectsRemoved.assert_called_once_with(nodes)
+
+    def test_createNewStoreWithNameAndMetadata(self) -> None:
+        """
+        The createNewStore method must use the given name and metadata.
+        """
+        root = Mock()
+        metadata = Mock()
+        with patch(self._MetadataCls) as mockedStoreMetadata, \
+                patch(self._DatastoreNodeCls) as mockedStoreNode, \
+                patch(self._ObjectListNodeCls):
+            DatastoreNode.createNewStore(root, 'firmware', metadata)
+            mockedStoreMetadata.assert_not_called()
+            mockedStoreNode.assert_called_once_with('firmware', root,
+                                                    metadata)
@@ -0,0 +1,234 @@
+from datetime import datetime
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import json
+import os
+import sys
+import yaml
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import DatastoreNode, loadDefinition, \
+    loadDefinitionFile, loadYamlDefinition, NodeType, ObjectListNode, \
+    saveDefinition, saveDefinitionFile, saveYamlDefinition, \
+    storeFromDict, storeToDict                                  # noqa: E402
+
+
+class TestDefinition(TestCase):
+    """
+    Datastore definition test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        element = {'name': 'E0', 'min': 0, 'max': 9, 'default': 3}
+        self._definition = {
+            'name': 'firmware',
+            'metadata': {'lastModifiedAt': '2025-01-14T10:30:00',
+                         'workingDir': '/path/to/store',
+                         'flashBudget': 65536, 'nvmBudget': 4096},
+            'objects': {
+                'BUTTON': [{'id': 0, 'name': 'B', 'longPressTime': 1000,
+                            'inactiveTime': 2000}],
+                'BUTTON_ARRAY': [{'id': 0, 'name': 'BA',
+                                  'longPressTime': 1500,
+                                  'inactiveTime': 2500,
+                                  'elements': ['B0', 'B1']}],
+                'FLOAT': [{'id': 0, 'name': 'F', 'min': -1.5, 'max': 1.5,
+                           'default': 0.5}],
+                'FLOAT_ARRAY': [{'id': 0, 'name': 'FA', 'inNvm': True,
+                                 'elements': [{'name': 'F0', 'min': -1.0,
+                                               'max': 1.0, 'default': 0.5}]}],
+                'INT': [{'id': 4, 'name': 'I', 'min': -10, 'max': 10,
+                         'default': 1}],
+                'INT_ARRAY': [{'id': 0, 'name': 'IA', 'inNvm': False,
+                               'elements': [element]}],
+                'MULTI_STATE': [{'id': 0, 'name': 'M', 'inNvm': True,
+                                 'default': 1,
+                                 'states': [{'name': 'OFF', 'value': 0},
+                                            {'name': 'ON', 'value': 1}]}],
+                'UINT': [{'id': 0, 'name': 'U', 'min': 0, 'max': 100,
+                          'default': 50}],
+                'UINT_ARRAY': [{'id': 0, 'name': 'UA', 'inNvm': True,
+                                'elements': [element, element]}],
+            },
+        }
+
+    def test_storeFromDictRoundTrip(self) -> None:
+        """
+        The storeFromDict function must create every object of the definition
+        and storeToDict must give the definition back.
+        """
+        store = storeFromDict(self._definition)
+        self.assertIsInstance(store, DatastoreNode)
+        self.assertEqual('firmware', store.getName())
+        self.assertEqual(datetime(2025, 1, 14, 10, 30),
+                         store.getMetadata().lastModifiedAt)
+        self.assertEqual('/path/to/store', store.getWorkingDir())
+        self.assertEqual(65536, store.getMetadata().flashBudget)
+        self.assertEqual(4096, store.getMetadata().nvmBudget)
+        self.assertFalse(store.hasUnsavedChanges())
+        for row in range(store.getChildCount()):
+            objList = store.getChild(row)
+            self.assertEqual(len(self._definition['objects'][
+                objList.getName()]), objList.getChildCount())
+            for index in range(objList.getChildCount()):
+                self.assertIs(objList, objList.getChild(index).getParent())
+        self.assertEqual(self._definition, storeToDict(store))
+
+    def test_storeFromDictMissingLists(self) -> None:
+        """
+        The storeFromDict function must create an empty object list for each
+        list missing from the definition and default the missing fields.
+        """
+        store = storeFromDict({'objects': {'INT': [{'name': 'I'}]}})
+        result = storeToDict(store)
+        self.assertEqual('datastore', result['name'])
+        self.assertNotIn('flashBudget', result['metadata'])
+        self.assertNotIn('nvmBudget', result['metadata'])
+        self.assertEqual([{'id': 0, 'name': 'I', 'min': -1000000,
+                           'max': 1000000, 'default': 0}],
+                         result['objects']['INT'])
+        for type in NodeType:
+            if type not in [NodeType.STORE, NodeType.OBJ_LIST, NodeType.INT]:
+                self.assertEqual([], result['objects'][type.name])
+
+    def test_storeFromDictObjectIds(self) -> None:
+        """
+        The storeFromDict function must keep the object ids of the definition
+        and give the next ids to the objects without id or with an id
+        already used.
+        """
+        store = storeFromDict({'objects': {'INT': [
+            {'id': 7, 'name': 'A'}, {'name': 'B'}, {'id': 2, 'name': 'C'},
+            {'id': 7, 'name': 'D'}]}})
+        nodes = [store.findObject(name) for name in 'ABCD']
+        self.assertEqual([7, 8, 2, 9], [node.getId() for node in nodes])
+
+    def test_storeFromDictInvalidDefinition(self) -> None:
+        """
+        The storeFromDict function must raise a value error when a list is
+        not supported, the definition is not shaped as a datastore or an
+        object is invalid, naming the object when it has a name.
+        """
+        datasets = [{'metadata': {'lastModifiedAt': 'yesterday'}},
+                    {'metadata': {'flashBudget': -1}},
+                    {'metadata': {'nvmBudget': '4k'}},
+                    {'objects': {'STORE': []}},
+                    {'objects': {'UNKNOWN': []}},
+                    {'objects': {'INT': [{'min': 0}]}},
+                    {'objects': {'INT': [{'name': 'I', 'unknown': 0}]}},
+                    {'objects': {'INT': [{'id': -1, 'name': 'I'}]}},
+                    {'objects': {'INT': [{'id': '1', 'name': 'I'}]}},
+                    {'objects': {'INT': ['I']}},
+                    {'objects': {'INT': {'name': 'I'}}},
+                    {'objects': [{'name': 'I'}]},
+                    {'metadata': []},
+                    []]
+        root = ObjectListNode('', None)
+        for definition in datasets:
+            with self.assertRaises(ValueError):
+                storeFromDict(definition, root)
+        self.assertEqual(0, root.getChildCount())
+        with self.assertRaisesRegex(ValueError, 'INT_ARRAY object GAINS'):
+            storeFromDict({'objects': {'INT_ARRAY': [
+                {'name': 'GAINS', 'elements': [
+                    {'name': 'P', 'min': 0, 'max': 99999999999999999999,
+                     'default': 0}]}]}})
+
+    def test_saveAndLoadDefinition(self) -> None:
+        """
+        The saveDefinition function must write the definition as JSON and
+        loadDefinition must read it back.
+        """
+        fp = StringIO()
+        saveDefinition(storeFromDict(self._definition), fp)
+        self.assertEqual(self._definition, json.loads(fp.getvalue()))
+        fp.seek(0)
+        self.assertEqual(self._definition, storeToDict(loadDefinition(fp)))
+
+    def test_saveAndLoadYamlDefinition(self) -> None:
+        """
+        The saveYamlDefinition function must write the definition as YAML
+        and loadYamlDefinition must read it back.
+        """
+        fp = StringIO()
+        saveYamlDefinition(storeFromDict(self._definition), fp)
+        self.assertEqual(self._definition, yaml.safe_load(fp.getvalue()))
+        fp.seek(0)
+        self.assertEqual(self._definition,
+                         storeToDict(loadYamlDefinition(fp)))
+
+    def test_yamlUseLibyaml(self) -> None:
+        """
+        The YAML definitions must be loaded and saved with the libyaml
+        loader and dumper when they are available.
+        """
+        if not hasattr(yaml, 'CSafeLoader'):
+            self.skipTest('libyaml is not available')
+        with patch('pkgs.datastore.definition.yaml.load') as mockedLoad, \
+                patch('pkgs.datastore.definition.yaml.dump') as mockedDump:
+            mockedLoad.return_value = self._definition
+            store = loadYamlDefinition(StringIO())
+            saveYamlDefinition(store, StringIO())
+            self.assertIs(yaml.CSafeLoader,
+                          mockedLoad.call_args.kwargs['Loader'])
+            self.assertIs(yaml.CSafeDumper,
+                          mockedDump.call_args.kwargs['Dumper'])
+
+    def test_loadYamlDefinitionYamlScalars(self) -> None:
+        """
+        The loadYamlDefinition function must accept an unquoted timestamp
+        and raise a value error naming the object when an unquoted name is
+        not loaded as a string.
+        """
+        store = loadYamlDefinition(StringIO(
+            'metadata: {lastModifiedAt: 2025-01-14 10:30:00}'))
+        self.assertEqual(datetime(2025, 1, 14, 10, 30),
+                         store.getMetadata().lastModifiedAt)
+        datasets = [
+            ('objects: {INT: [{name: ON}]}', 'INT object name True'),
+            ('objects: {MULTI_STATE: [{name: M, states: '
+             '[{name: OFF, value: 0}]}]}', 'MULTI_STATE object M'),
+            ('objects: {INT_ARRAY: [{name: IA, elements: '
+             '[{name: 1, min: 0, max: 1, default: 0}]}]}',
+             'INT_ARRAY object IA'),
+            ('objects: {BUTTON_ARRAY: [{name: BA, elements: [no]}]}',
+             'BUTTON_ARRAY object BA')]
+        for content, message in datasets:
+            with self.assertRaisesRegex(ValueError, message):
+                loadYamlDefinition(StringIO(content))
+
+    def test_loadYamlDefinitionInvalidYaml(self) -> None:
+        """
+        The loadYamlDefinition function must raise a value error when the
+        definition is not a valid YAML mapping.
+        """
+        for content in ['objects: [', '- not a mapping']:
+            with self.assertRaises(ValueError):
+                loadYamlDefinition(StringIO(content))
+
+    def test_definitionFileFormatFromExtension(self) -> None:
+        """
+        The saveDefinitionFile and loadDefinitionFile functions must pick the
+        definition format from the file extension and refuse unsupported
+        extensions.
+        """
+        store = storeFromDict(self._definition)
+        with TemporaryDirectory() as tmpDir:
+            for extension in ['json', 'yaml', 'yml', 'YAML']:
+                path = os.path.join(tmpDir, f"store.{extension}")
+                saveDefinitionFile(store, path)
+                self.assertEqual(self._definition,
+                                 storeToDict(loadDefinitionFile(path)))
+            with open(os.path.join(tmpDir, 'store.json')) as fp:
+                json.load(fp)
+            for path in ['store.txt', 'store']:
+                with self.assertRaises(ValueError):
+                    saveDefinitionFile(store, os.path.join(tmpDir, path))
+                with self.assertRaises(ValueError):
+                    loadDefinitionFile(os.path.join(tmpDir, path))
@@ -0,0 +1,181 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import DatastoreMetadata, DatastoreNode, DiffKind, \
+    FieldDiff, IntArrayData, IntArrayElement, IntArrayNode, IntData, \
+    IntNode, MultiStateData, MultiStateNode, NodeType, ObjectDiff, \
+    ObjectListNode, StateNode, StoreDiffer, diffStores          # noqa: E402
+
+
+def _createStore() -> DatastoreNode:
+    """
+    Create a datastore with int, int array and multi-state objects.
+
+    Return
+        The datastore node.
+    """
+    store = DatastoreNode.createNewStore(ObjectListNode('', None),
+                                         metadata=DatastoreMetadata(None))
+    lists = {objList.getName(): objList for objList in store.getChildren()}
+    lists[NodeType.INT.name].addChildrenAt(0, [
+        IntNode('SPEED', IntData(0, 100, 10)),
+        IntNode('TORQUE', IntData(-5, 5, 0)),
+        IntNode('FAN', IntData(0, 3, 1))])
+    lists[NodeType.INT_ARRAY.name].addChildrenAt(0, [
+        IntArrayNode('GAINS', IntArrayData(False, [
+            IntArrayElement('P', 0, 10, 1),
+            IntArrayElement('I', 0, 10, 2)]))])
+    lists[NodeType.MULTI_STATE.name].addChildrenAt(0, [
+        MultiStateNode('MODE', MultiStateData([StateNode('OFF', 0),
+                                               StateNode('ON', 1)]))])
+    return store
+
+
+def _getObject(store: DatastoreNode, type: NodeType, name: str):
+    """
+    Get an object of a datastore.
+
+    Param
+        store: The datastore node.
+        type: The object type.
+        name: The object name.
+
+    Return
+        The object node.
+    """
+    for objList in store.getChildren():
+        if objList.getName() == type.name:
+            for node in objList.getChildren():
+                if node.getName() == name:
+                    return node
+
+
+class TestStoreDiffer(TestCase):
+    """
+    StoreDiffer test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._old = _createStore()
+        self._new = _createStore()
+        self._uut = StoreDiffer()
+
+    def test_diffIdenticalStores(self) -> None:
+        """
+        The diff method must not report any difference between datastores
+        with the same objects.
+        """
+        self.assertEqual([], self._uut.diff(self._old, self._new))
+
+    def test_diffAddedRemovedRenamed(self) -> None:
+        """
+        The diff method must report the added and removed objects, and the
+        objects renamed without other changes.
+        """
+        intList = _getObject(self._new, NodeType.INT, 'SPEED').getParent()
+        intList.addChild(IntNode('PUMP', IntData()))
+        _getObject(self._new, NodeType.INT, 'TORQUE').setName('FORCE')
+        intList.removeChildAt(2)
+        self.assertEqual([
+            ObjectDiff(DiffKind.RENAMED, NodeType.INT, 'FORCE', 'TORQUE'),
+            ObjectDiff(DiffKind.ADDED, NodeType.INT, 'PUMP'),
+            ObjectDiff(DiffKind.REMOVED, NodeType.INT, 'FAN'),
+        ], self._uut.diff(self._old, self._new))
+
+    def test_diffModifiedFields(self) -> None:
+        """
+        The diff method must report the modified fields, array elements and
+        states of the objects matched by name.
+        """
+        _getObject(self._new, NodeType.INT, 'SPEED').setDefault(20)
+        gains = _getObject(self._new, NodeType.INT_ARRAY, 'GAINS')
+        gains.getElements()[1].max = 20
+        gains.getElements().append(IntArrayElement('D', 0, 10, 3))
+        mode = _getObject(self._new, NodeType.MULTI_STATE, 'MODE')
+        mode.getStateList()[1].setValue(2)
+        mode.getStateList().pop(0)
+        self.assertEqual([
+            ObjectDiff(DiffKind.MODIFIED, NodeType.INT, 'SPEED',
+                       fields=[FieldDiff('default', 10, 20)]),
+            ObjectDiff(DiffKind.MODIFIED, NodeType.INT_ARRAY, 'GAINS',
+                       fields=[FieldDiff('elements.I.max', 10, 20),
+                               FieldDiff('elements.D', None,
+                                         {'name': 'D', 'min': 0, 'max': 10,
+                                          'default': 3})]),
+            ObjectDiff(DiffKind.MODIFIED, NodeType.MULTI_STATE, 'MODE',
+                       fields=[FieldDiff('states.ON.value', 1, 2),
+                               FieldDiff('states.OFF',
+                                         {'name': 'OFF', 'value': 0},
+                                         None)]),
+        ], self._uut.diff(self._old, self._new))
+
+    def test_diffEqualPythonHashes(self) -> None:
+        """
+        The diff method must compare the object contents, not their Python
+        hashes, which are equal for -1 and -2.
+        """
+        self.assertEqual(hash(-1), hash(-2))
+        torque = _getObject(self._old, NodeType.INT, 'TORQUE')
+        torque.setMinimum(-1)
+        self._uut.diff(self._old, self._new)
+        _getObject(self._new, NodeType.INT, 'TORQUE').setMinimum(-2)
+        self.assertEqual([
+            ObjectDiff(DiffKind.MODIFIED, NodeType.INT, 'TORQUE',
+                       fields=[FieldDiff('min', -1, -2)]),
+        ], self._uut.diff(self._old, self._new))
+        torque.setName('FORCE')
+        self.assertEqual([
+            ObjectDiff(DiffKind.ADDED, NodeType.INT, 'TORQUE'),
+            ObjectDiff(DiffKind.REMOVED, NodeType.INT, 'FORCE'),
+        ], self._uut.diff(self._old, self._new))
+
+    def test_diffReorderedElements(self) -> None:
+        """
+        The diff method must report the reordered array elements.
+        """
+        gains = _getObject(self._new, NodeType.INT_ARRAY, 'GAINS')
+        gains.getElements().append(gains.getElements().pop(0))
+        self.assertEqual([
+            ObjectDiff(DiffKind.MODIFIED, NodeType.INT_ARRAY, 'GAINS',
+                       fields=[FieldDiff('elements', ['P', 'I'],
+                                         ['I', 'P'])]),
+        ], self._uut.diff(self._old, self._new))
+
+    def test_diffSkipUnchangedLists(self) -> None:
+        """
+        The diff method must only compare the objects of the lists whose
+        hash changed, and only hash the objects modified since the previous
+        diff.
+        """
+        self._uut.diff(self._old, self._new)
+        speed = _getObject(self._new, NodeType.INT, 'SPEED')
+        speed.setDefault(20)
+        numberKey = Mock(return_value=())
+        with patch.object(StoreDiffer, '_diffLists',
+                          autospec=True, return_value=[]) as mockedDiffLists, \
+                patch.dict('pkgs.datastore.diff._CONTENT_KEYS',
+                           {NodeType.INT: numberKey}):
+            self._uut.diff(self._old, self._new)
+            self.assertEqual(1, mockedDiffLists.call_count)
+            self.assertEqual(NodeType.INT, mockedDiffLists.call_args.args[1])
+            numberKey.assert_called_once_with(speed)
+
+    def test_diffMissingList(self) -> None:
+        """
+        The diff function must report every object of a list missing from
+        one of the datastores.
+        """
+        self._old.removeChildAt(self._old.getChildren().index(
+            _getObject(self._old, NodeType.INT, 'SPEED').getParent()))
+        self.assertEqual([
+            ObjectDiff(DiffKind.ADDED, NodeType.INT, 'SPEED'),
+            ObjectDiff(DiffKind.ADDED, NodeType.INT, 'TORQUE'),
+            ObjectDiff(DiffKind.ADDED, NodeType.INT, 'FAN'),
+        ], diffStores(self._old, self._new))
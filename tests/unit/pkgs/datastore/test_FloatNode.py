@@ -6,7 +6,7 @@ import sys
 
 sys.path.append(os.path.abspath('./src'))
 
-from pkgs.ui.models import FloatArrayData, FloatArrayElement, \
+from pkgs.datastore import FloatArrayData, FloatArrayElement, \
     FloatArrayNode, FloatData, FloatNode, NodeType              # noqa: E402
 
 
@@ -18,10 +18,13 @@ class TestFloatNode(TestCase):
         """
         Test cases setup.
         """
-        self._BaseNodeCls = 'pkgs.ui.models.intNode.BaseNode'
+        self._BaseNodeCls = 'pkgs.datastore.intNode.BaseNode'
         with patch(f"{self._BaseNodeCls}.__init__"):
             self._data = FloatData(0.0, 10.0, 1.0)
             self._uut = FloatNode('test node', self._data)
+        bumpPatcher = patch.object(FloatNode, 'bumpRevision')
+        self._mockedBumpRevision = bumpPatcher.start()
+        self.addCleanup(bumpPatcher.stop)
 
     def test_constructorBaseClassInitAndSaveData(self) -> None:
         """
@@ -50,6 +53,7 @@ class TestFloatNode(TestCase):
         min = -12.0
         self._uut.setMinimum(min)
         self.assertEqual(min, self._uut._data.min)
+        self._mockedBumpRevision.assert_called_once_with()
 
     def test_getMaximumReturnMax(self) -> None:
         """
@@ -64,6 +68,7 @@ class TestFloatNode(TestCase):
         max = 12.0
         self._uut.setMaximum(max)
         self.assertEqual(max, self._uut._data.max)
+        self._mockedBumpRevision.assert_called_once_with()
 
     def test_getDefaultReturnDefault(self) -> None:
         """
@@ -78,6 +83,22 @@ class TestFloatNode(TestCase):
         default = 6.0
         self._uut.setDefault(default)
         self.assertEqual(default, self._uut._data.default)
+        self._mockedBumpRevision.assert_called_once_with()
+
+
+class TestFloatArrayData(TestCase):
+    """
+    FloatArrayData class test cases.
+    """
+    def test_constructorConvertElements(self) -> None:
+        """
+        The constructor must store the given elements in columns.
+        """
+        elements = [FloatArrayElement('ELEM', 0.0, 1.0, 0.5)]
+        uut = FloatArrayData(elements=elements)
+        self.assertNotIsInstance(uut.elements, list)
+        self.assertEqual(elements, uut.elements)
+        self.assertEqual(0, len(FloatArrayData().elements))
 
 
 class TestFloatArrayNode(TestCase):
@@ -88,7 +109,10 @@ class TestFloatArrayNode(TestCase):
         """
         Test cases setup.
         """
-        self._BaseNodeCls = 'pkgs.ui.models.intNode.BaseNode'
+        self._BaseNodeCls = 'pkgs.datastore.intNode.BaseNode'
+        with patch(f"{self._BaseNodeCls}.__init__"):
+            self._data = FloatArrayData(inNvm=True)
+            self._uut = FloatArrayNode('test node', self._data)
 
     def test_constructorBaseClassInitAndSaveData(self) -> None:
         """
@@ -103,3 +127,15 @@ class TestFloatArrayNode(TestCase):
             mockedBaseNode.assert_called_once_with(name, NodeType.FLOAT_ARRAY,
                                                    parent=parent)
             self.assertEqual(data, uut._data)
+
+    def test_isInNvmReturnInNvm(self) -> None:
+        """
+        The isInNvm method must return the array non-volatile memory flag.
+        """
+        self.assertEqual(self._data.inNvm, self._uut.isInNvm())
+
+    def test_getElementsReturnElements(self) -> None:
+        """
+        The getElements method must return the array elements.
+        """
+        self.assertEqual(self._data.elements, self._uut.getElements())
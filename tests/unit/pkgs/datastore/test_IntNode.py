@@ -6,7 +6,7 @@ import sys
 
 sys.path.append(os.path.abspath('./src'))
 
-from pkgs.ui.models import IntArrayData, IntArrayElement, \
+from pkgs.datastore import IntArrayData, IntArrayElement, \
     IntArrayNode, IntData, IntNode, NodeType                    # noqa: E402
 
 
@@ -18,10 +18,13 @@ class TestIntNode(TestCase):
         """
         Test cases setup.
         """
-        self._BaseNodeCls = 'pkgs.ui.models.intNode.BaseNode'
+        self._BaseNodeCls = 'pkgs.datastore.intNode.BaseNode'
         with patch(f"{self._BaseNodeCls}.__init__"):
             self._data = IntData(0, 10, 1)
             self._uut = IntNode('test node', self._data)
+        bumpPatcher = patch.object(IntNode, 'bumpRevision')
+        self._mockedBumpRevision = bumpPatcher.start()
+        self.addCleanup(bumpPatcher.stop)
 
     def test_constructorBaseClassInitAndSaveData(self) -> None:
         """
@@ -50,6 +53,7 @@ class TestIntNode(TestCase):
         min = -12
         self._uut.setMinimum(min)
         self.assertEqual(min, self._uut._data.min)
+        self._mockedBumpRevision.assert_called_once_with()
 
     def test_getMaximumReturnMax(self) -> None:
         """
@@ -64,6 +68,7 @@ class TestIntNode(TestCase):
         max = 12
         self._uut.setMaximum(max)
         self.assertEqual(max, self._uut._data.max)
+        self._mockedBumpRevision.assert_called_once_with()
 
     def test_getDefaultReturnDefault(self) -> None:
         """
@@ -78,6 +83,22 @@ class TestIntNode(TestCase):
         default = 6
         self._uut.setDefault(default)
         self.assertEqual(default, self._uut._data.default)
+        self._mockedBumpRevision.assert_called_once_with()
+
+
+class TestIntArrayData(TestCase):
+    """
+    IntArrayData class test cases.
+    """
+    def test_constructorConvertElements(self) -> None:
+        """
+        The constructor must store the given elements in columns.
+        """
+        elements = [IntArrayElement('ELEM', 0, 10, 5)]
+        uut = IntArrayData(elements=elements)
+        self.assertNotIsInstance(uut.elements, list)
+        self.assertEqual(elements, uut.elements)
+        self.assertEqual(0, len(IntArrayData().elements))
 
 
 class TestIntArrayNode(TestCase):
@@ -88,7 +109,10 @@ class TestIntArrayNode(TestCase):
         """
         Test cases setup.
         """
-        self._BaseNodeCls = 'pkgs.ui.models.intNode.BaseNode'
+        self._BaseNodeCls = 'pkgs.datastore.intNode.BaseNode'
+        with patch(f"{self._BaseNodeCls}.__init__"):
+            self._data = IntArrayData(inNvm=True)
+            self._uut = IntArrayNode('test node', self._data)
 
     def test_constructorBaseClassInitAndSaveData(self) -> None:
         """
@@ -103,3 +127,15 @@ class TestIntArrayNode(TestCase):
             mockedBaseNode.assert_called_once_with(name, NodeType.INT_ARRAY,
                                                    parent=parent)
             self.assertEqual(data, uut._data)
+
+    def test_isInNvmReturnInNvm(self) -> None:
+        """
+        The isInNvm method must return the array non-volatile memory flag.
+        """
+        self.assertEqual(self._data.inNvm, self._uut.isInNvm())
+
+    def test_getElementsReturnElements(self) -> None:
+        """
+        The getElements method must return the array elements.
+        """
+        self.assertEqual(self._data.elements, self._uut.getElements())
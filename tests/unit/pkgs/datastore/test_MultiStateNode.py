@@ -6,7 +6,7 @@ import sys
 
 sys.path.append(os.path.abspath('./src'))
 
-from pkgs.ui.models import MultiStateData, MultiStateNode, NodeType     # noqa: E402 E501
+from pkgs.datastore import MultiStateData, MultiStateNode, NodeType     # noqa: E402 E501
 
 
 class TestMultiStateNode(TestCase):
@@ -17,10 +17,13 @@ class TestMultiStateNode(TestCase):
         """
         Test cases setup.
         """
-        self._BaseNodeCls = 'pkgs.ui.models.multiStateNode.BaseNode'
+        self._BaseNodeCls = 'pkgs.datastore.multiStateNode.BaseNode'
         with patch(f"{self._BaseNodeCls}.__init__"):
             self._data = MultiStateData()
             self._uut = MultiStateNode('test node', self._data, Mock())
+        bumpPatcher = patch.object(MultiStateNode, 'bumpRevision')
+        self._mockedBumpRevision = bumpPatcher.start()
+        self.addCleanup(bumpPatcher.stop)
 
     def test_constructorBaseClassInitAndSaveData(self) -> None:
         """
@@ -28,13 +31,15 @@ class TestMultiStateNode(TestCase):
         object data.
         """
         name = 'test node'
-        data = Mock()
+        data = MultiStateData([Mock(), Mock()])
         parent = Mock()
         with patch(f"{self._BaseNodeCls}.__init__") as mockedBaseNode:
             uut = MultiStateNode(name, data, parent)
             mockedBaseNode.assert_called_once_with(name, NodeType.MULTI_STATE,
                                                    parent=parent)
             self.assertEqual(data, uut._data)
+            for state in data.states:
+                state.setParent.assert_called_once_with(uut)
 
     def test_getStateListReturnStateList(self) -> None:
         """
@@ -55,3 +60,10 @@ class TestMultiStateNode(TestCase):
         index = 2
         self._uut.setDefaultIndex(index)
         self.assertEqual(index, self._data.default)
+        self._mockedBumpRevision.assert_called_once_with()
+
+    def test_isInNvmReturnInNvm(self) -> None:
+        """
+        The isInNvm method must return the non-volatile memory flag.
+        """
+        self.assertEqual(self._data.inNvm, self._uut.isInNvm())
@@ -0,0 +1,51 @@
+from logging import Logger
+from unittest import TestCase
+from unittest.mock import patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import NodeLoggerAdapter, getNodeLogger     # noqa: E402
+
+
+class TestNodeLogger(TestCase):
+    """
+    The node logger test cases.
+    """
+    def test_getNodeLoggerUseCategoryLogger(self) -> None:
+        """
+        The getNodeLogger function must return an adapter over the shared
+        logger of the node category.
+        """
+        category = 'INT'
+        name = 'test node'
+        with patch('pkgs.datastore.nodeLogger.getLogger') as mockedGetLogger:
+            result = getNodeLogger(category, name)
+            mockedGetLogger \
+                .assert_called_once_with(f"app.datastoreModel.{category}")
+            self.assertIsInstance(result, NodeLoggerAdapter)
+            self.assertEqual(mockedGetLogger.return_value, result.logger)
+            self.assertEqual({'node': name}, result.extra)
+
+    def test_getNodeLoggerDoesNotRegisterNodeLogger(self) -> None:
+        """
+        The getNodeLogger function must not register a logger per node.
+        """
+        getNodeLogger('UINT', 'first node')
+        getNodeLogger('UINT', 'second node')
+        loggers = Logger.manager.loggerDict
+        self.assertNotIn('app.datastoreModel.UINT.first node', loggers)
+        self.assertNotIn('app.datastoreModel.UINT.second node', loggers)
+        self.assertIn('app.datastoreModel.UINT', loggers)
+
+    def test_processPrefixNodeName(self) -> None:
+        """
+        The process method must prefix the message with the node name.
+        """
+        kwargs = {'exc_info': True}
+        uut = getNodeLogger('FLOAT', 'test node')
+        msg, resultKwargs = uut.process('message', kwargs)
+        self.assertEqual('test node: message', msg)
+        self.assertEqual(kwargs, resultKwargs)
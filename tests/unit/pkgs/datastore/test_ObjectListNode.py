@@ -0,0 +1,146 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import DatastoreNode, IntData, IntNode, NodeType, \
+    ObjectListNode                                              # noqa: E402
+
+
+def _initRevision(node, *args, **kwargs) -> None:
+    """
+    Mocked base class constructor, only setting the node revision.
+    """
+    node._revision = 1
+
+
+class TestObjectList(TestCase):
+    """
+    ObjectListNode class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._BaseNodeCls = 'pkgs.datastore.objectListNode.BaseNode'
+
+    def test_constructorBaseClassInit(self) -> None:
+        """
+        The constructor must call the base class constructor.
+        """
+        name = 'test node'
+        parent = Mock()
+        with patch(f"{self._BaseNodeCls}.__init__", autospec=True,
+                   side_effect=_initRevision) as mockedBaseNode:
+            uut = ObjectListNode(name, parent)
+            mockedBaseNode.assert_called_once_with(uut, name,
+                                                   NodeType.OBJ_LIST,
+                                                   parent=parent)
+
+    def test_objectsChangesForwardedToStore(self) -> None:
+        """
+        The object additions, removals and renamings must be forwarded to
+        the parent when it is a datastore.
+        """
+        for type in [NodeType.STORE, NodeType.OBJ_LIST]:
+            parent = Mock()
+            parent.getType.return_value = type
+            uut = ObjectListNode(NodeType.INT.name, parent)
+            child = Mock(_id=None)
+            uut._childrenAdded([child])
+            uut._childRenamed(child, 'old name')
+            uut._childrenRemoved([child])
+            if type == NodeType.STORE:
+                parent._indexObjects.assert_called_once_with([child])
+                parent._reindexObject.assert_called_once_with(child,
+                                                              'old name')
+                parent._unindexObjects.assert_called_once_with([child])
+            else:
+                parent._indexObjects.assert_not_called()
+                parent._reindexObject.assert_not_called()
+                parent._unindexObjects.assert_not_called()
+
+    def test_objectModificationsForwardedToStore(self) -> None:
+        """
+        The modification of an object must be forwarded to the parent when
+        it is a datastore.
+        """
+        for type in [NodeType.STORE, NodeType.OBJ_LIST]:
+            parent = Mock()
+            parent.getType.return_value = type
+            uut = ObjectListNode(NodeType.INT.name, parent)
+            child = Mock()
+            uut._childModified(child)
+            if type == NodeType.STORE:
+                parent._objectModified.assert_called_once_with(child)
+            else:
+                parent._objectModified.assert_not_called()
+
+    def test_getDirtySubtreesModifiedNodes(self) -> None:
+        """
+        The getDirtySubtrees method must return the modified objects, and the
+        lists whose children were added or removed, after the revision.
+        """
+        root = ObjectListNode('', None)
+        lists = [ObjectListNode(name, root) for name in ['A', 'B', 'C']]
+        for objList in lists:
+            objList.addChildrenAt(0, [IntNode(f"{objList.getName()}{index}",
+                                              IntData())
+                                      for index in range(3)])
+        revision = root.getRevision()
+        self.assertEqual([], root.getDirtySubtrees(revision))
+        lists[2].getChild(1).setDefault(5)
+        lists[0].getChild(2).setName('RENAMED')
+        self.assertEqual([lists[0].getChild(2), lists[2].getChild(1)],
+                         root.getDirtySubtrees(revision))
+        lists[2].removeChildAt(0)
+        self.assertEqual([lists[0].getChild(2), lists[2]],
+                         root.getDirtySubtrees(revision))
+        self.assertEqual([], lists[1].getDirtySubtrees(revision))
+
+    def test_objectIdsStable(self) -> None:
+        """
+        The objects added to a datastore list must get ids kept across
+        renamings and moves, and the ids of the removed objects must not be
+        given again.
+        """
+        store = DatastoreNode.createNewStore(ObjectListNode('', None))
+        uut = store.getChild(4)
+        nodes = [IntNode(f"I{index}", IntData()) for index in range(4)]
+        uut.addChildrenAt(0, nodes[:3])
+        self.assertEqual([0, 1, 2], [node.getId() for node in nodes[:3]])
+        nodes[0].setName('RENAMED')
+        uut.removeChildAt(0)
+        uut.addChild(nodes[0])
+        uut.removeChildAt(1)
+        uut.addChildAt(0, nodes[3])
+        self.assertEqual([3, 1, 0], [node.getId()
+                                     for node in uut.getChildren()])
+        self.assertEqual(4, uut.getNextId())
+
+    def test_objectIdsReassignDuplicates(self) -> None:
+        """
+        An object added with the id of another object of the list must get
+        the next id.
+        """
+        store = DatastoreNode.createNewStore(ObjectListNode('', None))
+        other = DatastoreNode.createNewStore(ObjectListNode('', None))
+        uut = store.getChild(4)
+        uut.addChild(IntNode('A', IntData()))
+        node = IntNode('B', IntData())
+        other.getChild(4).addChild(node)
+        other.getChild(4).removeChildAt(0)
+        uut.addChild(node)
+        self.assertEqual(1, node.getId())
+
+    def test_objectIdsOnlyInStore(self) -> None:
+        """
+        The lists outside of a datastore must not give ids.
+        """
+        uut = ObjectListNode(NodeType.INT.name, None)
+        node = IntNode('A', IntData())
+        uut.addChild(node)
+        self.assertIsNone(node.getId())
@@ -0,0 +1,82 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import DatastoreMetadata, DatastoreNode, IntData, \
+    IntNode, NodeType, ObjectListNode, ObjectSearchIndex, UintData, \
+    UintNode                                                    # noqa: E402
+
+
+class TestObjectSearchIndex(TestCase):
+    """
+    ObjectSearchIndex test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._store = DatastoreNode.createNewStore(
+            ObjectListNode('', None), metadata=DatastoreMetadata(None))
+        self._lists = {self._store.getChild(row).getName():
+                       self._store.getChild(row)
+                       for row in range(self._store.getChildCount())}
+        self._ints = [IntNode(name, IntData())
+                      for name in ['MOTOR_SPEED', 'motor_torque', 'FAN']]
+        self._uints = [UintNode('SPEED_LIMIT', UintData())]
+        self._lists[NodeType.INT.name].addChildrenAt(0, self._ints)
+        self._lists[NodeType.UINT.name].addChildrenAt(0, self._uints)
+        self._uut = ObjectSearchIndex()
+        self._uut.addStore(self._store)
+
+    def test_addStoreIndexObjects(self) -> None:
+        """
+        The addStore method must index every object of the datastore, and
+        the removeStore method remove them.
+        """
+        self.assertEqual(4, len(self._uut))
+        self._uut.removeStore(self._store)
+        self.assertEqual(0, len(self._uut))
+        self.assertEqual(set(), self._uut.search('speed'))
+        self.assertEqual({}, self._uut._trigrams)
+
+    def test_searchSubstringCaseInsensitive(self) -> None:
+        """
+        The search method must return the objects whose name contains the
+        text, ignoring the case, for long and short texts.
+        """
+        self.assertEqual({self._ints[0], self._ints[1]},
+                         self._uut.search('Motor'))
+        self.assertEqual({self._ints[0], self._uints[0]},
+                         self._uut.search('SPEED'))
+        self.assertEqual({self._ints[2]}, self._uut.search('an'))
+        self.assertEqual(set(), self._uut.search('speedy'))
+        self.assertEqual(set(), self._uut.search('dee'))
+
+    def test_searchTypesAndWithin(self) -> None:
+        """
+        The search method must only return the objects of the given types,
+        and only search the given objects.
+        """
+        self.assertEqual({self._uints[0]},
+                         self._uut.search('speed', {NodeType.UINT}))
+        self.assertEqual({self._ints[1]},
+                         self._uut.search('tor', within=self._ints[1:]))
+
+    def test_listenerUpdateIndex(self) -> None:
+        """
+        The object listener methods must keep the index current.
+        """
+        newNode = IntNode('PUMP', IntData())
+        self._uut.objectsAdded([newNode])
+        self.assertEqual({newNode}, self._uut.search('pum'))
+        oldName = self._ints[2].getName()
+        self._ints[2]._name = 'HEATER'
+        self._uut.objectRenamed(self._ints[2], oldName)
+        self.assertEqual(set(), self._uut.search('fan'))
+        self.assertEqual({self._ints[2]}, self._uut.search('heat'))
+        self._uut.objectsRemoved([newNode, self._ints[0]])
+        self.assertEqual(set(), self._uut.search('pump'))
+        self.assertEqual({self._ints[1]}, self._uut.search('motor'))
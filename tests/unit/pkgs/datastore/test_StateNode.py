@@ -0,0 +1,96 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import StateNode                            # noqa: E402
+
+
+class TestStateNode(TestCase):
+    """
+    The StateNode class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._getNodeLoggerFn = 'pkgs.datastore.stateNode.getNodeLogger'
+        self._name = 'test state node'
+        self._value = 12
+        self._uut = StateNode(self._name, self._value)
+
+    def test_constructorDoesNotGetLogger(self) -> None:
+        """
+        The constructor must not get a logger for the state.
+        """
+        with patch(self._getNodeLoggerFn) as mockedGetNodeLogger:
+            StateNode('test node', 12000)
+            mockedGetNodeLogger.assert_not_called()
+
+    def test_loggerReturnSharedStateLogger(self) -> None:
+        """
+        The logger must be the shared state list logger carrying the state
+        name.
+        """
+        with patch(self._getNodeLoggerFn) as mockedGetNodeLogger:
+            logger = self._uut._logger
+            mockedGetNodeLogger.assert_called_once_with('MULTI_STATE.'
+                                                        'stateList',
+                                                        self._name)
+            self.assertEqual(mockedGetNodeLogger.return_value, logger)
+
+    def test_constructorSaveNameAndValue(self) -> None:
+        name = 'test node'
+        value = 12000
+        uut = StateNode(name, value)
+        self.assertEqual(name, uut._name)
+        self.assertEqual(value, uut._value)
+
+    def test_getNameReturnName(self) -> None:
+        """
+        The getName method must return the state name.
+        """
+        self.assertEqual(self._name, self._uut.getName())
+
+    def test_setNameSaveNewName(self) -> None:
+        """
+        The setName method must save the state new name.
+        """
+        name = 'new name'
+        self._uut.setName(name)
+        self.assertEqual(name, self._uut._name)
+
+    def test_getValueReturnValue(self) -> None:
+        """
+        The getValue method must return the state value.
+        """
+        self.assertEqual(self._value, self._uut.getValue())
+
+    def test_setValueSaveNewValue(self) -> None:
+        """
+        The setValue method must save the state new value.
+        """
+        value = 0
+        self._uut.setValue(value)
+        self.assertEqual(value, self._uut._value)
+
+    def test_setParentSaveParent(self) -> None:
+        """
+        The setParent method must save the multi-state owning the state.
+        """
+        parent = Mock()
+        self._uut.setParent(parent)
+        self.assertIs(parent, self._uut.getParent())
+
+    def test_modificationsBumpParentRevision(self) -> None:
+        """
+        The setName and setValue methods must bump the parent revision.
+        """
+        parent = Mock()
+        self._uut.setParent(parent)
+        self._uut.setName('new name')
+        self._uut.setValue(1)
+        self.assertEqual(2, parent.bumpRevision.call_count)
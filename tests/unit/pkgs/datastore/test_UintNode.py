@@ -6,7 +6,7 @@ import sys
 
 sys.path.append(os.path.abspath('./src'))
 
-from pkgs.ui.models import UintArrayData, UintArrayElement, \
+from pkgs.datastore import UintArrayData, UintArrayElement, \
     UintArrayNode, UintData, UintNode, NodeType                 # noqa: E402
 
 
@@ -18,10 +18,13 @@ class TestUintNode(TestCase):
         """
         Test cases setup.
         """
-        self._BaseNodeCls = 'pkgs.ui.models.uintNode.BaseNode'
+        self._BaseNodeCls = 'pkgs.datastore.uintNode.BaseNode'
         with patch(f"{self._BaseNodeCls}.__init__"):
             self._data = UintData(0, 10, 1)
             self._uut = UintNode('test node', self._data)
+        bumpPatcher = patch.object(UintNode, 'bumpRevision')
+        self._mockedBumpRevision = bumpPatcher.start()
+        self.addCleanup(bumpPatcher.stop)
 
     def test_constructorBaseClassInitAndSaveData(self) -> None:
         """
@@ -50,6 +53,7 @@ class TestUintNode(TestCase):
         min = 2
         self._uut.setMinimum(min)
         self.assertEqual(min, self._uut._data.min)
+        self._mockedBumpRevision.assert_called_once_with()
 
     def test_getMaximumReturnMax(self) -> None:
         """
@@ -64,6 +68,7 @@ class TestUintNode(TestCase):
         max = 12
         self._uut.setMaximum(max)
         self.assertEqual(max, self._uut._data.max)
+        self._mockedBumpRevision.assert_called_once_with()
 
     def test_getDefaultReturnDefault(self) -> None:
         """
@@ -78,6 +83,22 @@ class TestUintNode(TestCase):
         default = 6
         self._uut.setDefault(default)
         self.assertEqual(default, self._uut._data.default)
+        self._mockedBumpRevision.assert_called_once_with()
+
+
+class TestUintArrayData(TestCase):
+    """
+    UintArrayData class test cases.
+    """
+    def test_constructorConvertElements(self) -> None:
+        """
+        The constructor must store the given elements in columns.
+        """
+        elements = [UintArrayElement('ELEM', 0, 10, 5)]
+        uut = UintArrayData(elements=elements)
+        self.assertNotIsInstance(uut.elements, list)
+        self.assertEqual(elements, uut.elements)
+        self.assertEqual(0, len(UintArrayData().elements))
 
 
 class TestUintArrayNode(TestCase):
@@ -88,7 +109,10 @@ class TestUintArrayNode(TestCase):
         """
         Test cases setup.
         """
-        self._BaseNodeCls = 'pkgs.ui.models.datastoreNode.BaseNode'
+        self._BaseNodeCls = 'pkgs.datastore.datastoreNode.BaseNode'
+        with patch(f"{self._BaseNodeCls}.__init__"):
+            self._data = UintArrayData(inNvm=True)
+            self._uut = UintArrayNode('test node', self._data)
 
     def test_constructorBaseClassInitAndSaveData(self) -> None:
         """
@@ -103,3 +127,15 @@ class TestUintArrayNode(TestCase):
             mockedBaseNode.assert_called_once_with(name, NodeType.UINT_ARRAY,
                                                    parent=parent)
             self.assertEqual(data, uut._data)
+
+    def test_isInNvmReturnInNvm(self) -> None:
+        """
+        The isInNvm method must return the array non-volatile memory flag.
+        """
+        self.assertEqual(self._data.inNvm, self._uut.isInNvm())
+
+    def test_getElementsReturnElements(self) -> None:
+        """
+        The getElements method must return the array elements.
+        """
+        self.assertEqual(self._data.elements, self._uut.getElements())
@@ -0,0 +1,167 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import FieldChange, IntData, IntNode, storeFromDict, \
+    UndoStack                                                   # noqa: E402
+
+
+class TestUndoStack(TestCase):
+    """
+    UndoStack test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._int = IntNode('SPEED', IntData(default=0, min=-100, max=100))
+        self._uut = UndoStack()
+
+    def test_pushApplyChange(self) -> None:
+        """
+        The push method must apply the change and make it undoable.
+        """
+        self._uut.push(FieldChange(self._int, 'Default', 0, 5))
+        self.assertEqual(5, self._int.getDefault())
+        self.assertTrue(self._uut.canUndo())
+        self.assertFalse(self._uut.canRedo())
+        self.assertGreater(self._uut.getMemoryUsage(), 0)
+
+    def test_undoRedoRestoreValues(self) -> None:
+        """
+        The undo method must restore the value before the change and the redo
+        method the value after it, returning the change or none when there
+        is nothing to undo or redo.
+        """
+        self._uut.pushFieldChange(self._int, 'Default', 5)
+        self._uut.pushFieldChange(self._int, 'Name', 'TORQUE')
+        self.assertEqual('Name', self._uut.undo().field)
+        self.assertEqual('SPEED', self._int.getName())
+        self.assertEqual('Default', self._uut.undo().field)
+        self.assertEqual(0, self._int.getDefault())
+        self.assertIsNone(self._uut.undo())
+        self.assertEqual('Default', self._uut.redo().field)
+        self.assertEqual(5, self._int.getDefault())
+        self.assertEqual('Name', self._uut.redo().field)
+        self.assertEqual('TORQUE', self._int.getName())
+        self.assertIsNone(self._uut.redo())
+
+    def test_undoRedoRefuseUsedName(self) -> None:
+        """
+        The undo and redo methods must raise a value error, without changing
+        the object or the recorded changes, when the restored name is used
+        by another object.
+        """
+        store = storeFromDict({'objects': {'INT': [
+            {'name': 'A', 'min': 0, 'max': 1, 'default': 0},
+            {'name': 'C', 'min': 0, 'max': 1, 'default': 0}]}})
+        intA, intC = store.findObject('A'), store.findObject('C')
+        self._uut.pushFieldChange(intA, 'Name', 'B')
+        intC.setName('A')
+        with self.assertRaises(ValueError):
+            self._uut.undo()
+        self.assertEqual(['B', 'A'], [intA.getName(), intC.getName()])
+        self.assertEqual(1, self._uut.getUndoCount())
+        self.assertFalse(self._uut.canRedo())
+        intC.setName('C')
+        self.assertEqual('Name', self._uut.undo().field)
+        self.assertEqual('A', intA.getName())
+        intC.setName('B')
+        with self.assertRaises(ValueError):
+            self._uut.redo()
+        self.assertEqual(['A', 'B'], [intA.getName(), intC.getName()])
+        self.assertTrue(self._uut.canRedo())
+        self.assertEqual([], store.getDuplicateNames())
+
+    def test_pushClearRedo(self) -> None:
+        """
+        The push method must drop the undone changes.
+        """
+        self._uut.pushFieldChange(self._int, 'Default', 5)
+        self._uut.undo()
+        self._uut.pushFieldChange(self._int, 'Minimum', -50)
+        self.assertFalse(self._uut.canRedo())
+        self.assertEqual(1, self._uut.getUndoCount())
+
+    def test_pushFieldChangeIgnoreSameValue(self) -> None:
+        """
+        The pushFieldChange method must not record a change keeping the
+        field value.
+        """
+        self._uut.pushFieldChange(self._int, 'Default', 0)
+        self.assertFalse(self._uut.canUndo())
+
+    def test_pushMergeSuccessiveChanges(self) -> None:
+        """
+        The push method must merge the successive mergeable changes of the
+        same field of the same node only.
+        """
+        other = IntNode('TORQUE', IntData())
+        for value in range(1, 6):
+            self._uut.pushFieldChange(self._int, 'Default', value, merge=True)
+        self.assertEqual(1, self._uut.getUndoCount())
+        self._uut.pushFieldChange(self._int, 'Maximum', 50, merge=True)
+        self._uut.pushFieldChange(other, 'Maximum', 50, merge=True)
+        self._uut.pushFieldChange(other, 'Maximum', 60)
+        self.assertEqual(4, self._uut.getUndoCount())
+        self._uut.undo()
+        self._uut.undo()
+        self._uut.undo()
+        self._uut.undo()
+        self.assertEqual(0, self._int.getDefault())
+
+    def test_pushNotMergeAfterUndo(self) -> None:
+        """
+        The push method must not merge a change into a change undone and
+        redone since.
+        """
+        self._uut.pushFieldChange(self._int, 'Default', 1, merge=True)
+        self._uut.pushFieldChange(self._int, 'Default', 2, merge=True)
+        self._uut.undo()
+        self._uut.redo()
+        self._uut.pushFieldChange(self._int, 'Default', 3, merge=True)
+        self.assertEqual(2, self._uut.getUndoCount())
+        self._uut.undo()
+        self.assertEqual(2, self._int.getDefault())
+
+    def test_pushDropOldestChanges(self) -> None:
+        """
+        The push method must drop the oldest changes when the changes use
+        more memory than the budget.
+        """
+        size = FieldChange(self._int, 'Default', 0, 1).getSize()
+        uut = UndoStack(memoryBudget=3 * size)
+        for value in range(1, 11):
+            uut.pushFieldChange(self._int, 'Default', value)
+        self.assertEqual(3, uut.getUndoCount())
+        self.assertLessEqual(uut.getMemoryUsage(), 3 * size)
+        while uut.undo() is not None:
+            pass
+        self.assertEqual(7, self._int.getDefault())
+
+    def test_zeroBudgetApplyWithoutRecording(self) -> None:
+        """
+        A stack without memory budget must apply the changes without
+        recording them.
+        """
+        uut = UndoStack(0)
+        uut.pushFieldChange(self._int, 'Default', 5, merge=True)
+        uut.pushFieldChange(self._int, 'Default', 6, merge=True)
+        self.assertEqual(6, self._int.getDefault())
+        self.assertFalse(uut.canUndo())
+        self.assertEqual(0, uut.getMemoryUsage())
+
+    def test_clearDropChanges(self) -> None:
+        """
+        The clear method must drop every change.
+        """
+        self._uut.pushFieldChange(self._int, 'Default', 5)
+        self._uut.pushFieldChange(self._int, 'Default', 6)
+        self._uut.undo()
+        self._uut.clear()
+        self.assertFalse(self._uut.canUndo())
+        self.assertFalse(self._uut.canRedo())
+        self.assertEqual(0, self._uut.getMemoryUsage())
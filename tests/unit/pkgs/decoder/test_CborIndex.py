@@ -0,0 +1,92 @@
+from unittest import TestCase
+
+import cbor2
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.decoder import indexObjects, readHead, readText, \
+    skipItem                                                    # noqa: E402
+
+
+class TestCborIndex(TestCase):
+    """
+    CBOR index helpers test cases.
+    """
+    def test_readHead(self) -> None:
+        """
+        The readHead function must return the major type, the argument and
+        the offset following the head for every argument size.
+        """
+        datasets = [(0, 0), (23, 0), (24, 0), (255, 0), (256, 0),
+                    (65536, 0), (1 << 40, 0), (-1, 1), (-1000, 1)]
+        for value, major in datasets:
+            data = cbor2.dumps(value)
+            self.assertEqual((major, value if value >= 0 else -1 - value,
+                              len(data)), readHead(data, 0))
+
+    def test_readHeadInvalidData(self) -> None:
+        """
+        The readHead function must raise a value error on truncated data and
+        indefinite lengths.
+        """
+        for data in [b'', b'\x19\x01', b'\x9f']:
+            with self.assertRaises(ValueError):
+                readHead(data, 0)
+
+    def test_readText(self) -> None:
+        """
+        The readText function must decode a text string and refuse other
+        data items.
+        """
+        data = cbor2.dumps('héllo') + b'\x00'
+        self.assertEqual(('héllo', len(data) - 1), readText(data, 0))
+        with self.assertRaises(ValueError):
+            readText(cbor2.dumps(b'bytes'), 0)
+
+    def test_skipItem(self) -> None:
+        """
+        The skipItem function must return the offset following any definite
+        length data item.
+        """
+        datasets = [0, -5, 1 << 33, 1.5, True, None, 'text', b'\x00' * 300,
+                    [1, [2, 3], {'a': 'b'}],
+                    {'name': 'X', 'values': cbor2.CBORTag(79, b'\x01' * 8)},
+                    [[]] * 30]
+        for value in datasets:
+            data = cbor2.dumps(value)
+            self.assertEqual(len(data), skipItem(data + b'\xff', 0))
+
+    def test_skipItemTruncatedData(self) -> None:
+        """
+        The skipItem function must raise a value error on truncated data.
+        """
+        data = cbor2.dumps({'name': 'X', 'values': [1, 2, 3]})
+        for end in [1, 5, len(data) - 1]:
+            with self.assertRaises(ValueError):
+                skipItem(data[:end], 0)
+
+    def test_indexObjects(self) -> None:
+        """
+        The indexObjects function must return the offsets of the objects of
+        every object list, ending with the end offset of the list.
+        """
+        objects = [{'name': 'A'}, {'name': 'B', 'values': [1, 2]}]
+        data = cbor2.dumps({'INT': objects, 'FLOAT': []})
+        index = indexObjects(data)
+        self.assertEqual(['INT', 'FLOAT'], list(index))
+        self.assertEqual(3, len(index['INT']))
+        self.assertEqual(1, len(index['FLOAT']))
+        self.assertEqual(objects, [
+            cbor2.loads(data[index['INT'][row]:index['INT'][row + 1]])
+            for row in range(2)])
+
+    def test_indexObjectsInvalidData(self) -> None:
+        """
+        The indexObjects function must raise a value error on data other than
+        a map of object lists.
+        """
+        for value in [[1, 2], {'INT': 1}]:
+            with self.assertRaises(ValueError):
+                indexObjects(cbor2.dumps(value))
@@ -0,0 +1,351 @@
+from io import BytesIO
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import Mock
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import BaseNode, IntData, IntNode, NodeType, \
+    ObjectSearchIndex, storeFromDict, storeToDict               # noqa: E402
+from pkgs.decoder import getNameTablePath, LazyChildList, \
+    LazyDatastoreReader, LazyObjectListNode                     # noqa: E402
+from pkgs.encoder import DatastoreEncoder                       # noqa: E402
+
+
+class TestLazyChildList(TestCase):
+    """
+    LazyChildList test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._owner = BaseNode('list', NodeType.OBJ_LIST)
+        self._load = Mock(side_effect=lambda index:
+                          IntNode(f"INT_{index}", IntData()))
+        self._uut = LazyChildList(self._owner, 5, self._load)
+
+    def test_getItemLoadOnce(self) -> None:
+        """
+        The children must be created once, on their first access, with their
+        parent and row.
+        """
+        self.assertEqual(5, len(self._uut))
+        self._load.assert_not_called()
+        child = self._uut[3]
+        self.assertIs(child, self._uut[-2])
+        self._load.assert_called_once_with(3)
+        self.assertIs(self._owner, child.getParent())
+        self.assertEqual(3, self._uut.rowOf(child))
+        self.assertTrue(self._uut.isLoaded(3))
+        self.assertFalse(self._uut.isLoaded(2))
+        with self.assertRaises(IndexError):
+            self._uut[5]
+
+    def test_rowOfUnknownChild(self) -> None:
+        """
+        The rowOf method must return none for a child that is not in the
+        container.
+        """
+        child = IntNode('OTHER', IntData())
+        child._row = 1
+        self.assertIsNone(self._uut.rowOf(child))
+        self.assertFalse(child in self._uut)
+
+    def test_modificationLoadEveryChild(self) -> None:
+        """
+        The first modification must create every child and then behave like
+        a child list.
+        """
+        first = self._uut[0]
+        new = IntNode('NEW', IntData())
+        self._uut.insert(1, [new])
+        self.assertEqual(5, self._load.call_count)
+        self.assertEqual(6, len(self._uut))
+        self.assertIs(first, self._uut[0])
+        self.assertEqual(1, self._uut.rowOf(new))
+        self.assertEqual(['INT_0', 'NEW', 'INT_1', 'INT_2', 'INT_3',
+                          'INT_4'], [child.getName() for child in self._uut])
+        self.assertEqual([new], self._uut.pop(1))
+        self.assertTrue(self._uut.isLoaded(4))
+
+
+class TestLazyDatastoreReader(TestCase):
+    """
+    LazyDatastoreReader test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        element = {'name': 'E0', 'min': -3, 'max': 9, 'default': 3}
+        self._objects = {
+            'BUTTON': [{'name': 'B', 'longPressTime': 1000,
+                        'inactiveTime': 2000}],
+            'BUTTON_ARRAY': [{'name': 'BA', 'longPressTime': 1500,
+                              'inactiveTime': 2500,
+                              'elements': ['B0', 'B1']}],
+            'FLOAT': [{'name': 'F', 'min': -1.5, 'max': 1.5,
+                       'default': 0.5}],
+            'FLOAT_ARRAY': [{'name': 'FA', 'inNvm': True,
+                             'elements': [{'name': 'F0', 'min': -1.0,
+                                           'max': 1.0, 'default': 0.5}]}],
+            'INT': [{'name': f"I{index}", 'min': -index, 'max': index,
+                     'default': 0} for index in range(10)],
+            'INT_ARRAY': [{'name': 'IA', 'inNvm': False,
+                           'elements': [element, element]}],
+            'MULTI_STATE': [{'name': 'M', 'inNvm': True, 'default': 1,
+                             'states': [{'name': 'OFF', 'value': 0},
+                                        {'name': 'ON', 'value': 1}]}],
+            'UINT': [],
+            'UINT_ARRAY': [{'name': 'UA', 'inNvm': True,
+                            'elements': [{'name': 'U0', 'min': 0,
+                                          'max': 1 << 40, 'default': 7}]}],
+        }
+        self._tmpDir = TemporaryDirectory()
+        self._path = os.path.join(self._tmpDir.name, 'device.cbor')
+        self._encode(storeFromDict({'objects': self._objects}))
+
+    def _encode(self, store) -> None:
+        """
+        Encode a datastore to the test file, with its name table.
+
+        Param
+            store: The datastore node.
+        """
+        with open(self._path, 'wb') as fp, \
+                open(getNameTablePath(self._path), 'wb') as nameFp:
+            DatastoreEncoder(fp, nameFp).encode(store)
+
+    def tearDown(self) -> None:
+        """
+        Test cases teardown.
+        """
+        self._tmpDir.cleanup()
+
+    def test_constructorIndexObjects(self) -> None:
+        """
+        The constructor must index every object of every object list.
+        """
+        with LazyDatastoreReader(self._path) as uut:
+            self.assertEqual(list(self._objects), uut.getListNames())
+            self.assertEqual(sum(len(objects) for objects in
+                                 self._objects.values()),
+                             uut.getObjectCount())
+            self.assertEqual(10, uut.getObjectCount('INT'))
+            start, end = uut.getObjectSpan('INT', 3)
+            self.assertEqual((end, uut.getObjectSpan('INT', 4)[1]),
+                             uut.getObjectSpan('INT', 4))
+            with self.assertRaises(IndexError):
+                uut.getObjectSpan('INT', 10)
+
+    def test_decodeObject(self) -> None:
+        """
+        The decodeObject method must decode a single object.
+        """
+        expected = dict(self._objects['INT'][7])
+        del expected['name']
+        with LazyDatastoreReader(self._path) as uut:
+            self.assertEqual(expected, uut.decodeObject('INT', 7))
+
+    def test_peekObject(self) -> None:
+        """
+        The peekObject method must read the id, encoded size and scalar
+        fields of an object, the arrays by their item count, in both
+        encodings, and the lazy object lists must peek at their objects
+        until they are created.
+        """
+        expected = {
+            ('INT', 7): {'min': -7, 'max': 7, 'default': 0},
+            ('FLOAT', 0): {'min': -1.5, 'max': 1.5, 'default': 0.5},
+            ('BUTTON_ARRAY', 0): {'longPressTime': 1500,
+                                  'inactiveTime': 2500, 'elements': 2},
+            ('UINT_ARRAY', 0): {'inNvm': True, 'elements': 1},
+            ('MULTI_STATE', 0): {'inNvm': True, 'default': 1, 'states': 2},
+        }
+        for compact in (False, True):
+            with open(self._path, 'wb') as fp:
+                DatastoreEncoder(fp, compact=compact).encode(
+                    storeFromDict({'objects': self._objects}))
+            with LazyDatastoreReader(self._path) as uut:
+                for (listName, index), fields in expected.items():
+                    start, end = uut.getObjectSpan(listName, index)
+                    self.assertEqual((index, end - start, fields),
+                                     uut.peekObject(listName, index))
+                intList = uut.createStore().getChild(4)
+                self.assertEqual(uut.peekObject('INT', 3),
+                                 intList.peekChild(3))
+                intList.getChild(3)
+                self.assertIsNone(intList.peekChild(3))
+
+    def test_createStoreLoadOnAccess(self) -> None:
+        """
+        The createStore method must create a datastore with every object
+        list, creating the objects only when they are accessed.
+        """
+        with LazyDatastoreReader(self._path) as uut:
+            store = uut.createStore()
+            self.assertEqual('device', store.getName())
+            self.assertFalse(store.hasUnsavedChanges())
+            intList = store.getChild(4)
+            self.assertIsInstance(intList, LazyObjectListNode)
+            self.assertEqual(10, intList.getChildCount())
+            self.assertFalse(intList._children.isLoaded(5))
+            self.assertEqual('I5', intList.getChild(5).getName())
+            self.assertEqual(5, intList.getChild(5).getRow())
+            self.assertFalse(intList._children.isLoaded(4))
+            self.assertEqual(storeToDict(storeFromDict(
+                {'objects': self._objects}))['objects'],
+                storeToDict(store)['objects'])
+
+    def test_createStoreCompact(self) -> None:
+        """
+        The objects of the compact encoding must be decoded to the same
+        definitions.
+        """
+        self._objects['INT_ARRAY'][0]['elements'].append(
+            {'name': 'E0_MAX', 'min': 0, 'max': 1 << 40, 'default': 0})
+        self._objects['MULTI_STATE'][0]['states'].append(
+            {'name': 'ON_HIGH', 'value': 2})
+        store = storeFromDict({'objects': self._objects})
+        with open(self._path, 'wb') as fp:
+            DatastoreEncoder(fp, compact=True).encode(store)
+        with LazyDatastoreReader(self._path) as uut:
+            self.assertEqual(storeToDict(store)['objects'],
+                             storeToDict(uut.createStore())['objects'])
+
+    def test_createStoreKeepIds(self) -> None:
+        """
+        The objects must be created with their id, skipping the ids no object
+        has, and the objects added to a list must get the next id.
+        """
+        store = storeFromDict({'objects': self._objects})
+        intList = store.getChild(4)
+        intList.removeChildAt(5)
+        intList.removeChildAt(3)
+        self._encode(store)
+        with LazyDatastoreReader(self._path) as uut:
+            intList = uut.createStore().getChild(4)
+            self.assertEqual(8, intList.getChildCount())
+            self.assertEqual(('I4', 4), (intList.getChild(3).getName(),
+                                         intList.getChild(3).getId()))
+            intList.addChild(IntNode('NEW', IntData()))
+            self.assertEqual(10, intList.getChild(8).getId())
+
+    def test_createStoreWithoutNameTable(self) -> None:
+        """
+        Without name table, the objects must be named after their list and
+        id.
+        """
+        os.remove(getNameTablePath(self._path))
+        with LazyDatastoreReader(self._path) as uut:
+            self.assertEqual('INT_5', uut.getObjectName('INT', 5))
+            self.assertEqual('INT_5',
+                             uut.createStore().getChild(4).getChild(5)
+                             .getName())
+
+    def test_nameTableMismatch(self) -> None:
+        """
+        The constructor must raise a value error when the name table does not
+        match the encoded datastore.
+        """
+        store = storeFromDict({'objects': self._objects})
+        store.getChild(4).removeChildAt(9)
+        with open(getNameTablePath(self._path), 'wb') as nameFp:
+            DatastoreEncoder(BytesIO(), nameFp).encode(store)
+        with self.assertRaises(ValueError):
+            LazyDatastoreReader(self._path)
+
+    def test_createStoreDirtySubtrees(self) -> None:
+        """
+        The objects created when accessed must not be dirty, and only the
+        created objects must be checked for modifications.
+        """
+        with LazyDatastoreReader(self._path) as uut:
+            store = uut.createStore()
+            intList = store.getChild(4)
+            revision = store.getSavedRevision()
+            intList.getChild(2)
+            self.assertEqual([], store.getDirtySubtrees(revision))
+            intList.getChild(5).setDefault(3)
+            self.assertTrue(store.hasUnsavedChanges())
+            self.assertEqual([intList.getChild(5)],
+                             store.getDirtySubtrees(revision))
+            self.assertFalse(intList._children.isLoaded(4))
+
+    def test_createStoreIndexNamesWithoutLoading(self) -> None:
+        """
+        The name index of the datastore must be built from the name table,
+        creating only the objects found or renamed.
+        """
+        with LazyDatastoreReader(self._path) as uut:
+            store = uut.createStore()
+            intList = store.getChild(4)
+            self.assertIs(intList.getChild(2), store.findObject('I2'))
+            self.assertIs(intList.getChild(7), store.findObject('I7'))
+            self.assertIsNone(store.findObject('I10'))
+            self.assertFalse(store.isNameAvailable('I5'))
+            self.assertTrue(store.isNameAvailable('I7', intList.getChild(7)))
+            self.assertEqual(['I9_1'], store.getUniqueNames('I9', 1))
+            intList.getChild(7).setName('I5')
+            self.assertEqual(['I5'], store.getDuplicateNames())
+            self.assertFalse(store.isNameAvailable('I5', intList.getChild(7)))
+            self.assertTrue(store.isNameAvailable('I7'))
+            self.assertEqual([intList.getChild(2), intList.getChild(7)],
+                             intList._children.getLoadedChildren())
+            self.assertIs(intList.getChild(5), store.findObject('I5'))
+
+    def test_createStoreIndexNamesAfterModification(self) -> None:
+        """
+        The name index of the datastore must stay current once a lazily read
+        object list is modified.
+        """
+        with LazyDatastoreReader(self._path) as uut:
+            store = uut.createStore()
+            intList = store.getChild(4)
+            intList.getChild(3).setName('I4')
+            self.assertFalse(store.isNameAvailable('I4', intList.getChild(3)))
+            intList.removeChildAt(4)
+            self.assertIs(intList.getChild(3), store.findObject('I4'))
+            self.assertTrue(store.isNameAvailable('I4', intList.getChild(3)))
+            self.assertEqual([], store.getDuplicateNames())
+            self.assertIs(intList.getChild(4), store.findObject('I5'))
+            self.assertIs(intList.getChild(8), store.findObject('I9'))
+            intList.getChild(8).setName('I9_NEW')
+            self.assertIsNone(store.findObject('I9'))
+            self.assertIs(intList.getChild(8), store.findObject('I9_NEW'))
+
+    def test_createStoreSearchWithoutLoading(self) -> None:
+        """
+        The search index must index the objects from the name table,
+        creating only the matching objects, and keep them once the object
+        list creates every object.
+        """
+        with LazyDatastoreReader(self._path) as uut:
+            store = uut.createStore()
+            intList = store.getChild(4)
+            index = ObjectSearchIndex()
+            index.addStore(store)
+            store.addObjectListener(index)
+            self.assertEqual({intList.getChild(5)}, index.search('i5'))
+            self.assertEqual(set(), index.search('i', {NodeType.UINT}))
+            self.assertEqual([intList.getChild(5)],
+                             intList._children.getLoadedChildren())
+            intList.removeChildAt(0)
+            self.assertEqual({intList.getChild(4)}, index.search('i5'))
+            self.assertEqual(9, len(index.search('i', {NodeType.INT})))
+
+    def test_invalidFile(self) -> None:
+        """
+        The constructor must raise a value error when the file is not an
+        encoded datastore.
+        """
+        datasets = [b'', b'\x80', b'\xa1\x63INT\x82\x00', b'\xa1\x00\x80']
+        for data in datasets:
+            with open(self._path, 'wb') as fp:
+                fp.write(data)
+            with self.assertRaises(ValueError):
+                LazyDatastoreReader(self._path)
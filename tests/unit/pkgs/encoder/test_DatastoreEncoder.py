@@ -0,0 +1,243 @@
+from array import array
+from io import BytesIO
+from unittest import TestCase
+from unittest.mock import Mock
+
+import cbor2
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.encoder import DatastoreEncoder                       # noqa: E402
+from pkgs.datastore import ButtonArrayData, ButtonArrayElement, \
+    ButtonArrayNode, ButtonData, ButtonNode, DatastoreNode, FloatArrayData, \
+    FloatArrayElement, FloatArrayNode, FloatData, FloatNode, IntArrayData, \
+    IntArrayElement, IntArrayNode, IntData, IntNode, MultiStateData, \
+    MultiStateNode, NodeType, ObjectListNode, StateNode, UintArrayData, \
+    UintArrayElement, UintArrayNode, UintData, UintNode         # noqa: E402
+
+
+class TestDatastoreEncoder(TestCase):
+    """
+    DatastoreEncoder test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._root = ObjectListNode('', None)
+        self._store = DatastoreNode.createNewStore(self._root)
+        self._lists = {self._store.getChild(row).getName():
+                       self._store.getChild(row)
+                       for row in range(self._store.getChildCount())}
+        self._fp = BytesIO()
+        self._uut = DatastoreEncoder(self._fp)
+
+    def _encode(self) -> dict:
+        """
+        Encode the test store and decode the result.
+
+        Return
+            The decoded store.
+        """
+        self._uut.encode(self._store)
+        return cbor2.loads(self._fp.getvalue())
+
+    def test_encodeEmptyStore(self) -> None:
+        """
+        The encode method must encode every object list of the store as an
+        empty array.
+        """
+        expected = {type.name: [] for type in NodeType
+                    if type != NodeType.STORE and type != NodeType.OBJ_LIST}
+        self.assertEqual(0, self._uut.encode(self._store))
+        self.assertEqual(expected, cbor2.loads(self._fp.getvalue()))
+
+    def test_encodeButtons(self) -> None:
+        """
+        The encode method must encode the button and button array objects.
+        """
+        ButtonNode('BUTTON_0', ButtonData(1000, 2000),
+                   self._lists['BUTTON'])
+        ButtonArrayNode('BUTTONS', ButtonArrayData(
+            1500, 2500, [ButtonArrayElement('B0'), ButtonArrayElement('B1')]),
+            self._lists['BUTTON_ARRAY'])
+        result = self._encode()
+        self.assertEqual([{'longPressTime': 1000, 'inactiveTime': 2000}],
+                         result['BUTTON'])
+        self.assertEqual([{'longPressTime': 1500, 'inactiveTime': 2500,
+                           'elements': ['B0', 'B1']}],
+                         result['BUTTON_ARRAY'])
+
+    def test_encodeNumbers(self) -> None:
+        """
+        The encode method must encode the float, int and uint objects in id
+        order.
+        """
+        FloatNode('FLOAT_0', FloatData(-1.5, 1.5, 0.5), self._lists['FLOAT'])
+        IntNode('INT_0', IntData(-10, 10, 1), self._lists['INT'])
+        IntNode('INT_1', IntData(-20, 20, 2), self._lists['INT'])
+        UintNode('UINT_0', UintData(0, 100, 50), self._lists['UINT'])
+        result = self._encode()
+        self.assertEqual([{'min': -1.5, 'max': 1.5, 'default': 0.5}],
+                         result['FLOAT'])
+        self.assertEqual([{'min': -10, 'max': 10, 'default': 1},
+                          {'min': -20, 'max': 20, 'default': 2}],
+                         result['INT'])
+        self.assertEqual([{'min': 0, 'max': 100, 'default': 50}],
+                         result['UINT'])
+
+    def test_encodeNumberArrays(self) -> None:
+        """
+        The encode method must encode the numeric array values as typed
+        arrays.
+        """
+        little = sys.byteorder == 'little'
+        datasets = [
+            {'list': 'FLOAT_ARRAY', 'cls': FloatArrayNode,
+             'data': FloatArrayData(True, [FloatArrayElement('F', 0, 1, .5)]),
+             'tag': 86 if little else 82, 'typecode': 'd'},
+            {'list': 'INT_ARRAY', 'cls': IntArrayNode,
+             'data': IntArrayData(False, [IntArrayElement('I', -1, 1, 0)]),
+             'tag': 79 if little else 75, 'typecode': 'q'},
+            {'list': 'UINT_ARRAY', 'cls': UintArrayNode,
+             'data': UintArrayData(True, [UintArrayElement('U', 0, 9, 3)]),
+             'tag': 71 if little else 67, 'typecode': 'Q'},
+        ]
+        for dataset in datasets:
+            dataset['cls'](dataset['list'], dataset['data'],
+                           self._lists[dataset['list']])
+        result = self._encode()
+        for dataset in datasets:
+            encoded = result[dataset['list']][0]
+            element = dataset['data'].elements[0]
+            self.assertEqual(dataset['data'].inNvm, encoded['inNvm'])
+            self.assertEqual([element.name], encoded['elements'])
+            for field in ['min', 'max', 'default']:
+                value = encoded[field]
+                self.assertEqual(dataset['tag'], value.tag)
+                self.assertEqual([getattr(element, field)],
+                                 array(dataset['typecode'],
+                                       value.value).tolist())
+
+    def test_encodeMultiState(self) -> None:
+        """
+        The encode method must encode the multi-state objects and their
+        states.
+        """
+        data = MultiStateData([StateNode('OFF', 0), StateNode('ON', 1)], 1,
+                              True)
+        MultiStateNode('MODE', data, self._lists['MULTI_STATE'])
+        result = self._encode()
+        self.assertEqual([{'inNvm': True, 'default': 1,
+                           'states': [['OFF', 0], ['ON', 1]]}],
+                         result['MULTI_STATE'])
+
+    def test_encodeCompact(self) -> None:
+        """
+        The compact encoding must key the objects by integer, front code the
+        names sharing at least 3 bytes with the previous one and narrow the
+        value columns holding their values exactly.
+        """
+        little = sys.byteorder == 'little'
+        IntArrayNode('GAINS', IntArrayData(False, [
+            IntArrayElement('GAIN_P', -1, 300, 0),
+            IntArrayElement('GAIN_I', 0, 1, 0),
+            IntArrayElement('OFFSET', -(1 << 40), 0, 0)]),
+            self._lists['INT_ARRAY'])
+        FloatArrayNode('RATIOS', FloatArrayData(False, [
+            FloatArrayElement('R', -0.1, 1.5, 0.5)]),
+            self._lists['FLOAT_ARRAY'])
+        MultiStateNode('MODE', MultiStateData(
+            [StateNode('MODE_OFF', 0), StateNode('MODE_ON', 1)]),
+            self._lists['MULTI_STATE'])
+        IntNode('INT_0', IntData(-10, 10, 1), self._lists['INT'])
+        DatastoreEncoder(self._fp, compact=True).encode(self._store)
+        result = cbor2.loads(self._fp.getvalue())
+        self.assertEqual([{2: -10, 3: 10, 4: 1}], result['INT'])
+        gains = result['INT_ARRAY'][0]
+        self.assertEqual(['GAIN_P', [5, 'I'], 'OFFSET'], gains[1])
+        for key, tag, typecode, values in (
+                (2, 79 if little else 75, 'q', [-1, 0, -(1 << 40)]),
+                (3, 77 if little else 73, 'h', [300, 1, 0]),
+                (4, 72, 'b', [0, 0, 0])):
+            self.assertEqual(tag, gains[key].tag)
+            self.assertEqual(values,
+                             array(typecode, gains[key].value).tolist())
+        ratios = result['FLOAT_ARRAY'][0]
+        self.assertEqual(86 if little else 82, ratios[2].tag)
+        self.assertEqual(85 if little else 81, ratios[3].tag)
+        self.assertEqual([[0, False], [4, 0], [5, [['MODE_OFF', 0],
+                                                   [[6, 'N'], 1]]]],
+                         [[key, value] for key, value in
+                          result['MULTI_STATE'][0].items()])
+
+    def test_encodeObjectsById(self) -> None:
+        """
+        The encode method must encode the objects at their id, whatever their
+        order, with null at the ids no object has.
+        """
+        nodes = [IntNode(f"INT_{row}", IntData(default=row),
+                         self._lists['INT']) for row in range(4)]
+        self._lists['INT'].removeChildAt(1)
+        self._lists['INT'].removeChildAt(2)
+        self._lists['INT'].addChildAt(0, nodes[3])
+        self.assertEqual([0, None, 2, 3], [
+            encoded['default'] if encoded is not None else None
+            for encoded in self._encode()['INT']])
+
+    def test_encodeNameTable(self) -> None:
+        """
+        The encode method must write the object names indexed by id to the
+        name table output stream.
+        """
+        for row in range(3):
+            IntNode(f"INT_{row}", IntData(), self._lists['INT'])
+        self._lists['INT'].removeChildAt(1)
+        nameFp = BytesIO()
+        DatastoreEncoder(self._fp, nameFp).encode(self._store)
+        names = cbor2.loads(nameFp.getvalue())
+        self.assertEqual(['INT_0', None, 'INT_2'], names['INT'])
+        self.assertEqual([], names['UINT'])
+        self.assertEqual(len(names['INT']),
+                         len(cbor2.loads(self._fp.getvalue())['INT']))
+
+    def test_encodeNameTableById(self) -> None:
+        """
+        The encode method must write the object names at their id, whatever
+        the order of the objects, and keep the name table as a map.
+        """
+        nodes = [IntNode(f"INT_{row}", IntData(), self._lists['INT'])
+                 for row in range(4)]
+        self._lists['INT'].removeChildAt(1)
+        self._lists['INT'].removeChildAt(0)
+        self._lists['INT'].addChildAt(1, nodes[0])
+        nameFp = BytesIO()
+        DatastoreEncoder(self._fp, nameFp).encode(self._store)
+        names = cbor2.loads(nameFp.getvalue())
+        self.assertEqual(['INT_0', None, 'INT_2', 'INT_3'], names['INT'])
+        self.assertEqual({type.name for type in NodeType
+                          if type != NodeType.STORE
+                          and type != NodeType.OBJ_LIST}, set(names))
+
+    def test_encodeReturnObjectCount(self) -> None:
+        """
+        The encode method must return the number of encoded objects.
+        """
+        for row in range(3):
+            IntNode(f"INT_{row}", IntData(), self._lists['INT'])
+        UintNode('UINT_0', UintData(), self._lists['UINT'])
+        self.assertEqual(4, self._uut.encode(self._store))
+
+    def test_encodeUnsupportedObject(self) -> None:
+        """
+        The encode method must raise a value error when an object list holds
+        an unsupported object type.
+        """
+        node = Mock(_id=None)
+        node.getId.return_value = 0
+        node.getType.return_value = NodeType.OBJ_LIST
+        self._lists['INT'].addChild(node)
+        with self.assertRaises(ValueError):
+            self._uut.encode(self._store)
@@ -0,0 +1,123 @@
+from io import BytesIO
+from unittest import TestCase
+
+import cbor2
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.encoder import DatastoreEncoder, applyPatch, \
+    createPatch                                                 # noqa: E402
+from pkgs.datastore import DatastoreNode, IntData, IntNode, NodeType, \
+    ObjectListNode                                              # noqa: E402
+
+
+class TestDatastorePatch(TestCase):
+    """
+    Datastore patch test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._store = DatastoreNode.createNewStore(ObjectListNode('', None))
+        self._intList = next(objList
+                             for objList in self._store.getChildren()
+                             if objList.getName() == NodeType.INT.name)
+        self._intList.addChildrenAt(0, [
+            IntNode(f"INT_{index}", IntData(-index, index, 0))
+            for index in range(200)])
+        self._old = self._encode()
+
+    def _encode(self) -> bytes:
+        """
+        Encode the test store.
+
+        Return
+            The encoded store.
+        """
+        fp = BytesIO()
+        DatastoreEncoder(fp).encode(self._store)
+        return fp.getvalue()
+
+    def _assertPatch(self, new: bytes) -> bytes:
+        """
+        Assert a patch from the old encoded store rebuilds a new one.
+
+        Param
+            new: The new encoded store.
+
+        Return
+            The patch.
+        """
+        patch = createPatch(self._old, new)
+        self.assertEqual(new, applyPatch(self._old, patch))
+        return patch
+
+    def test_patchSameStore(self) -> None:
+        """
+        A patch between identical stores must copy every object list with a
+        single operation.
+        """
+        patch = self._assertPatch(self._old)
+        self.assertLess(len(patch), 200)
+
+    def test_patchEditedObjects(self) -> None:
+        """
+        A patch must rebuild the new store from modified, renamed, added,
+        removed and moved objects, and only hold the new objects.
+        """
+        self._intList.getChild(10).setDefault(5)
+        self._intList.getChild(20).setName('RENAMED')
+        self._intList.removeChildAt(30)
+        self._intList.addChild(IntNode('ADDED', IntData()))
+        moved = self._intList.getChild(0)
+        self._intList.removeChildAt(0)
+        self._intList.addChild(moved)
+        new = self._encode()
+        patch = self._assertPatch(new)
+        self.assertLess(len(patch), len(new) // 5)
+        ops = dict(cbor2.loads(patch)[3])[NodeType.INT.name]
+        self.assertEqual(3, sum(isinstance(op, bytes) for op in ops))
+
+    def test_patchMissingList(self) -> None:
+        """
+        A patch must rebuild the object lists missing from the old store and
+        drop the lists missing from the new one.
+        """
+        row = self._store.getChildren().index(self._intList)
+        self._store.removeChildAt(row)
+        self._assertPatch(self._encode())
+        self._old, new = self._encode(), self._old
+        self._assertPatch(new)
+
+    def test_applyPatchWrongStore(self) -> None:
+        """
+        The applyPatch function must raise a value error when the patch was
+        created from another store.
+        """
+        self._intList.getChild(0).setDefault(1)
+        patch = createPatch(self._old, self._encode())
+        self._intList.getChild(0).setDefault(2)
+        with self.assertRaises(ValueError):
+            applyPatch(self._encode(), patch)
+
+    def test_applyInvalidPatch(self) -> None:
+        """
+        The applyPatch function must raise a value error on a corrupt patch.
+        """
+        version, oldHash, newHash, lists = \
+            cbor2.loads(createPatch(self._old, self._old))
+        patches = [
+            b'\xff\x00',
+            cbor2.dumps([2, oldHash, newHash, lists]),
+            cbor2.dumps([version, oldHash, newHash,
+                         [[NodeType.INT.name, [150, 100]]]]),
+            cbor2.dumps([version, oldHash, newHash,
+                         [[NodeType.INT.name, ['text']]]]),
+            cbor2.dumps([version, oldHash, oldHash[::-1], lists]),
+        ]
+        for patch in patches:
+            with self.assertRaises(ValueError):
+                applyPatch(self._old, patch)
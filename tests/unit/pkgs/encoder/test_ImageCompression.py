@@ -0,0 +1,119 @@
+from io import BytesIO
+from unittest import TestCase
+
+import cbor2
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import DatastoreNode, IntArrayData, IntArrayElement, \
+    IntArrayNode, IntData, IntNode, NodeType, ObjectListNode    # noqa: E402
+from pkgs.encoder import compressImage, DatastoreEncoder, \
+    decompressChunk, decompressImage, getCompressedPath, \
+    readCompressedHeader, trainDictionary                       # noqa: E402
+
+
+def _encodeStore(count: int, offset: int = 0) -> bytes:
+    """
+    Encode a datastore of int and int array objects.
+
+    Param
+        count: The number of objects of each list.
+        offset: The offset of the object values.
+
+    Return
+        The encoded datastore.
+    """
+    store = DatastoreNode.createNewStore(ObjectListNode('', None))
+    lists = {objList.getName(): objList for objList in store.getChildren()}
+    lists[NodeType.INT.name].addChildrenAt(0, [
+        IntNode(f"INT_{index}", IntData(-index - offset, index + offset, 0))
+        for index in range(count)])
+    lists[NodeType.INT_ARRAY.name].addChildrenAt(0, [
+        IntArrayNode(f"ARRAY_{index}", IntArrayData(index % 2 == 0, [
+            IntArrayElement(f"ARRAY_{index}_{element}", -element,
+                            element + offset, 0)
+            for element in range(4)]))
+        for index in range(count)])
+    fp = BytesIO()
+    DatastoreEncoder(fp).encode(store)
+    return fp.getvalue()
+
+
+class TestImageCompression(TestCase):
+    """
+    Image compression test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._previous = _encodeStore(300)
+        self._image = _encodeStore(400, 7)
+        self._dictionary = trainDictionary([self._previous], 4096)
+
+    def test_getCompressedPath(self) -> None:
+        """
+        The getCompressedPath function must append the .z extension.
+        """
+        self.assertEqual(os.path.join('out', 'a.pages.z'),
+                         getCompressedPath(os.path.join('out', 'a.pages')))
+
+    def test_trainDictionary(self) -> None:
+        """
+        The trained dictionary must hold at most the requested size of
+        sample data, and be empty without sample data.
+        """
+        self.assertEqual(4096, len(self._dictionary))
+        self.assertEqual(b'', trainDictionary([]))
+        self.assertEqual(b'', trainDictionary([self._previous], 0))
+        self.assertLessEqual(len(trainDictionary([b'abcdefgh' * 4])), 32)
+
+    def test_compressRoundTrip(self) -> None:
+        """
+        A compressed image must be decompressed to the image, with or
+        without dictionary, and the dictionary must make it smaller.
+        """
+        plain = compressImage(self._image, 512)
+        trained = compressImage(self._image, 512, self._dictionary)
+        self.assertEqual(self._image, decompressImage(plain))
+        self.assertEqual(self._image,
+                         decompressImage(trained, self._dictionary))
+        self.assertLess(len(trained), len(plain))
+        self.assertLess(len(plain), len(self._image))
+
+    def test_decompressChunkIndependently(self) -> None:
+        """
+        Each chunk must be decompressed on its own to its part of the image.
+        """
+        compressed = compressImage(self._image, 1000, self._dictionary)
+        header = readCompressedHeader(compressed)
+        self.assertEqual(len(self._image), header.size)
+        self.assertEqual(-(-len(self._image) // 1000), header.getChunkCount())
+        for index in reversed(range(header.getChunkCount())):
+            self.assertEqual(self._image[index * 1000:(index + 1) * 1000],
+                             decompressChunk(compressed, index,
+                                             self._dictionary))
+        with self.assertRaises(IndexError):
+            decompressChunk(compressed, header.getChunkCount(),
+                            self._dictionary, header)
+
+    def test_decompressInvalidImage(self) -> None:
+        """
+        A wrong dictionary, a corrupted chunk or an invalid header must
+        raise a value error.
+        """
+        compressed = compressImage(self._image, 1000, self._dictionary)
+        with self.assertRaises(ValueError):
+            decompressImage(compressed)
+        header = readCompressedHeader(compressed)
+        corrupted = bytearray(compressed)
+        corrupted[header.headerSize:header.headerSize + 16] = bytes(16)
+        with self.assertRaises(ValueError):
+            decompressChunk(bytes(corrupted), 0, self._dictionary)
+        for data in (b'', cbor2.dumps([2, 1000, 0, 1, [0]])):
+            with self.assertRaises(ValueError):
+                readCompressedHeader(data)
+        with self.assertRaises(ValueError):
+            compressImage(self._image, 0)
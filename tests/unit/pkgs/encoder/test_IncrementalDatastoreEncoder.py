@@ -0,0 +1,115 @@
+from io import BytesIO
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.encoder import DatastoreEncoder, \
+    IncrementalDatastoreEncoder                                 # noqa: E402
+from pkgs.datastore import DatastoreNode, IntArrayData, IntArrayElement, \
+    IntArrayNode, IntData, IntNode, MultiStateData, MultiStateNode, \
+    ObjectListNode, StateNode                                   # noqa: E402
+
+
+class TestIncrementalDatastoreEncoder(TestCase):
+    """
+    IncrementalDatastoreEncoder test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._root = ObjectListNode('', None)
+        self._store = DatastoreNode.createNewStore(self._root)
+        self._lists = {self._store.getChild(row).getName():
+                       self._store.getChild(row)
+                       for row in range(self._store.getChildCount())}
+        self._ints = [IntNode(f"INT_{row}", IntData(-row, row, 0),
+                              self._lists['INT']) for row in range(3)]
+        self._array = IntArrayNode('INTS', IntArrayData(
+            False, [IntArrayElement('I0', -1, 1, 0)]),
+            self._lists['INT_ARRAY'])
+        self._multiState = MultiStateNode('MODE', MultiStateData(
+            [StateNode('OFF', 0), StateNode('ON', 1)], 0, True),
+            self._lists['MULTI_STATE'])
+        self._uut = IncrementalDatastoreEncoder()
+
+    def _assertSameAsFullEncoding(self, data: bytes) -> None:
+        """
+        Assert that the data matches the datastore encoder output.
+
+        Param
+            data: The incrementally encoded data.
+        """
+        fp = BytesIO()
+        DatastoreEncoder(fp).encode(self._store)
+        self.assertEqual(fp.getvalue(), data)
+
+    def test_encodeMatchDatastoreEncoder(self) -> None:
+        """
+        The encode method must produce the datastore encoder output and
+        encode every object on the first encoding.
+        """
+        self._assertSameAsFullEncoding(self._uut.encode(self._store))
+        self.assertEqual(5, self._uut.getEncodedCount())
+
+    def test_encodeCompact(self) -> None:
+        """
+        The compact encoder must produce the compact datastore encoder
+        output.
+        """
+        fp = BytesIO()
+        DatastoreEncoder(fp, compact=True).encode(self._store)
+        self.assertEqual(fp.getvalue(),
+                         IncrementalDatastoreEncoder(True).encode(
+                             self._store))
+
+    def test_encodeReuseUnmodifiedFragments(self) -> None:
+        """
+        The encode method must not re-encode an unmodified store.
+        """
+        first = self._uut.encode(self._store)
+        self.assertIs(first, self._uut.encode(self._store))
+        self.assertEqual(0, self._uut.getEncodedCount())
+
+    def test_encodeModifiedObjects(self) -> None:
+        """
+        The encode method must only re-encode the modified objects.
+        """
+        datasets = [
+            lambda: self._ints[1].setMaximum(42),
+            lambda: setattr(self._array.getElements()[0], 'default', 1),
+            lambda: self._multiState.getStateList()[1].setValue(7),
+        ]
+        self._uut.encode(self._store)
+        for edit in datasets:
+            edit()
+            self._assertSameAsFullEncoding(self._uut.encode(self._store))
+            self.assertEqual(1, self._uut.getEncodedCount())
+
+    def test_encodeStructureChanges(self) -> None:
+        """
+        The encode method must follow object insertions, removals and
+        moves.
+        """
+        self._uut.encode(self._store)
+        IntNode('INT_3', IntData(), self._lists['INT'])
+        self._assertSameAsFullEncoding(self._uut.encode(self._store))
+        self.assertEqual(1, self._uut.getEncodedCount())
+        self._lists['INT'].removeChildAt(0)
+        self._assertSameAsFullEncoding(self._uut.encode(self._store))
+        self.assertEqual(0, self._uut.getEncodedCount())
+        self._lists['INT'].removeChildAt(1)
+        self._lists['INT'].addChildAt(0, self._ints[2])
+        self._assertSameAsFullEncoding(self._uut.encode(self._store))
+        self.assertEqual(0, self._uut.getEncodedCount())
+
+    def test_encodeOtherStore(self) -> None:
+        """
+        The encode method must not reuse the fragments of another store.
+        """
+        self._uut.encode(self._store)
+        self._store = DatastoreNode.createNewStore(ObjectListNode('', None))
+        self._assertSameAsFullEncoding(self._uut.encode(self._store))
@@ -0,0 +1,123 @@
+from io import BytesIO
+from unittest import TestCase
+
+import cbor2
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.datastore import DatastoreNode, IntArrayData, IntArrayElement, \
+    IntArrayNode, IntData, IntNode, NodeType, ObjectListNode    # noqa: E402
+from pkgs.decoder import indexObjects                           # noqa: E402
+from pkgs.encoder import createPagedImage, DatastoreEncoder, \
+    getPagedImagePath, readPageIndex, readPagedObject           # noqa: E402
+
+
+class TestPagedImage(TestCase):
+    """
+    Paged image test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._store = DatastoreNode.createNewStore(ObjectListNode('', None))
+        self._lists = {objList.getName(): objList
+                       for objList in self._store.getChildren()}
+        self._lists[NodeType.INT.name].addChildrenAt(0, [
+            IntNode(f"INT_{index}", IntData(-index, index, 0))
+            for index in range(100)])
+        self._lists[NodeType.INT.name].removeChildAt(50)
+        self._lists[NodeType.INT_ARRAY.name].addChild(IntArrayNode(
+            'GAINS', IntArrayData(False, [
+                IntArrayElement(f"G{index}", 0, 10, 0)
+                for index in range(20)])))
+        fp = BytesIO()
+        DatastoreEncoder(fp).encode(self._store)
+        self._encoded = fp.getvalue()
+
+    def _assertObjects(self, image: bytes) -> None:
+        """
+        Assert every object of the encoded store is read from a paged image.
+
+        Param
+            image: The paged image.
+        """
+        pageIndex = readPageIndex(image)
+        for listName, offsets in indexObjects(self._encoded).items():
+            self.assertEqual(len(offsets) - 1,
+                             pageIndex.lists[listName].count)
+            for id in range(len(offsets) - 1):
+                self.assertEqual(self._encoded[offsets[id]:offsets[id + 1]],
+                                 readPagedObject(image, listName, id,
+                                                 pageIndex))
+
+    def test_getPagedImagePath(self) -> None:
+        """
+        The getPagedImagePath function must replace the encoded datastore
+        extension by .pages.
+        """
+        self.assertEqual(os.path.join('out', 'a.pages'),
+                         getPagedImagePath(os.path.join('out', 'a.cbor')))
+
+    def test_createPagedImageObjectsInPages(self) -> None:
+        """
+        The paged image must hold every object in a single page, padding the
+        pages, behind an index padded to whole pages.
+        """
+        image = createPagedImage(self._encoded, 1024)
+        self.assertEqual(0, len(image) % 1024)
+        pageIndex = readPageIndex(image)
+        self.assertEqual(1024, pageIndex.dataOffset)
+        self.assertEqual(len(image), pageIndex.dataOffset +
+                         pageIndex.pageCount * 1024)
+        self._assertObjects(image)
+        for listName, offsets in indexObjects(self._encoded).items():
+            for id in range(len(offsets) - 1):
+                start, skipCount = pageIndex.locate(listName, id)
+                size = offsets[id + 1] - offsets[id]
+                self.assertEqual(start // 1024, (start + size - 1) // 1024)
+        self.assertEqual(b'\xf6', readPagedObject(image, 'INT', 50))
+
+    def test_createPagedImageObjectLargerThanPage(self) -> None:
+        """
+        An object larger than the page size must raise a value error unless
+        spanning is allowed.
+        """
+        with self.assertRaises(ValueError):
+            createPagedImage(self._encoded, 512)
+        self._assertObjects(createPagedImage(self._encoded, 512, True))
+
+    def test_createPagedImageSpanning(self) -> None:
+        """
+        With spanning allowed, the objects must be packed without padding.
+        """
+        image = createPagedImage(self._encoded, 128, True)
+        pageIndex = readPageIndex(image)
+        objectSize = sum(offsets[-1] - offsets[0] for offsets in
+                         indexObjects(self._encoded).values())
+        self.assertEqual(-(-objectSize // 128), pageIndex.pageCount)
+        self._assertObjects(image)
+
+    def test_readPagedObjectOutOfRange(self) -> None:
+        """
+        An id out of the list range or an unknown list must read none.
+        """
+        image = createPagedImage(self._encoded, 1024)
+        self.assertIsNone(readPagedObject(image, 'INT', 100))
+        self.assertIsNone(readPagedObject(image, 'INT', -1))
+        self.assertIsNone(readPagedObject(image, 'BUTTON', 0))
+        self.assertIsNone(readPagedObject(image, 'UNKNOWN', 0))
+        self.assertEqual({'min': -3, 'max': 3, 'default': 0},
+                         cbor2.loads(readPagedObject(image, 'INT', 3)))
+
+    def test_invalidPagedImage(self) -> None:
+        """
+        An invalid page size or paged image must raise a value error.
+        """
+        with self.assertRaises(ValueError):
+            createPagedImage(self._encoded, 0)
+        for image in (b'', b'\x01', cbor2.dumps([2, 64, 0, {}])):
+            with self.assertRaises(ValueError):
+                readPageIndex(image)
@@ -0,0 +1,205 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from PySide6.QtCore import QModelIndex
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.ui.models import DatastoreFilterModel, DatastoreMetadata, \
+    DatastoreNode, IntData, IntNode, NodeType, ObjectListNode, \
+    ObjectSearchIndex, UintData, UintNode                       # noqa: E402
+
+
+class TestDatastoreFilterModel(TestCase):
+    """
+    DatastoreFilterModel test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._root = ObjectListNode('', None)
+        self._store = DatastoreNode.createNewStore(
+            self._root, metadata=DatastoreMetadata(None))
+        self._lists = {self._store.getChild(row).getName():
+                       self._store.getChild(row)
+                       for row in range(self._store.getChildCount())}
+        self._ints = [IntNode(f"INT_{index}", IntData())
+                      for index in range(20)]
+        self._uints = [UintNode(f"UINT_{index}", UintData())
+                       for index in range(3)]
+        self._lists[NodeType.INT.name].addChildrenAt(0, self._ints)
+        self._lists[NodeType.UINT.name].addChildrenAt(0, self._uints)
+        self._sourceModel = Mock()
+        self._uut = DatastoreFilterModel(self._root)
+        self._uut.setSourceModel = Mock()
+        self._uut.sourceModel = Mock(return_value=self._sourceModel)
+
+    def _getChildNodes(self, index: QModelIndex) -> list:
+        """
+        Get the nodes shown under an index.
+
+        Param
+            index: The parent index.
+
+        Return
+            The child nodes, in row order.
+        """
+        return [self._uut.index(row, 0, index).internalPointer()
+                for row in range(self._uut.rowCount(index))]
+
+    def test_setFilterTextShowMatchingObjects(self) -> None:
+        """
+        The setFilterText method must show the matching objects in row order
+        under their datastore and object list.
+        """
+        self._uut.setFilterText('int_1')
+        self.assertEqual([self._store], self._getChildNodes(QModelIndex()))
+        storeIdx = self._uut.index(0, 0, QModelIndex())
+        self.assertEqual([self._lists[NodeType.INT.name],
+                          self._lists[NodeType.UINT.name]],
+                         self._getChildNodes(storeIdx))
+        intIdx = self._uut.index(0, 0, storeIdx)
+        self.assertEqual([self._ints[1]] + self._ints[10:],
+                         self._getChildNodes(intIdx))
+        objIdx = self._uut.index(2, 0, intIdx)
+        self.assertIs(self._lists[NodeType.INT.name],
+                      self._uut.parent(objIdx).internalPointer())
+        self.assertFalse(self._uut.parent(storeIdx).isValid())
+        self.assertFalse(self._uut.index(11, 0, intIdx).isValid())
+        self.assertEqual('int_1', self._uut.getFilterText())
+
+    def test_setFilterTextSortSmallResults(self) -> None:
+        """
+        The setFilterText method must sort the objects by row when few
+        objects match.
+        """
+        self._uut.setFilterText('INT_19')
+        storeIdx = self._uut.index(0, 0, QModelIndex())
+        self.assertEqual([self._lists[NodeType.INT.name]],
+                         self._getChildNodes(storeIdx))
+        self.assertEqual([self._ints[19]], self._getChildNodes(
+            self._uut.index(0, 0, storeIdx)))
+
+    def test_setFilterTextNarrowPreviousResults(self) -> None:
+        """
+        The setFilterText method must only search the previous results when
+        the text extends the previous one.
+        """
+        with patch.object(ObjectSearchIndex, 'search') as mockedSearch:
+            mockedSearch.return_value = set()
+            self._uut.setFilterText('in')
+            mockedSearch.assert_called_with('in', None, None)
+            self._uut.setFilterText('int')
+            mockedSearch.assert_called_with('int', None, set())
+            self._uut.setFilterText('nt')
+            mockedSearch.assert_called_with('nt', None, None)
+
+    def test_setFilterTypesShowTypes(self) -> None:
+        """
+        The setFilterTypes method must only show the objects of the given
+        types.
+        """
+        self._uut.setFilterText('int_1')
+        self._uut.setFilterTypes([NodeType.UINT])
+        storeIdx = self._uut.index(0, 0, QModelIndex())
+        self.assertEqual([self._lists[NodeType.UINT.name]],
+                         self._getChildNodes(storeIdx))
+
+    def test_datastoreChangesUpdateResults(self) -> None:
+        """
+        The object additions, removals and renamings must update the search
+        results once the datastores are indexed.
+        """
+        self._uut.setFilterText('int_2')
+        intList = self._lists[NodeType.INT.name]
+        newNode = IntNode('INT_20', IntData())
+        intList.addChildAt(0, newNode)
+        self.assertEqual({self._ints[2], self._uints[2], newNode},
+                         self._uut._matches)
+        self._ints[2].setName('MOTOR')
+        self.assertEqual({self._uints[2], newNode}, self._uut._matches)
+        intList.removeChildAt(0)
+        self.assertEqual({self._uints[2]}, self._uut._matches)
+        storeIdx = self._uut.index(0, 0, QModelIndex())
+        self.assertEqual([self._lists[NodeType.UINT.name]],
+                         self._getChildNodes(storeIdx))
+
+    def test_datastoreChangesUpdateRowsWithoutReset(self) -> None:
+        """
+        The object additions, removals and renamings must only insert,
+        remove or update the affected rows, showing and hiding the object
+        lists with the matching objects.
+        """
+        self._uut.setFilterText('int_1')
+        slots = {name: Mock() for name in ['modelReset', 'rowsInserted',
+                                           'rowsRemoved', 'dataChanged']}
+        for name, slot in slots.items():
+            getattr(self._uut, name).connect(slot)
+        intList = self._lists[NodeType.INT.name]
+        uintList = self._lists[NodeType.UINT.name]
+        storeIdx = self._uut.index(0, 0, QModelIndex())
+        intIdx = self._uut.index(0, 0, storeIdx)
+        newNode = IntNode('INT_1X', IntData())
+        intList.addChildAt(0, newNode)
+        self.assertEqual([newNode, self._ints[1]] + self._ints[10:],
+                         self._getChildNodes(intIdx))
+        self.assertEqual(1, slots['rowsInserted'].call_count)
+        self._ints[12].setName('INT_1B')
+        slots['dataChanged'].assert_called_once()
+        self._uints[1].setName('MOTOR')
+        self.assertEqual([intList], self._getChildNodes(storeIdx))
+        self.assertEqual(2, slots['rowsRemoved'].call_count)
+        self._uints[1].setName('UINT_1')
+        self.assertEqual([intList, uintList], self._getChildNodes(storeIdx))
+        self.assertEqual([self._uints[1]], self._getChildNodes(
+            self._uut.index(1, 0, storeIdx)))
+        intList.removeChildrenAt(0, 3)
+        self.assertEqual(self._ints[10:], self._getChildNodes(intIdx))
+        self.assertEqual({self._uints[1]} | set(self._ints[10:]),
+                         self._uut._matches)
+        self.assertEqual(5, self._uut._getRow(self._ints[15]))
+        slots['modelReset'].assert_not_called()
+
+    def test_mapToSourceReturnNodeIndex(self) -> None:
+        """
+        The mapToSource method must return the datastore model index of the
+        node, and an invalid index for an invalid index.
+        """
+        self._uut.setFilterText('INT_19')
+        index = Mock()
+        self._sourceModel.getNodeIndex.return_value = index
+        storeIdx = self._uut.index(0, 0, QModelIndex())
+        objIdx = self._uut.index(0, 0, self._uut.index(0, 0, storeIdx))
+        self.assertEqual(index, self._uut.mapToSource(objIdx))
+        self._sourceModel.getNodeIndex.assert_called_once_with(self._ints[19])
+        self.assertFalse(self._uut.mapToSource(QModelIndex()).isValid())
+
+    def test_mapFromSourceReturnResultIndex(self) -> None:
+        """
+        The mapFromSource method must return the search result index of the
+        node, and an invalid index if the node is not in the results.
+        """
+        self._uut.setFilterText('int_1')
+        for node, row in [(self._ints[12], 3), (self._store, 0),
+                          (self._lists[NodeType.UINT.name], 1)]:
+            index = Mock()
+            index.internalPointer.return_value = node
+            result = self._uut.mapFromSource(index)
+            self.assertEqual(row, result.row())
+            self.assertIs(node, result.internalPointer())
+        index.internalPointer.return_value = self._ints[2]
+        self.assertFalse(self._uut.mapFromSource(index).isValid())
+        self.assertFalse(self._uut.mapFromSource(QModelIndex()).isValid())
+
+    def test_resultsNeverPaged(self) -> None:
+        """
+        The search results must never be fetched in pages.
+        """
+        self._uut.setFilterText('int')
+        self.assertFalse(self._uut.canFetchMore(QModelIndex()))
+        self.assertTrue(self._uut.hasChildren(QModelIndex()))
+        self.assertEqual(1, self._uut.columnCount(QModelIndex()))
@@ -62,176 +62,78 @@ class TestDatastoreModel(TestCase):
             mockedBaseCls.assert_called_once_with(parent)
         self.assertEqual(self._mockedRoot, uut._root)
 
-    def test_insertButtonNode(self) -> None:
+    def test_createNodes(self) -> None:
+        """
+        The _create methods must create a new node of the list type with its
+        default data.
+        """
+        datasets = [
+            {'method': '_createButtonNode', 'name': 'NEW_BUTTON',
+             'data': self._ButtonDataCls, 'node': self._ButtonNodeCls},
+            {'method': '_createButtonArrayNode', 'name': 'NEW_BUTTON_ARRAY',
+             'data': self._ButtonArrayDataCls,
+             'node': self._ButtonArrayNodeCls},
+            {'method': '_createFloatNode', 'name': 'NEW_FLOAT',
+             'data': self._FloatDataCls, 'node': self._FloatNodeCls},
+            {'method': '_createFloatArrayNode', 'name': 'NEW_FLOAT_ARRAY',
+             'data': self._FloatArrayDataCls,
+             'node': self._FloatArrayNodeCls},
+            {'method': '_createIntNode', 'name': 'NEW_INT',
+             'data': self._IntDataCls, 'node': self._IntNodeCls},
+            {'method': '_createIntArrayNode', 'name': 'NEW_INT_ARRAY',
+             'data': self._IntArrayDataCls, 'node': self._IntArrayNodeCls},
+            {'method': '_createMultiStateNode', 'name': 'NEW_MULTI_STATE',
+             'data': self._MultiStateDataCls,
+             'node': self._MultiStateNodeCls},
+            {'method': '_createUintNode', 'name': 'NEW_UINT',
+             'data': self._UintDataCls, 'node': self._UintNodeCls},
+            {'method': '_createUintArrayNode', 'name': 'NEW_UINT_ARRAY',
+             'data': self._UintArrayDataCls,
+             'node': self._UintArrayNodeCls},
+        ]
+        for dataset in datasets:
+            data = Mock()
+            node = Mock()
+            with patch(dataset['data']) as mockedData, \
+                    patch(dataset['node']) as mockedNode:
+                mockedData.return_value = data
+                mockedNode.return_value = node
+                result = getattr(self._uut, dataset['method'])()
+                mockedData.assert_called_once_with()
+                mockedNode.assert_called_once_with(dataset['name'], data)
+                self.assertEqual(node, result)
+
+    def test_getNodeFactoryInvalidListName(self) -> None:
+        """
+        The _getNodeFactory method must return none if the list name is not
+        an object type.
         """
-        The _insertButtonNode method must create a new button node and
-        append it the given button list.
-        """
-        row = 3
-        name = 'NEW_BUTTON'
-        data = Mock()
-        node = Mock()
         list = Mock()
-        with patch(self._ButtonDataCls) as mockedData, \
-                patch(self._ButtonNodeCls) as mockedNode:
-            mockedData.return_value = data
-            mockedNode.return_value = node
-            self._uut._insertButtonNode(list, row)
-            mockedData.assert_called_once_with()
-            mockedNode.assert_called_once_with(name, data)
-            list.addChildAt.assert_called_once_with(row, node)
-
-    def test_insertButtonArrayNode(self) -> None:
-        """
-        The _insertButtonArrayNode method must create a new button array node
-        and append it the given button array list.
-        """
-        row = 3
-        name = 'NEW_BUTTON_ARRAY'
-        data = Mock()
-        node = Mock()
+        for name in ['invalid name', NodeType.STORE.name,
+                     NodeType.OBJ_LIST.name]:
+            list.getName.return_value = name
+            self.assertIsNone(self._uut._getNodeFactory(list))
+
+    def test_getNodeFactoryReturnListFactory(self) -> None:
+        """
+        The _getNodeFactory method must return the factory creating the
+        objects of the list.
+        """
+        factories = {
+            NodeType.BUTTON: self._uut._createButtonNode,
+            NodeType.BUTTON_ARRAY: self._uut._createButtonArrayNode,
+            NodeType.FLOAT: self._uut._createFloatNode,
+            NodeType.FLOAT_ARRAY: self._uut._createFloatArrayNode,
+            NodeType.INT: self._uut._createIntNode,
+            NodeType.INT_ARRAY: self._uut._createIntArrayNode,
+            NodeType.MULTI_STATE: self._uut._createMultiStateNode,
+            NodeType.UINT: self._uut._createUintNode,
+            NodeType.UINT_ARRAY: self._uut._createUintArrayNode,
+        }
         list = Mock()
-        with patch(self._ButtonArrayDataCls) as mockedData, \
-                patch(self._ButtonArrayNodeCls) as mockedNode:
-            mockedData.return_value = data
-            mockedNode.return_value = node
-            self._uut._insertButtonArrayNode(list, row)
-            mockedData.assert_called_once_with()
-            mockedNode.assert_called_once_with(name, data)
-            list.addChildAt.assert_called_once_with(row, node)
-
-    def test_insertFloatNode(self) -> None:
-        """
-        The _insertFloatNode method must create a new float node and
-        append it the given float list.
-        """
-        row = 3
-        name = 'NEW_FLOAT'
-        data = Mock()
-        node = Mock()
-        list = Mock()
-        with patch(self._FloatDataCls) as mockedData, \
-                patch(self._FloatNodeCls) as mockedNode:
-            mockedData.return_value = data
-            mockedNode.return_value = node
-            self._uut._insertFloatNode(list, row)
-            mockedData.assert_called_once_with()
-            mockedNode.assert_called_once_with(name, data)
-            list.addChildAt.assert_called_once_with(row, node)
-
-    def test_insertFloatArrayNode(self) -> None:
-        """
-        The _insertFloatArrayNode method must create a new float array node and
-        append it the given float array list.
-        """
-        row = 3
-        name = 'NEW_FLOAT_ARRAY'
-        data = Mock()
-        node = Mock()
-        list = Mock()
-        with patch(self._FloatArrayDataCls) as mockedData, \
-                patch(self._FloatArrayNodeCls) as mockedNode:
-            mockedData.return_value = data
-            mockedNode.return_value = node
-            self._uut._insertFloatArrayNode(list, row)
-            mockedData.assert_called_once_with()
-            mockedNode.assert_called_once_with(name, data)
-            list.addChildAt.assert_called_once_with(row, node)
-
-    def test_insertIntNode(self) -> None:
-        """
-        The _insertIntNode method must create a new int node and
-        append it the given int list.
-        """
-        row = 3
-        name = 'NEW_INT'
-        data = Mock()
-        node = Mock()
-        list = Mock()
-        with patch(self._IntDataCls) as mockedData, \
-                patch(self._IntNodeCls) as mockedNode:
-            mockedData.return_value = data
-            mockedNode.return_value = node
-            self._uut._insertIntNode(list, row)
-            mockedData.assert_called_once_with()
-            mockedNode.assert_called_once_with(name, data)
-            list.addChildAt.assert_called_once_with(row, node)
-
-    def test_insertIntArrayNode(self) -> None:
-        """
-        The _insertIntArrayNode method must create a new int array node and
-        append it the given int array list.
-        """
-        row = 3
-        name = 'NEW_INT_ARRAY'
-        data = Mock()
-        node = Mock()
-        list = Mock()
-        with patch(self._IntArrayDataCls) as mockedData, \
-                patch(self._IntArrayNodeCls) as mockedNode:
-            mockedData.return_value = data
-            mockedNode.return_value = node
-            self._uut._insertIntArrayNode(list, row)
-            mockedData.assert_called_once_with()
-            mockedNode.assert_called_once_with(name, data)
-            list.addChildAt.assert_called_once_with(row, node)
-
-    def test_insertMultiStateNode(self) -> None:
-        """
-        The _insertMultiStateNode method must create a new multi-state node and
-        append it the given multi-state list.
-        """
-        row = 3
-        name = 'NEW_MULTI_STATE'
-        data = Mock()
-        node = Mock()
-        list = Mock()
-        with patch(self._MultiStateDataCls) as mockedData, \
-                patch(self._MultiStateNodeCls) as mockedNode:
-            mockedData.return_value = data
-            mockedNode.return_value = node
-            self._uut._insertMultiStateNode(list, row)
-            mockedData.assert_called_once_with()
-            mockedNode.assert_called_once_with(name, data)
-            list.addChildAt.assert_called_once_with(row, node)
-
-    def test_insertUintNode(self) -> None:
-        """
-        The _insertUintNode method must create a new uint node and
-        append it the given uint list.
-        """
-        row = 3
-        name = 'NEW_UINT'
-        data = Mock()
-        node = Mock()
-        list = Mock()
-        with patch(self._UintDataCls) as mockedData, \
-                patch(self._UintNodeCls) as mockedNode:
-            mockedData.return_value = data
-            mockedNode.return_value = node
-            self._uut._insertUintNode(list, row)
-            mockedData.assert_called_once_with()
-            mockedNode.assert_called_once_with(name, data)
-            list.addChildAt.assert_called_once_with(row, node)
-
-    def test_insertUintArrayNode(self) -> None:
-        """
-        The _insertUintArrayNode method must create a new uint array node and
-        append it the given uint array list.
-        """
-        row = 3
-        name = 'NEW_UINT_ARRAY'
-        data = Mock()
-        node = Mock()
-        list = Mock()
-        with patch(self._UintArrayDataCls) as mockedData, \
-                patch(self._UintArrayNodeCls) as mockedNode:
-            mockedData.return_value = data
-            mockedNode.return_value = node
-            self._uut._insertUintArrayNode(list, row)
-            mockedData.assert_called_once_with()
-            mockedNode.assert_called_once_with(name, data)
-            list.addChildAt.assert_called_once_with(row, node)
+        for type, factory in factories.items():
+            list.getName.return_value = type.name
+            self.assertEqual(factory, self._uut._getNodeFactory(list))
 
     def test_rowCountReturnRowCount(self) -> None:
         """
@@ -350,28 +252,63 @@ class TestDatastoreModel(TestCase):
         nodeIdx.internalPointer.assert_called_once_with()
         node.setName.assert_called_once_with(name)
 
-    def test_flagsReturnNodeFlags(self) -> None:
+    def test_setDataRejectDuplicateName(self) -> None:
         """
-        The flags method must return the given node flags if the index is
-        valid, otherwise return the root node flags.
+        The setData method must return false without renaming the node if
+        another object of its datastore has the name.
         """
-        validFlags = [True, False]
+        name = 'used name'
+        node = Mock()
         nodeIdx = Mock()
+        nodeIdx.isValid.return_value = True
+        nodeIdx.internalPointer.return_value = node
+        node.getStore().isNameAvailable.return_value = False
+        self.assertFalse(self._uut.setData(nodeIdx, name,
+                                           Qt.ItemDataRole.EditRole))
+        node.getStore().isNameAvailable.assert_called_once_with(name, node)
+        node.setName.assert_not_called()
+
+    def test_setDataRecordRename(self) -> None:
+        """
+        The setData method must record the rename in the undo stack.
+        """
+        name = 'new name'
         node = Mock()
-        flags = 10
-        for validFlag in validFlags:
-            if validFlag:
-                nodeIdx.internalPointer.return_value = node
-                node.getFlags.return_value = flags
-            else:
-                self._mockedRoot.getFlags.return_value = flags
+        nodeIdx = Mock()
+        nodeIdx.isValid.return_value = True
+        nodeIdx.internalPointer.return_value = node
+        undoStack = Mock()
+        self._uut._undoStack = undoStack
+        self.assertTrue(self._uut.setData(nodeIdx, name,
+                                          Qt.ItemDataRole.EditRole))
+        undoStack.pushFieldChange.assert_called_once_with(node, 'Name', name)
+
+    def test_flagsReturnNodeFlags(self) -> None:
+        """
+        The flags method must return the selectable and enabled flags of the
+        given node if the index is valid, otherwise of the root node, adding
+        the editable flag when the node is editable.
+        """
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        datasets = [{'valid': True, 'editable': True},
+                    {'valid': True, 'editable': False},
+                    {'valid': False, 'editable': True},
+                    {'valid': False, 'editable': False}]
+        for dataset in datasets:
+            nodeIdx = Mock()
+            node = Mock()
+            nodeIdx.isValid.return_value = dataset['valid']
+            nodeIdx.internalPointer.return_value = node
+            expected = node if dataset['valid'] else self._mockedRoot
+            expected.isEditable.return_value = dataset['editable']
             result = self._uut.flags(nodeIdx)
-            if validFlag:
-                nodeIdx.internalPointer.assert_called_once_with()
-                node.getFlags.assert_called_once_with()
+            expected.isEditable.assert_called_once_with()
+            if dataset['editable']:
+                self.assertEqual(flags | Qt.ItemFlag.ItemIsEditable,
+                                 result)
             else:
-                self._mockedRoot.getFlags.asset_called_once_with()
-            self.assertEqual(flags, result)
+                self.assertEqual(flags, result)
+            self._mockedRoot.reset_mock()
 
     def test_parentReturnNodeParent(self) -> None:
         """
@@ -460,236 +397,261 @@ class TestDatastoreModel(TestCase):
                 self.assertEqual(childIndex, result)
             nodeIdx.reset_mock()
 
-    def test_insertRowInvalidParent(self) -> None:
+    def test_rowCountFirstPage(self) -> None:
         """
-        The insertRow method must return false if the given parent is not a
-        valid index.
+        The rowCount method must only count the first page of children until
+        more children are fetched.
         """
-        row = 3
-        parentIndex = Mock()
-        parentIndex.isValid.return_value = False
-        self.assertFalse(self._uut.insertRow(row, parentIndex))
+        node = Mock()
+        nodeIdx = Mock()
+        nodeIdx.isValid.return_value = True
+        nodeIdx.internalPointer.return_value = node
+        node.getChildCount.return_value = 5
+        with patch(f"{self._QAbstractItemModelCls}.__init__"):
+            self._uut = DatastoreModel(self._mockedRoot, pageSize=2)
+        self.assertEqual(2, self._uut.rowCount(nodeIdx))
 
-    def test_insertRowInvalidParentName(self) -> None:
+    def test_rowCountLeafNotCached(self) -> None:
         """
-        The insertRow method must return false if the parent node has an
-        invalid name.
+        The rowCount method must not keep the count of the nodes without
+        children.
         """
-        row = 3
-        parent = Mock()
         node = Mock()
-        with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin, \
-                patch.object(DatastoreModel, 'endInsertRows') as mockedEnd:
-            parent.isValid.return_value = True
-            parent.internalPointer.return_value = node
-            node.getName.return_value = 'invalid name'
-            self.assertFalse(self._uut.insertRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedEnd.assert_called_once_with()
+        nodeIdx = Mock()
+        nodeIdx.isValid.return_value = True
+        nodeIdx.internalPointer.return_value = node
+        node.getChildCount.return_value = 0
+        self.assertEqual(0, self._uut.rowCount(nodeIdx))
+        self.assertEqual({}, self._uut._fetched)
 
-    def test_insertRowInsertButtonNode(self) -> None:
+    def test_beginResetModelForgetFetchedCounts(self) -> None:
         """
-        The insertRow method must insert a new button node at the given row
-        when the parent node name is BUTTON, and return true when the
-        operation succeeds.
+        The beginResetModel method must forget the children revealed to the
+        view.
         """
-        row = 3
-        parent = Mock()
-        node = Mock()
-        with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin, \
-                patch.object(DatastoreModel, '_insertButtonNode') \
-                as mockedInsert, \
-                patch.object(DatastoreModel, 'endInsertRows') as mockedEnd:
-            parent.isValid.return_value = True
-            parent.internalPointer.return_value = node
-            node.getName.return_value = NodeType.BUTTON.name
-            self.assertTrue(self._uut.insertRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedInsert.assert_called_once_with(node, row)
-            mockedEnd.assert_called_once_with()
+        self._uut._fetched[Mock()] = 3
+        with patch(f"{self._QAbstractItemModelCls}.beginResetModel") \
+                as mockedBegin:
+            self._uut.beginResetModel()
+            mockedBegin.assert_called_once_with()
+        self.assertEqual({}, self._uut._fetched)
 
-    def test_insertRowInsertButtonArrayNode(self) -> None:
+    def test_canFetchMoreUnfetchedChildren(self) -> None:
         """
-        The insertRow method must insert a new button array node at the given
-        row when the parent node name is BUTTON_ARRAY, and return true when
-        the operation succeeds.
+        The canFetchMore method must return true while some children of the
+        node are not revealed to the view.
         """
-        row = 3
-        parent = Mock()
         node = Mock()
-        with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin, \
-                patch.object(DatastoreModel, '_insertButtonArrayNode') \
-                as mockedInsert, \
-                patch.object(DatastoreModel, 'endInsertRows') as mockedEnd:
-            parent.isValid.return_value = True
-            parent.internalPointer.return_value = node
-            node.getName.return_value = NodeType.BUTTON_ARRAY.name
-            self.assertTrue(self._uut.insertRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedInsert.assert_called_once_with(node, row)
-            mockedEnd.assert_called_once_with()
+        nodeIdx = Mock()
+        nodeIdx.isValid.return_value = True
+        nodeIdx.internalPointer.return_value = node
+        with patch(f"{self._QAbstractItemModelCls}.__init__"):
+            self._uut = DatastoreModel(self._mockedRoot, pageSize=2)
+        for childCount, expected in [(2, False), (3, True)]:
+            self._uut._fetched.clear()
+            node.getChildCount.return_value = childCount
+            self.assertEqual(expected, self._uut.canFetchMore(nodeIdx))
 
-    def test_insertRowInsertFloatNode(self) -> None:
+    def test_fetchMoreRevealNextPage(self) -> None:
         """
-        The insertRow method must insert a new float node at the given row
-        when the parent node name is FLOAT, and return true when the
-        operation succeeds.
+        The fetchMore method must reveal the next page of children in a
+        single model transaction, and do nothing once every child is
+        revealed.
         """
-        row = 3
-        parent = Mock()
         node = Mock()
+        nodeIdx = Mock()
+        nodeIdx.isValid.return_value = True
+        nodeIdx.internalPointer.return_value = node
+        node.getChildCount.return_value = 5
+        with patch(f"{self._QAbstractItemModelCls}.__init__"):
+            self._uut = DatastoreModel(self._mockedRoot, pageSize=2)
         with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin, \
-                patch.object(DatastoreModel, '_insertFloatNode') \
-                as mockedInsert, \
                 patch.object(DatastoreModel, 'endInsertRows') as mockedEnd:
-            parent.isValid.return_value = True
-            parent.internalPointer.return_value = node
-            node.getName.return_value = NodeType.FLOAT.name
-            self.assertTrue(self._uut.insertRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedInsert.assert_called_once_with(node, row)
-            mockedEnd.assert_called_once_with()
+            for first, last in [(2, 3), (4, 4)]:
+                self._uut.fetchMore(nodeIdx)
+                mockedBegin.assert_called_once_with(nodeIdx, first, last)
+                mockedEnd.assert_called_once_with()
+                self.assertEqual(last + 1, self._uut.rowCount(nodeIdx))
+                mockedBegin.reset_mock()
+                mockedEnd.reset_mock()
+            self._uut.fetchMore(nodeIdx)
+            self.assertFalse(self._uut.canFetchMore(nodeIdx))
+            mockedBegin.assert_not_called()
+
+    def test_getNodeIndexReturnIndex(self) -> None:
+        """
+        The getNodeIndex method must return the index of the node at its row,
+        and an invalid index for the root node and a removed node.
+        """
+        node = Mock()
+        index = Mock()
+        node.getRow.return_value = 300
+        with patch.object(DatastoreModel, 'createIndex') as mockedCreateIndex:
+            mockedCreateIndex.return_value = index
+            self.assertEqual(index, self._uut.getNodeIndex(node))
+            mockedCreateIndex.assert_called_once_with(300, 0, node)
+            self.assertFalse(
+                self._uut.getNodeIndex(self._mockedRoot).isValid())
+            node.getRow.return_value = None
+            self.assertFalse(self._uut.getNodeIndex(node).isValid())
+            mockedCreateIndex.assert_called_once()
+
+    def test_insertRowsInvalidParent(self) -> None:
+        """
+        The insertRows method must return false if the given parent is not a
+        valid index or if the count is not positive.
+        """
+        row = 3
+        parentIndex = Mock()
+        with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin:
+            parentIndex.isValid.return_value = False
+            self.assertFalse(self._uut.insertRows(row, 1, parentIndex))
+            parentIndex.isValid.return_value = True
+            self.assertFalse(self._uut.insertRows(row, 0, parentIndex))
+            mockedBegin.assert_not_called()
 
-    def test_insertRowInsertFloatArrayNode(self) -> None:
+    def test_insertRowsInvalidParentName(self) -> None:
         """
-        The insertRow method must insert a new float array node at the given
-        row when the parent node name is FLOAT_ARRAY, and return true when
-        the operation succeeds.
+        The insertRows method must return false without notifying the view if
+        the parent node has an invalid name.
         """
         row = 3
         parent = Mock()
         node = Mock()
         with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin, \
-                patch.object(DatastoreModel, '_insertFloatArrayNode') \
-                as mockedInsert, \
                 patch.object(DatastoreModel, 'endInsertRows') as mockedEnd:
             parent.isValid.return_value = True
             parent.internalPointer.return_value = node
-            node.getName.return_value = NodeType.FLOAT_ARRAY.name
-            self.assertTrue(self._uut.insertRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedInsert.assert_called_once_with(node, row)
-            mockedEnd.assert_called_once_with()
+            node.getName.return_value = 'invalid name'
+            self.assertFalse(self._uut.insertRows(row, 2, parent))
+            mockedBegin.assert_not_called()
+            mockedEnd.assert_not_called()
+            node.addChildrenAt.assert_not_called()
 
-    def test_insertRowInsertIntNode(self) -> None:
+    def test_insertRowsRowOutOfRange(self) -> None:
         """
-        The insertRow method must insert a new int node at the given row
-        when the parent node name is INT, and return true when the
-        operation succeeds.
+        The insertRows method must return false without notifying the view if
+        the row is out of range.
         """
-        row = 3
         parent = Mock()
         node = Mock()
-        with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin, \
-                patch.object(DatastoreModel, '_insertIntNode') \
-                as mockedInsert, \
-                patch.object(DatastoreModel, 'endInsertRows') as mockedEnd:
+        childCount = 5
+        with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin:
             parent.isValid.return_value = True
             parent.internalPointer.return_value = node
             node.getName.return_value = NodeType.INT.name
-            self.assertTrue(self._uut.insertRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedInsert.assert_called_once_with(node, row)
-            mockedEnd.assert_called_once_with()
+            node.getChildCount.return_value = childCount
+            for row in [-1, childCount + 1]:
+                self.assertFalse(self._uut.insertRows(row, 2, parent))
+            mockedBegin.assert_not_called()
+            node.addChildrenAt.assert_not_called()
 
-    def test_insertRowInsertIntArrayNode(self) -> None:
+    def test_insertRowsInsertNodes(self) -> None:
         """
-        The insertRow method must insert a new int array node at the given
-        row when the parent node name is INT_ARRAY, and return true when
-        the operation succeeds.
+        The insertRows method must insert the requested count of new nodes at
+        the given row in a single model transaction and return true when the
+        operation succeeds.
         """
         row = 3
+        count = 4
         parent = Mock()
         node = Mock()
+        factory = Mock()
+        newNodes = [Mock() for _ in range(count)]
         with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin, \
-                patch.object(DatastoreModel, '_insertIntArrayNode') \
-                as mockedInsert, \
+                patch.object(DatastoreModel, '_getNodeFactory') \
+                as mockedGetFactory, \
                 patch.object(DatastoreModel, 'endInsertRows') as mockedEnd:
             parent.isValid.return_value = True
             parent.internalPointer.return_value = node
-            node.getName.return_value = NodeType.INT_ARRAY.name
-            self.assertTrue(self._uut.insertRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedInsert.assert_called_once_with(node, row)
+            node.getChildCount.return_value = row
+            node.getStore.return_value = None
+            mockedGetFactory.return_value = factory
+            factory.side_effect = newNodes
+            self.assertTrue(self._uut.insertRows(row, count, parent))
+            mockedGetFactory.assert_called_once_with(node)
+            mockedBegin.assert_called_once_with(parent, row, row + count - 1)
+            node.addChildrenAt.assert_called_once_with(row, newNodes)
             mockedEnd.assert_called_once_with()
 
-    def test_insertRowInsertMultiStateNode(self) -> None:
+    def test_insertRowsBeyondFetchedRows(self) -> None:
         """
-        The insertRow method must insert a new multi-state node at the given
-        row when the parent node name is MULTI_STATE, and return true when
-        the operation succeeds.
+        The insertRows method must insert the nodes without notifying the
+        view when the row is beyond the rows revealed to the view.
         """
-        row = 3
         parent = Mock()
         node = Mock()
+        with patch(f"{self._QAbstractItemModelCls}.__init__"):
+            self._uut = DatastoreModel(self._mockedRoot, pageSize=2)
         with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin, \
-                patch.object(DatastoreModel, '_insertMultiStateNode') \
-                as mockedInsert, \
-                patch.object(DatastoreModel, 'endInsertRows') as mockedEnd:
+                patch.object(DatastoreModel, '_getNodeFactory') \
+                as mockedGetFactory:
             parent.isValid.return_value = True
             parent.internalPointer.return_value = node
-            node.getName.return_value = NodeType.MULTI_STATE.name
-            self.assertTrue(self._uut.insertRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedInsert.assert_called_once_with(node, row)
-            mockedEnd.assert_called_once_with()
+            node.getChildCount.return_value = 5
+            node.getStore.return_value = None
+            mockedGetFactory.return_value = Mock()
+            self.assertTrue(self._uut.insertRows(4, 1, parent))
+            mockedBegin.assert_not_called()
+            node.addChildrenAt.assert_called_once()
+            self.assertEqual(2, self._uut.rowCount(parent))
 
-    def test_insertRowInsertUintNode(self) -> None:
+    def test_insertRowsUniqueNames(self) -> None:
         """
-        The insertRow method must insert a new uint node at the given row
-        when the parent node name is UINT, and return true when the
-        operation succeeds.
+        The insertRows method must give the new nodes names not used in the
+        datastore.
         """
-        row = 3
+        count = 2
         parent = Mock()
         node = Mock()
-        with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin, \
-                patch.object(DatastoreModel, '_insertUintNode') \
-                as mockedInsert, \
-                patch.object(DatastoreModel, 'endInsertRows') as mockedEnd:
+        store = Mock()
+        newNodes = [Mock() for _ in range(count)]
+        names = ['NEW_INT_1', 'NEW_INT_2']
+        with patch.object(DatastoreModel, 'beginInsertRows'), \
+                patch.object(DatastoreModel, '_getNodeFactory') \
+                as mockedGetFactory, \
+                patch.object(DatastoreModel, 'endInsertRows'):
             parent.isValid.return_value = True
             parent.internalPointer.return_value = node
-            node.getName.return_value = NodeType.UINT.name
-            self.assertTrue(self._uut.insertRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedInsert.assert_called_once_with(node, row)
-            mockedEnd.assert_called_once_with()
+            node.getChildCount.return_value = 0
+            node.getStore.return_value = store
+            store.getUniqueNames.return_value = names
+            mockedGetFactory.return_value = Mock(side_effect=newNodes)
+            newNodes[0].getName.return_value = 'NEW_INT'
+            self.assertTrue(self._uut.insertRows(0, count, parent))
+            store.getUniqueNames.assert_called_once_with('NEW_INT', count)
+            for newNode, name in zip(newNodes, names):
+                newNode.setName.assert_called_once_with(name)
 
-    def test_insertRowInsertUintArrayNode(self) -> None:
+    def test_insertRowInsertOneRow(self) -> None:
         """
-        The insertRow method must insert a new uint array node at the given
-        row when the parent node name is UINT_ARRAY, and return true when
-        the operation succeeds.
+        The insertRow method must insert a single row.
         """
         row = 3
         parent = Mock()
-        node = Mock()
-        with patch.object(DatastoreModel, 'beginInsertRows') as mockedBegin, \
-                patch.object(DatastoreModel, '_insertUintArrayNode') \
-                as mockedInsert, \
-                patch.object(DatastoreModel, 'endInsertRows') as mockedEnd:
-            parent.isValid.return_value = True
-            parent.internalPointer.return_value = node
-            node.getName.return_value = NodeType.UINT_ARRAY.name
+        with patch.object(DatastoreModel, 'insertRows') as mockedInsertRows:
+            mockedInsertRows.return_value = True
             self.assertTrue(self._uut.insertRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedInsert.assert_called_once_with(node, row)
-            mockedEnd.assert_called_once_with()
+            mockedInsertRows.assert_called_once_with(row, 1, parent)
 
-    def test_removeRowInvalidParent(self) -> None:
+    def test_removeRowsInvalidParent(self) -> None:
         """
-        The removeRow method must return false when the parent index is
-        invalid.
+        The removeRows method must return false when the parent index is
+        invalid or if the count is not positive.
         """
         row = 3
         parent = Mock()
-        parent.isValid.return_value = False
-        self.assertFalse(self._uut.removeRow(row, parent))
+        with patch.object(DatastoreModel, 'beginRemoveRows') as mockedBegin:
+            parent.isValid.return_value = False
+            self.assertFalse(self._uut.removeRows(row, 1, parent))
+            parent.isValid.return_value = True
+            self.assertFalse(self._uut.removeRows(row, 0, parent))
+            mockedBegin.assert_not_called()
 
-    def test_removeRowInvalidParentName(self) -> None:
+    def test_removeRowsInvalidParentName(self) -> None:
         """
-        The removeRow method must return false if the parent node has an
-        invalid name.
+        The removeRows method must return false without notifying the view if
+        the parent node has an invalid name.
         """
         row = 3
         parent = Mock()
@@ -699,21 +661,40 @@ class TestDatastoreModel(TestCase):
             parent.isValid.return_value = True
             parent.internalPointer.return_value = node
             node.getName.return_value = 'invalid name'
-            self.assertFalse(self._uut.removeRow(row, parent))
-            mockedBegin.assert_called_once_with(parent, row, row + 1)
-            mockedEnd.assert_called_once_with()
+            self.assertFalse(self._uut.removeRows(row, 1, parent))
+            mockedBegin.assert_not_called()
+            mockedEnd.assert_not_called()
 
-    def test_removeRowRemoveNode(self) -> None:
+    def test_removeRowsRowOutOfRange(self) -> None:
         """
-        The removeRow method must remove the node at the given row
-        when the parent node name is valid, and return true when the
-        operation succeeds.
+        The removeRows method must return false without notifying the view if
+        the rows to remove are out of range.
         """
-        row = 3
         parent = Mock()
         node = Mock()
+        childCount = 5
+        with patch.object(DatastoreModel, 'beginRemoveRows') as mockedBegin:
+            parent.isValid.return_value = True
+            parent.internalPointer.return_value = node
+            node.getName.return_value = NodeType.INT.name
+            node.getChildCount.return_value = childCount
+            for row, count in [(-1, 1), (childCount - 1, 2)]:
+                self.assertFalse(self._uut.removeRows(row, count, parent))
+            mockedBegin.assert_not_called()
+            node.removeChildrenAt.assert_not_called()
+
+    def test_removeRowsRemoveNodes(self) -> None:
+        """
+        The removeRows method must remove the nodes starting at the given row
+        in a single model transaction when the parent node name is valid, and
+        return true when the operation succeeds.
+        """
+        row = 3
+        count = 2
+        parent = Mock()
         for type in NodeType:
             if type != NodeType.STORE and type != NodeType.OBJ_LIST:
+                node = Mock()
                 with patch.object(DatastoreModel, 'beginRemoveRows') \
                         as mockedBegin, \
                         patch.object(DatastoreModel, 'endRemoveRows') \
@@ -721,8 +702,66 @@ class TestDatastoreModel(TestCase):
                     parent.isValid.return_value = True
                     parent.internalPointer.return_value = node
                     node.getName.return_value = type.name
-                    self.assertTrue(self._uut.removeRow(row, parent))
-                    mockedBegin.assert_called_once_with(parent, row, row + 1)
-                    node.removeChildAt.assert_called_once_with(row)
+                    node.getChildCount.return_value = row + count
+                    self.assertTrue(self._uut.removeRows(row, count, parent))
+                    mockedBegin.assert_called_once_with(parent, row,
+                                                        row + count - 1)
+                    node.removeChildrenAt.assert_called_once_with(row, count)
                     mockedEnd.assert_called_once_with()
-                node.removeChildAt.reset_mock()
+
+    def test_removeRowsPartlyFetchedRows(self) -> None:
+        """
+        The removeRows method must only notify the view of the removal of
+        the rows revealed to it.
+        """
+        parent = Mock()
+        node = Mock()
+        with patch(f"{self._QAbstractItemModelCls}.__init__"):
+            self._uut = DatastoreModel(self._mockedRoot, pageSize=3)
+        with patch.object(DatastoreModel, 'beginRemoveRows') as mockedBegin, \
+                patch.object(DatastoreModel, 'endRemoveRows'):
+            parent.isValid.return_value = True
+            parent.internalPointer.return_value = node
+            node.getName.return_value = NodeType.INT.name
+            node.getChildCount.return_value = 6
+            self.assertTrue(self._uut.removeRows(2, 3, parent))
+            mockedBegin.assert_called_once_with(parent, 2, 2)
+            node.removeChildrenAt.assert_called_once_with(2, 3)
+            self.assertEqual(2, self._uut.rowCount(parent))
+            mockedBegin.reset_mock()
+            self.assertTrue(self._uut.removeRows(2, 1, parent))
+            mockedBegin.assert_not_called()
+
+    def test_removeRowsForgetRemovedNodes(self) -> None:
+        """
+        The removeRows method must forget the revealed children of the
+        removed nodes and of their descendants.
+        """
+        parent = Mock()
+        node = Mock()
+        children = [Mock() for _ in range(3)]
+        grandChild = Mock()
+        children[1].getChildren.return_value = [grandChild]
+        grandChild.getChildren.return_value = []
+        parent.isValid.return_value = True
+        parent.internalPointer.return_value = node
+        node.getName.return_value = NodeType.INT.name
+        node.getChildCount.return_value = 3
+        node.getChild.side_effect = children.__getitem__
+        self._uut._fetched.update({node: 3, children[0]: 1, children[1]: 1,
+                                   grandChild: 2})
+        with patch.object(DatastoreModel, 'beginRemoveRows'), \
+                patch.object(DatastoreModel, 'endRemoveRows'):
+            self.assertTrue(self._uut.removeRows(1, 2, parent))
+        self.assertEqual({node: 1, children[0]: 1}, self._uut._fetched)
+
+    def test_removeRowRemoveOneRow(self) -> None:
+        """
+        The removeRow method must remove a single row.
+        """
+        row = 3
+        parent = Mock()
+        with patch.object(DatastoreModel, 'removeRows') as mockedRemoveRows:
+            mockedRemoveRows.return_value = True
+            self.assertTrue(self._uut.removeRow(row, parent))
+            mockedRemoveRows.assert_called_once_with(row, 1, parent)
@@ -183,12 +183,28 @@ class TestStateListModel(TestCase):
             mockedStateNode.return_value = node
             self.assertTrue(self._uut.insertRow(row, Mock()))
             mockedBegin.assert_called_once_with(index, row, row + 1)
-            mockedStateNode.assert_called_once_with(f"STATE_{row}", row)
+            mockedStateNode.assert_called_once_with(f"STATE_{row}", row, None)
             mockedEnd.assert_called_once_with()
             self._uut.layoutChanged.emit.assert_called_once_with()
             self.assertEqual(len(states), len(self._uut._states))
             self.assertEqual(states, self._uut._states)
 
+    def test_insertRowBumpOwnerRevision(self) -> None:
+        """
+        The insertRow method must create the new state in the owner
+        multi-state and mark the owner as modified.
+        """
+        row = 1
+        owner = Mock()
+        self._uut._owner = owner
+        with patch.object(StateListModel, 'beginInsertRows'), \
+                patch.object(StateListModel, 'endInsertRows'), \
+                patch(self._StateNodeCls) as mockedStateNode:
+            self.assertTrue(self._uut.insertRow(row, Mock()))
+            mockedStateNode.assert_called_once_with(f"STATE_{row}", row,
+                                                    owner)
+            owner.bumpRevision.assert_called_once_with()
+
     def test_removeRowRowOutOfRange(self) -> None:
         """
         The removeRow method must return false if the row to remove is
@@ -227,3 +243,14 @@ class TestStateListModel(TestCase):
             self._uut.layoutChanged.emit.assert_called_once_with()
             self.assertEqual(len(states), len(self._uut._states))
             self.assertEqual(states, self._uut._states)
+
+    def test_removeRowBumpOwnerRevision(self) -> None:
+        """
+        The removeRow method must mark the owner multi-state as modified.
+        """
+        owner = Mock()
+        self._uut._owner = owner
+        with patch.object(StateListModel, 'beginRemoveRows'), \
+                patch.object(StateListModel, 'endRemoveRows'):
+            self.assertTrue(self._uut.removeRow(1, Mock()))
+            owner.bumpRevision.assert_called_once_with()
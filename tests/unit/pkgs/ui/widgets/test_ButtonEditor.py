@@ -99,3 +99,14 @@ class TestButtonEditor(TestCase):
         inactiveTime = 8000
         self._uut._saveInactiveTime(inactiveTime)
         self._button.setInactiveTime.assert_called_once_with(inactiveTime)
+
+    def test_saveLongPressTimeRecordChange(self) -> None:
+        """
+        The _saveLongPressTime method must record the new long press time in
+        the undo stack, merging the successive changes.
+        """
+        undoStack = Mock()
+        self._uut._undoStack = undoStack
+        self._uut._saveLongPressTime(6000)
+        undoStack.pushFieldChange.assert_called_once_with(
+            self._button, 'LongPressTime', 6000, merge=True)
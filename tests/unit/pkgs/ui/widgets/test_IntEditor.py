@@ -101,6 +101,17 @@ class TestIntEditor(TestCase):
         self._uut._saveDefaultValue(default)
         self._uut._int.setDefault.assert_called_once_with(default)
 
+    def test_saveDefaultValueRecordChange(self) -> None:
+        """
+        The _saveDefaultValue method must record the new default value in the
+        undo stack, merging the successive changes.
+        """
+        undoStack = Mock()
+        self._uut._undoStack = undoStack
+        self._uut._saveDefaultValue(12)
+        undoStack.pushFieldChange.assert_called_once_with(
+            self._int, 'Default', 12, merge=True)
+
     def test_saveMinValueSaveMin(self) -> None:
         """
         The _saveMinValue method must save the new minimum, update the default
@@ -72,7 +72,9 @@ class TestMultiStateEditor(TestCase):
             self._multiState.getStateList.return_value = states
             self._multiState.getDefaultIndex.return_value = defaultState
             self._uut._initUi()
-            mockedModel.assert_called_once_with(states)
+            mockedModel.assert_called_once_with(
+                states, owner=self._multiState,
+                undoStack=self._uut._undoStack)
             self._uut.tvStateList.setModel.assert_called_once_with(model)
             self._uut.tvStateList.selectionModel().selectionChanged \
                 .connect.assert_called_once_with(self._uut._newStateSelection)
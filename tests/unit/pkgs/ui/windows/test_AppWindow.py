@@ -2,6 +2,7 @@ from freezegun import freeze_time
 from unittest import TestCase
 from unittest.mock import call, Mock, patch
 
+from PySide6.QtCore import QModelIndex
 from PySide6.QtWidgets import QMessageBox
 
 import os
@@ -10,7 +11,12 @@ import sys
 sys.path.append(os.path.abspath('./src'))
 
 from pkgs.ui.windows import AppWindow                       # noqa: E402
-from pkgs.ui.models import NodeType                         # noqa: E402
+from pkgs.ui.models import DatastoreMetadata, DatastoreNode, IntArrayData, \
+    IntArrayElement, IntArrayNode, NodeType, \
+    ObjectListNode                                          # noqa: E402
+
+
+_updateSizeLabel = AppWindow._updateSizeLabel
 
 
 class TestAppWindow(TestCase):
@@ -24,6 +30,8 @@ class TestAppWindow(TestCase):
         self._DatastoreNodeCls = 'pkgs.ui.windows.appWindow.DatastoreNode'
         self._ObjectListNodeCls = 'pkgs.ui.windows.appWindow.ObjectListNode'
         self._DatastoreModelCls = 'pkgs.ui.windows.appWindow.DatastoreModel'
+        self._DatastoreFilterModelCls = 'pkgs.ui.windows.appWindow.' \
+            'DatastoreFilterModel'
         self._ButtonEditorCls = 'pkgs.ui.windows.appWindow.ButtonEditor'
         self._FloatEditorCls = 'pkgs.ui.windows.appWindow.FloatEditor'
         self._IntEditorCls = 'pkgs.ui.windows.appWindow.IntEditor'
@@ -31,6 +39,13 @@ class TestAppWindow(TestCase):
             'MultiStateEditor'
         self._UintEditorCls = 'pkgs.ui.windows.appWindow.UintEditor'
         self._loggingMod = 'pkgs.ui.windows.appWindow.logging'
+        self._QFileDialogCls = 'pkgs.ui.windows.appWindow.qtw.QFileDialog'
+        self._loadDefinitionFileFn = 'pkgs.ui.windows.appWindow.' \
+            'loadDefinitionFile'
+        self._saveDefinitionFileFn = 'pkgs.ui.windows.appWindow.' \
+            'saveDefinitionFile'
+        self._LazyDatastoreReaderCls = 'pkgs.ui.windows.appWindow.' \
+            'LazyDatastoreReader'
         self._mockedLogger = Mock()
         with patch(self._loggingMod) as mockedLoggingMod, \
                 patch(self._QMainWindow), patch.object(AppWindow, 'setupUi'), \
@@ -39,17 +54,27 @@ class TestAppWindow(TestCase):
             self._uut = AppWindow()
         self._setUpMockedWidgets()
         self._mockedLogger.reset_mock()
+        sizeLabelPatcher = patch.object(AppWindow, '_updateSizeLabel')
+        self._mockedUpdateSizeLabel = sizeLabelPatcher.start()
+        self.addCleanup(sizeLabelPatcher.stop)
 
     def _setUpMockedWidgets(self):
         """
         Setup the mocked widgets.
         """
         self._uut._storeRoot = Mock()
+        self._uut._storeRoot.getChildCount.return_value = 0
         self._uut.actionNew = Mock()
+        self._uut.actionOpen = Mock()
+        self._uut.actionSave = Mock()
+        self._uut.actionUndo = Mock()
+        self._uut.actionRedo = Mock()
         self._uut.pbAddObject = Mock()
         self._uut.tvObjectList = Mock()
         self._uut.pbDeleteObject = Mock()
         self._uut.vlEditor = Mock()
+        self._uut.leSearch = Mock()
+        self._uut.lbSize = Mock()
 
     def test_constructorGetLogger(self) -> None:
         """
@@ -94,10 +119,20 @@ class TestAppWindow(TestCase):
             self.assertEqual(root, self._uut._storeRoot)
             self._uut.actionNew.triggered.connect \
                 .assert_called_once_with(self._uut._createNewStore)
+            self._uut.actionOpen.triggered.connect \
+                .assert_called_once_with(self._uut._openStore)
+            self._uut.actionSave.triggered.connect \
+                .assert_called_once_with(self._uut._saveStore)
+            self._uut.actionUndo.triggered.connect \
+                .assert_called_once_with(self._uut._undo)
+            self._uut.actionRedo.triggered.connect \
+                .assert_called_once_with(self._uut._redo)
             self._uut.pbAddObject.clicked.connect \
                 .assert_called_once_with(self._uut._createNewObject)
             self._uut.pbDeleteObject.clicked.connect \
                 .assert_called_once_with(self._uut._deleteObject)
+            self._uut.leSearch.textChanged.connect \
+                .assert_called_once_with(self._uut._filterObjects)
 
     def test_displayEditorButton(self) -> None:
         """
@@ -111,7 +146,8 @@ class TestAppWindow(TestCase):
             selected.getType.return_value = type
             mockedEditorCls.return_value = objectEditor
             self._uut._displayEditor(selected)
-            mockedEditorCls.assert_called_once_with(selected)
+            mockedEditorCls.assert_called_once_with(
+                selected, undoStack=self._uut._undoStack)
             self._uut.vlEditor.insertWidget \
                 .assert_called_once_with(0, objectEditor)
             self.assertEqual(objectEditor, self._uut._objectEditor)
@@ -128,7 +164,8 @@ class TestAppWindow(TestCase):
             selected.getType.return_value = type
             mockedEditorCls.return_value = objectEditor
             self._uut._displayEditor(selected)
-            mockedEditorCls.assert_called_once_with(selected)
+            mockedEditorCls.assert_called_once_with(
+                selected, undoStack=self._uut._undoStack)
             self._uut.vlEditor.insertWidget \
                 .assert_called_once_with(0, objectEditor)
             self.assertEqual(objectEditor, self._uut._objectEditor)
@@ -145,7 +182,8 @@ class TestAppWindow(TestCase):
             selected.getType.return_value = type
             mockedEditorCls.return_value = objectEditor
             self._uut._displayEditor(selected)
-            mockedEditorCls.assert_called_once_with(selected)
+            mockedEditorCls.assert_called_once_with(
+                selected, undoStack=self._uut._undoStack)
             self._uut.vlEditor.insertWidget \
                 .assert_called_once_with(0, objectEditor)
             self.assertEqual(objectEditor, self._uut._objectEditor)
@@ -162,7 +200,8 @@ class TestAppWindow(TestCase):
             selected.getType.return_value = type
             mockedEditorCls.return_value = objectEditor
             self._uut._displayEditor(selected)
-            mockedEditorCls.assert_called_once_with(selected)
+            mockedEditorCls.assert_called_once_with(
+                selected, undoStack=self._uut._undoStack)
             self._uut.vlEditor.insertWidget \
                 .assert_called_once_with(0, objectEditor)
             self.assertEqual(objectEditor, self._uut._objectEditor)
@@ -179,7 +218,8 @@ class TestAppWindow(TestCase):
             selected.getType.return_value = type
             mockedEditorCls.return_value = objectEditor
             self._uut._displayEditor(selected)
-            mockedEditorCls.assert_called_once_with(selected)
+            mockedEditorCls.assert_called_once_with(
+                selected, undoStack=self._uut._undoStack)
             self._uut.vlEditor.insertWidget \
                 .assert_called_once_with(0, objectEditor)
             self.assertEqual(objectEditor, self._uut._objectEditor)
@@ -232,11 +272,300 @@ class TestAppWindow(TestCase):
                 .assert_called_once_with('creating new datastore')
             mockedDatastoreNode.createNewStore \
                 .assert_called_once_with(self._uut._storeRoot)
-            mockedDatastoreModel.assert_called_once_with(self._uut._storeRoot)
+            mockedDatastoreModel.assert_called_once_with(
+                self._uut._storeRoot, undoStack=self._uut._undoStack)
             self._uut.tvObjectList.setModel.assert_called_once_with(model)
             self._uut.tvObjectList.selectionModel().selectionChanged.connect \
                 .assert_called_once_with(self._uut._newStoreSelection)
+            model.modelReset.connect \
+                .assert_called_once_with(self._uut._newStoreSelection)
             self._uut.tvObjectList.expandAll.assert_called_once_with()
+            self.assertIs(model, self._uut._storeModel)
+            self.assertIsNone(self._uut._filterModel)
+            self._uut.leSearch.clear.assert_called_once_with()
+
+    def test_filterObjectsShowSearchResults(self) -> None:
+        """
+        The _filterObjects method must create the search results model on
+        first use, set its filter text and show it in the tree view.
+        """
+        storeModel = Mock()
+        filterModel = Mock()
+        self._uut._storeModel = storeModel
+        with patch(self._DatastoreFilterModelCls) as mockedFilterModel:
+            mockedFilterModel.return_value = filterModel
+            for text in ['obj', 'obje']:
+                self._uut.tvObjectList.model.return_value = \
+                    self._uut._filterModel
+                self._uut._filterObjects(text)
+                filterModel.setFilterText.assert_called_once_with(text)
+                self._uut.tvObjectList.expandAll.assert_called_once_with()
+                filterModel.setFilterText.reset_mock()
+                self._uut.tvObjectList.expandAll.reset_mock()
+            mockedFilterModel.assert_called_once_with(self._uut._storeRoot)
+            filterModel.setSourceModel.assert_called_once_with(storeModel)
+            filterModel.modelReset.connect \
+                .assert_called_once_with(self._uut._newStoreSelection)
+            self._uut.tvObjectList.setModel \
+                .assert_called_once_with(filterModel)
+
+    def test_filterObjectsEmptyTextShowDatastores(self) -> None:
+        """
+        The _filterObjects method must show the datastore model again when
+        the search text is cleared, and do nothing without datastore.
+        """
+        self._uut._filterObjects('')
+        self._uut.tvObjectList.setModel.assert_not_called()
+        storeModel = Mock()
+        self._uut._storeModel = storeModel
+        self._uut.tvObjectList.model.return_value = Mock()
+        self._uut._filterObjects('')
+        self._uut.tvObjectList.setModel.assert_called_once_with(storeModel)
+        self._uut.tvObjectList.expandAll.assert_called_once_with()
+
+    def test_getSelectionMapSearchResult(self) -> None:
+        """
+        The _getSelection method must map the selected search result to the
+        datastore model.
+        """
+        filterModel = Mock()
+        storeModel = Mock()
+        sourceIdx = Mock()
+        filterModel.sourceModel.return_value = storeModel
+        filterModel.mapToSource.return_value = sourceIdx
+        self._uut._filterModel = filterModel
+        self._uut.tvObjectList.model.return_value = filterModel
+        self.assertEqual((storeModel, sourceIdx), self._uut._getSelection())
+        filterModel.mapToSource.assert_called_once_with(
+            self._uut.tvObjectList.currentIndex())
+
+    def test_undoRedoRefreshEditor(self) -> None:
+        """
+        The _undo and _redo methods must undo and redo the last change,
+        redisplay the editor of the selected object and update the actions
+        enable state.
+        """
+        node = Mock()
+        node.getDefault.return_value = 0
+        selected = Mock()
+        editor = Mock()
+        self._uut.tvObjectList.currentIndex().internalPointer.return_value = \
+            selected
+        self._uut._undoStack.pushFieldChange(node, 'Default', 5)
+        self._uut.actionUndo.setEnabled.assert_called_with(True)
+        self._uut.actionRedo.setEnabled.assert_called_with(False)
+        for method, value, canUndo in [(self._uut._undo, 0, False),
+                                       (self._uut._redo, 5, True)]:
+            self._uut._objectEditor = editor
+            with patch.object(AppWindow, '_hideEditor') as mockedHideEditor, \
+                    patch.object(AppWindow, '_displayEditor') \
+                    as mockedDisplayEditor:
+                method()
+                node.setDefault.assert_called_with(value)
+                mockedHideEditor.assert_called_once_with()
+                mockedDisplayEditor.assert_called_once_with(selected)
+                self._uut.actionUndo.setEnabled.assert_called_with(canUndo)
+                self._uut.actionRedo.setEnabled \
+                    .assert_called_with(not canUndo)
+
+    def test_undoNothingToUndo(self) -> None:
+        """
+        The _undo and _redo methods must do nothing when there is no change
+        to undo or redo.
+        """
+        with patch.object(AppWindow, '_refreshObject') as mockedRefresh:
+            self._uut._undo()
+            self._uut._redo()
+            mockedRefresh.assert_not_called()
+
+    def test_undoRedoReportRefusedChange(self) -> None:
+        """
+        The _undo and _redo methods must report the changes refused by the
+        undo stack without refreshing the editor.
+        """
+        error = ValueError('A is already used by another object')
+        for method in ['undo', 'redo']:
+            with patch.object(self._uut._undoStack, method,
+                              side_effect=error), \
+                    patch.object(AppWindow, '_refreshObject') \
+                    as mockedRefresh, \
+                    patch.object(AppWindow, '_createErrorMsgBox') \
+                    as mockedErrorMsgBox:
+                getattr(self._uut, f"_{method}")()
+                mockedErrorMsgBox.assert_called_once_with(
+                    QMessageBox.Warning, error)
+                mockedRefresh.assert_not_called()
+
+    def test_setStoreModelLargeStore(self) -> None:
+        """
+        The _setStoreModel method must only expand the datastores when the
+        object count is above the large datastore threshold, and expand
+        everything otherwise.
+        """
+        store = Mock()
+        objList = Mock()
+        self._uut._storeRoot.getChildCount.return_value = 1
+        self._uut._storeRoot.getChild.return_value = store
+        store.getChildCount.return_value = 2
+        store.getChild.return_value = objList
+        for objCount, large in [(5000, False), (5001, True)]:
+            objList.getChildCount.return_value = objCount
+            with patch(self._DatastoreModelCls):
+                self._uut._setStoreModel()
+            self.assertEqual(2 * objCount, self._uut._getObjectCount())
+            if large:
+                self._uut.tvObjectList.setUniformRowHeights \
+                    .assert_called_once_with(True)
+                self._uut.tvObjectList.expandToDepth \
+                    .assert_called_once_with(0)
+                self._uut.tvObjectList.expandAll.assert_not_called()
+            else:
+                self._uut.tvObjectList.expandAll.assert_called_once_with()
+                self._uut.tvObjectList.expandToDepth.assert_not_called()
+            self._uut.tvObjectList.reset_mock()
+
+    def test_openStoreCancelled(self) -> None:
+        """
+        The _openStore method must not load anything when the file dialog is
+        cancelled.
+        """
+        with patch(self._QFileDialogCls) as mockedFileDialog, \
+                patch(self._loadDefinitionFileFn) as mockedLoad:
+            mockedFileDialog.getOpenFileName.return_value = ('', '')
+            self._uut._openStore()
+            mockedLoad.assert_not_called()
+            self._uut.tvObjectList.setModel.assert_not_called()
+
+    def test_openStoreLoadDefinition(self) -> None:
+        """
+        The _openStore method must load the selected definition in the store
+        root and create the tree view model.
+        """
+        path = '/path/to/store.yaml'
+        model = Mock()
+        with patch(self._QFileDialogCls) as mockedFileDialog, \
+                patch(self._loadDefinitionFileFn) as mockedLoad, \
+                patch(self._DatastoreModelCls) as mockedDatastoreModel:
+            mockedFileDialog.getOpenFileName.return_value = (path, '')
+            mockedDatastoreModel.return_value = model
+            self._uut._openStore()
+            mockedLoad.assert_called_once_with(path, self._uut._storeRoot)
+            mockedDatastoreModel.assert_called_once_with(
+                self._uut._storeRoot, undoStack=self._uut._undoStack)
+            self._uut.tvObjectList.setModel.assert_called_once_with(model)
+
+    def test_openStoreEncodedDatastore(self) -> None:
+        """
+        The _openStore method must open an encoded datastore with a lazy
+        reader, keep the reader and create the tree view model.
+        """
+        path = '/path/to/device.CBOR'
+        reader = Mock()
+        self._uut._readers = []
+        with patch(self._QFileDialogCls) as mockedFileDialog, \
+                patch(self._loadDefinitionFileFn) as mockedLoad, \
+                patch(self._LazyDatastoreReaderCls) as mockedReaderCls, \
+                patch(self._DatastoreModelCls):
+            mockedFileDialog.getOpenFileName.return_value = (path, '')
+            mockedReaderCls.return_value = reader
+            self._uut._openStore()
+            mockedReaderCls.assert_called_once_with(path)
+            reader.createStore.assert_called_once_with(self._uut._storeRoot)
+            self.assertEqual([reader], self._uut._readers)
+            mockedLoad.assert_not_called()
+            self._uut.tvObjectList.setModel.assert_called_once()
+
+    def test_openStoreInvalidDefinition(self) -> None:
+        """
+        The _openStore method must display a warning when the definition
+        cannot be loaded.
+        """
+        error = ValueError('invalid definition')
+        with patch(self._QFileDialogCls) as mockedFileDialog, \
+                patch(self._loadDefinitionFileFn) as mockedLoad, \
+                patch.object(AppWindow, '_createErrorMsgBox') \
+                as mockedErrorMsgBox:
+            mockedFileDialog.getOpenFileName.return_value = ('store.yaml', '')
+            mockedLoad.side_effect = error
+            self._uut._openStore()
+            mockedErrorMsgBox.assert_called_once_with(QMessageBox.Warning,
+                                                      error)
+            self._uut.tvObjectList.setModel.assert_not_called()
+
+    def test_getCurrentStore(self) -> None:
+        """
+        The _getCurrentStore method must return the store of the selected
+        node, the last store when nothing is selected and none when there is
+        no store.
+        """
+        store = Mock()
+        store.getType.return_value = NodeType.STORE
+        objList = Mock()
+        objList.getType.return_value = NodeType.OBJ_LIST
+        objList.getParent.return_value = store
+        selection = self._uut.tvObjectList.currentIndex()
+        selection.internalPointer.return_value = objList
+        self.assertIs(store, self._uut._getCurrentStore())
+        selection.internalPointer.return_value = None
+        self._uut._storeRoot.getChildCount.return_value = 2
+        self._uut._storeRoot.getChild.return_value = store
+        self.assertIs(store, self._uut._getCurrentStore())
+        self._uut._storeRoot.getChild.assert_called_once_with(1)
+        self._uut._storeRoot.getChildCount.return_value = 0
+        self.assertIsNone(self._uut._getCurrentStore())
+
+    def test_saveStoreSaveDefinition(self) -> None:
+        """
+        The _saveStore method must save the current store to the selected
+        file, update its working directory and clear its unsaved changes
+        flag.
+        """
+        store = Mock()
+        store.getWorkingDir.return_value = '/path/to'
+        store.getName.return_value = 'store'
+        path = '/path/to/other/store.yaml'
+        with patch(self._QFileDialogCls) as mockedFileDialog, \
+                patch(self._saveDefinitionFileFn) as mockedSave, \
+                patch.object(AppWindow, '_getCurrentStore') \
+                as mockedGetCurrentStore:
+            mockedGetCurrentStore.return_value = store
+            mockedFileDialog.getSaveFileName.return_value = (path, '')
+            self._uut._saveStore()
+            self.assertEqual(os.path.join('/path/to', 'store.yaml'),
+                             mockedFileDialog.getSaveFileName.call_args[0][2])
+            store.setWorkingDir.assert_called_once_with('/path/to/other')
+            mockedSave.assert_called_once_with(store, path)
+            store.clearUnsavedChangesFlag.assert_called_once_with()
+
+    def test_saveStoreNothingToSave(self) -> None:
+        """
+        The _saveStore method must not save anything when there is no store
+        or the file dialog is cancelled, and display a warning when the save
+        fails.
+        """
+        store = Mock()
+        store.getWorkingDir.return_value = '.'
+        store.getName.return_value = 'store'
+        error = OSError('read-only')
+        with patch(self._QFileDialogCls) as mockedFileDialog, \
+                patch(self._saveDefinitionFileFn) as mockedSave, \
+                patch.object(AppWindow, '_getCurrentStore') \
+                as mockedGetCurrentStore, \
+                patch.object(AppWindow, '_createErrorMsgBox') \
+                as mockedErrorMsgBox:
+            mockedGetCurrentStore.return_value = None
+            self._uut._saveStore()
+            mockedFileDialog.getSaveFileName.assert_not_called()
+            mockedGetCurrentStore.return_value = store
+            mockedFileDialog.getSaveFileName.return_value = ('', '')
+            self._uut._saveStore()
+            mockedSave.assert_not_called()
+            mockedFileDialog.getSaveFileName.return_value = ('s.yaml', '')
+            mockedSave.side_effect = error
+            self._uut._saveStore()
+            mockedErrorMsgBox.assert_called_once_with(QMessageBox.Warning,
+                                                      error)
+            store.clearUnsavedChangesFlag.assert_not_called()
 
     def test_newStoreSelectionStoreSelected(self) -> None:
         """
@@ -256,6 +585,7 @@ class TestAppWindow(TestCase):
             mockedDisplayEditor.assert_not_called()
             self._uut.pbAddObject.setEnabled.assert_called_once_with(False)
             self._uut.pbDeleteObject.setEnabled.assert_called_once_with(False)
+            self._mockedUpdateSizeLabel.assert_called_once_with()
 
     def test_newStoreSelectionListSelected(self) -> None:
         """
@@ -303,6 +633,35 @@ class TestAppWindow(TestCase):
                 self._uut.pbAddObject.setEnabled.reset_mock()
                 self._uut.pbDeleteObject.setEnabled.reset_mock()
 
+    def test_newStoreSelectionNothingSelected(self) -> None:
+        """
+        The _newStoreSelection must hide the editor and disable the add new
+        object and the delete object buttons when no node is selected, e.g.
+        after a model reset.
+        """
+        self._uut.tvObjectList.currentIndex.return_value = QModelIndex()
+        with patch.object(AppWindow, '_hideEditor') as mockedHideEditor, \
+                patch.object(AppWindow, '_displayEditor') \
+                as mockedDisplayEditor:
+            self._uut._newStoreSelection()
+            mockedHideEditor.assert_called_once_with()
+            mockedDisplayEditor.assert_not_called()
+            self._uut.pbAddObject.setEnabled.assert_called_once_with(False)
+            self._uut.pbDeleteObject.setEnabled.assert_called_once_with(False)
+
+    def test_createAndDeleteObjectNothingSelected(self) -> None:
+        """
+        The _createNewObject and _deleteObject methods must do nothing when
+        no node is selected.
+        """
+        model = Mock()
+        self._uut.tvObjectList.model.return_value = model
+        self._uut.tvObjectList.currentIndex.return_value = QModelIndex()
+        self._uut._createNewObject()
+        self._uut._deleteObject()
+        model.insertRow.assert_not_called()
+        model.removeRow.assert_not_called()
+
     def test_createNewObjectNewObjectInList(self) -> None:
         """
         The _createNewObject method must get the selected node of the store,
@@ -374,6 +733,45 @@ class TestAppWindow(TestCase):
             model.parent.reset_mock()
             model.removeRow.reset_mock()
 
+    def test_updateSizeLabelSelectedObject(self) -> None:
+        """
+        The _updateSizeLabel method must show the sizes of the selected
+        object and of its datastore, and warn when the datastore exceeds its
+        size budgets.
+        """
+        store = DatastoreNode.createNewStore(
+            ObjectListNode('', None), 'motor',
+            DatastoreMetadata(None, nvmBudget=16))
+        node = IntArrayNode('GAINS', IntArrayData(True, [
+            IntArrayElement(f"G{index}", 0, 10, 0) for index in range(3)]))
+        next(objList for objList in store.getChildren()
+             if objList.getName() == NodeType.INT_ARRAY.name).addChild(node)
+        self._uut.tvObjectList.currentIndex().internalPointer.return_value = \
+            node
+        _updateSizeLabel(self._uut)
+        text = self._uut.lbSize.setText.call_args.args[0]
+        self.assertRegex(text, r'^GAINS: \d+ B encoded, 24 B NVM\n'
+                         r'motor: \d+ B encoded, 24 / 16 B NVM$')
+        self._uut.lbSize.setStyleSheet.assert_called_once_with('color: red;')
+        node.getElements().pop()
+        self._uut.lbSize.setStyleSheet.reset_mock()
+        _updateSizeLabel(self._uut)
+        self.assertIn('motor: ', self._uut.lbSize.setText.call_args.args[0])
+        self.assertIn('16 / 16 B NVM',
+                      self._uut.lbSize.setText.call_args.args[0])
+        self._uut.lbSize.setStyleSheet.assert_called_once_with('')
+
+    def test_updateSizeLabelNothingSelected(self) -> None:
+        """
+        The _updateSizeLabel method must clear the sizes when nothing is
+        selected.
+        """
+        self._uut.tvObjectList.currentIndex().internalPointer.return_value = \
+            None
+        _updateSizeLabel(self._uut)
+        self._uut.lbSize.clear.assert_called_once_with()
+        self._uut.lbSize.setText.assert_not_called()
+
     def test_createErrorMsgBoxNewMsgBox(self) -> None:
         """
         The _createErrorMsgBox method must create the new message box.
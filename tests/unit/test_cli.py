@@ -0,0 +1,255 @@
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import cbor2
+import json
+import os
+import subprocess
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+import cli  # noqa: E402
+
+
+class TestCli(TestCase):
+    """
+    The cli module test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self._tmpDir = TemporaryDirectory()
+        self._definitionPath = os.path.join(self._tmpDir.name, 'store.json')
+        with open(self._definitionPath, 'w') as fp:
+            json.dump({'objects': {'INT': [{'name': 'I', 'min': 0, 'max': 1,
+                                            'default': 0}]}}, fp)
+
+    def tearDown(self) -> None:
+        """
+        Test cases teardown.
+        """
+        self._tmpDir.cleanup()
+
+    def test_mainEncodeDefinition(self) -> None:
+        """
+        The main function must encode the definition to the output file, by
+        default next to the definition.
+        """
+        outputPath = os.path.join(self._tmpDir.name, 'out.bin')
+        datasets = [{'argv': [self._definitionPath, '-o', outputPath],
+                     'output': outputPath},
+                    {'argv': [self._definitionPath],
+                     'output': os.path.join(self._tmpDir.name, 'store.cbor')}]
+        for dataset in datasets:
+            with redirect_stdout(StringIO()):
+                self.assertEqual(0, cli.main(dataset['argv']))
+            with open(dataset['output'], 'rb') as fp:
+                encoded = cbor2.load(fp)
+            self.assertEqual([{'min': 0, 'max': 1, 'default': 0}],
+                             encoded['INT'])
+
+    def test_mainEncodeCompact(self) -> None:
+        """
+        The main function must use the compact encoding when requested.
+        """
+        with redirect_stdout(StringIO()):
+            self.assertEqual(0, cli.main([self._definitionPath, '-c']))
+        with open(os.path.join(self._tmpDir.name, 'store.cbor'), 'rb') as fp:
+            self.assertEqual([{2: 0, 3: 1, 4: 0}], cbor2.load(fp)['INT'])
+
+    def test_mainWriteNameTable(self) -> None:
+        """
+        The main function must write the name table next to the encoded
+        datastore when requested.
+        """
+        with redirect_stdout(StringIO()):
+            self.assertEqual(0, cli.main([self._definitionPath, '-n']))
+        with open(os.path.join(self._tmpDir.name, 'store.names.cbor'),
+                  'rb') as fp:
+            self.assertEqual(['I'], cbor2.load(fp)['INT'])
+
+    def test_mainWriteHeader(self) -> None:
+        """
+        The main function must write the C header next to the encoded
+        datastore when requested.
+        """
+        with redirect_stdout(StringIO()):
+            self.assertEqual(0, cli.main([self._definitionPath, '-H']))
+        with open(os.path.join(self._tmpDir.name, 'store.h')) as fp:
+            self.assertIn('DATASTORE_INT_I = 0,', fp.read())
+
+    def test_mainWriteLayout(self) -> None:
+        """
+        The main function must write the non-volatile memory layout next to
+        the encoded datastore when a sector size is given.
+        """
+        with redirect_stdout(StringIO()):
+            self.assertEqual(0, cli.main([self._definitionPath, '-s', '4096',
+                                          '--headroom', '0.5']))
+        with open(os.path.join(self._tmpDir.name, 'store.layout.json')) as fp:
+            self.assertEqual(2048, json.load(fp)['usableSize'])
+
+    def test_mainWritePagedImage(self) -> None:
+        """
+        The main function must write the paged image next to the encoded
+        datastore when a page size is given.
+        """
+        with redirect_stdout(StringIO()):
+            self.assertEqual(0, cli.main([self._definitionPath, '-p', '64',
+                                          '--allow-spanning']))
+        pagesPath = os.path.join(self._tmpDir.name, 'store.pages')
+        self.assertEqual(0, os.path.getsize(pagesPath) % 64)
+        with open(pagesPath, 'rb') as fp:
+            self.assertEqual(64, cbor2.load(fp)[1])
+
+    def test_mainCompressWithTrainedDictionary(self) -> None:
+        """
+        The main function must train the dictionary from the previous images
+        and compress the encoded datastore with it.
+        """
+        previousPath = os.path.join(self._tmpDir.name, 'previous.cbor')
+        with open(previousPath, 'wb') as fp:
+            fp.write(cbor2.dumps({'INT': [{'min': 0, 'max': 1,
+                                           'default': 0}] * 8}))
+        dictionaryPath = os.path.join(self._tmpDir.name, 'store.dict')
+        with redirect_stdout(StringIO()):
+            self.assertEqual(0, cli.main([
+                self._definitionPath, '-z', '--chunk-size', '16',
+                '--dictionary', dictionaryPath, '--train', previousPath]))
+        with open(dictionaryPath, 'rb') as fp:
+            self.assertTrue(fp.read())
+        self.assertTrue(os.path.exists(
+            os.path.join(self._tmpDir.name, 'store.cbor.z')))
+
+    def test_mainMissingDictionary(self) -> None:
+        """
+        The main function must return an error status when the dictionary
+        cannot be read.
+        """
+        with self.assertLogs('app.compiler', 'ERROR'), \
+                redirect_stdout(StringIO()):
+            self.assertEqual(1, cli.main([
+                self._definitionPath, '-z', '--dictionary',
+                os.path.join(self._tmpDir.name, 'missing.dict')]))
+
+    def test_mainInvalidDefinition(self) -> None:
+        """
+        The main function must return an error status when the definition
+        cannot be read or is invalid.
+        """
+        invalidPath = os.path.join(self._tmpDir.name, 'invalid.json')
+        with open(invalidPath, 'w') as fp:
+            fp.write('{"objects": {"UNKNOWN": []}}')
+        datasets = [os.path.join(self._tmpDir.name, 'missing.json'),
+                    invalidPath]
+        for path in datasets:
+            with self.assertLogs('app.compiler', 'ERROR'), \
+                    redirect_stdout(StringIO()):
+                self.assertEqual(1, cli.main([path]))
+
+    def test_cliDoesNotImportQt(self) -> None:
+        """
+        The command-line compiler must not import PySide6.
+        """
+        script = 'import sys\n' \
+            f"sys.path.insert(0, {os.path.abspath('./src')!r})\n" \
+            'import cli\n' \
+            'cli.main(sys.argv[1:])\n' \
+            "print('PySide6' in sys.modules)\n"
+        result = subprocess.run([sys.executable, '-c', script,
+                                 self._definitionPath],
+                                capture_output=True, text=True, check=True)
+        self.assertEqual('False', result.stdout.splitlines()[-1])
+
+    def test_mainBuildVariants(self) -> None:
+        """
+        The main function must encode every definition to the output
+        directory and report each variant and the build summary.
+        """
+        outputDir = os.path.join(self._tmpDir.name, 'out')
+        os.mkdir(outputDir)
+        otherPath = os.path.join(self._tmpDir.name, 'other.json')
+        with open(otherPath, 'w') as fp:
+            json.dump({'objects': {}}, fp)
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            self.assertEqual(0, cli.main([self._definitionPath, otherPath,
+                                          '-d', outputDir, '-j', '2']))
+        report = stdout.getvalue()
+        self.assertIn(self._definitionPath, report)
+        self.assertIn(otherPath, report)
+        self.assertIn('2/2 variants built', report)
+        self.assertEqual(['other.cbor', 'store.cbor'],
+                         sorted(os.listdir(outputDir)))
+
+    def test_mainReportInvalidVariant(self) -> None:
+        """
+        The main function must report a variant with a malformed definition
+        as failed and build the other variants in parallel.
+        """
+        outputDir = os.path.join(self._tmpDir.name, 'out')
+        os.mkdir(outputDir)
+        datasets = [{'objects': [{'name': 'I'}]}, {'metadata': []},
+                    {'objects': {'INT_ARRAY': [
+                        {'name': 'A', 'elements': [
+                            {'name': 'E', 'min': 0, 'default': 0,
+                             'max': 99999999999999999999}]}]}}]
+        for index, definition in enumerate(datasets):
+            path = os.path.join(self._tmpDir.name, f"bad{index}.json")
+            with open(path, 'w') as fp:
+                json.dump(definition, fp)
+            stdout = StringIO()
+            with self.assertLogs('app.compiler', 'ERROR'), \
+                    redirect_stdout(stdout):
+                self.assertEqual(1, cli.main([self._definitionPath, path,
+                                              '-d', outputDir, '-j', '2']))
+            self.assertIn('1/2 variants built', stdout.getvalue())
+            self.assertEqual(['store.cbor'], os.listdir(outputDir))
+
+    def test_mainOutputRequireSingleDefinition(self) -> None:
+        """
+        The main function must refuse an output file with multiple
+        definitions.
+        """
+        with self.assertRaises(SystemExit), redirect_stdout(StringIO()), \
+                patch('sys.stderr', StringIO()):
+            cli.main([self._definitionPath, self._definitionPath, '-o', 'x'])
+
+    def test_mainInvalidPageArguments(self) -> None:
+        """
+        The main function must refuse a page size below 1 and spanning
+        without page size.
+        """
+        for argv in (['-p', '0'], ['--allow-spanning']):
+            with self.assertRaises(SystemExit), \
+                    redirect_stdout(StringIO()), \
+                    patch('sys.stderr', StringIO()):
+                cli.main([self._definitionPath, *argv])
+
+    def test_mainInvalidCompressArguments(self) -> None:
+        """
+        The main function must refuse a chunk size below 1, a chunk size or
+        a dictionary without compression and training without dictionary.
+        """
+        for argv in (['-z', '--chunk-size', '0'], ['--chunk-size', '64'],
+                     ['--dictionary', 'd'], ['-z', '--train', 'x.cbor']):
+            with self.assertRaises(SystemExit), \
+                    redirect_stdout(StringIO()), \
+                    patch('sys.stderr', StringIO()):
+                cli.main([self._definitionPath, *argv])
+
+    def test_mainInvalidLayoutArguments(self) -> None:
+        """
+        The main function must refuse a sector size below 1 and a headroom
+        out of [0, 1).
+        """
+        for argv in (['-s', '0'], ['-s', '4096', '--headroom', '1']):
+            with self.assertRaises(SystemExit), \
+                    redirect_stdout(StringIO()), \
+                    patch('sys.stderr', StringIO()):
+                cli.main([self._definitionPath, *argv])